@@ -20,8 +20,10 @@ import os
 import logging
 import time
 import pickle
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
 
 from src.plugin_system.base_plugin import BasePlugin, VegasDisplayMode
@@ -32,6 +34,8 @@ try:
     from google_auth_oauthlib.flow import InstalledAppFlow
     from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
+    import google_auth_httplib2
+    import httplib2
     import pytz
     GOOGLE_AVAILABLE = True
 except ImportError:
@@ -54,10 +58,19 @@ class CalendarPlugin(BasePlugin):
         calendars (list): List of calendar IDs to fetch from
         update_interval (float): Seconds between API updates
         event_rotation_interval (float): Seconds between event rotations
+        sync_window_days (int): Days ahead covered by a full sync
+        full_sync_interval (int): Seconds between full re-syncs
+    
+    Events are kept in a per-calendar index that is filled by one full sync
+    and then kept current with incremental syncs using the calendar's
+    ``nextSyncToken``, so routine refreshes only transfer changed events.
     """
     
     SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
     
+    # Event fields kept in the local index
+    EVENT_FIELDS = ('id', 'etag', 'status', 'summary', 'start', 'end', 'updated')
+    
     def __init__(self, plugin_id: str, config: Dict[str, Any],
                  display_manager, cache_manager, plugin_manager):
         """Initialize the calendar plugin."""
@@ -81,10 +94,18 @@ class CalendarPlugin(BasePlugin):
         self.update_interval = config.get('update_interval', 3600)
         self.show_all_day = config.get('show_all_day_events', True)
         self.rotation_interval = config.get('event_rotation_interval', 10)
+        self.sync_window_days = config.get('sync_window_days', 180)
+        self.full_sync_interval = config.get('full_sync_interval', 86400)
         
         # State
         self.service = None
+        self._credentials = None
+        self._thread_local = threading.local()
         self.events = []
+        # calendar_id -> {'sync_token', 'last_full_sync', 'last_sync', 'events': {event_id: event}}
+        self._sync_state: Dict[str, Dict[str, Any]] = {}
+        # (calendar_id, event_id, etag, width, height) -> rendered event image
+        self._event_image_cache: Dict[Tuple, Image.Image] = {}
         self.current_event_index = 0
         self.last_rotation = time.time()
         
@@ -363,6 +384,7 @@ class CalendarPlugin(BasePlugin):
         
         # Build service
         try:
+            self._credentials = creds
             self.service = build('calendar', 'v3', credentials=creds)
             self.logger.info("Calendar service built successfully")
             return True
@@ -401,72 +423,210 @@ class CalendarPlugin(BasePlugin):
 
     def update(self) -> None:
         """
-        Fetch upcoming calendar events.
+        Sync upcoming calendar events.
         
-        Uses cache_manager to cache API responses and reduce API calls.
+        Each calendar is synced incrementally with its stored sync token, so
+        only changed or deleted events are transferred; calendars without a
+        token (or whose token expired) get a full sync. Calendars are synced
+        concurrently and their event indexes are persisted through
+        cache_manager so restarts resume incrementally.
         Plugin system handles update interval scheduling.
         """
         if not self.service:
             self.logger.warning("Calendar service not available - authentication may be required")
             return
         
-        # Check cache first
-        cache_key = f"{self.plugin_id}_events_{'_'.join(sorted(self.calendars))}"
-        cached_events = self.cache_manager.get(cache_key, max_age=self.update_interval)
-        
-        if cached_events is not None:
-            self.events = cached_events
-            self.logger.debug(f"Using cached events: {len(self.events)} events")
-            return
-        
         try:
-            # Fetch events from all configured calendars
-            all_events = []
-            
+            now = time.time()
             for calendar_id in self.calendars:
-                try:
-                    now = datetime.utcnow().isoformat() + 'Z'
-                    events_result = self.service.events().list(
-                        calendarId=calendar_id,
-                        timeMin=now,
-                        maxResults=self.max_events * 2,  # Fetch extra to account for filtering
-                        singleEvents=True,
-                        orderBy='startTime'
-                    ).execute()
-                    
-                    events = events_result.get('items', [])
-                    
-                    # Filter all-day events if needed
-                    if not self.show_all_day:
-                        events = [e for e in events if 'dateTime' in e.get('start', {})]
-                    
-                    all_events.extend(events)
-                    
-                    self.logger.info(f"Fetched {len(events)} events from calendar: {calendar_id}")
-                
-                except Exception:
-                    self.logger.exception(
-                        "Error fetching events from calendar '%s' - verify this calendar ID is correct and accessible under your Google account",
-                        calendar_id,
-                    )
-                    continue
+                if calendar_id not in self._sync_state:
+                    self._sync_state[calendar_id] = self._load_sync_state(calendar_id)
             
-            # Sort all events by start time
-            all_events.sort(key=lambda x: x['start'].get('dateTime', x['start'].get('date', '')))
+            due = [
+                calendar_id for calendar_id in self.calendars
+                if now - self._sync_state[calendar_id].get('last_sync', 0) >= self.update_interval
+            ]
+            
+            if due:
+                with ThreadPoolExecutor(max_workers=min(4, len(due)),
+                                        thread_name_prefix="calendar-sync") as executor:
+                    results = list(executor.map(self._sync_calendar, due))
+                for calendar_id, changed in zip(due, results):
+                    if changed is not None:
+                        self._save_sync_state(calendar_id)
+            else:
+                self.logger.debug("Calendar indexes are fresh, skipping sync")
             
-            # Limit to max_events
-            self.events = all_events[:self.max_events]
+            self.events = self._select_upcoming_events()
+            self._prune_event_images()
             
-            # Cache the results
             if self.events:
-                self.cache_manager.set(cache_key, self.events, ttl=self.update_interval)
-                self.logger.info(f"Total events fetched and cached: {len(self.events)}")
+                self.logger.info(f"Upcoming events: {len(self.events)}")
             else:
                 self.logger.info("No upcoming events found")
         
         except Exception as e:
             self.logger.error(f"Error updating calendar: {e}", exc_info=True)
     
+    def _sync_state_cache_key(self, calendar_id: str) -> str:
+        """Cache key for a calendar's persisted sync state."""
+        return f"{self.plugin_id}_sync_{calendar_id}"
+    
+    def _load_sync_state(self, calendar_id: str) -> Dict[str, Any]:
+        """Load a calendar's persisted sync token and event index."""
+        try:
+            state = self.cache_manager.get(self._sync_state_cache_key(calendar_id),
+                                           max_age=self.full_sync_interval)
+            if isinstance(state, dict) and isinstance(state.get('events'), dict):
+                self.logger.debug(f"Loaded {len(state['events'])} indexed events for calendar: {calendar_id}")
+                return state
+        except Exception as e:
+            self.logger.warning(f"Could not load sync state for calendar '{calendar_id}': {e}")
+        return {'sync_token': None, 'last_full_sync': 0, 'last_sync': 0, 'events': {}}
+    
+    def _save_sync_state(self, calendar_id: str) -> None:
+        """Persist a calendar's sync token and event index."""
+        try:
+            self.cache_manager.set(self._sync_state_cache_key(calendar_id),
+                                   self._sync_state[calendar_id], ttl=self.full_sync_interval)
+        except Exception as e:
+            self.logger.warning(f"Could not save sync state for calendar '{calendar_id}': {e}")
+    
+    def _thread_http(self):
+        """
+        Return an authorized HTTP object for the current thread.
+        
+        httplib2 connections are not thread-safe, so each sync thread gets
+        its own; returns None when the service wasn't built from credentials.
+        """
+        if self._credentials is None:
+            return None
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+    
+    def _sync_calendar(self, calendar_id: str) -> Optional[int]:
+        """
+        Bring one calendar's event index up to date.
+        
+        Returns:
+            Number of events added, changed or removed, or None on failure
+        """
+        state = self._sync_state[calendar_id]
+        now = time.time()
+        full_sync = (not state.get('sync_token')
+                     or now - state.get('last_full_sync', 0) >= self.full_sync_interval)
+        
+        try:
+            if full_sync:
+                items, sync_token = self._list_events(calendar_id, sync_token=None)
+                events = {}
+            else:
+                try:
+                    items, sync_token = self._list_events(calendar_id, sync_token=state['sync_token'])
+                except Exception as e:
+                    if getattr(getattr(e, 'resp', None), 'status', None) != 410:
+                        raise
+                    # Sync token expired or invalidated - start over
+                    self.logger.info(f"Sync token expired for calendar '{calendar_id}', performing full sync")
+                    full_sync = True
+                    items, sync_token = self._list_events(calendar_id, sync_token=None)
+                    events = {}
+                else:
+                    events = dict(state.get('events', {}))
+        except Exception:
+            self.logger.exception(
+                "Error fetching events from calendar '%s' - verify this calendar ID is correct and accessible under your Google account",
+                calendar_id,
+            )
+            return None
+        
+        changes = 0
+        for item in items:
+            event_id = item.get('id')
+            if not event_id:
+                continue
+            if item.get('status') == 'cancelled':
+                if events.pop(event_id, None) is not None:
+                    changes += 1
+                continue
+            events[event_id] = {key: item[key] for key in self.EVENT_FIELDS if key in item}
+            changes += 1
+        
+        state['events'] = events
+        state['sync_token'] = sync_token
+        state['last_sync'] = now
+        if full_sync:
+            state['last_full_sync'] = now
+        
+        self.logger.info(
+            f"{'Full' if full_sync else 'Incremental'} sync of calendar '{calendar_id}': "
+            f"{changes} change(s), {len(events)} indexed event(s)"
+        )
+        return changes
+    
+    def _list_events(self, calendar_id: str, sync_token: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Page through events().list for a calendar.
+        
+        A full sync (no token) is limited to the configured window ahead of
+        now; sync tokens can't be combined with time filters, so incremental
+        requests pass only the token.
+        
+        Returns:
+            Tuple of (event items, nextSyncToken)
+        """
+        params: Dict[str, Any] = {'calendarId': calendar_id, 'singleEvents': True, 'maxResults': 250}
+        if sync_token:
+            params['syncToken'] = sync_token
+        else:
+            now = datetime.now(timezone.utc)
+            params['timeMin'] = now.isoformat().replace('+00:00', 'Z')
+            params['timeMax'] = (now + timedelta(days=self.sync_window_days)).isoformat().replace('+00:00', 'Z')
+        
+        http = self._thread_http()
+        items = []
+        page_token = None
+        while True:
+            if page_token:
+                params['pageToken'] = page_token
+            request = self.service.events().list(**params)
+            response = request.execute(http=http) if http is not None else request.execute()
+            items.extend(response.get('items', []))
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return items, response.get('nextSyncToken')
+    
+    def _select_upcoming_events(self) -> List[Dict[str, Any]]:
+        """Pick the next max_events events across all configured calendars."""
+        now = datetime.now(timezone.utc)
+        today = now.astimezone(self.timezone).date().isoformat() if self.timezone else now.date().isoformat()
+        upcoming = []
+        for calendar_id in self.calendars:
+            for event in self._sync_state.get(calendar_id, {}).get('events', {}).values():
+                start = event.get('start', {})
+                end = event.get('end', {})
+                if 'dateTime' in start:
+                    end_str = end.get('dateTime', start['dateTime'])
+                    try:
+                        if datetime.fromisoformat(end_str.replace('Z', '+00:00')) <= now:
+                            continue
+                    except ValueError:
+                        continue
+                elif 'date' in start:
+                    # Filter all-day events if needed; end dates are exclusive
+                    if not self.show_all_day or end.get('date', start['date']) <= today:
+                        continue
+                else:
+                    continue
+                upcoming.append(dict(event, calendar_id=calendar_id))
+        
+        # Sort all events by start time
+        upcoming.sort(key=lambda x: x['start'].get('dateTime', x['start'].get('date', '')))
+        return upcoming[:self.max_events]
+    
     def display(self, force_clear: bool = False) -> None:
         """
         Display calendar events.
@@ -509,12 +669,34 @@ class CalendarPlugin(BasePlugin):
         """Display a single calendar event on the display_manager."""
         self.display_manager.clear()
 
-        # Render to the display_manager's image
+        # Paste the cached render into the display_manager's image
         width, height = self._get_display_dimensions()
-        self._render_event_to_image(event, self.display_manager.image, width, height)
+        self.display_manager.image.paste(self._get_event_image(event, width, height), (0, 0))
 
         self.display_manager.update_display()
 
+    def _event_image_key(self, event: Dict, width: int, height: int) -> Tuple:
+        """Cache key identifying an event's rendered content."""
+        version = event.get('etag') or event.get('updated') or (
+            event.get('summary'), str(event.get('start')))
+        return (event.get('calendar_id'), event.get('id'), version, width, height)
+
+    def _get_event_image(self, event: Dict, width: int, height: int) -> Image.Image:
+        """Return the rendered image for an event, rendering it only when the event changed."""
+        key = self._event_image_key(event, width, height)
+        image = self._event_image_cache.get(key)
+        if image is None:
+            image = self._render_event_image(event, width, height)
+            self._event_image_cache[key] = image
+        return image
+
+    def _prune_event_images(self) -> None:
+        """Drop rendered images for events that changed or are no longer shown."""
+        current = {(event.get('calendar_id'), event.get('id'), self._event_image_key(event, 0, 0)[2])
+                   for event in self.events}
+        for key in [key for key in self._event_image_cache if key[:3] not in current]:
+            del self._event_image_cache[key]
+
     def _render_event_image(self, event: Dict, width: Optional[int] = None,
                             height: Optional[int] = None) -> Image.Image:
         """
@@ -741,8 +923,7 @@ class CalendarPlugin(BasePlugin):
             width, height = self._get_display_dimensions()
 
             for event in self.events:
-                img = self._render_event_image(event, width, height)
-                images.append(img)
+                images.append(self._get_event_image(event, width, height))
 
             return images if images else None
 
@@ -819,5 +1000,6 @@ class CalendarPlugin(BasePlugin):
     def cleanup(self) -> None:
         """Cleanup resources."""
         self.events = []
+        self._event_image_cache.clear()
         self.service = None
         self.logger.info("Calendar plugin cleaned up")
@@ -11,6 +11,12 @@ from datetime import datetime, timezone
 import requests
 from typing import Dict, Any, List, Optional
 
+try:
+    from src.http_client import get_http_client
+    _http = get_http_client()
+except ImportError:  # Running outside LEDMatrix
+    _http = requests
+
 class DataFetcher:
     """Handles fetching standings and rankings data from ESPN API."""
     
@@ -71,7 +77,7 @@ class DataFetcher:
             self.logger.info(f"Fetching fresh rankings data for {league_key}")
             rankings_url = "https://site.api.espn.com/apis/site/v2/sports/football/college-football/rankings"
             
-            response = requests.get(rankings_url, timeout=self.request_timeout)
+            response = _http.get(rankings_url, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -161,7 +167,7 @@ class DataFetcher:
             self.logger.info(f"Fetching fresh rankings data for {league_key}")
             rankings_url = "https://site.api.espn.com/apis/site/v2/sports/hockey/mens-college-hockey/rankings"
             
-            response = requests.get(rankings_url, timeout=self.request_timeout)
+            response = _http.get(rankings_url, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -240,7 +246,7 @@ class DataFetcher:
             scoreboard_url = f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{league_key}/scoreboard?groups=100&limit=1000"
             self.logger.info(f"Fetching tournament seeds from {scoreboard_url}")
 
-            response = requests.get(scoreboard_url, timeout=self.request_timeout)
+            response = _http.get(scoreboard_url, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -324,7 +330,7 @@ class DataFetcher:
             sport = league_config['sport']
             rankings_url = f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{league_key}/rankings"
 
-            response = requests.get(rankings_url, timeout=self.request_timeout)
+            response = _http.get(rankings_url, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -423,7 +429,7 @@ class DataFetcher:
             if 'season' in league_config and league_config.get('season'):
                 params['season'] = league_config['season']
             
-            response = requests.get(standings_url, params=params, timeout=self.request_timeout)
+            response = _http.get(standings_url, params=params, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -508,7 +514,7 @@ class DataFetcher:
         try:
             self.logger.info(f"Fetching fresh leaderboard data for {league_key}")
             teams_url = league_config['teams_url']
-            response = requests.get(teams_url, timeout=self.request_timeout)
+            response = _http.get(teams_url, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -641,7 +647,7 @@ class DataFetcher:
             else:
                 url = f"https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/teams/{team_abbr}"
             
-            response = requests.get(url, timeout=self.request_timeout)
+            response = _http.get(url, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
             
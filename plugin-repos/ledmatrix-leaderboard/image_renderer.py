@@ -8,22 +8,22 @@ Includes logo loading, text drawing with outlines, and layout calculations.
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
-# Try to import logo downloader
+# Try to import the background logo prefetcher
 try:
-    from src.logo_downloader import download_missing_logo
+    from src.logo_prefetcher import get_logo_prefetcher
 except ImportError:
-    # Fallback - plugins may have their own logo downloader
+    # Fallback - plugins may run outside the main tree
     try:
         import sys
-        # Look for logo downloader in parent directories
+        # Look for logo prefetcher in parent directories
         sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-        from src.logo_downloader import download_missing_logo
+        from src.logo_prefetcher import get_logo_prefetcher
     except ImportError:
-        def download_missing_logo(*args, **kwargs):
-            return False
+        get_logo_prefetcher = None
 
 
 class ImageRenderer:
@@ -31,6 +31,11 @@ class ImageRenderer:
 
     MARCH_MADNESS_LOGO_PATH = 'assets/sports/ncaa_logos/MARCH_MADNESS.png'
 
+    LEAGUE_LOGO_WIDTH = 64
+    LEAGUE_HEADER_GAP = 10
+    LEAGUE_TRAILING_GAP = 20
+    LEAGUE_SPACING = 40  # Spacing between leagues
+
     def __init__(self, display_height: int, logger: Optional[logging.Logger] = None):
         """
         Initialize image renderer.
@@ -42,6 +47,15 @@ class ImageRenderer:
         self.display_height = display_height
         self.logger = logger or logging.getLogger(__name__)
         self.fonts = self._load_fonts()
+
+        # Rendered league headers and team entries keyed by their visible
+        # content, so a refresh only redraws entries that actually changed
+        self._tile_cache: Dict[Tuple, np.ndarray] = {}
+        self._last_layout: Optional[Tuple] = None
+        self._last_image: Optional[Image.Image] = None
+        self.last_strip_array: Optional[np.ndarray] = None
+        self.tiles_rendered = 0
+        self.tiles_reused = 0
     
     def _load_fonts(self) -> Dict[str, ImageFont.FreeTypeFont]:
         """Load fonts for the leaderboard display."""
@@ -93,7 +107,7 @@ class ImageRenderer:
         draw.text((x, y), text, font=font, fill=fill)
     
     def _get_team_logo(self, league: str, team_id: str, team_abbr: str, logo_dir: str) -> Optional[Image.Image]:
-        """Get team logo from the configured directory, downloading if missing."""
+        """Get team logo from the configured directory, downloading in the background if missing."""
         if not team_abbr or not logo_dir:
             self.logger.debug("Cannot get team logo with missing team_abbr or logo_dir")
             return None
@@ -106,14 +120,10 @@ class ImageRenderer:
             else:
                 self.logger.warning(f"Logo not found at path: {logo_path}")
                 
-                # Try to download the missing logo
-                if league:
-                    self.logger.info(f"Attempting to download missing logo for {team_abbr} in league {league}")
-                    success = download_missing_logo(league, team_id, team_abbr, logo_path, None)
-                    if success and os.path.exists(logo_path):
-                        logo = Image.open(logo_path)
-                        self.logger.info(f"Successfully downloaded and loaded logo for {team_abbr}")
-                        return logo
+                # Download without blocking; the tile is redrawn once the file appears
+                if league and get_logo_prefetcher is not None:
+                    if get_logo_prefetcher().request(league, team_id, team_abbr, logo_path):
+                        self.logger.info(f"Downloading missing logo for {team_abbr} in league {league} in background")
                 
                 return None
         except Exception as e:
@@ -140,6 +150,13 @@ class ImageRenderer:
         """
         Create the scrolling leaderboard image.
         
+        The strip is assembled from cached tiles: one per league header and
+        one per team entry (rank, logo and abbreviation). Tiles are keyed by
+        their visible content, so only entries whose rank text, abbreviation
+        or logo file changed are re-rendered. The assembled pixel array is
+        kept in ``last_strip_array`` so it can be handed to ScrollHelper
+        without converting the image again.
+        
         Args:
             leaderboard_data: List of league data dictionaries with teams
             
@@ -152,123 +169,151 @@ class ImageRenderer:
         
         try:
             height = self.display_height
-            spacing = 40  # Spacing between leagues
+            league_gap = self.LEAGUE_TRAILING_GAP + self.LEAGUE_SPACING
+            rendered_before = self.tiles_rendered
             
-            # Calculate total width needed
-            total_width = 0
+            # Resolve the tile keys for every league header and team entry
+            layout = []
             for league_data in leaderboard_data:
                 league_key = league_data['league']
                 league_config = league_data['league_config']
-                teams = league_data['teams']
-                
-                league_logo_width = 64
-                teams_width = 0
-                logo_size = int(height * 1.2)
-                
-                for i, team in enumerate(teams):
-                    number_text = self._get_number_text(league_key, league_config, team, i)
-                    number_bbox = self.fonts['xlarge'].getbbox(number_text)
-                    number_width = number_bbox[2] - number_bbox[0]
-                    
-                    team_text = team['abbreviation']
-                    text_bbox = self.fonts['large'].getbbox(team_text)
-                    text_width = text_bbox[2] - text_bbox[0]
-                    
-                    team_width = number_width + 4 + logo_size + 4 + text_width + 12
-                    teams_width += team_width
                 
-                league_width = league_logo_width + teams_width + 20
-                total_width += league_width + spacing
-            
-            # Create the main image
-            leaderboard_image = Image.new('RGB', (total_width, height), (0, 0, 0))
-            draw = ImageDraw.Draw(leaderboard_image)
-            
-            current_x = 0
-            for league_idx, league_data in enumerate(leaderboard_data):
-                league_key = league_data['league']
-                league_config = league_data['league_config']
-                teams = league_data['teams']
-                
-                self.logger.info(f"Drawing League {league_idx+1} ({league_key}) starting at x={current_x}px")
-                
-                # Draw league logo (swap to March Madness logo during tournament)
+                # Swap to March Madness logo during tournament
                 league_logo_path = league_config['league_logo']
                 if league_data.get('is_tournament') and league_key in ('ncaam_basketball', 'ncaaw_basketball'):
                     if os.path.exists(self.MARCH_MADNESS_LOGO_PATH):
                         league_logo_path = self.MARCH_MADNESS_LOGO_PATH
-                league_logo = self._get_league_logo(league_logo_path)
-                if league_logo:
-                    logo_height = height - 4
-                    logo_width = int(logo_height * league_logo.width / league_logo.height)
-                    logo_x = current_x + (64 - logo_width) // 2
-                    logo_y = 2
-                    league_logo = league_logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
-                    leaderboard_image.paste(league_logo, (logo_x, logo_y), 
-                                           league_logo if league_logo.mode == 'RGBA' else None)
-                
-                # Move to team section
-                current_x += 64 + 10
-                team_x = current_x
-                logo_size = int(height * 1.2)
+                layout.append(('league', height, league_logo_path, self._file_mtime(league_logo_path)))
                 
-                # Draw teams
-                for i, team in enumerate(teams):
-                    number_text = self._get_number_text(league_key, league_config, team, i)
-                    number_bbox = self.fonts['xlarge'].getbbox(number_text)
-                    number_width = number_bbox[2] - number_bbox[0]
-                    number_height = number_bbox[3] - number_bbox[1]
-                    number_y = (height - number_height) // 2
-                    self._draw_text_with_outline(draw, number_text, (team_x, number_y), 
-                                                self.fonts['xlarge'], fill=(255, 255, 0))
-                    
-                    # Draw team logo
-                    team_logo = self._get_team_logo(league_key, team.get('id'), 
-                                                   team['abbreviation'], league_config['logo_dir'])
-                    if team_logo:
-                        team_logo = team_logo.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
-                        logo_x = team_x + number_width + 4
-                        logo_y_pos = (height - logo_size) // 2
-                        leaderboard_image.paste(team_logo, (logo_x, logo_y_pos), 
-                                               team_logo if team_logo.mode == 'RGBA' else None)
-                        
-                        # Draw team abbreviation
-                        team_text = team['abbreviation']
-                        text_bbox = self.fonts['large'].getbbox(team_text)
-                        text_width = text_bbox[2] - text_bbox[0]
-                        text_height = text_bbox[3] - text_bbox[1]
-                        text_x = logo_x + logo_size + 4
-                        text_y = (height - text_height) // 2
-                        self._draw_text_with_outline(draw, team_text, (text_x, text_y), 
-                                                    self.fonts['large'], fill=(255, 255, 255))
-                        
-                        team_width = number_width + 4 + logo_size + 4 + text_width + 12
-                    else:
-                        # Fallback if no logo
-                        team_text = team['abbreviation']
-                        text_bbox = self.fonts['large'].getbbox(team_text)
-                        text_width = text_bbox[2] - text_bbox[0]
-                        text_height = text_bbox[3] - text_bbox[1]
-                        text_x = team_x + number_width + 4
-                        text_y = (height - text_height) // 2
-                        self._draw_text_with_outline(draw, team_text, (text_x, text_y), 
-                                                    self.fonts['large'], fill=(255, 255, 255))
-                        team_width = number_width + 4 + text_width + 12
-                    
-                    team_x += team_width
-                
-                current_x = team_x + 20 + spacing
+                for i, team in enumerate(league_data['teams']):
+                    logo_path = None
+                    if team['abbreviation'] and league_config['logo_dir']:
+                        logo_path = str(Path(league_config['logo_dir'], f"{team['abbreviation']}.png"))
+                    layout.append((
+                        'team', height, league_key, team.get('id'), team['abbreviation'],
+                        self._get_number_text(league_key, league_config, team, i),
+                        league_config['logo_dir'], self._file_mtime(logo_path)
+                    ))
+                layout.append(('gap', league_gap))
+            layout = tuple(layout)
+            
+            if layout == self._last_layout and self._last_image is not None:
+                self.logger.debug("Leaderboard layout unchanged, reusing existing image")
+                return self._last_image
             
-            # Calculate actual content width
-            actual_content_width = current_x - (20 + spacing)
+            tiles = [self._get_tile(key) for key in layout if key[0] != 'gap']
+            total_width = sum(tile.shape[1] for tile in tiles) + league_gap * len(leaderboard_data)
+            
+            # Assemble the strip directly from tile arrays
+            strip = np.zeros((height, total_width, 3), dtype=np.uint8)
+            current_x = 0
+            tile_iter = iter(tiles)
+            for key in layout:
+                if key[0] == 'gap':
+                    current_x += key[1]
+                    continue
+                tile = next(tile_iter)
+                strip[:, current_x:current_x + tile.shape[1]] = tile
+                current_x += tile.shape[1]
             
-            self.logger.info(f"Created leaderboard image: {total_width}px wide (actual: {actual_content_width}px)")
+            # Keep only tiles used by the current layout
+            used_keys = set(layout)
+            for key in [key for key in self._tile_cache if key not in used_keys]:
+                del self._tile_cache[key]
+            
+            leaderboard_image = Image.fromarray(strip, 'RGB')
+            self._last_layout = layout
+            self._last_image = leaderboard_image
+            self.last_strip_array = strip
+            
+            rendered = self.tiles_rendered - rendered_before
+            self.logger.info(f"Created leaderboard image: {total_width}px wide "
+                             f"({rendered} of {len(tiles)} tiles re-rendered)")
             return leaderboard_image
             
         except Exception as e:
             self.logger.error(f"Error creating leaderboard image: {e}")
             return None
     
+    def clear_tile_cache(self) -> None:
+        """Drop all cached tiles and the last assembled strip."""
+        self._tile_cache.clear()
+        self._last_layout = None
+        self._last_image = None
+        self.last_strip_array = None
+    
+    @staticmethod
+    def _file_mtime(path: Optional[str]) -> Optional[float]:
+        """Return a file's mtime, or None if it does not exist."""
+        if not path:
+            return None
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+    
+    def _get_tile(self, key: Tuple) -> np.ndarray:
+        """Return the pixel array for a tile key, rendering it on a cache miss."""
+        tile = self._tile_cache.get(key)
+        if tile is not None:
+            self.tiles_reused += 1
+            return tile
+        if key[0] == 'league':
+            image = self._render_league_tile(key[2])
+        else:
+            _, _, league_key, team_id, abbreviation, number_text, logo_dir, _ = key
+            image = self._render_team_tile(league_key, team_id, abbreviation, number_text, logo_dir)
+        tile = np.asarray(image, dtype=np.uint8)
+        self._tile_cache[key] = tile
+        self.tiles_rendered += 1
+        return tile
+    
+    def _render_league_tile(self, league_logo_path: str) -> Image.Image:
+        """Render a league header: the league logo centered in its slot plus the gap before the teams."""
+        height = self.display_height
+        tile = Image.new('RGB', (self.LEAGUE_LOGO_WIDTH + self.LEAGUE_HEADER_GAP, height), (0, 0, 0))
+        league_logo = self._get_league_logo(league_logo_path)
+        if league_logo:
+            logo_height = height - 4
+            logo_width = int(logo_height * league_logo.width / league_logo.height)
+            logo_x = (self.LEAGUE_LOGO_WIDTH - logo_width) // 2
+            logo_y = 2
+            league_logo = league_logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
+            tile.paste(league_logo, (logo_x, logo_y), league_logo if league_logo.mode == 'RGBA' else None)
+        return tile
+    
+    def _render_team_tile(self, league_key: str, team_id: Optional[str], team_abbr: str,
+                          number_text: str, logo_dir: str) -> Image.Image:
+        """Render a team entry: rank/number, logo (when available) and abbreviation."""
+        height = self.display_height
+        logo_size = int(height * 1.2)
+        
+        number_bbox = self.fonts['xlarge'].getbbox(number_text)
+        number_width = number_bbox[2] - number_bbox[0]
+        number_height = number_bbox[3] - number_bbox[1]
+        text_bbox = self.fonts['large'].getbbox(team_abbr)
+        text_width = text_bbox[2] - text_bbox[0]
+        text_height = text_bbox[3] - text_bbox[1]
+        
+        team_logo = self._get_team_logo(league_key, team_id, team_abbr, logo_dir)
+        logo_width = logo_size + 4 if team_logo else 0
+        tile = Image.new('RGB', (number_width + 4 + logo_width + text_width + 12, height), (0, 0, 0))
+        draw = ImageDraw.Draw(tile)
+        
+        self._draw_text_with_outline(draw, number_text, (0, (height - number_height) // 2),
+                                     self.fonts['xlarge'], fill=(255, 255, 0))
+        
+        text_x = number_width + 4
+        if team_logo:
+            team_logo = team_logo.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
+            tile.paste(team_logo, (text_x, (height - logo_size) // 2),
+                       team_logo if team_logo.mode == 'RGBA' else None)
+            text_x += logo_size + 4
+        
+        self._draw_text_with_outline(draw, team_abbr, (text_x, (height - text_height) // 2),
+                                     self.fonts['large'], fill=(255, 255, 255))
+        return tile
+    
     def _get_number_text(self, league_key: str, league_config: Dict[str, Any],
                          team: Dict[str, Any], index: int) -> str:
         """Get the number/ranking text to display for a team."""
@@ -39,6 +39,10 @@ class LeaderboardPlugin(BasePlugin):
     conference/division filtering, and scrolling ticker format.
     """
 
+    # Standings fetching and parsing can run in the plugin update worker
+    # (plugin_system.separate_update_process)
+    UPDATE_SNAPSHOT_ATTRIBUTES = ('leaderboard_data', 'last_update')
+
     def __init__(self, plugin_id: str, config: Dict[str, Any],
                  display_manager, cache_manager, plugin_manager):
         """Initialize the leaderboard plugin."""
@@ -256,6 +260,14 @@ class LeaderboardPlugin(BasePlugin):
         except Exception as e:
             self.logger.error(f"Error updating leaderboard data: {e}", exc_info=True)
     
+    def apply_update_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Take over standings fetched by the update worker."""
+        refreshed = snapshot.get('last_update') != self.last_update
+        super().apply_update_snapshot(snapshot)
+        if refreshed:
+            # Rebuild the scrolling image from the new data, as update() does
+            self.scroll_helper.clear_cache()
+
     def display(self, force_clear: bool = False) -> None:
         """Display the scrolling leaderboard."""
         if not self.enabled:
@@ -331,8 +343,11 @@ class LeaderboardPlugin(BasePlugin):
             leaderboard_image = self.image_renderer.create_leaderboard_image(self.leaderboard_data)
             
             if leaderboard_image:
-                # Set up scroll helper with the image (properly initializes cached_array and state)
-                self.scroll_helper.set_scrolling_image(leaderboard_image)
+                # Set up scroll helper with the image (properly initializes cached_array and state).
+                # The renderer's assembled strip array is reused so the image isn't converted again.
+                self.scroll_helper.set_scrolling_image(
+                    leaderboard_image, image_array=self.image_renderer.last_strip_array
+                )
                 # Dynamic duration is automatically calculated by set_scrolling_image()
                 self._cycle_complete = False
                 
@@ -613,4 +628,5 @@ class LeaderboardPlugin(BasePlugin):
         self.leaderboard_data = []
         if self.scroll_helper:
             self.scroll_helper.clear_cache()
+        self.image_renderer.clear_tile_cache()
         self.logger.info("Leaderboard plugin cleaned up")
@@ -0,0 +1,301 @@
+"""
+Album Art Cache for the Music Plugin
+
+Keeps album art pre-resized to the panel's target size so track changes can
+render art immediately:
+
+- An in-memory LRU of ready-to-paste images sits in front of
+- a content-addressed disk store. Downloaded bytes are hashed, and each
+  processed variant is saved as ``<sha256>_<w>x<h>.png``. A small URL index
+  maps art URLs to content hashes, so different URLs serving the same cover
+  (common with YouTube Music thumbnails) share one file. The store holds at
+  most ``max_disk_items`` files; the least recently used are evicted (file
+  modification times record use).
+
+Downloads run on a background worker; callers never block the render path.
+A URL whose download failed isn't prefetched again until its backoff
+(doubling from ``FAILURE_BACKOFF`` up to ``MAX_FAILURE_BACKOFF``) expires.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Dict, Optional, Set, Tuple
+
+import requests
+from PIL import Image, ImageEnhance
+
+
+class AlbumArtCache:
+    """Two-level (memory LRU + disk) cache of processed album art."""
+
+    INDEX_FILE = 'index.json'
+    MAX_INDEX_ENTRIES = 2000
+    FAILURE_BACKOFF = 30.0  # Seconds before retrying a failed URL; doubles per failure
+    MAX_FAILURE_BACKOFF = 3600.0
+
+    def __init__(self, cache_dir: Optional[str], max_memory_items: int = 32,
+                 logger: Optional[logging.Logger] = None, timeout: float = 5.0,
+                 max_disk_items: int = 500):
+        """
+        Initialize the album art cache.
+
+        Args:
+            cache_dir: Directory for processed art files (None = memory only)
+            max_memory_items: Number of processed images kept in memory
+            logger: Optional logger instance
+            timeout: Download timeout in seconds
+            max_disk_items: Number of processed art files kept on disk
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self.timeout = timeout
+
+        self._memory: "OrderedDict[Tuple[str, Tuple[int, int]], Image.Image]" = OrderedDict()
+        self._url_index: Dict[str, str] = {}
+        self._in_flight: Set[Tuple[str, Tuple[int, int]]] = set()
+        # URL -> (retry not before, consecutive failures)
+        self._failures: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="music-art")
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self._load_index()
+                self._evict_disk()
+            except OSError as e:
+                self.logger.warning(f"Album art disk cache unavailable at {self.cache_dir}: {e}")
+                self.cache_dir = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_cached(self, url: str, target_size: Tuple[int, int]) -> Optional[Image.Image]:
+        """Return processed art from memory or disk without any network access."""
+        if not url:
+            return None
+        key = (url, tuple(target_size))
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                return image
+            digest = self._url_index.get(url)
+
+        if digest:
+            image = self._load_from_disk(digest, key[1])
+            if image is not None:
+                self._remember(key, image)
+                return image
+        return None
+
+    def fetch(self, url: str, target_size: Tuple[int, int]) -> Optional[Image.Image]:
+        """Return processed art, downloading it if needed (blocking)."""
+        image = self.get_cached(url, target_size)
+        if image is not None:
+            return image
+
+        size = tuple(target_size)
+        try:
+            response = self._session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            content = response.content
+            digest = hashlib.sha256(content).hexdigest()
+
+            # Another URL may already have produced this exact cover
+            image = self._load_from_disk(digest, size)
+            if image is None:
+                image = self._process(content, size)
+                self._save_to_disk(digest, size, image)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error fetching image from {url}: {e}")
+            self._record_failure(url)
+            return None
+        except IOError as e:
+            self.logger.error(f"Error processing image from {url}: {e}")
+            self._record_failure(url)
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching/processing image {url}: {e}")
+            self._record_failure(url)
+            return None
+
+        with self._lock:
+            self._failures.pop(url, None)
+            self._url_index[url] = digest
+            while len(self._url_index) > self.MAX_INDEX_ENTRIES:
+                self._url_index.pop(next(iter(self._url_index)))
+        self._save_index()
+        self._remember((url, size), image)
+        return image
+
+    def prefetch(self, url: str, target_size: Tuple[int, int]) -> bool:
+        """
+        Schedule a background fetch if the art isn't cached, already in flight
+        or backing off after a failed download.
+
+        Returns:
+            True if a download was scheduled
+        """
+        if not url or self.get_cached(url, target_size) is not None:
+            return False
+        key = (url, tuple(target_size))
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            failure = self._failures.get(url)
+            if failure is not None and time.monotonic() < failure[0]:
+                return False
+            self._in_flight.add(key)
+
+        def _run():
+            try:
+                self.fetch(url, key[1])
+            finally:
+                with self._lock:
+                    self._in_flight.discard(key)
+
+        try:
+            self._executor.submit(_run)
+        except RuntimeError:
+            # Executor already shut down
+            with self._lock:
+                self._in_flight.discard(key)
+            return False
+        self.logger.debug(f"Prefetching album art: {url}")
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the background worker and close the HTTP session."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _process(content: bytes, target_size: Tuple[int, int]) -> Image.Image:
+        """Resize and enhance downloaded art, letterboxed onto the target size."""
+        img = Image.open(BytesIO(content))
+
+        # Ensure image is RGB for compatibility with the matrix
+        img = img.convert("RGB")
+        img.thumbnail(target_size, Image.Resampling.LANCZOS)
+
+        # Enhance contrast and saturation (Color)
+        img = ImageEnhance.Contrast(img).enhance(1.3)
+        img = ImageEnhance.Color(img).enhance(1.3)
+
+        final_img = Image.new("RGB", target_size, (0, 0, 0))
+        paste_x = (target_size[0] - img.width) // 2
+        paste_y = (target_size[1] - img.height) // 2
+        final_img.paste(img, (paste_x, paste_y))
+        return final_img
+
+    def _remember(self, key: Tuple[str, Tuple[int, int]], image: Image.Image) -> None:
+        with self._lock:
+            self._memory[key] = image
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    def _record_failure(self, url: str) -> None:
+        with self._lock:
+            failures = self._failures.pop(url, (0.0, 0))[1] + 1
+            delay = min(self.MAX_FAILURE_BACKOFF, self.FAILURE_BACKOFF * 2 ** (failures - 1))
+            self._failures[url] = (time.monotonic() + delay, failures)
+            while len(self._failures) > self.MAX_INDEX_ENTRIES:
+                self._failures.pop(next(iter(self._failures)))
+
+    def _variant_path(self, digest: str, size: Tuple[int, int]) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{digest}_{size[0]}x{size[1]}.png")
+
+    def _load_from_disk(self, digest: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+        path = self._variant_path(digest, size)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with Image.open(path) as img:
+                image = img.convert("RGB")
+            # Mark as recently used for disk eviction
+            os.utime(path)
+            return image
+        except (IOError, OSError) as e:
+            self.logger.warning(f"Discarding unreadable cached album art {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _save_to_disk(self, digest: str, size: Tuple[int, int], image: Image.Image) -> None:
+        path = self._variant_path(digest, size)
+        if not path:
+            return
+        tmp_path = f"{path}.tmp"
+        try:
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+        except (IOError, OSError) as e:
+            self.logger.warning(f"Could not write album art cache file {path}: {e}")
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Remove the least recently used art files beyond ``max_disk_items``."""
+        if not self.cache_dir:
+            return
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir)
+                       if entry.is_file() and entry.name.endswith('.png')]
+            if len(entries) <= self.max_disk_items:
+                return
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+        except OSError as e:
+            self.logger.warning(f"Could not list album art cache {self.cache_dir}: {e}")
+            return
+        for entry in entries[:len(entries) - self.max_disk_items]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _load_index(self) -> None:
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        try:
+            with open(path, 'r') as f:
+                index = json.load(f)
+            if isinstance(index, dict):
+                self._url_index = {str(k): str(v) for k, v in index.items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring corrupt album art index {path}: {e}")
+
+    def _save_index(self) -> None:
+        if not self.cache_dir:
+            return
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        with self._lock:
+            snapshot = dict(self._url_index)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write album art index {path}: {e}")
@@ -12,15 +12,14 @@ from enum import Enum, auto
 import logging
 import json
 import os
-from io import BytesIO
-import requests
-from typing import Union, Dict, Any
-from PIL import Image, ImageEnhance, ImageFont
+from typing import Union, Dict, Any, Optional
+from PIL import Image, ImageFont
 import queue
 
 # Import client modules
 from spotify_client import SpotifyClient
 from ytm_client import YTMClient
+from album_art_cache import AlbumArtCache
 
 # Import base plugin class
 from src.plugin_system.base_plugin import BasePlugin
@@ -105,6 +104,13 @@ class MusicPlugin(BasePlugin):
         
         # Load configuration with flattened access
         self._load_config()
+
+        # Pre-resized album art: memory LRU in front of a persistent disk cache
+        art_cache_dir = None
+        if getattr(self.cache_manager, 'cache_dir', None):
+            art_cache_dir = os.path.join(self.cache_manager.cache_dir, 'music_album_art')
+        self.art_cache = AlbumArtCache(art_cache_dir, logger=self.logger)
+
         self._initialize_clients()
         
         # Load custom fonts from config
@@ -359,6 +365,10 @@ class MusicPlugin(BasePlugin):
                     self.last_album_art_url = self.current_track_info.get('album_art_url')
                     self.album_art_image = None
 
+                # Warm the art cache for this track and the next one in the queue
+                self._prefetch_album_art(new_album_art_url)
+                self._prefetch_album_art(simplified_info.get('next_album_art_url'))
+
                 display_title = self.current_track_info.get('title', 'None')
                 
                 # Throttle track update logging to reduce spam
@@ -458,44 +468,34 @@ class MusicPlugin(BasePlugin):
         self._process_ytm_data_update(ytm_data, "YTM Event")
 
     def _fetch_and_resize_image(self, url: str, target_size: tuple) -> Union[Image.Image, None]:
-        """Fetch an image from a URL, resize it, and return a PIL Image object."""
+        """Fetch an image from a URL, resize it, and return a PIL Image object (cache-backed, blocking)."""
         if not url:
             return None
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-
-            img_data = BytesIO(response.content)
-            img = Image.open(img_data)
-            
-            # Ensure image is RGB for compatibility with the matrix
-            img = img.convert("RGB") 
-            
-            img.thumbnail(target_size, Image.Resampling.LANCZOS)
+        return self.art_cache.fetch(url, target_size)
 
-            # Enhance contrast
-            enhancer_contrast = ImageEnhance.Contrast(img)
-            img = enhancer_contrast.enhance(1.3)
+    def _album_art_target_size(self) -> tuple:
+        """Album art fills the full height of the display."""
+        size = self.display_manager.matrix.height
+        return (size, size)
 
-            # Enhance saturation (Color)
-            enhancer_saturation = ImageEnhance.Color(img)
-            img = enhancer_saturation.enhance(1.3)
-            
-            final_img = Image.new("RGB", target_size, (0,0,0))
-            paste_x = (target_size[0] - img.width) // 2
-            paste_y = (target_size[1] - img.height) // 2
-            final_img.paste(img, (paste_x, paste_y))
-            
-            return final_img
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error fetching image from {url}: {e}")
-            return None
-        except IOError as e:
-            self.logger.error(f"Error processing image from {url}: {e}")
-            return None
+    def _prefetch_album_art(self, url: Optional[str]) -> None:
+        """Warm the art cache for an upcoming track in the background."""
+        if not url:
+            return
+        try:
+            self.art_cache.prefetch(url, self._album_art_target_size())
         except Exception as e:
-            self.logger.error(f"Unexpected error fetching/processing image {url}: {e}")
-            return None
+            self.logger.debug(f"Album art prefetch skipped for {url}: {e}")
+
+    def _prefetch_next_spotify_art(self) -> None:
+        """Prefetch art for the first track in the Spotify queue, if available."""
+        if not self.spotify or not hasattr(self.spotify, 'get_queue'):
+            return
+        queue_data = self.spotify.get_queue()
+        upcoming = (queue_data or {}).get('queue') or []
+        if upcoming:
+            images = (upcoming[0].get('album') or {}).get('images') or []
+            self._prefetch_album_art(images[0].get('url') if images else None)
 
     def _poll_music_data(self):
         """Continuously poll music sources for updates, respecting preferences."""
@@ -554,6 +554,11 @@ class MusicPlugin(BasePlugin):
                                 self.logger.debug(f"Polling Spotify: Active track - {spotify_track.get('item', {}).get('name')}")
                             else:
                                 self.logger.debug("Polling Spotify: No change in simplified track info.")
+
+                        # Warm the art cache outside the lock; the queue lookup is a network call
+                        if significant_change_for_callback:
+                            self._prefetch_album_art(simplified_info_poll.get('album_art_url'))
+                            self._prefetch_next_spotify_art()
                         
                     else:
                         self.logger.debug("Polling Spotify: No active track or player paused.")
@@ -653,6 +658,15 @@ class MusicPlugin(BasePlugin):
             thumbnails = video_info.get('thumbnails', [])
             album_art_url = thumbnails[0].get('url') if thumbnails else None
 
+            # Art for the next queued track, so it can be prefetched
+            next_album_art_url = None
+            queue_info = player_info.get('queue') or {}
+            queue_items = queue_info.get('items') or []
+            selected_index = queue_info.get('selectedItemIndex')
+            if isinstance(selected_index, int) and 0 <= selected_index + 1 < len(queue_items):
+                next_thumbnails = queue_items[selected_index + 1].get('thumbnails') or []
+                next_album_art_url = next_thumbnails[0].get('url') if next_thumbnails else None
+
             # Primary conditions for "Nothing Playing" for YTM
             if player_info.get('adPlaying', False):
                 self.logger.debug("YTM (get_simplified_track_info): Ad is playing, reporting as Nothing Playing.")
@@ -678,6 +692,7 @@ class MusicPlugin(BasePlugin):
                 'artist': artist,
                 'album': album if album else '',
                 'album_art_url': album_art_url,
+                'next_album_art_url': next_album_art_url,
                 'duration_ms': duration_ms,
                 'progress_ms': progress_ms,
                 'is_playing': is_playing_ytm,
@@ -894,26 +909,19 @@ class MusicPlugin(BasePlugin):
             if image_currently_in_cache and art_url_currently_in_cache == target_art_url_for_current_track:
                 image_to_render_this_cycle = image_currently_in_cache
             else:
-                self.logger.info(f"MusicPlugin: Fetching album art for: {target_art_url_for_current_track}")
-                fetched_image = self._fetch_and_resize_image(target_art_url_for_current_track, album_art_target_size)
-                if fetched_image:
-                    self.logger.info(f"MusicPlugin: Album art for {target_art_url_for_current_track} fetched successfully.")
+                # Only ever read the art cache here; downloads happen in the background
+                # so the render loop never blocks on the network.
+                cached_image = self.art_cache.get_cached(target_art_url_for_current_track, album_art_target_size)
+                if cached_image:
                     with self.track_info_lock:
                         latest_known_art_url_in_live_info = self.current_track_info.get('album_art_url') if self.current_track_info else None
                         if target_art_url_for_current_track == latest_known_art_url_in_live_info:
-                            self.album_art_image = fetched_image
-                            self.last_album_art_url = target_art_url_for_current_track 
-                            image_to_render_this_cycle = fetched_image
-                            self.logger.debug(f"Cached and will render new art for {target_art_url_for_current_track}")
-                        else:
-                            self.logger.info(f"MusicPlugin: Discarding fetched art for {target_art_url_for_current_track}; "
-                                        f"track changed to '{self.current_track_info.get('title', 'N/A')}' "
-                                        f"with art '{latest_known_art_url_in_live_info}' during fetch.")
-                else:
-                    self.logger.warning(f"MusicPlugin: Failed to fetch or process album art for {target_art_url_for_current_track}.")
-                    with self.track_info_lock:
-                        if self.last_album_art_url == target_art_url_for_current_track:
-                            self.album_art_image = None 
+                            self.album_art_image = cached_image
+                            self.last_album_art_url = target_art_url_for_current_track
+                    image_to_render_this_cycle = cached_image
+                    self.logger.debug(f"Rendering cached album art for {target_art_url_for_current_track}")
+                elif self.art_cache.prefetch(target_art_url_for_current_track, album_art_target_size):
+                    self.logger.info(f"MusicPlugin: Fetching album art in background for: {target_art_url_for_current_track}")
         else:
             with self.track_info_lock:
                 if self.album_art_image is not None or self.last_album_art_url is not None:
@@ -1248,4 +1256,5 @@ class MusicPlugin(BasePlugin):
         """Clean up resources when plugin is unloaded."""
         self.logger.info("Music plugin: Cleaning up resources...")
         self.stop_polling()
+        self.art_cache.shutdown()
         super().cleanup()
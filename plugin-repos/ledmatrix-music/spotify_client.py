@@ -162,6 +162,21 @@ class SpotifyClient:
             logging.error(f"Unexpected error fetching current track from Spotify: {e}")
             return None
 
+    def get_queue(self):
+        """Fetches the user's playback queue (currently playing item plus upcoming tracks)."""
+        if not self.is_authenticated():
+            return None
+
+        try:
+            return self.sp.queue()
+        except spotipy.exceptions.SpotifyException as e:
+            # Queue access needs the user-read-playback-state scope; treat failures as "no queue"
+            logging.debug(f"Spotify API error when fetching queue: {e}")
+            return None
+        except Exception as e:
+            logging.debug(f"Unexpected error fetching queue from Spotify: {e}")
+            return None
+
 # Example Usage (for testing, adapt to new auth flow)
 # if __name__ == '__main__':
 #     # First, ensure you have run authenticate_spotify.py successfully as the user.
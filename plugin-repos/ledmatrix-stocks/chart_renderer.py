@@ -5,13 +5,14 @@ Handles all chart drawing functionality including mini charts
 and full-screen chart displays.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
-from datetime import datetime
+from typing import Dict, Any, Tuple, Optional
 from PIL import Image, ImageDraw
 
 # Import common utilities
 from src.common import TextHelper
 
+from price_history import PriceHistory
+
 
 class StockChartRenderer:
     """Handles rendering of stock and cryptocurrency charts."""
@@ -70,13 +71,8 @@ class StockChartRenderer:
             draw = ImageDraw.Draw(image)
             
             # Get price history
-            price_history = data['price_history']
-            if len(price_history) < 2:
-                return None
-            
-            # Extract prices and timestamps
-            prices = [point['price'] for point in price_history if 'price' in point]
-            timestamps = [point['timestamp'] for point in price_history if 'timestamp' in point]
+            price_history = PriceHistory.coerce(data['price_history'])
+            prices = price_history.prices
             
             if len(prices) < 2:
                 return None
@@ -121,7 +117,7 @@ class StockChartRenderer:
             self._draw_price_labels(draw, min_price, max_price, chart_x, chart_y, chart_height)
             
             # Draw time labels
-            self._draw_time_labels(draw, timestamps, chart_x, chart_y, chart_width, chart_height)
+            self._draw_time_labels(draw, price_history, chart_x, chart_y, chart_width, chart_height)
             
             return image
             
@@ -192,7 +188,7 @@ class StockChartRenderer:
         except Exception as e:
             self.logger.error("Error drawing price labels: %s", e)
     
-    def _draw_time_labels(self, draw: ImageDraw.Draw, timestamps: List[datetime], 
+    def _draw_time_labels(self, draw: ImageDraw.Draw, price_history: PriceHistory, 
                          chart_x: int, chart_y: int, chart_width: int, chart_height: int) -> None:
         """Draw time labels on the X-axis."""
         try:
@@ -200,23 +196,23 @@ class StockChartRenderer:
             fonts = self._get_fonts()
             label_font = fonts.get('time')
             
-            if not timestamps:
+            point_count = len(price_history.timestamps)
+            if point_count < 2:
                 return
             
             # Draw time labels
-            for i in range(0, len(timestamps), max(1, len(timestamps) // 3)):  # Show up to 3 time labels
-                timestamp = timestamps[i]
-                time_text = timestamp.strftime("%H:%M")
+            for i in range(0, point_count, max(1, point_count // 3)):  # Show up to 3 time labels
+                time_text = price_history.datetime_at(i).strftime("%H:%M")
                 label_bbox = draw.textbbox((0, 0), time_text, font=label_font)
                 label_width = label_bbox[2] - label_bbox[0]
-                label_x = chart_x + (i * chart_width) // (len(timestamps) - 1) - (label_width // 2)
+                label_x = chart_x + (i * chart_width) // (point_count - 1) - (label_width // 2)
                 label_y = chart_y + chart_height + 2
                 draw.text((label_x, label_y), time_text, font=label_font, fill=self.chart_colors['text'])
             
         except Exception as e:
             self.logger.error("Error drawing time labels: %s", e)
     
-    def draw_mini_chart(self, draw: ImageDraw.Draw, price_history: List[Dict], 
+    def draw_mini_chart(self, draw: ImageDraw.Draw, price_history: PriceHistory, 
                        width: int, height: int, color: Tuple[int, int, int]) -> None:
         """Draw a mini price chart (used in scrolling display)."""
         if len(price_history) < 2:
@@ -230,7 +226,7 @@ class StockChartRenderer:
             chart_y = 2
             
             # Extract prices
-            prices = [point['price'] for point in price_history if 'price' in point]
+            prices = PriceHistory.coerce(price_history).prices
             if len(prices) < 2:
                 return
             
@@ -73,6 +73,9 @@ class StockConfigManager:
         self.timeout = 10
         self.retry_count = 3
         self.rate_limit_delay = 0.1
+        self.batch_requests = True
+        self.batch_size = 20
+        self.max_workers = 4
     
     def _load_config(self) -> None:
         """Load and validate configuration."""
@@ -191,6 +194,9 @@ class StockConfigManager:
             self.timeout = self.api_config.get('timeout', 10)
             self.retry_count = self.api_config.get('retry_count', 3)
             self.rate_limit_delay = self.api_config.get('rate_limit_delay', 0.1)
+            self.batch_requests = self.api_config.get('batch_requests', True)
+            self.batch_size = max(1, min(20, int(self.api_config.get('batch_size', 20))))
+            self.max_workers = max(1, min(8, int(self.api_config.get('max_workers', 4))))
             
             self.logger.debug("Configuration loaded successfully")
             
@@ -234,6 +240,9 @@ class StockConfigManager:
         self.timeout = 10
         self.retry_count = 3
         self.rate_limit_delay = 0.1
+        self.batch_requests = True
+        self.batch_size = 20
+        self.max_workers = 4
     
     def reload_config(self) -> None:
         """Reload configuration from the main config file."""
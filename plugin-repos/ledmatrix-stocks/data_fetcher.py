@@ -7,8 +7,8 @@ for stock and cryptocurrency data from Yahoo Finance.
 
 import re
 import json
-from typing import Dict, Any, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -17,6 +17,11 @@ from urllib3.util.retry import Retry
 # Import common utilities
 from src.common import APIHelper
 
+from price_history import PriceHistory
+
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+YAHOO_SPARK_URL = "https://query1.finance.yahoo.com/v7/finance/spark"
+
 class StockDataFetcher:
     """Handles fetching stock and cryptocurrency data from Yahoo Finance API."""
     
@@ -33,6 +38,8 @@ class StockDataFetcher:
         self.timeout = config_manager.timeout
         self.retry_count = config_manager.retry_count
         self.rate_limit_delay = config_manager.rate_limit_delay
+        self.chart_url = YAHOO_CHART_URL
+        self.spark_url = YAHOO_SPARK_URL
         
         # Stock and crypto symbols
         self.stock_symbols = config_manager.stock_symbols
@@ -59,7 +66,9 @@ class StockDataFetcher:
             status_forcelist=[429, 500, 502, 503, 504],
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the pool for the concurrent per-symbol fallback
+        pool_size = max(10, getattr(self.config_manager, 'max_workers', 4))
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_size)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -81,52 +90,150 @@ class StockDataFetcher:
             self.logger.warning("Background service not available")
     
     def fetch_all_data(self) -> Dict[str, Any]:
-        """Fetch data for all configured stocks and cryptocurrencies."""
+        """
+        Fetch data for all configured stocks and cryptocurrencies.
+
+        Cached symbols are served from the cache. The remaining symbols are
+        requested in batches from the multi-symbol spark endpoint, and any
+        symbol the batch could not answer falls back to per-symbol chart
+        requests on a bounded thread pool.
+        """
         all_data = {}
-        
-        
-        # Fetch stock data
-        for symbol in self.stock_symbols:
-            try:
-                data = self.fetch_stock_data(symbol, is_crypto=False)
-                if data:
-                    all_data[symbol] = data
-                    self.logger.debug("Updated stock data for %s", symbol)
-                else:
-                    self.logger.warning("No data returned for stock %s", symbol)
-            except Exception as e:
-                self.logger.error("Error fetching stock data for %s: %s", symbol, e)
-        
-        # Fetch crypto data
+        pending: List[Tuple[str, str, str, bool]] = []
+
+        # (result key, api symbol, display symbol, is_crypto)
+        targets = [(symbol, symbol, symbol, False) for symbol in self.stock_symbols]
         for symbol in self.crypto_symbols:
+            # Add -USD suffix for Yahoo Finance API if not already present
+            api_symbol = symbol if symbol.endswith('-USD') else f"{symbol}-USD"
+            targets.append((symbol, api_symbol, api_symbol.replace('-USD', ''), True))
+
+        for key, api_symbol, display_symbol, is_crypto in targets:
+            cached = self._get_cached(display_symbol)
+            if cached:
+                all_data[key] = cached
+            else:
+                pending.append((key, api_symbol, display_symbol, is_crypto))
+
+        if pending and getattr(self.config_manager, 'batch_requests', True):
+            batch_size = getattr(self.config_manager, 'batch_size', 20)
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                batch_results = self._fetch_batch(chunk)
+                for key, api_symbol, display_symbol, is_crypto in chunk:
+                    data = batch_results.get(api_symbol)
+                    if data:
+                        all_data[key] = data
+                        self._set_cached(display_symbol, data)
+            pending = [target for target in pending if target[0] not in all_data]
+
+        if pending:
+            all_data.update(self._fetch_concurrently(pending))
+
+        for key, _, _, is_crypto in targets:
+            if key not in all_data:
+                self.logger.warning("No data returned for %s %s", 'crypto' if is_crypto else 'stock', key)
+
+        return all_data
+
+    def _fetch_batch(self, targets: List[Tuple[str, str, str, bool]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several symbols with a single spark request.
+
+        Returns:
+            Mapping of api symbol to parsed result data. Symbols missing from
+            the response are omitted so the caller can retry them individually.
+        """
+        symbols = {api_symbol: (display_symbol, is_crypto)
+                   for _, api_symbol, display_symbol, is_crypto in targets}
+        params = {
+            'symbols': ','.join(symbols),
+            'interval': '5m',
+            'range': '1d'
+        }
+        try:
+            response = self.session.get(self.spark_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.logger.warning("Batched quote request failed for %d symbols: %s", len(symbols), e)
+            return {}
+
+        results = {}
+        for entry in (payload.get('spark') or {}).get('result') or []:
+            api_symbol = entry.get('symbol')
+            chart_results = entry.get('response') or []
+            if api_symbol not in symbols or not chart_results:
+                continue
+            display_symbol, is_crypto = symbols[api_symbol]
             try:
-                # Add -USD suffix for Yahoo Finance API if not already present
-                api_symbol = symbol if symbol.endswith('-USD') else f"{symbol}-USD"
-                data = self.fetch_stock_data(api_symbol, is_crypto=True)
+                results[api_symbol] = self._parse_chart_result(chart_results[0], display_symbol, is_crypto)
+            except (KeyError, ValueError, TypeError) as e:
+                self.logger.error("Error parsing batched response for %s: %s", api_symbol, e)
+
+        self.logger.debug("Batched quote request returned %d/%d symbols", len(results), len(symbols))
+        return results
+
+    def _fetch_concurrently(self, targets: List[Tuple[str, str, str, bool]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch symbols individually using a bounded number of worker threads.
+
+        Each symbol goes through fetch_stock_data, so it uses the same cache
+        keys and background service dispatch as a single-symbol fetch.
+        """
+        results = {}
+        max_workers = min(len(targets), getattr(self.config_manager, 'max_workers', 4))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stocks-fetch") as executor:
+            futures = {
+                executor.submit(self.fetch_stock_data, api_symbol, is_crypto): key
+                for key, api_symbol, _, is_crypto in targets
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    self.logger.error("Error fetching data for %s: %s", key, e)
+                    continue
                 if data:
-                    all_data[symbol] = data  # Store with original symbol name
-                    self.logger.debug("Updated crypto data for %s", symbol)
-                else:
-                    self.logger.warning("No data returned for crypto %s", symbol)
-            except Exception as e:
-                self.logger.error("Error fetching crypto data for %s: %s", symbol, e)
-        
-        return all_data
-    
+                    results[key] = data
+                    self.logger.debug("Updated data for %s", key)
+        return results
+
+    def _get_cache_ttl(self) -> int:
+        """Get the cache max age in seconds."""
+        return self.config_manager.update_interval if hasattr(self.config_manager, 'update_interval') else 300
+
+    def _get_cached(self, display_symbol: str) -> Optional[Dict[str, Any]]:
+        """Return cached data for a symbol with its price history restored."""
+        if not self.cache_manager:
+            return None
+        cached_data = self.cache_manager.get(f"stock_data_{display_symbol}", max_age=self._get_cache_ttl())
+        if not cached_data:
+            return None
+        self.logger.debug("Using cached data for %s", display_symbol)
+        data = dict(cached_data)
+        data['price_history'] = PriceHistory.coerce(data.get('price_history'))
+        return data
+
+    def _set_cached(self, display_symbol: str, data: Dict[str, Any]) -> None:
+        """Store symbol data in the cache with a serializable price history."""
+        if not self.cache_manager:
+            return
+        cache_data = dict(data)
+        cache_data['price_history'] = PriceHistory.coerce(data.get('price_history')).to_dict()
+        self.cache_manager.set(f"stock_data_{display_symbol}", cache_data)
+        self.logger.debug("Cached data for %s (max_age: %ds)", display_symbol, self._get_cache_ttl())
+
     def fetch_stock_data(self, symbol: str, is_crypto: bool = False) -> Optional[Dict[str, Any]]:
         """Fetch data for a single stock or cryptocurrency."""
         api_symbol = symbol
         display_symbol = symbol.replace('-USD', '') if is_crypto else symbol
         
         # Check cache first
-        cache_key = f"stock_data_{display_symbol}"
-        cache_ttl = self.config_manager.update_interval if hasattr(self.config_manager, 'update_interval') else 300
-        
-        if self.cache_manager:
-            cached_data = self.cache_manager.get(cache_key, max_age=cache_ttl)
-            if cached_data:
-                self.logger.debug("Using cached data for %s", display_symbol)
-                return cached_data
+        cached_data = self._get_cached(display_symbol)
+        if cached_data:
+            return cached_data
         
         # Try background service first
         if self.background_service and hasattr(self.background_service, 'submit'):
@@ -135,9 +242,8 @@ class StockDataFetcher:
             result = self._fetch_direct(api_symbol, display_symbol, is_crypto)
         
         # Cache the result if successful
-        if result and self.cache_manager:
-            self.cache_manager.set(cache_key, result)
-            self.logger.debug("Cached data for %s (max_age: %ds)", display_symbol, cache_ttl)
+        if result:
+            self._set_cached(display_symbol, result)
         
         return result
     
@@ -161,7 +267,7 @@ class StockDataFetcher:
         try:
             
             # Build URL
-            url = f"https://query1.finance.yahoo.com/v8/finance/chart/{api_symbol}"
+            url = self.chart_url.format(symbol=api_symbol)
             params = {
                 'interval': '5m',
                 'range': '1d'
@@ -178,42 +284,7 @@ class StockDataFetcher:
                 self.logger.warning("No chart data found for %s", api_symbol)
                 return None
             
-            result = data['chart']['result'][0]
-            meta = result.get('meta', {})
-            
-            # Extract current price and change
-            current_price = meta.get('regularMarketPrice', 0)
-            previous_close = meta.get('previousClose', 0)
-            change = current_price - previous_close
-            change_percent = (change / previous_close * 100) if previous_close > 0 else 0
-            
-            # Extract price history for chart
-            price_history = []
-            if 'timestamp' in result and 'indicators' in result:
-                timestamps = result['timestamp']
-                quotes = result['indicators'].get('quote', [{}])[0]
-                closes = quotes.get('close', [])
-                
-                for i, timestamp in enumerate(timestamps):
-                    if i < len(closes) and closes[i] is not None:
-                        price_history.append({
-                            'timestamp': datetime.fromtimestamp(timestamp),
-                            'price': closes[i]
-                        })
-            
-            # Create result data - matching old manager structure
-            result_data = {
-                'symbol': display_symbol,
-                'name': meta.get('symbol', display_symbol),  # Use symbol as name if not available
-                'price': round(current_price, 2),
-                'change': round(change, 2),  # Dollar change (current_price - previous_close)
-                'change_percent': round(change_percent, 2),  # Percentage change
-                'open': previous_close,  # Store previous_close as "open" to match old structure
-                'price_history': price_history,
-                'is_crypto': is_crypto
-            }
-            
-            return result_data
+            return self._parse_chart_result(data['chart']['result'][0], display_symbol, is_crypto)
             
         except requests.exceptions.RequestException as e:
             self.logger.error("API request failed for %s: %s", api_symbol, e)
@@ -225,6 +296,32 @@ class StockDataFetcher:
             self.logger.error("Unexpected error fetching data for %s: %s", api_symbol, e)
             return None
     
+    def _parse_chart_result(self, result: Dict[str, Any], display_symbol: str, is_crypto: bool) -> Dict[str, Any]:
+        """Convert a Yahoo chart result (from the chart or spark endpoint) into plugin data."""
+        meta = result.get('meta', {})
+        
+        # Extract current price and change
+        current_price = meta.get('regularMarketPrice') or 0
+        previous_close = meta.get('previousClose') or meta.get('chartPreviousClose') or 0
+        change = current_price - previous_close
+        change_percent = (change / previous_close * 100) if previous_close > 0 else 0
+        
+        # Extract price history for chart
+        quotes = (result.get('indicators', {}).get('quote') or [{}])[0]
+        price_history = PriceHistory.from_chart(result.get('timestamp', []), quotes.get('close', []))
+        
+        # Create result data - matching old manager structure
+        return {
+            'symbol': display_symbol,
+            'name': meta.get('symbol', display_symbol),  # Use symbol as name if not available
+            'price': round(current_price, 2),
+            'change': round(change, 2),  # Dollar change (current_price - previous_close)
+            'change_percent': round(change_percent, 2),  # Percentage change
+            'open': previous_close,  # Store previous_close as "open" to match old structure
+            'price_history': price_history,
+            'is_crypto': is_crypto
+        }
+    
     def _extract_json_from_html(self, html: str) -> Dict:
         """Extract JSON data from HTML response (fallback method)."""
         try:
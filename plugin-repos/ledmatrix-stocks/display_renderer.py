@@ -6,12 +6,14 @@ scrolling and static display modes.
 """
 
 import os
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
 
 # Import common utilities
 from src.common import ScrollHelper, LogoHelper, TextHelper
 
+from price_history import PriceHistory
+
 
 class StockDisplayRenderer:
     """Handles rendering of stock and cryptocurrency displays."""
@@ -454,7 +456,7 @@ class StockDisplayRenderer:
             return (255, 0, 0)  # Red for negative
         return (255, 255, 0)  # Yellow for no change
     
-    def _draw_mini_chart(self, draw: ImageDraw.Draw, price_history: List[Dict], 
+    def _draw_mini_chart(self, draw: ImageDraw.Draw, price_history: PriceHistory, 
                         width: int, height: int, color: Tuple[int, int, int]) -> None:
         """Draw a mini price chart on the right side of the display - matching old stock_manager exactly."""
         if len(price_history) < 2:
@@ -469,7 +471,7 @@ class StockDisplayRenderer:
         chart_y = int((height - chart_height) / 2)
         
         # Extract prices - match old stock_manager exactly
-        prices = [point['price'] for point in price_history if 'price' in point]
+        prices = PriceHistory.coerce(price_history).prices
         if len(prices) < 2:
             return
         
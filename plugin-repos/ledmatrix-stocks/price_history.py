@@ -0,0 +1,78 @@
+"""
+Price History Storage for Stock Ticker Plugin
+
+Stores intraday price history as two parallel ``array('d')`` columns
+(epoch timestamps and close prices) instead of a list of per-point dicts,
+which keeps a full day of 5-minute bars to a couple of kilobytes per symbol.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class PriceHistory:
+    """Compact column store for a symbol's price history."""
+
+    __slots__ = ('timestamps', 'prices')
+
+    def __init__(self, timestamps: Optional[Iterable[float]] = None,
+                 prices: Optional[Iterable[float]] = None):
+        """Initialize from optional timestamp and price sequences."""
+        self.timestamps = array('d', timestamps or ())
+        self.prices = array('d', prices or ())
+
+    @classmethod
+    def from_chart(cls, timestamps: List[Any], closes: List[Any]) -> 'PriceHistory':
+        """Build from Yahoo chart columns, skipping points with no close."""
+        history = cls()
+        for timestamp, close in zip(timestamps or (), closes or ()):
+            if timestamp is not None and close is not None:
+                history.timestamps.append(float(timestamp))
+                history.prices.append(float(close))
+        return history
+
+    @classmethod
+    def coerce(cls, value: Any) -> 'PriceHistory':
+        """
+        Convert any supported representation into a PriceHistory.
+
+        Accepts an existing PriceHistory, the serialized dict produced by
+        :meth:`to_dict`, or the legacy list of ``{'timestamp', 'price'}``
+        points that older cache entries still contain.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(value.get('timestamps'), value.get('prices'))
+        history = cls()
+        for point in value or ():
+            if not isinstance(point, dict) or point.get('price') is None:
+                continue
+            timestamp = point.get('timestamp')
+            if isinstance(timestamp, datetime):
+                timestamp = timestamp.timestamp()
+            elif isinstance(timestamp, str):
+                try:
+                    timestamp = datetime.fromisoformat(timestamp).timestamp()
+                except ValueError:
+                    continue
+            if timestamp is None:
+                continue
+            history.timestamps.append(float(timestamp))
+            history.prices.append(float(point['price']))
+        return history
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """Return a JSON-serializable representation for the cache."""
+        return {'timestamps': self.timestamps.tolist(), 'prices': self.prices.tolist()}
+
+    def datetime_at(self, index: int) -> datetime:
+        """Return the local datetime for the point at ``index``."""
+        return datetime.fromtimestamp(self.timestamps[index])
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __repr__(self) -> str:
+        return f"PriceHistory(points={len(self)})"
@@ -22,7 +22,9 @@ from typing import Dict, Any, List, Optional
 from PIL import Image, ImageDraw
 from pathlib import Path
 
+from src.http_client import get_http_client
 from src.plugin_system.base_plugin import BasePlugin
+from src.plugin_system.render_cache import memoize_render
 
 # Import weather icons from local module
 try:
@@ -301,6 +303,7 @@ class WeatherPlugin(BasePlugin):
         self.current_display_mode = None
 
         self._layout_cache = None  # Invalidate layout cache on config change
+        self.invalidate_render_cache()
         self.logger.info("Configuration updated")
 
     def update(self) -> None:
@@ -340,6 +343,7 @@ class WeatherPlugin(BasePlugin):
         # Try to fetch weather data
         try:
             self._fetch_weather()
+            self.bump_data_version()
             self.last_update = current_time
             self.consecutive_errors = 0
             self._last_error_hint = None
@@ -442,7 +446,7 @@ class WeatherPlugin(BasePlugin):
         geo_url = f"https://api.openweathermap.org/geo/1.0/direct?q={city},{state},{country}&limit=1&appid={self.api_key}"
 
         try:
-            response = requests.get(geo_url, timeout=10)
+            response = get_http_client().get(geo_url, timeout=10)
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
             status = e.response.status_code if e.response is not None else None
@@ -475,7 +479,7 @@ class WeatherPlugin(BasePlugin):
         one_call_url = f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}&exclude=minutely&appid={self.api_key}&units={self.units}"
 
         try:
-            response = requests.get(one_call_url, timeout=10)
+            response = get_http_client().get(one_call_url, timeout=10)
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
             status = e.response.status_code if e.response is not None else None
@@ -599,6 +603,8 @@ class WeatherPlugin(BasePlugin):
                 'condition': condition,
                 'icon': icon_code
             })
+
+        self.bump_data_version()
     
     def display(self, force_clear: bool = False, display_mode: Optional[str] = None) -> None:
         """
@@ -708,6 +714,7 @@ class WeatherPlugin(BasePlugin):
         self.display_manager.image = img
         self.display_manager.update_display()
     
+    @memoize_render(lambda self: self.data_version)
     def _render_current_weather_image(self) -> Optional[Image.Image]:
         """Render current weather conditions to an Image without display side effects."""
         try:
@@ -883,6 +890,7 @@ class WeatherPlugin(BasePlugin):
             for f in self.daily_forecast[:4]
         ]
     
+    @memoize_render(lambda self: self.data_version)
     def _render_hourly_forecast_image(self) -> Optional[Image.Image]:
         """Render hourly forecast to an Image without display side effects."""
         try:
@@ -955,6 +963,7 @@ class WeatherPlugin(BasePlugin):
         except Exception as e:
             self.logger.error(f"Error displaying hourly forecast: {e}")
     
+    @memoize_render(lambda self: self.data_version)
     def _render_daily_forecast_image(self) -> Optional[Image.Image]:
         """Render daily forecast to an Image without display side effects."""
         try:
@@ -12,14 +12,23 @@ Radar: RainViewer API (free, worldwide, no API key).
 import json
 import logging
 import math
+import hashlib
 import os
+import threading
 import time
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import requests
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from src.http_client import get_http_client
+    _http = get_http_client()
+except ImportError:  # Running outside LEDMatrix
+    _http = requests
+
 logger = logging.getLogger(__name__)
 
 _MAPS_URL = "https://api.rainviewer.com/public/weather-maps.json"
@@ -28,6 +37,10 @@ _TILE_SIZE = 256
 # Path to bundled GeoJSON state boundaries
 _GEOJSON_PATH = os.path.join(os.path.dirname(__file__), "data", "us-states.geojson")
 
+# Rendered map backgrounds persisted under <cache_dir>/radar_maps
+_MAP_CACHE_VERSION = 1  # Bump when render_vector_map output changes
+_MAP_CACHE_MAX_FILES = 8
+
 
 # ---------------------------------------------------------------------------
 # Coordinate math
@@ -78,10 +91,45 @@ def _latlon_to_pixel(lat: float, lon: float, center_lat: float, center_lon: floa
     return x, y
 
 
+def _mercator_pixels(lons: np.ndarray, lats: np.ndarray, center_lat: float, center_lon: float,
+                     width: int, height: int, zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``_latlon_to_pixel`` for arrays of coordinates.
+
+    Returns float pixel positions; truncate with ``astype(int)`` to match
+    the scalar version exactly.
+    """
+    world = _TILE_SIZE * 2 ** zoom
+    cx = (center_lon + 180) / 360 * world
+    cy_rad = math.radians(center_lat)
+    cy = (1 - math.log(math.tan(cy_rad) + 1 / math.cos(cy_rad)) / math.pi) / 2 * world
+
+    px = (lons + 180) / 360 * world
+    lat_rad = np.radians(lats)
+    py = (1 - np.log(np.tan(lat_rad) + 1 / np.cos(lat_rad)) / math.pi) / 2 * world
+    return (px - cx) + width / 2, (py - cy) + height / 2
+
+
 # ---------------------------------------------------------------------------
 # GeoJSON map renderer
 # ---------------------------------------------------------------------------
 
+class _StateRings:
+    """State boundary rings parsed once into NumPy arrays."""
+
+    def __init__(self, rings: List[np.ndarray]):
+        self.rings = rings  # Each ring is an (N, 2) array of [lon, lat]
+        if rings:
+            self.bboxes = np.array([
+                (r[:, 0].min(), r[:, 1].min(), r[:, 0].max(), r[:, 1].max()) for r in rings
+            ])  # (R, 4): min_lon, min_lat, max_lon, max_lat
+        else:
+            self.bboxes = np.empty((0, 4))
+
+
+_rings_cache: Optional[_StateRings] = None
+_rings_lock = threading.Lock()
+
+
 def _load_geojson() -> Optional[Dict]:
     """Load US state boundaries GeoJSON."""
     if os.path.exists(_GEOJSON_PATH):
@@ -91,6 +139,39 @@ def _load_geojson() -> Optional[Dict]:
     return None
 
 
+def _load_state_rings() -> Optional[_StateRings]:
+    """Return the parsed state rings, reading the GeoJSON on first use only."""
+    global _rings_cache
+    with _rings_lock:
+        if _rings_cache is not None:
+            return _rings_cache
+
+        geojson = _load_geojson()
+        if not geojson:
+            return None
+
+        rings = []
+        for feature in geojson.get("features", []):
+            geom = feature.get("geometry") or {}
+            gtype = geom.get("type", "")
+            coords = geom.get("coordinates", [])
+
+            polygons = []
+            if gtype == "Polygon":
+                polygons = [coords]
+            elif gtype == "MultiPolygon":
+                polygons = coords
+
+            for polygon in polygons:
+                for ring in polygon:
+                    if len(ring) < 3:
+                        continue
+                    rings.append(np.asarray([c[:2] for c in ring], dtype=np.float64))
+
+        _rings_cache = _StateRings(rings)
+        return _rings_cache
+
+
 def render_vector_map(center_lat: float, center_lon: float, width: int, height: int,
                       zoom: int, line_color: Tuple[int, int, int] = (0, 100, 50),
                       fill_color: Optional[Tuple[int, int, int]] = (15, 20, 15)) -> Image.Image:
@@ -98,59 +179,53 @@ def render_vector_map(center_lat: float, center_lon: float, width: int, height:
 
     Returns an RGB image with state outlines drawn in the WeatherStar style:
     black background (water), optional dark fill (land), colored outlines.
+
+    Rings whose bounding box falls outside the viewport (plus a margin) are
+    skipped before any of their points are projected.
     """
     img = Image.new("RGB", (width, height), (0, 0, 0))
     draw = ImageDraw.Draw(img)
 
-    geojson = _load_geojson()
-    if not geojson:
+    state_rings = _load_state_rings()
+    if not state_rings or not state_rings.rings:
         return img
 
-    features = geojson.get("features", [])
-
-    for feature in features:
-        geom = feature.get("geometry", {})
-        gtype = geom.get("type", "")
-        coords = geom.get("coordinates", [])
-
-        polygons = []
-        if gtype == "Polygon":
-            polygons = [coords]
-        elif gtype == "MultiPolygon":
-            polygons = coords
-
-        for polygon in polygons:
-            for ring in polygon:
-                # Convert GeoJSON [lon, lat] to pixel [x, y]
-                pixel_points = []
-                for coord in ring:
-                    lon, lat = coord[0], coord[1]
-                    px, py = _latlon_to_pixel(lat, lon, center_lat, center_lon,
-                                              width, height, zoom)
-                    pixel_points.append((px, py))
-
-                if len(pixel_points) < 3:
-                    continue
-
-                # Check if any point is within a reasonable margin of the display
-                margin = max(width, height)
-                visible = any(-margin < x < width + margin and -margin < y < height + margin
-                              for x, y in pixel_points)
-                if not visible:
-                    continue
-
-                # Fill land area with subtle dark color
-                if fill_color:
-                    try:
-                        draw.polygon(pixel_points, fill=fill_color)
-                    except Exception:
-                        pass
-
-                # Draw boundary outline
-                try:
-                    draw.polygon(pixel_points, outline=line_color)
-                except Exception:
-                    pass
+    # Cull by bounding box. Mercator is monotonic in both axes, so projecting
+    # the bbox corners gives the ring's pixel extent.
+    margin = max(width, height)
+    bb = state_rings.bboxes
+    left, bottom = _mercator_pixels(bb[:, 0], bb[:, 1], center_lat, center_lon, width, height, zoom)
+    right, top = _mercator_pixels(bb[:, 2], bb[:, 3], center_lat, center_lon, width, height, zoom)
+    candidates = np.nonzero(
+        (right > -margin - 1) & (left < width + margin)
+        & (bottom > -margin - 1) & (top < height + margin)
+    )[0]
+
+    for index in candidates:
+        ring = state_rings.rings[index]
+        xs, ys = _mercator_pixels(ring[:, 0], ring[:, 1], center_lat, center_lon, width, height, zoom)
+        xs = xs.astype(int)
+        ys = ys.astype(int)
+
+        # Check if any point is within a reasonable margin of the display
+        visible = ((xs > -margin) & (xs < width + margin) & (ys > -margin) & (ys < height + margin)).any()
+        if not visible:
+            continue
+
+        pixel_points = list(zip(xs.tolist(), ys.tolist()))
+
+        # Fill land area with subtle dark color
+        if fill_color:
+            try:
+                draw.polygon(pixel_points, fill=fill_color)
+            except Exception:
+                pass
+
+        # Draw boundary outline
+        try:
+            draw.polygon(pixel_points, outline=line_color)
+        except Exception:
+            pass
 
     return img
 
@@ -180,17 +255,68 @@ class RadarFetcher:
         self._last_fetch = 0.0
         self._last_frame_advance = 0.0
 
+    def _map_cache_path(self, width: int, height: int) -> Optional[str]:
+        """Disk cache path for the rendered map, or None without a cache dir."""
+        cache_dir = getattr(self.cache, 'cache_dir', None)
+        if not cache_dir:
+            return None
+        try:
+            geojson_mtime = os.stat(_GEOJSON_PATH).st_mtime_ns
+        except OSError:
+            return None
+        key = repr((_MAP_CACHE_VERSION, geojson_mtime, self.lat, self.lon, self.zoom,
+                    width, height, tuple(self.line_color),
+                    tuple(self.fill_color) if self.fill_color else None))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(cache_dir, "radar_maps", f"map_{digest}.png")
+
     def _render_map(self, width: int, height: int) -> Image.Image:
-        """Render the vector map background at display resolution."""
-        return render_vector_map(
+        """Render the vector map background at display resolution.
+
+        The rendered map is persisted keyed by location, zoom, size and
+        colors, so restarts and resizes back to a known size skip rendering.
+        """
+        cache_path = self._map_cache_path(width, height)
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with Image.open(cache_path) as cached:
+                    if cached.size == (width, height):
+                        return cached.convert("RGB")
+            except Exception as e:
+                logger.debug(f"[Radar] Ignoring unreadable map cache {cache_path}: {e}")
+
+        img = render_vector_map(
             self.lat, self.lon, width, height, self.zoom,
             line_color=self.line_color, fill_color=self.fill_color,
         )
 
+        if cache_path:
+            tmp_path = f"{cache_path}.tmp"
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                img.save(tmp_path, format="PNG")
+                os.replace(tmp_path, cache_path)
+                self._prune_map_cache(os.path.dirname(cache_path))
+            except OSError as e:
+                logger.debug(f"[Radar] Could not write map cache {cache_path}: {e}")
+        return img
+
+    @staticmethod
+    def _prune_map_cache(directory: str) -> None:
+        """Keep only the most recently written map renders."""
+        try:
+            paths = [os.path.join(directory, name) for name in os.listdir(directory)
+                     if name.startswith("map_") and name.endswith(".png")]
+            paths.sort(key=os.path.getmtime, reverse=True)
+            for stale in paths[_MAP_CACHE_MAX_FILES:]:
+                os.remove(stale)
+        except OSError:
+            pass
+
     def _fetch_radar_paths(self) -> List[Tuple[str, int]]:
         """Get available radar frame paths and timestamps from RainViewer."""
         try:
-            resp = requests.get(_MAPS_URL, timeout=10)
+            resp = _http.get(_MAPS_URL, timeout=10)
             resp.raise_for_status()
             data = resp.json()
             past = data.get("radar", {}).get("past", [])
@@ -204,7 +330,7 @@ class RadarFetcher:
         tx, ty = _latlon_to_tile(self.lat, self.lon, self.zoom)
         url = f"https://tilecache.rainviewer.com{path}/{_TILE_SIZE}/{self.zoom}/{tx}/{ty}/2/1_1.png"
         try:
-            resp = requests.get(url, timeout=10)
+            resp = _http.get(url, timeout=10)
             resp.raise_for_status()
             if resp.content[:4] != b"\x89PNG":
                 return None
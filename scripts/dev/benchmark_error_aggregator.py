@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: ErrorAggregator under an error storm.
+
+Records a large number of errors from a few flapping plugins and reports
+the cost per record_error() call at the start and end of the run, plus the
+cost of get_error_summary() and get_plugin_health() once the aggregator is
+full. With bounded storage all of these stay flat as the error count grows.
+
+Usage: python3 scripts/dev/benchmark_error_aggregator.py [--errors 100000] [--plugins 5] [--max-records 1000]
+"""
+
+import argparse
+import logging
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.error_aggregator import ErrorAggregator  # noqa: E402
+
+ERROR_TYPES = (ValueError, KeyError, TimeoutError, ConnectionError)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--errors', type=int, default=100_000, help='Number of errors to record')
+    parser.add_argument('--plugins', type=int, default=5, help='Number of failing plugins')
+    parser.add_argument('--max-records', type=int, default=1000, help='ErrorAggregator max_records')
+    parser.add_argument('--repeat', type=int, default=200, help='Query repetitions')
+    args = parser.parse_args()
+
+    # Pattern warnings would dominate the timing
+    logging.getLogger('src.error_aggregator').setLevel(logging.ERROR)
+    aggregator = ErrorAggregator(max_records=args.max_records)
+    plugins = [f"plugin-{i}" for i in range(args.plugins)]
+    errors = [ERROR_TYPES[i % len(ERROR_TYPES)](f"upstream failure {i}") for i in range(100)]
+
+    chunk = max(1, args.errors // 10)
+    chunk_times = []
+    recorded = 0
+    while recorded < args.errors:
+        count = min(chunk, args.errors - recorded)
+        start = time.perf_counter()
+        for i in range(recorded, recorded + count):
+            aggregator.record_error(errors[i % len(errors)], plugin_id=plugins[i % len(plugins)],
+                                    operation="update")
+        chunk_times.append((time.perf_counter() - start) / count)
+        recorded += count
+
+    summary_time = timeit.timeit(aggregator.get_error_summary, number=args.repeat) / args.repeat
+    health_time = timeit.timeit(lambda: aggregator.get_plugin_health(plugins[0]),
+                                number=args.repeat) / args.repeat
+
+    summary = aggregator.get_error_summary()
+    print(f"errors: {recorded}, plugins: {len(plugins)}, records kept: {summary['total_errors']}, "
+          f"patterns: {len(summary['active_patterns'])}")
+    print(f"record_error (first {chunk}): {chunk_times[0] * 1e6:9.1f} us/error")
+    print(f"record_error (last {chunk}):  {chunk_times[-1] * 1e6:9.1f} us/error")
+    print(f"get_error_summary:           {summary_time * 1e6:9.1f} us")
+    print(f"get_plugin_health:           {health_time * 1e6:9.1f} us")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: chained GameHelper filters vs. a GameIndex query.
+
+Runs the composite query "favorite teams, live or final in the last 48 h,
+sorted newest first" both ways over a large scoreboard and checks that both
+return the same games.
+
+By default an NCAA football Saturday-sized scoreboard (~800 games) is
+generated. To use a recorded payload instead, save an ESPN scoreboard
+response, e.g.
+
+    curl -o ncaa.json 'https://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard?groups=80&limit=1000'
+
+Usage: python3 scripts/dev/benchmark_game_index.py [--payload ncaa.json] [--games 800] [--repeat 200]
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.common.game_helper import GameHelper  # noqa: E402
+
+
+def generate_payload(game_count: int, seed: int = 7) -> dict:
+    """Generate ESPN-shaped scoreboard events spread over a week."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    teams = [f"T{i:03d}" for i in range(max(2, game_count // 2 * 2))]
+    events = []
+    for i in range(game_count):
+        home, away = rng.sample(teams, 2)
+        start = now + timedelta(hours=rng.uniform(-120, 72))
+        if start > now:
+            state = 'pre'
+        elif start > now - timedelta(hours=3):
+            state = 'in'
+        else:
+            state = 'post'
+        events.append({
+            'id': str(400000000 + i),
+            'date': start.strftime('%Y-%m-%dT%H:%MZ'),
+            'competitions': [{
+                'status': {'displayClock': '7:21', 'period': 2,
+                           'type': {'state': state, 'name': 'STATUS_X', 'shortDetail': '7:21 - 2nd'}},
+                'competitors': [
+                    {'id': home, 'homeAway': 'home', 'score': str(rng.randint(0, 49)),
+                     'team': {'abbreviation': home}, 'records': [{'summary': '5-2'}]},
+                    {'id': away, 'homeAway': 'away', 'score': str(rng.randint(0, 49)),
+                     'team': {'abbreviation': away}, 'records': [{'summary': '3-4'}]},
+                ],
+            }],
+        })
+    return {'events': events}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--payload', help='Recorded ESPN scoreboard JSON')
+    parser.add_argument('--games', type=int, default=800, help='Generated game count (without --payload)')
+    parser.add_argument('--favorites', type=int, default=6, help='Number of favorite teams')
+    parser.add_argument('--repeat', type=int, default=200, help='Query repetitions')
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    else:
+        payload = generate_payload(args.games)
+
+    helper = GameHelper()
+    games = helper.process_games(payload.get('events', []), sport='football')
+    teams = sorted({g['home_abbr'] for g in games} | {g['away_abbr'] for g in games})
+    favorites = random.Random(1).sample(teams, min(args.favorites, len(teams)))
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=48)
+
+    def chained():
+        selected = helper.filter_favorite_teams(games, favorites)
+        selected = [g for g in selected if g.get('is_live') or g.get('is_final')]
+        selected = [g for g in selected if g.get('start_time_utc') and g['start_time_utc'] >= cutoff]
+        return helper.sort_games_by_time(selected, reverse=True)
+
+    index = helper.build_index(games)
+
+    def indexed():
+        return index.query(states=['live', 'final'], teams=favorites, start=cutoff, reverse=True)
+
+    expected = [g['id'] for g in chained()]
+    actual = [g['id'] for g in indexed()]
+    if sorted(expected) != sorted(actual):
+        print("Mismatch between chained filters and index query", file=sys.stderr)
+        return 1
+
+    build = timeit.timeit(lambda: helper.build_index(games), number=max(1, args.repeat // 10)) / max(1, args.repeat // 10)
+    chained_time = timeit.timeit(chained, number=args.repeat) / args.repeat
+    indexed_time = timeit.timeit(indexed, number=args.repeat) / args.repeat
+
+    print(f"games: {len(games)}, favorites: {len(favorites)}, matches: {len(actual)}")
+    print(f"chained filters: {chained_time * 1e6:9.1f} us/query")
+    print(f"index query:     {indexed_time * 1e6:9.1f} us/query ({chained_time / indexed_time:.1f}x)")
+    print(f"index build:     {build * 1e6:9.1f} us (once per payload)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: logging overhead per display frame.
+
+Simulates a render loop that logs a few records per frame while the log
+sink is slow (an SD card flush or journald back-pressure, emulated with a
+fixed delay per write), and compares synchronous handlers with the queued
+LogPipeline used by setup_logging(). Reports the logging time spent on the
+render thread per frame.
+
+Usage: python3 scripts/dev/benchmark_logging.py [--frames 500] [--records-per-frame 3] [--sink-delay-ms 2]
+"""
+
+import argparse
+import io
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.logging_config import ContextualFormatter, LogPipeline  # noqa: E402
+
+
+class SlowStream(io.StringIO):
+    """Stream whose writes stall for a fixed time."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def write(self, s: str) -> int:
+        time.sleep(self.delay)
+        return super().write(s)
+
+
+def run_frames(logger: logging.Logger, frames: int, per_frame: int) -> list:
+    """Log per_frame records per frame and return the logging time of each frame."""
+    overheads = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        for i in range(per_frame):
+            logger.debug("frame %d: plugin %d rendered in %.1f ms", frame, i, 4.2)
+        overheads.append(time.perf_counter() - start)
+    return overheads
+
+
+def report(label: str, overheads: list) -> None:
+    ordered = sorted(overheads)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<12} mean {statistics.mean(overheads) * 1e6:9.1f} us/frame, "
+          f"p99 {p99 * 1e6:9.1f} us, max {ordered[-1] * 1e6:9.1f} us")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--frames', type=int, default=500, help='Frames to simulate')
+    parser.add_argument('--records-per-frame', type=int, default=3, help='Log records per frame')
+    parser.add_argument('--sink-delay-ms', type=float, default=2.0, help='Delay per write to the log sink')
+    args = parser.parse_args()
+
+    formatter = ContextualFormatter(include_context=True)
+
+    sync_handler = logging.StreamHandler(SlowStream(args.sink_delay_ms / 1000))
+    sync_handler.setFormatter(formatter)
+    sync_logger = logging.getLogger('benchmark.sync')
+    sync_logger.addHandler(sync_handler)
+    sync_logger.setLevel(logging.DEBUG)
+    sync_logger.propagate = False
+    report('synchronous', run_frames(sync_logger, args.frames, args.records_per_frame))
+
+    queued_handler = logging.StreamHandler(SlowStream(args.sink_delay_ms / 1000))
+    queued_handler.setFormatter(formatter)
+    pipeline = LogPipeline([queued_handler], debug_rate=None)
+    pipeline.start()
+    queued_logger = logging.getLogger('benchmark.queued')
+    queued_logger.addHandler(pipeline.handler)
+    queued_logger.setLevel(logging.DEBUG)
+    queued_logger.propagate = False
+    report('queued', run_frames(queued_logger, args.frames, args.records_per_frame))
+    drain_start = time.perf_counter()
+    pipeline.stop()
+    stats = pipeline.stats()
+    print(f"queued: dropped {stats['dropped']} records, "
+          f"listener drained the backlog in {time.perf_counter() - drain_start:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Benchmark frame jitter with plugin updates in the display process vs the update worker.
+
+A synthetic plugin whose update() parses a large JSON document and renders
+thumbnails with PIL is installed into a temporary plugins directory. A
+render loop then composes and "pushes" frames at a fixed rate for a while,
+servicing plugin updates the way the display controller does, first with
+updates running in-process and then with plugin_system.separate_update_process
+(src/plugin_system/update_worker.py). The frame interval percentiles and the
+number of late frames are printed for both modes.
+
+Usage: python3 scripts/dev/benchmark_update_worker.py [--duration 10] [--fps 125] [--update-interval 1]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.config_manager import ConfigManager  # noqa: E402
+from src.frame_recorder import latency_percentiles  # noqa: E402
+from src.plugin_system.plugin_manager import PluginManager  # noqa: E402
+from src.plugin_system.update_worker import UpdateWorker  # noqa: E402
+
+PLUGIN_ID = 'cpu-heavy'
+
+PLUGIN_MANIFEST = {
+    'id': PLUGIN_ID,
+    'name': 'CPU Heavy',
+    'version': '1.0.0',
+    'entry_point': 'manager.py',
+    'class_name': 'CpuHeavyPlugin',
+    'display_modes': [PLUGIN_ID],
+}
+
+PLUGIN_SOURCE = '''
+import json
+import random
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from src.plugin_system.base_plugin import BasePlugin
+
+
+class CpuHeavyPlugin(BasePlugin):
+    """Parses a large feed and renders thumbnails on every update."""
+
+    UPDATE_SNAPSHOT_ATTRIBUTES = ('scores', 'thumbnail')
+
+    def __init__(self, plugin_id, config, display_manager, cache_manager, plugin_manager):
+        super().__init__(plugin_id, config, display_manager, cache_manager, plugin_manager)
+        self.items = int(config.get('items', 20000))
+        self.scores = []
+        self.thumbnail = None
+        self.canvas = Image.new('RGB', (128, 32))
+
+    def update(self):
+        feed = json.dumps([{'id': i, 'home': random.random(), 'away': random.random(),
+                            'name': 'team-%d' % i} for i in range(self.items)])
+        games = json.loads(feed)
+        self.scores = sorted(games, key=lambda g: g['home'] - g['away'])[:8]
+        image = Image.new('RGB', (256, 256))
+        draw = ImageDraw.Draw(image)
+        for game in games[:2000]:
+            draw.point((int(game['home'] * 255), int(game['away'] * 255)), fill=(255, 160, 0))
+        self.thumbnail = image.filter(ImageFilter.GaussianBlur(2)).resize((32, 32)).tobytes()
+
+    def display(self, force_clear=False):
+        draw = ImageDraw.Draw(self.canvas)
+        draw.rectangle((0, 0, 127, 31), fill=(0, 0, 0))
+        for row, game in enumerate(self.scores[:3]):
+            draw.text((34, row * 10), game['name'], fill=(255, 255, 255))
+        if self.thumbnail:
+            self.canvas.paste(Image.frombytes('RGB', (32, 32), self.thumbnail), (0, 0))
+'''
+
+
+def write_fixture(root: Path, update_interval: float, items: int) -> Dict[str, str]:
+    """Create the synthetic plugin and a config that enables it."""
+    plugin_dir = root / 'plugins' / PLUGIN_ID
+    plugin_dir.mkdir(parents=True)
+    (plugin_dir / 'manifest.json').write_text(json.dumps(PLUGIN_MANIFEST))
+    (plugin_dir / 'manager.py').write_text(PLUGIN_SOURCE)
+    config_path = root / 'config.json'
+    secrets_path = root / 'config_secrets.json'
+    config_path.write_text(json.dumps({
+        PLUGIN_ID: {'enabled': True, 'update_interval': update_interval, 'items': items}
+    }))
+    secrets_path.write_text('{}')
+    return {'plugins_dir': str(root / 'plugins'), 'config_path': str(config_path),
+            'secrets_path': str(secrets_path)}
+
+
+def run_render_loop(plugin_manager: PluginManager, worker: Any, duration: float,
+                    fps: float) -> Tuple[List[float], int]:
+    """Compose frames at a fixed rate while servicing plugin updates.
+
+    Returns:
+        Frame intervals and the number of plugin updates that landed
+    """
+    plugin = plugin_manager.get_plugin(PLUGIN_ID)
+    frame_time = 1.0 / fps
+    frame = Image.new('RGB', (128, 32))
+    intervals = []
+    updates_landed = 0
+    last_push = None
+    deadline = time.perf_counter()
+    end = deadline + duration
+    while deadline < end:
+        # Same order as the display loop: apply worker data, run due updates, render
+        if worker is not None:
+            updates = worker.receive()
+            if updates.ready is not None:
+                plugin_manager.delegated_update_plugins = set(updates.ready)
+            for plugin_id, (updated_at, snapshot) in updates.snapshots.items():
+                plugin_manager.get_plugin(plugin_id).apply_update_snapshot(snapshot)
+                plugin_manager.plugin_last_update[plugin_id] = updated_at
+                updates_landed += 1
+        last_update = plugin_manager.plugin_last_update.get(PLUGIN_ID)
+        plugin_manager.run_scheduled_updates()
+        if plugin_manager.plugin_last_update.get(PLUGIN_ID) != last_update:
+            updates_landed += 1
+        plugin.display()
+        frame.paste(plugin.canvas)
+        pushed_at = time.perf_counter()
+        if last_push is not None:
+            intervals.append(pushed_at - last_push)
+        last_push = pushed_at
+
+        deadline += frame_time
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            deadline = time.perf_counter()
+    return intervals, updates_landed
+
+
+def benchmark(mode: str, paths: Dict[str, str], duration: float, fps: float) -> Dict[str, Any]:
+    config_manager = ConfigManager(paths['config_path'], paths['secrets_path'])
+    config_manager.load_config()
+    plugin_manager = PluginManager(plugins_dir=paths['plugins_dir'], config_manager=config_manager)
+    plugin_manager.discover_plugins()
+    if not plugin_manager.load_plugin(PLUGIN_ID):
+        raise RuntimeError(f"Could not load the synthetic plugin from {paths['plugins_dir']}")
+    # Initial update, as the display controller does before its loop
+    plugin_manager.update_all_plugins()
+
+    worker = None
+    if mode == 'worker':
+        worker = UpdateWorker([PLUGIN_ID], paths['plugins_dir'], paths['config_path'], paths['secrets_path'])
+        worker.start()
+        # Let the worker load the plugin before measuring
+        ready_by = time.time() + 30
+        while time.time() < ready_by:
+            updates = worker.receive()
+            if updates.ready is not None:
+                plugin_manager.delegated_update_plugins = set(updates.ready)
+                break
+            time.sleep(0.05)
+        else:
+            worker.stop()
+            raise RuntimeError("Update worker did not report ready")
+    try:
+        intervals, updates_landed = run_render_loop(plugin_manager, worker, duration, fps)
+    finally:
+        if worker is not None:
+            worker.stop()
+    stats = latency_percentiles(intervals)
+    stats['late_frames'] = sum(1 for interval in intervals if interval > 2.0 / fps)
+    stats['updates'] = updates_landed
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to render in each mode')
+    parser.add_argument('--fps', type=float, default=125.0, help='Target frame rate')
+    parser.add_argument('--update-interval', type=float, default=1.0, help='Synthetic plugin update interval (s)')
+    parser.add_argument('--items', type=int, default=20000, help='Feed entries the synthetic update() parses')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    with tempfile.TemporaryDirectory(prefix='ledmatrix-update-worker-') as tmp:
+        paths = write_fixture(Path(tmp), args.update_interval, args.items)
+        results = {mode: benchmark(mode, paths, args.duration, args.fps) for mode in ('in-process', 'worker')}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"Frame intervals at {args.fps:g} FPS (target {1e3 / args.fps:.2f} ms), "
+          f"{args.duration:g}s per mode, update every {args.update_interval:g}s:")
+    for mode, stats in results.items():
+        print(f"  {mode:<10} {stats['count']:6d} frames  p50 {stats['p50'] * 1e3:7.2f} ms  "
+              f"p99 {stats['p99'] * 1e3:7.2f} ms  max {stats['max'] * 1e3:7.2f} ms  "
+              f"late {stats['late_frames']:4d}  updates {stats['updates']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
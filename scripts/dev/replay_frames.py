@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Replay a frame recording and compare it against a golden recording.
+
+Recordings are written by DisplayManager when LEDMATRIX_RECORD_FRAMES is
+set (see src/frame_recorder.py). Frames are pushed to a headless surface
+(default) or the RGBMatrixEmulator window, optionally with the recorded
+timing, and the render latency percentiles per plugin are printed. With
+--golden, every frame is compared pixel by pixel against the golden
+recording and the p95 render latency per plugin against the golden's; the
+exit status is 1 on any visual or latency regression.
+
+Usage: python3 scripts/dev/replay_frames.py RECORDING [--golden GOLDEN] [--output emulator] [--realtime]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.frame_recorder import FrameReader, RecordedFrame, compare_recordings, summarize_render_latency  # noqa: E402
+
+
+class HeadlessSurface:
+    """Keeps the last pushed frame in memory."""
+
+    def __init__(self, width: int, height: int):
+        self.image = Image.new('RGB', (width, height))
+
+    def push(self, image: Image.Image) -> None:
+        self.image = image
+
+    def close(self) -> None:
+        pass
+
+
+class EmulatorSurface:
+    """Shows frames in the RGBMatrixEmulator window (configured by emulator_config.json)."""
+
+    def __init__(self, width: int, height: int):
+        from RGBMatrixEmulator import RGBMatrix, RGBMatrixOptions
+        options = RGBMatrixOptions()
+        options.rows = height
+        options.cols = width
+        options.chain_length = 1
+        self.matrix = RGBMatrix(options=options)
+        self.canvas = self.matrix.CreateFrameCanvas()
+
+    def push(self, image: Image.Image) -> None:
+        self.canvas.SetImage(image)
+        self.canvas = self.matrix.SwapOnVSync(self.canvas)
+
+    def close(self) -> None:
+        self.matrix.Clear()
+
+
+def replay(reader: FrameReader, surface, realtime: bool) -> Iterator[RecordedFrame]:
+    """Push each recorded frame to the surface and yield it."""
+    started = time.perf_counter()
+    for frame in reader:
+        if realtime:
+            delay = frame.timestamp - (time.perf_counter() - started)
+            if delay > 0:
+                time.sleep(delay)
+        surface.push(Image.fromarray(frame.pixels))
+        yield frame
+
+
+def save_mismatches(report: dict, actual: Path, golden: Path, diff_dir: Path) -> None:
+    """Write actual/golden PNGs of the reported mismatching frames."""
+    wanted = {m['index'] for m in report['mismatches']}
+    diff_dir.mkdir(parents=True, exist_ok=True)
+    for label, path in (('actual', actual), ('golden', golden)):
+        for frame in FrameReader(path):
+            if frame.index in wanted:
+                Image.fromarray(frame.pixels).save(diff_dir / f"frame_{frame.index:06d}_{label}.png")
+
+
+def print_latency(title: str, latency: dict) -> None:
+    print(title)
+    rows = [('overall', latency['overall'])] + list(latency['by_plugin'].items())
+    for name, stats in rows:
+        if not stats.get('count'):
+            continue
+        print(f"  {name:<24} {stats['count']:7d} frames  "
+              f"p50 {stats['p50'] * 1e3:7.2f} ms  p90 {stats['p90'] * 1e3:7.2f} ms  "
+              f"p99 {stats['p99'] * 1e3:7.2f} ms  max {stats['max'] * 1e3:7.2f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('recording', type=Path, help='Recording to replay')
+    parser.add_argument('--golden', type=Path, help='Golden recording to compare against')
+    parser.add_argument('--output', choices=('headless', 'emulator'), default='headless',
+                        help='Where frames are pushed')
+    parser.add_argument('--realtime', action='store_true', help='Replay with the recorded timing')
+    parser.add_argument('--tolerance', type=int, default=0, help='Per-channel difference that still counts as equal')
+    parser.add_argument('--latency-factor', type=float, default=1.5,
+                        help='Flag plugins whose p95 render latency exceeds the golden p95 by this factor')
+    parser.add_argument('--diff-dir', type=Path, help='Write PNGs of mismatching frames here')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    reader = FrameReader(args.recording)
+    surface_class = EmulatorSurface if args.output == 'emulator' else HeadlessSurface
+    surface = surface_class(reader.width, reader.height)
+    try:
+        frames = replay(reader, surface, args.realtime)
+        if args.golden:
+            report = compare_recordings(frames, FrameReader(args.golden), tolerance=args.tolerance,
+                                        latency_factor=args.latency_factor)
+        else:
+            report = {'passed': True, 'latency': summarize_render_latency(frames)}
+    finally:
+        surface.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_latency(f"Render latency ({args.recording.name}):", report['latency'])
+        if args.golden:
+            print_latency(f"Golden render latency ({args.golden.name}):", report['golden_latency'])
+            print(f"Frames: {report['frames']} (golden {report['golden_frames']}), "
+                  f"mismatched: {report['mismatched_frames']}")
+            for mismatch in report['mismatches']:
+                print(f"  frame {mismatch['index']}: {mismatch['reason']} "
+                      f"({mismatch['pixels_changed']} pixels, mode {mismatch['display_mode']}, "
+                      f"golden mode {mismatch['golden_display_mode']})")
+            for regression in report['latency_regressions']:
+                print(f"  latency regression in {regression['plugin_id']}: p95 "
+                      f"{regression['p95'] * 1e3:.2f} ms vs golden {regression['golden_p95'] * 1e3:.2f} ms")
+            print("PASSED" if report['passed'] else "FAILED")
+
+    if args.golden and args.diff_dir and report['mismatches']:
+        save_mismatches(report, args.recording, args.golden, args.diff_dir)
+    return 0 if report['passed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
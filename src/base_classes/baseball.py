@@ -13,6 +13,7 @@ from PIL import Image, ImageDraw, ImageFont
 
 from src.base_classes.data_sources import ESPNDataSource
 from src.base_classes.sports import SportsCore, SportsLive, SportsRecent
+from src.plugin_system.render_cache import skip_render_cache
 
 
 class Baseball(SportsCore):
@@ -435,6 +436,7 @@ class BaseballLive(Baseball, SportsLive):
                 )
                 self.display_manager.image.paste(main_img.convert("RGB"), (0, 0))
                 self.display_manager.update_display()
+                skip_render_cache(self)
                 return
 
             center_y = self.display_height // 2
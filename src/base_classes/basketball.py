@@ -9,6 +9,7 @@ from src.base_classes.data_sources import ESPNDataSource
 from src.base_classes.sports import SportsCore, SportsLive
 from src.cache_manager import CacheManager
 from src.display_manager import DisplayManager
+from src.plugin_system.render_cache import skip_render_cache
 
 
 class Basketball(SportsCore):
@@ -145,6 +146,7 @@ class BasketballLive(Basketball, SportsLive):
                 )
                 self.display_manager.image.paste(main_img.convert("RGB"), (0, 0))
                 self.display_manager.update_display()
+                skip_render_cache(self)
                 return
 
             center_y = self.display_height // 2
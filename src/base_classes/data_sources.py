@@ -12,25 +12,15 @@ import logging
 from datetime import datetime, timedelta
 import time
 
+from src.http_client import get_http_client
+
 class DataSource(ABC):
     """Abstract base class for data sources."""
     
     def __init__(self, logger: logging.Logger):
         self.logger = logger
-        self.session = requests.Session()
-        
-        # Configure retry strategy
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        
-        retry_strategy = Retry(
-            total=5,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Shared pooled client (retries, HTTP caching, per-host rate limits)
+        self.session = get_http_client().session()
     
     @abstractmethod
     def fetch_live_games(self, sport: str, league: str) -> List[Dict]:
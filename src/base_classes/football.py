@@ -7,6 +7,7 @@ from PIL import Image, ImageDraw, ImageFont
 import time
 from src.base_classes.data_sources import ESPNDataSource
 from src.base_classes.sports import SportsCore, SportsLive
+from src.plugin_system.render_cache import skip_render_cache
 
 class Football(SportsCore):
     """Base class for football sports with common functionality."""
@@ -178,6 +179,7 @@ class FootballLive(Football, SportsLive):
                 self._draw_text_with_outline(draw_final, "Logo Error", (5,5), self.fonts['status'])
                 self.display_manager.image.paste(main_img.convert('RGB'), (0, 0))
                 self.display_manager.update_display()
+                skip_render_cache(self)
                 return
 
             center_y = self.display_height // 2
@@ -0,0 +1,149 @@
+"""
+Scoreboard Delta Tracking
+
+Fingerprints scoreboard events so live managers only re-extract and re-render
+games whose visible state changed, and keeps a change feed consumers can poll.
+
+A fingerprint covers what a scorebug shows: status (state, clock, period,
+detail), competitors (score, record, rank, statistics such as the saves
+behind shots on goal) and the play situation (down and distance,
+possession, count, bases). Everything else in an ESPN event - news links,
+broadcasts, venue - is ignored.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def event_fingerprint(event: Dict[str, Any]) -> str:
+    """
+    Compute a fingerprint of the displayed state of a scoreboard event.
+
+    Args:
+        event: ESPN scoreboard event
+
+    Returns:
+        Hex digest that changes whenever status, score or situation change
+    """
+    competition = (event.get('competitions') or [{}])[0]
+    competitors = [
+        (
+            c.get('homeAway'),
+            c.get('score'),
+            (c.get('team') or {}).get('abbreviation'),
+            (c.get('curatedRank') or {}).get('current'),
+            [r.get('summary') for r in c.get('records') or []],
+            [(st.get('name'), st.get('displayValue')) for st in c.get('statistics') or []],
+        )
+        for c in competition.get('competitors') or []
+    ]
+    state = {
+        'date': event.get('date'),
+        'status': competition.get('status') or event.get('status'),
+        'competitors': competitors,
+        'situation': competition.get('situation'),
+    }
+    payload = json.dumps(state, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class GameChange:
+    """One entry of the change feed."""
+
+    seq: int
+    event_id: str
+    kind: str  # 'added', 'changed' or 'removed'
+    fingerprint: Optional[str]
+    timestamp: float
+
+
+class ScoreboardDelta:
+    """Tracks event fingerprints between scoreboard refreshes."""
+
+    def __init__(self, feed_size: int = 256) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            feed_size: Number of changes kept for ``changes_since``
+        """
+        self._fingerprints: Dict[str, str] = {}
+        self._feed: Deque[GameChange] = deque(maxlen=feed_size)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[List[GameChange]], None]] = []
+
+    def update(self, events: Iterable[Dict[str, Any]]) -> Set[str]:
+        """
+        Record a scoreboard refresh.
+
+        Args:
+            events: All events in the refreshed scoreboard
+
+        Returns:
+            IDs of events that are new or whose fingerprint changed
+        """
+        now = time.time()
+        seen: Dict[str, str] = {}
+        changes: List[GameChange] = []
+        with self._lock:
+            for event in events:
+                event_id = event.get('id')
+                if event_id is None:
+                    continue
+                event_id = str(event_id)
+                fingerprint = event_fingerprint(event)
+                seen[event_id] = fingerprint
+                previous = self._fingerprints.get(event_id)
+                if previous != fingerprint:
+                    changes.append(self._record(event_id, 'added' if previous is None else 'changed', fingerprint, now))
+            for event_id in self._fingerprints.keys() - seen.keys():
+                changes.append(self._record(event_id, 'removed', None, now))
+            self._fingerprints = seen
+            listeners = list(self._listeners)
+
+        if changes:
+            for listener in listeners:
+                listener(changes)
+        return {c.event_id for c in changes if c.kind != 'removed'}
+
+    def _record(self, event_id: str, kind: str, fingerprint: Optional[str], now: float) -> GameChange:
+        self._seq += 1
+        change = GameChange(self._seq, event_id, kind, fingerprint, now)
+        self._feed.append(change)
+        return change
+
+    def changes_since(self, seq: int = 0) -> Tuple[int, List[GameChange]]:
+        """
+        Get changes recorded after a sequence number.
+
+        Args:
+            seq: Last sequence number the caller has seen (0 for everything kept)
+
+        Returns:
+            Tuple of (latest sequence number, changes newer than ``seq``)
+        """
+        with self._lock:
+            return self._seq, [c for c in self._feed if c.seq > seq]
+
+    def subscribe(self, listener: Callable[[List[GameChange]], None]) -> None:
+        """Call ``listener`` with each refresh's changes (from the updating thread)."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[List[GameChange]], None]) -> None:
+        """Stop calling a listener added with ``subscribe``."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def reset(self) -> None:
+        """Forget all fingerprints so the next refresh reports every event as added."""
+        with self._lock:
+            self._fingerprints.clear()
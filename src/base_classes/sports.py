@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import tempfile
@@ -5,23 +6,27 @@ import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pytz
 import requests
 from PIL import Image, ImageDraw, ImageFont
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from src.background_data_service import get_background_service
 
 # Import new architecture components (individual classes will import what they need)
 from src.base_classes.api_extractors import APIDataExtractor
 from src.base_classes.data_sources import DataSource
+from src.base_classes.scoreboard_delta import GameChange, ScoreboardDelta
 from src.cache_manager import CacheManager
+from src.common.game_index import GameIndex
 from src.display_manager import DisplayManager
 from src.dynamic_team_resolver import DynamicTeamResolver
-from src.logo_downloader import LogoDownloader, download_missing_logo
+from src.http_client import get_http_client
+from src.logo_downloader import LogoDownloader
+from src.logo_prefetcher import get_logo_prefetcher, placeholder_logo
+from src.logo_sprites import get_logo_sprite_cache
+from src.plugin_system.render_cache import memoize_render, skip_render_cache
 try:
     from src.base_odds_manager import BaseOddsManager as OddsManager
 except ImportError:
@@ -74,19 +79,19 @@ class SportsCore(ABC):
         self.show_favorite_teams_only: bool = self.mode_config.get("show_favorite_teams_only", False)
         self.show_all_live: bool = self.mode_config.get("show_all_live", False)
 
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=5,  # increased number of retries
-            backoff_factor=1,  # increased backoff factor
-            # added 429 to retry list
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-
-        self._logo_cache = {}
+        # Pooled, cached and rate-limited per host; shared by every manager
+        self.session = get_http_client(cache_manager).session()
+
+        # Resized logos live in the process-wide sprite cache; only resolved paths are kept per manager
+        self._logo_sprites = get_logo_sprite_cache(getattr(cache_manager, 'cache_dir', None))
+        self._logo_paths: Dict[str, Path] = {}
+        # Missing logos download in the background; a placeholder is drawn meanwhile
+        self._logo_prefetcher = get_logo_prefetcher()
+        if self.mode_config.get("prefetch_logos", True):
+            self._logo_prefetcher.prefetch_league(
+                self.sport_key, self.logo_dir,
+                max_teams=self.mode_config.get("prefetch_logos_max_teams", 150)
+            )
 
         # Set up headers
         self.headers = {
@@ -205,6 +210,25 @@ class SportsCore(ABC):
             self.logger.error(f"Error in base _draw_scorebug_layout: {e}", exc_info=True)
 
 
+    def _scorebug_render_key(self, game: Dict, force_clear: bool = False) -> Optional[str]:
+        """Render key for a scorebug frame: the game plus the rankings and show_* flags the layout reads."""
+        rankings = self._team_rankings_cache or {}
+        try:
+            return json.dumps({
+                'game': game,
+                'ranks': [rankings.get(game.get('away_abbr', '')), rankings.get(game.get('home_abbr', ''))],
+                # Display flags come from config, which may change at runtime
+                'flags': {name: value for name, value in vars(self).items()
+                          if name.startswith('show_') and isinstance(value, bool)},
+            }, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+
+    @memoize_render(lambda self, game, force_clear=False: self._scorebug_render_key(game, force_clear), present=True)
+    def _present_scorebug(self, game: Dict, force_clear: bool = False) -> None:
+        """Draw and push the scorebug, reusing the last frame while the game is unchanged."""
+        self._draw_scorebug_layout(game, force_clear)
+
     def display(self, force_clear: bool = False) -> bool:
         """Common display method for all NCAA FB managers""" # Updated docstring
         if not self.is_enabled: # Check if module is enabled
@@ -229,7 +253,7 @@ class SportsCore(ABC):
             return False
 
         try:
-            self._draw_scorebug_layout(self.current_game, force_clear)
+            self._present_scorebug(self.current_game, force_clear)
             # display_manager.update_display() should be called within subclass draw methods
             # or after calling display() in the main loop. Let's keep it out of the base display.
             return True
@@ -347,12 +371,17 @@ class SportsCore(ABC):
         draw.text((x, y), text, font=font, fill=fill)
 
     def _load_and_resize_logo(self, team_id: str, team_abbrev: str, logo_path: Path, logo_url: str | None ) -> Optional[Image.Image]:
-        """Load and resize a team logo, with caching and automatic download if missing."""
-        self.logger.debug(f"Logo path: {logo_path}")
-        if team_abbrev in self._logo_cache:
-            self.logger.debug(f"Using cached logo for {team_abbrev}")
-            return self._logo_cache[team_abbrev]
+        """Load and resize a team logo, with caching and background download if missing."""
+        max_size = (int(self.display_width * 1.5), int(self.display_height * 1.5))
+        actual_logo_path = self._logo_paths.get(team_abbrev)
+        if actual_logo_path is not None:
+            logo = self._logo_sprites.get_logo(self.sport_key, team_abbrev, actual_logo_path, max_size)
+            if logo is not None:
+                return logo
+            # The file went away; resolve (and download) it again
+            del self._logo_paths[team_abbrev]
 
+        self.logger.debug(f"Logo path: {logo_path}")
         try:
             # Try different filename variations first (for cases like TA&M vs TAANDM)
             actual_logo_path = None
@@ -365,31 +394,20 @@ class SportsCore(ABC):
                     self.logger.debug(f"Found logo at alternative path: {actual_logo_path}")
                     break
             
-            # If no variation found, try to download missing logo
+            # If no variation found, fetch it in the background and draw a placeholder for now
             if not actual_logo_path and not logo_path.exists():
-                self.logger.info(f"Logo not found for {team_abbrev} at {logo_path}. Attempting to download.")
-                
-                # Try to download the logo from ESPN API (this will create placeholder if download fails)
-                download_missing_logo(self.sport_key, team_id, team_abbrev, logo_path, logo_url)
-                actual_logo_path = logo_path
+                if self._logo_prefetcher.request(self.sport_key, team_id, team_abbrev, logo_path, logo_url):
+                    self.logger.info(f"Logo not found for {team_abbrev} at {logo_path}. Downloading in background.")
+                skip_render_cache(self)
+                return placeholder_logo(team_abbrev, max_size)
 
             # Use the original path if no alternative was found
             if not actual_logo_path:
                 actual_logo_path = logo_path
 
-            # Only try to open the logo if the file exists
-            if os.path.exists(actual_logo_path):
-                logo = Image.open(actual_logo_path)
-            else:
-                self.logger.error(f"Logo file still doesn't exist at {actual_logo_path} after download attempt")
-                return None
-            if logo.mode != 'RGBA':
-                logo = logo.convert('RGBA')
-
-            max_width = int(self.display_width * 1.5)
-            max_height = int(self.display_height * 1.5)
-            logo.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-            self._logo_cache[team_abbrev] = logo
+            logo = self._logo_sprites.get_logo(self.sport_key, team_abbrev, actual_logo_path, max_size)
+            if logo is not None:
+                self._logo_paths[team_abbrev] = actual_logo_path
             return logo
 
         except Exception as e:
@@ -397,36 +415,51 @@ class SportsCore(ABC):
             return None
 
     def _fetch_odds(self, game: Dict) -> None:
-        """Fetch odds for a specific game using the new architecture."""
-        try:
-            if not self.show_odds:
-                return
-            
-            if not self.odds_manager:
-                return
-            
-            # Determine update interval based on game state
-            is_live = game.get('is_live', False)
-            update_interval = self.mode_config.get("live_odds_update_interval", 60) if is_live \
-                else self.mode_config.get("odds_update_interval", 3600)
-            
-            # Fetch odds using OddsManager
-            odds_data = self.odds_manager.get_odds(
-                sport=self.sport,
-                league=self.league,
-                event_id=game['id'],
-                update_interval_seconds=update_interval,
-                is_live=is_live
-            )
-            
-            if odds_data:
-                game['odds'] = odds_data
-                self.logger.debug(f"Successfully fetched and attached odds for game {game['id']}")
-            else:
-                self.logger.debug(f"No odds data returned for game {game['id']}")
-                
-        except Exception as e:
-            self.logger.error(f"Error fetching odds for game {game.get('id', 'N/A')}: {e}")
+        """Attach odds to a single game without blocking (see _fetch_odds_for_games)."""
+        self._fetch_odds_for_games([game])
+
+    def _fetch_odds_for_games(self, games: List[Dict]) -> None:
+        """
+        Attach odds to games without blocking the update.
+
+        Cached odds are attached immediately; the rest are fetched concurrently
+        by the shared odds manager and filled in as they arrive, so game lists
+        render before their odds do. Fetches are shared with the other managers
+        of this sport.
+        """
+        if not self.show_odds or not self.odds_manager or not games:
+            return
+
+        for game in games:
+            # Pre-create the key so late arrivals replace a value instead of
+            # resizing a dict that may be being rendered
+            game.setdefault('odds', None)
+            try:
+                # Determine update interval based on game state
+                is_live = game.get('is_live', False)
+                if is_live:
+                    max_ttl = self.mode_config.get("live_odds_update_interval", 60)
+                else:
+                    max_ttl = self.mode_config.get("odds_update_interval", 3600)
+
+                def _attach(odds_data, game=game):
+                    if odds_data:
+                        game['odds'] = odds_data
+                        self.logger.debug(f"Attached odds for game {game['id']}")
+
+                future = self.odds_manager.get_odds_async(
+                    sport=self.sport,
+                    league=self.league,
+                    event_id=game['id'],
+                    update_interval_seconds=max_ttl,
+                    is_live=is_live,
+                    start_time=game.get('start_time_utc'),
+                    callback=_attach
+                )
+                if not future.done():
+                    self.logger.debug(f"Odds for game {game['id']} will be attached when fetched")
+            except Exception as e:
+                self.logger.error(f"Error fetching odds for game {game.get('id', 'N/A')}: {e}")
 
     def _get_timezone(self):
         try:
@@ -580,6 +613,12 @@ class SportsCore(ABC):
                 "is_within_window": True, # Whether game is within display window
 
             }
+            # Start downloads for teams seen for the first time before they're drawn
+            for side in ("home", "away"):
+                self._logo_prefetcher.request(
+                    self.sport_key, details[f"{side}_id"], details[f"{side}_abbr"],
+                    details[f"{side}_logo_path"], details[f"{side}_logo_url"]
+                )
             return details, home_team, away_team, status, situation
         except Exception as e:
             # Log the problematic event structure if possible
@@ -596,7 +635,13 @@ class SportsCore(ABC):
         pass
 
     def _fetch_todays_games(self) -> Optional[Dict]:
-        """Fetch only today's games for live updates (not entire season)."""
+        """
+        Fetch only today's games for live updates (not entire season).
+
+        Sends the ETag / Last-Modified of the previous response so an unchanged
+        scoreboard costs a 304 instead of a full payload; the previous result is
+        returned (as the same object) in that case.
+        """
         try:
             tz = pytz.timezone("America/New_York")  # Use full name (not "EST") for DST support
             now = datetime.now(tz)
@@ -605,13 +650,31 @@ class SportsCore(ABC):
             formatted_date_yesterday = yesterday.strftime("%Y%m%d")
             # Fetch todays games only
             url = f"https://site.api.espn.com/apis/site/v2/sports/{self.sport}/{self.league}/scoreboard"
-            response = self.session.get(url, params={"dates": f"{formatted_date_yesterday}-{formatted_date}", "limit": 1000}, headers=self.headers, timeout=10)
+            dates = f"{formatted_date_yesterday}-{formatted_date}"
+            headers = dict(self.headers)
+            previous = getattr(self, '_todays_games_response', None)
+            if previous and previous['dates'] == dates:
+                if previous['etag']:
+                    headers['If-None-Match'] = previous['etag']
+                if previous['last_modified']:
+                    headers['If-Modified-Since'] = previous['last_modified']
+            response = self.session.get(url, params={"dates": dates, "limit": 1000}, headers=headers, timeout=10)
+            if response.status_code == 304 and previous:
+                self.logger.debug(f"Todays games unchanged for {self.sport} - {self.league}")
+                return previous['data']
             response.raise_for_status()
             data = response.json()
             events = data.get('events', [])
             
             self.logger.info(f"Fetched {len(events)} todays games for {self.sport} - {self.league}")
-            return {'events': events}
+            result = {'events': events}
+            self._todays_games_response = {
+                'dates': dates,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'data': result,
+            }
+            return result
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API error fetching todays games for {self.sport} - {self.league}: {e}")
             return None
@@ -707,8 +770,6 @@ class SportsUpcoming(SportsCore):
                     if (game['home_abbr'] in self.favorite_teams or 
                         game['away_abbr'] in self.favorite_teams):
                         favorite_games_found += 1
-                    if self.show_odds:
-                        self._fetch_odds(game)
 
             # Enhanced logging for debugging
             self.logger.info(f"Found {all_upcoming_games} total upcoming games in data")
@@ -787,6 +848,9 @@ class SportsUpcoming(SportsCore):
                  self.logger.info("No relevant upcoming games found to display.") # Changed log prefix
                  self.current_game = None
 
+            # Only fetch odds for games that will be displayed, all at once
+            self._fetch_odds_for_games(self.games_list)
+
             if should_log and not self.games_list:
                  # Log favorite teams only if no games are found and logging is needed
                  self.logger.debug(f"Favorite teams: {self.favorite_teams}") # Changed log prefix
@@ -813,6 +877,7 @@ class SportsUpcoming(SportsCore):
                 self.logger.error(f"Failed to load logos for game: {game.get('id')}") # Changed log prefix
                 draw_final = ImageDraw.Draw(main_img.convert('RGB'))
                 self._draw_text_with_outline(draw_final, "Logo Error", (5,5), self.fonts['status'])
+                skip_render_cache(self)
                 self.display_manager.image.paste(main_img.convert('RGB'), (0, 0))
                 self.display_manager.update_display()
                 return
@@ -974,7 +1039,7 @@ class SportsUpcoming(SportsCore):
                     self.logger.debug(f"Switched to game index {self.current_game_index}")
 
             if self.current_game:
-                self._draw_scorebug_layout(self.current_game, force_clear)
+                self._present_scorebug(self.current_game, force_clear)
                 return True
             # update_display() is called within _draw_scorebug_layout for upcoming
             return False
@@ -1025,36 +1090,23 @@ class SportsRecent(SportsCore):
             recent_cutoff = now - timedelta(days=21)
             self.logger.info(f"Current time: {now}, Recent cutoff: {recent_cutoff} (21 days ago)")
             
-            # Process games and filter for final games, date range & favorite teams
-            processed_games = []
-            for event in events:
-                game = self._extract_game_details(event)
-                # Filter criteria: must be final AND within recent date range
-                if game and game['is_final']:
-                    game_time = game.get('start_time_utc')
-                    if game_time and game_time >= recent_cutoff:
-                        processed_games.append(game)
+            # Index the processed games once; final games within the date range
+            # (and per favorite team) are then looked up instead of rescanned
+            index = GameIndex(game for game in map(self._extract_game_details, events) if game)
+            processed_games = index.query(states=['final'], start=recent_cutoff)
             # Filter for favorite teams only if the config is set
             if self.show_favorite_teams_only:
                 # Get all games involving favorite teams
-                favorite_team_games = [game for game in processed_games
-                                      if game['home_abbr'] in self.favorite_teams or
-                                         game['away_abbr'] in self.favorite_teams]
+                favorite_team_games = index.query(states=['final'], teams=self.favorite_teams, start=recent_cutoff)
                 self.logger.info(f"Found {len(favorite_team_games)} favorite team games out of {len(processed_games)} total final games within last 21 days")
                 
                 # Select N games per favorite team (where N = recent_games_to_show)
                 # Example: recent_games_to_show=1 with 2 favorite teams = 2 games total
                 team_games = []
                 for team in self.favorite_teams:
-                    # Find games where this team is playing
-                    team_specific_games = [game for game in favorite_team_games
-                                          if game['home_abbr'] == team or game['away_abbr'] == team]
-                    
-                    if team_specific_games:
-                        # Sort by game time and take the most recent N games
-                        team_specific_games.sort(key=lambda g: g.get('start_time_utc') or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-                        # Take up to recent_games_to_show games for this team
-                        team_games.extend(team_specific_games[:self.recent_games_to_show])
+                    # The most recent N games this team played
+                    team_games.extend(index.query(states=['final'], teams=[team], start=recent_cutoff,
+                                                  reverse=True, limit=self.recent_games_to_show))
                 
                 # Sort the final list by game time (most recent first)
                 team_games.sort(key=lambda g: g.get('start_time_utc') or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
@@ -1071,11 +1123,10 @@ class SportsRecent(SportsCore):
                 for i, game in enumerate(team_games):
                     self.logger.info(f"Game {i+1} for display: {game['away_abbr']} @ {game['home_abbr']} - {game.get('start_time_utc')} - Score: {game['away_score']}-{game['home_score']}")
             else:
-                team_games = processed_games # Show all recent games if no favorites defined
                 self.logger.info(f"Found {len(processed_games)} total final games within last 21 days (no favorite teams filtering)")
-                # Sort games by start time, most recent first, and limit to recent_games_to_show
-                team_games.sort(key=lambda g: g.get('start_time_utc') or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-                team_games = team_games[:self.recent_games_to_show]
+                # Show all recent games if no favorites defined: most recent first, up to recent_games_to_show
+                team_games = index.query(states=['final'], start=recent_cutoff, reverse=True,
+                                         limit=self.recent_games_to_show)
 
             # Check if the list of games to display has changed
             new_game_ids = {g['id'] for g in team_games}
@@ -1127,6 +1178,7 @@ class SportsRecent(SportsCore):
                 # Draw placeholder text if logos fail (similar to live)
                 draw_final = ImageDraw.Draw(main_img.convert('RGB'))
                 self._draw_text_with_outline(draw_final, "Logo Error", (5,5), self.fonts['status'])
+                skip_render_cache(self)
                 self.display_manager.image.paste(main_img.convert('RGB'), (0, 0))
                 self.display_manager.update_display()
                 return
@@ -1275,7 +1327,7 @@ class SportsRecent(SportsCore):
                     self.logger.debug(f"Switched to game index {self.current_game_index}")
 
             if self.current_game:
-                self._draw_scorebug_layout(self.current_game, force_clear)
+                self._present_scorebug(self.current_game, force_clear)
                 return True
             # update_display() is called within _draw_scorebug_layout for recent
             return False
@@ -1302,11 +1354,28 @@ class SportsLive(SportsCore):
         self.count_log_interval = 5  # Only log count data every 5 seconds
         # Initialize test_mode - defaults to False (live mode)
         self.test_mode = self.mode_config.get("test_mode", False)
+        # Per-event fingerprints: only games whose status, score or situation
+        # changed are re-extracted (and, with new details, re-rendered)
+        self.scoreboard_delta = ScoreboardDelta()
+        self._live_details: Dict[str, Dict] = {}
+        self._last_live_payload = None
 
     @abstractmethod
     def _test_mode_update(self) -> None:
         return
 
+    def get_game_changes(self, since: int = 0) -> Tuple[int, List[GameChange]]:
+        """
+        Get scoreboard changes seen by this manager.
+
+        Args:
+            since: Last sequence number the caller has processed
+
+        Returns:
+            Tuple of (latest sequence number, changes newer than ``since``)
+        """
+        return self.scoreboard_delta.changes_since(since)
+
     def update(self):
         """Update live game data and handle game switching."""
         if not self.is_enabled:
@@ -1342,15 +1411,24 @@ class SportsLive(SportsCore):
                 data = self._fetch_data()
                 new_live_games = []
                 if data and "events" in data:
+                    # An unchanged payload (e.g. a 304) means no game changed
+                    changed_ids = set() if data is self._last_live_payload else self.scoreboard_delta.update(data["events"])
+                    self._last_live_payload = data
+                    live_details = {}
                     for game in data["events"]:
-                        details = self._extract_game_details(game)
+                        event_id = str(game.get("id"))
+                        details = self._live_details.get(event_id)
+                        if details is None or event_id in changed_ids:
+                            details = self._extract_game_details(game)
+                        if details:
+                            live_details[event_id] = details
                         if details and (details["is_live"] or details["is_halftime"]):
                             # If show_favorite_teams_only is true, only add if it's a favorite.
                             # Otherwise, add all games.
                             if self.show_all_live or not self.show_favorite_teams_only or (self.show_favorite_teams_only and (details["home_abbr"] in self.favorite_teams or details["away_abbr"] in self.favorite_teams)):
-                                if self.show_odds:
-                                    self._fetch_odds(details)
                                 new_live_games.append(details)
+                    self._live_details = live_details
+                    self._fetch_odds_for_games(new_live_games)
                     # Log changes or periodically
                     current_time_for_log = time.time() # Use a consistent time for logging comparison
                     should_log = (
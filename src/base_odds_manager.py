@@ -13,12 +13,17 @@ Follows LEDMatrix configuration management patterns:
 
 import time
 import logging
+import threading
 import requests
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional, List
+from functools import partial
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union
 import pytz
 
+from src.http_client import get_http_client
+
 # Import the API counter function from web interface
 try:
     from web_interface_v2 import increment_api_counter
@@ -38,9 +43,40 @@ class BaseOddsManager:
     - Error handling and timeouts
     - League mapping and data extraction
     
+    Odds requests from every manager in the process share the pooled HTTP
+    client and one worker pool, and concurrent requests for the same event are
+    collapsed into a single fetch, so the upcoming and live managers of a
+    sport never fetch the same odds twice. Cache lifetimes shrink as kickoff
+    approaches (see ``get_odds_ttl``).
+    
     Plugins can inherit from this class to get odds functionality.
     """
     
+    # Map league names to ESPN API format
+    LEAGUE_MAPPING = {
+        'ncaa_fb': 'college-football',
+        'nfl': 'nfl',
+        'nba': 'nba',
+        'mlb': 'mlb',
+        'nhl': 'nhl'
+    }
+    
+    # (seconds until kickoff, cache TTL) - the first tier the game falls within wins
+    TTL_TIERS: Tuple[Tuple[int, int], ...] = (
+        (3600, 300),        # Within the hour: 5 minutes
+        (6 * 3600, 900),    # Later today: 15 minutes
+        (24 * 3600, 1800),  # Within a day: 30 minutes
+        (72 * 3600, 3600),  # Within three days: 1 hour
+    )
+    FAR_FUTURE_TTL = 4 * 3600  # Further out: 4 hours
+    
+    MAX_WORKERS = 4
+    
+    # Process-wide fetch machinery, shared by all odds managers
+    _shared_lock = threading.Lock()
+    _executor: Optional[ThreadPoolExecutor] = None
+    _inflight: Dict[str, Future] = {}
+    
     def __init__(self, cache_manager, config_manager=None):
         """
         Initialize the base odds manager.
@@ -58,6 +94,7 @@ class BaseOddsManager:
         self.update_interval = 3600  # 1 hour default
         self.request_timeout = 30    # 30 seconds default
         self.cache_ttl = 1800       # 30 minutes default
+        self.live_cache_ttl = 60    # 1 minute default for games in progress
         
         # Load configuration if available
         if config_manager:
@@ -75,6 +112,7 @@ class BaseOddsManager:
             self.update_interval = odds_config.get('update_interval', self.update_interval)
             self.request_timeout = odds_config.get('timeout', self.request_timeout)
             self.cache_ttl = odds_config.get('cache_ttl', self.cache_ttl)
+            self.live_cache_ttl = odds_config.get('live_cache_ttl', self.live_cache_ttl)
             
             self.logger.debug(f"BaseOddsManager configuration loaded: "
                             f"update_interval={self.update_interval}s, "
@@ -84,71 +122,186 @@ class BaseOddsManager:
         except Exception as e:
             self.logger.warning(f"Failed to load BaseOddsManager configuration: {e}")
     
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Return the process-wide odds worker pool."""
+        with cls._shared_lock:
+            if BaseOddsManager._executor is None:
+                BaseOddsManager._executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS,
+                                                               thread_name_prefix="odds-fetch")
+            return BaseOddsManager._executor
+    
+    @staticmethod
+    def _cache_key(sport: str, league: str, event_id: str) -> str:
+        return f"odds_espn_{sport}_{league}_{event_id}"
+    
+    def get_odds_ttl(self, start_time: Union[datetime, str, None] = None, is_live: bool = False,
+                     max_ttl: Optional[int] = None) -> int:
+        """
+        Get how long odds for an event stay fresh.
+        
+        Odds barely move days before a game but change quickly near kickoff
+        and while it is played, so the TTL shrinks as the start time approaches.
+        
+        Args:
+            start_time: Event start (aware datetime or ISO 8601 string)
+            is_live: Whether the event is in progress
+            max_ttl: Upper bound for the TTL (e.g. a configured update interval)
+            
+        Returns:
+            TTL in seconds
+        """
+        if is_live:
+            ttl = self.live_cache_ttl
+        else:
+            if isinstance(start_time, str):
+                try:
+                    start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                except ValueError:
+                    start_time = None
+            if start_time is None:
+                ttl = self.cache_ttl
+            else:
+                if start_time.tzinfo is None:
+                    start_time = start_time.replace(tzinfo=timezone.utc)
+                until_start = (start_time - datetime.now(timezone.utc)).total_seconds()
+                ttl = next((tier_ttl for horizon, tier_ttl in self.TTL_TIERS if until_start <= horizon),
+                           self.FAR_FUTURE_TTL)
+        if max_ttl:
+            ttl = min(ttl, max_ttl)
+        return int(ttl)
+    
+    def get_cached_odds(self, sport: str, league: str, event_id: str,
+                        ttl: int) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up cached odds without fetching.
+        
+        Args:
+            sport: Sport name (e.g., 'football', 'basketball')
+            league: League name (e.g., 'nfl', 'nba')
+            event_id: ESPN event ID
+            ttl: Maximum age of the cached entry in seconds
+            
+        Returns:
+            Tuple of (found, odds); odds is None if the event is known to have no odds
+        """
+        cached_data = self.cache_manager.get(self._cache_key(sport, league, event_id), max_age=ttl)
+        if not cached_data:
+            return False, None
+        if cached_data.get('no_odds'):
+            return True, None
+        return True, cached_data
+    
     def get_odds(self, sport: str | None, league: str | None, event_id: str,
-                 update_interval_seconds: int = None) -> Optional[Dict[str, Any]]:
+                 update_interval_seconds: Optional[int] = None, is_live: bool = False,
+                 start_time: Union[datetime, str, None] = None) -> Optional[Dict[str, Any]]:
         """
-        Fetch odds data for a specific game.
+        Fetch odds data for a specific game (blocking).
         
         Args:
             sport: Sport name (e.g., 'football', 'basketball')
             league: League name (e.g., 'nfl', 'nba')
             event_id: ESPN event ID
-            update_interval_seconds: Override default update interval
+            update_interval_seconds: Override default update interval; with a
+                start_time it caps the kickoff-based TTL instead
+            is_live: Whether the game is in progress
+            start_time: Game start, used to pick the cache TTL
 
         Returns:
             Dictionary containing odds data or None if unavailable
         """
+        return self.get_odds_async(sport, league, event_id, update_interval_seconds,
+                                   is_live, start_time).result()
+    
+    def get_odds_async(self, sport: str | None, league: str | None, event_id: str,
+                       update_interval_seconds: Optional[int] = None, is_live: bool = False,
+                       start_time: Union[datetime, str, None] = None,
+                       callback: Optional[Callable[[Optional[Dict[str, Any]]], None]] = None) -> Future:
+        """
+        Fetch odds data for a specific game without blocking.
+        
+        Cached odds resolve immediately; otherwise the fetch runs on the shared
+        worker pool, joining an in-flight fetch for the same event if there is one.
+        
+        Args:
+            sport: Sport name (e.g., 'football', 'basketball')
+            league: League name (e.g., 'nfl', 'nba')
+            event_id: ESPN event ID
+            update_interval_seconds: See ``get_odds``
+            is_live: Whether the game is in progress
+            start_time: Game start, used to pick the cache TTL
+            callback: Called with the odds (or None) once available
+            
+        Returns:
+            Future resolving to the odds dictionary or None
+        """
         if sport is None or league is None:
             raise ValueError("Sport and League cannot be None")
 
-        # Use provided interval or default
-        interval = update_interval_seconds or self.update_interval
-        cache_key = f"odds_espn_{sport}_{league}_{event_id}"
-
-        # Check cache first
-        cached_data = self.cache_manager.get_with_auto_strategy(cache_key)
+        if start_time is None and not is_live:
+            ttl = update_interval_seconds or self.update_interval
+        else:
+            ttl = self.get_odds_ttl(start_time, is_live, max_ttl=update_interval_seconds)
+        cache_key = self._cache_key(sport, league, event_id)
 
-        if cached_data:
-            self.logger.info(f"Using cached odds from ESPN for {cache_key}")
-            return cached_data
+        found, odds_data = self.get_cached_odds(sport, league, event_id, ttl)
+        if found:
+            self.logger.debug(f"Using cached odds from ESPN for {cache_key}")
+            future: Future = Future()
+            future.set_result(odds_data)
+        else:
+            executor = self._get_executor()
+            with self._shared_lock:
+                inflight = BaseOddsManager._inflight.get(cache_key)
+                created = inflight is None
+                if inflight is None:
+                    inflight = executor.submit(self._fetch_odds, sport, league, event_id, cache_key, ttl)
+                    BaseOddsManager._inflight[cache_key] = inflight
+            future = inflight
+            if created:
+                future.add_done_callback(partial(self._discard_inflight, cache_key))
 
+        if callback is not None:
+            def _deliver(done: Future) -> None:
+                try:
+                    callback(done.result())
+                except Exception as e:
+                    self.logger.error(f"Error delivering odds for {cache_key}: {e}")
+            future.add_done_callback(_deliver)
+        return future
+    
+    @classmethod
+    def _discard_inflight(cls, cache_key: str, future: Future) -> None:
+        with cls._shared_lock:
+            if BaseOddsManager._inflight.get(cache_key) is future:
+                del BaseOddsManager._inflight[cache_key]
+    
+    def _fetch_odds(self, sport: str, league: str, event_id: str, cache_key: str,
+                    ttl: int) -> Optional[Dict[str, Any]]:
+        """Fetch, extract and cache odds for one event (runs on the worker pool)."""
         self.logger.info(f"Cache miss - fetching fresh odds from ESPN for {cache_key}")
         
         try:
-            # Map league names to ESPN API format
-            league_mapping = {
-                'ncaa_fb': 'college-football',
-                'nfl': 'nfl',
-                'nba': 'nba',
-                'mlb': 'mlb',
-                'nhl': 'nhl'
-            }
-            
-            espn_league = league_mapping.get(league, league)
+            espn_league = self.LEAGUE_MAPPING.get(league, league)
             url = f"{self.base_url}/{sport}/leagues/{espn_league}/events/{event_id}/competitions/{event_id}/odds"
-            self.logger.info(f"Requesting odds from URL: {url}")
+            self.logger.debug(f"Requesting odds from URL: {url}")
             
-            response = requests.get(url, timeout=self.request_timeout)
+            # Odds freshness is governed by the kickoff-based TTLs, not HTTP caching
+            response = get_http_client().get(url, timeout=self.request_timeout, cache=False)
             response.raise_for_status()
             raw_data = response.json()
             
             # Increment API counter for odds data
             increment_api_counter('odds', 1)
-            self.logger.debug(f"Received raw odds data from ESPN: {json.dumps(raw_data, indent=2)}")
             
             odds_data = self._extract_espn_data(raw_data)
             if odds_data:
-                self.logger.info(f"Successfully extracted odds data: {odds_data}")
-            else:
-                self.logger.debug("No odds data available for this game")
-            
-            if odds_data:
-                self.cache_manager.set(cache_key, odds_data, ttl=interval)
-                self.logger.info(f"Saved odds data to cache for {cache_key} with TTL {interval}s")
+                self.cache_manager.set(cache_key, odds_data, ttl=ttl)
+                self.logger.info(f"Saved odds data to cache for {cache_key} with TTL {ttl}s")
             else:
                 self.logger.debug(f"No odds data available for {cache_key}")
                 # Cache the fact that no odds are available to avoid repeated API calls
-                self.cache_manager.set(cache_key, {"no_odds": True}, ttl=interval)
+                self.cache_manager.set(cache_key, {"no_odds": True}, ttl=ttl)
             
             return odds_data
 
@@ -157,7 +310,11 @@ class BaseOddsManager:
         except json.JSONDecodeError:
             self.logger.error(f"Error decoding JSON response from ESPN API for {cache_key}.")
         
-        return self.cache_manager.get_with_auto_strategy(cache_key)
+        # Fall back to whatever we have, however old
+        stale = self.cache_manager.get(cache_key, max_age=self.FAR_FUTURE_TTL * 6)
+        if stale and not stale.get('no_odds'):
+            return stale
+        return None
 
     def _extract_espn_data(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -205,38 +362,52 @@ class BaseOddsManager:
             self.logger.warning(f"Unexpected response structure: {json.dumps(data, indent=2)}")
             return None
     
-    def get_odds_for_games(self, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def get_odds_for_games(self, games: List[Dict[str, Any]], wait: bool = True) -> List[Dict[str, Any]]:
         """
-        Fetch odds for multiple games efficiently.
+        Fetch odds for multiple games concurrently.
 
         Args:
-            games: List of game dictionaries with sport, league, and id
+            games: List of game dictionaries with sport, league and id (and
+                optionally is_live and start_time)
+            wait: If True, block until every game has its odds; if False,
+                attach cached odds now and fill in the rest as fetches finish
 
         Returns:
             List of games with odds data added
         """
-        games_with_odds = []
-
+        futures = []
         for game in games:
-            try:
-                sport = game.get('sport')
-                league = game.get('league')
-                event_id = game.get('id')
-
-                if sport and league and event_id:
-                    odds_data = self.get_odds(sport, league, event_id)
-                    game['odds'] = odds_data
-                else:
-                    game['odds'] = None
+            game.setdefault('odds', None)
+            sport = game.get('sport')
+            league = game.get('league')
+            event_id = game.get('id')
+            if not (sport and league and event_id):
+                continue
 
-                games_with_odds.append(game)
+            def _attach(odds_data, game=game):
+                game['odds'] = odds_data
 
+            try:
+                futures.append((game, self.get_odds_async(
+                    sport, league, event_id,
+                    is_live=game.get('is_live', False),
+                    start_time=game.get('start_time_utc') or game.get('start_time'),
+                    callback=None if wait else _attach
+                )))
             except Exception as e:
-                self.logger.error(f"Error fetching odds for game {game.get('id', 'unknown')}: {e}")
-                game['odds'] = None
-                games_with_odds.append(game)
+                self.logger.error(f"Error fetching odds for game {event_id}: {e}")
+
+        for game, future in futures:
+            if wait:
+                try:
+                    game['odds'] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error fetching odds for game {game.get('id', 'unknown')}: {e}")
+                    game['odds'] = None
+            elif future.done() and future.exception() is None:
+                game['odds'] = future.result()
 
-        return games_with_odds
+        return games
     
     def is_odds_available(self, odds_data: Optional[Dict[str, Any]]) -> bool:
         """
@@ -9,6 +9,16 @@ import time
 import logging
 from typing import Dict, Any, Optional
 
+from src.metrics import get_metrics_registry
+
+_metrics = get_metrics_registry()
+CACHE_LOOKUPS = _metrics.counter(
+    'ledmatrix_cache_lookups_total', 'Cache lookups by the tier that answered (memory, disk, miss)', ('tier',))
+CACHE_REQUESTS = _metrics.counter(
+    'ledmatrix_cache_requests_total', 'Cache hits and misses reported by managers', ('cache_type', 'result'))
+CACHE_FETCH_SECONDS = _metrics.histogram(
+    'ledmatrix_cache_fetch_seconds', 'Duration of fetches made on cache misses')
+
 
 class CacheMetrics:
     """Tracks cache performance metrics."""
@@ -44,6 +54,7 @@ class CacheMetrics:
         Args:
             cache_type: Type of cache hit ('regular' or 'background')
         """
+        CACHE_REQUESTS.labels(cache_type, 'hit').inc()
         with self._lock:
             if cache_type == 'background':
                 self._metrics['background_hits'] += 1
@@ -57,6 +68,7 @@ class CacheMetrics:
         Args:
             cache_type: Type of cache miss ('regular' or 'background')
         """
+        CACHE_REQUESTS.labels(cache_type, 'miss').inc()
         with self._lock:
             if cache_type == 'background':
                 self._metrics['background_misses'] += 1
@@ -71,10 +83,20 @@ class CacheMetrics:
         Args:
             duration: Duration in seconds
         """
+        CACHE_FETCH_SECONDS.observe(duration)
         with self._lock:
             self._metrics['total_fetch_time'] += duration
             self._metrics['fetch_count'] += 1
     
+    def record_lookup(self, tier: str) -> None:
+        """
+        Record which tier answered a cache lookup.
+        
+        Args:
+            tier: 'memory', 'disk' or 'miss'
+        """
+        CACHE_LOOKUPS.labels(tier).inc()
+    
     def record_disk_cleanup(self, files_cleaned: int, space_freed_mb: float, duration_sec: float) -> None:
         """
         Record disk cleanup operation results.
@@ -194,6 +194,10 @@ class CacheStrategy:
         """
         key_lower = key.lower()
         
+        # HTTP client responses (src/http_client.py); keys end in a URL hash
+        if key_lower.startswith('http_cache_'):
+            return 'http_cache'
+
         # Odds data — checked FIRST because odds keys may also contain 'live'/'current'
         # (e.g. odds_espn_nba_game_123_live). The odds TTL (120s for live, 1800s for
         # upcoming) must win over the generic sports_live TTL (30s) to avoid hitting
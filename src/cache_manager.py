@@ -78,6 +78,7 @@ class CacheManager:
             'team_info': 60,        # Team info: 60 days
             'stocks': 14,           # Stock data: 14 days
             'crypto': 14,           # Crypto data: 14 days
+            'http_cache': 2,        # HTTP client responses: 2 days (dated URLs make new keys daily)
             'default': 30           # Default: 30 days
         }
         
@@ -271,6 +272,7 @@ class CacheManager:
         # 1) Memory cache
         cached = self._memory_cache_component.get(key, max_age=in_memory_ttl)
         if cached is not None:
+            self._metrics_component.record_lookup('memory')
             return cached
 
         # 2) Disk cache
@@ -278,9 +280,11 @@ class CacheManager:
         if record is not None:
             # Hydrate memory cache (use current time to start memory TTL window)
             self._memory_cache_component.set(key, record)
+            self._metrics_component.record_lookup('disk')
             return record
 
         # 3) Miss
+        self._metrics_component.record_lookup('miss')
         return None
             
     def save_cache(self, key: str, data: Dict[str, Any]) -> None:
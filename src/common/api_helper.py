@@ -14,8 +14,8 @@ from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlencode
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from src.http_client import get_http_client
 
 
 class APIHelper:
@@ -45,19 +45,9 @@ class APIHelper:
         self.max_retries = max_retries
         self.logger = logger or logging.getLogger(__name__)
         
-        # Setup session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-        
-        # Default headers
+        # Requests go through the shared client (pooling, retries, HTTP caching,
+        # per-host rate limits); the session only carries default headers
+        self.session = get_http_client(cache_manager).session()
         self.session.headers.update({
             'User-Agent': 'LEDMatrix-Common/1.0',
             'Accept': 'application/json',
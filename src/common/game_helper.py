@@ -7,9 +7,30 @@ Extracted from LEDMatrix core to provide reusable functionality for plugins.
 
 import logging
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 import pytz
 
+from src.common.game_index import GameIndex
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_utc(game_date_str: str) -> Optional[datetime]:
+    """Parse an ESPN ISO 8601 date to a pytz.UTC datetime (cached; scoreboards repeat dates)."""
+    # Handle ISO format with Z suffix
+    if game_date_str.endswith('Z'):
+        game_date_str = game_date_str.replace('Z', '+00:00')
+    try:
+        dt = datetime.fromisoformat(game_date_str)
+    except ValueError:
+        return None
+    # Ensure the datetime is UTC-aware (fromisoformat may create timezone-aware but not pytz.UTC)
+    if dt.tzinfo is None:
+        # If naive, assume it's UTC
+        return dt.replace(tzinfo=pytz.UTC)
+    # Convert to pytz.UTC for consistency
+    return dt.astimezone(pytz.UTC)
+
 
 class GameHelper:
     """
@@ -211,6 +232,22 @@ class GameHelper:
         
         return sorted(games, key=get_start_time, reverse=reverse)
     
+    def build_index(self, games: List[Dict[str, Any]]) -> GameIndex:
+        """
+        Build an index for running several filters over the same games.
+        
+        The filter_* methods each scan the whole list; build the index once
+        per payload and query it instead when combining filters, e.g.
+        ``index.query(states=['live', 'final'], teams=favorites, start=cutoff)``.
+        
+        Args:
+            games: List of game dictionaries
+            
+        Returns:
+            GameIndex over the games
+        """
+        return GameIndex(games)
+    
     def process_games(self, events: List[Dict[str, Any]], sport: str = None) -> List[Dict[str, Any]]:
         """
         Process a list of ESPN events into game details.
@@ -282,22 +319,10 @@ class GameHelper:
         if not game_date_str:
             return None
         
-        try:
-            # Handle ISO format with Z suffix
-            if game_date_str.endswith('Z'):
-                game_date_str = game_date_str.replace('Z', '+00:00')
-            
-            dt = datetime.fromisoformat(game_date_str)
-            # Ensure the datetime is UTC-aware (fromisoformat may create timezone-aware but not pytz.UTC)
-            if dt.tzinfo is None:
-                # If naive, assume it's UTC
-                return dt.replace(tzinfo=pytz.UTC)
-            else:
-                # Convert to pytz.UTC for consistency
-                return dt.astimezone(pytz.UTC)
-        except ValueError:
+        dt = _parse_iso_utc(game_date_str)
+        if dt is None:
             self.logger.warning(f"Could not parse game date: {game_date_str}")
-            return None
+        return dt
     
     def _format_game_time(self, start_time_utc: Optional[datetime]) -> Tuple[str, str]:
         """Format game time for display."""
@@ -0,0 +1,201 @@
+"""
+Game Index
+
+Indexed view over a list of processed games (``GameHelper.process_games``
+output) for answering composite queries without rescanning the list.
+
+Built once per payload, the index parses start times once and keeps:
+- buckets of games per state (live, final, upcoming, halftime, period_break)
+- a team abbreviation -> games map
+- a time-sorted order with timestamps for bisecting time windows
+
+A query starts from its most selective constraint and only checks the other
+constraints against those candidates, so "favorite teams, live or final in
+the last 48 hours, sorted" costs roughly the size of the answer rather than
+the size of the slate.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+STATES = ('live', 'final', 'upcoming', 'halftime', 'period_break')
+
+
+def _to_utc(value: Union[datetime, str, None]) -> Optional[datetime]:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _bound_timestamp(value: Union[datetime, str, None], name: str) -> Optional[float]:
+    if value is None:
+        return None
+    parsed = _to_utc(value)
+    if parsed is None:
+        raise ValueError(f"Invalid {name} time: {value!r}")
+    return parsed.timestamp()
+
+
+class GameIndex:
+    """Read-only index over a list of game dictionaries."""
+
+    def __init__(self, games: Iterable[Dict[str, Any]]) -> None:
+        """
+        Build the index.
+
+        Args:
+            games: Game dictionaries with ``start_time_utc`` (datetime or ISO
+                string), ``is_<state>`` flags and ``home_abbr``/``away_abbr``
+        """
+        self.games: List[Dict[str, Any]] = list(games)
+        now_ts = datetime.now(timezone.utc).timestamp()
+
+        self._timestamps: List[Optional[float]] = []
+        self._states: List[Set[str]] = []
+        self._teams: List[Set[str]] = []
+        self._by_state: Dict[str, List[int]] = {state: [] for state in STATES}
+        self._by_team: Dict[str, List[int]] = {}
+
+        for pos, game in enumerate(self.games):
+            start = _to_utc(game.get('start_time_utc'))
+            self._timestamps.append(start.timestamp() if start else None)
+
+            states = {state for state in STATES if game.get(f'is_{state}', False)}
+            self._states.append(states)
+            for state in states:
+                self._by_state[state].append(pos)
+
+            teams = {abbr for abbr in (game.get('home_abbr'), game.get('away_abbr')) if abbr}
+            self._teams.append(teams)
+            for team in teams:
+                self._by_team.setdefault(team, []).append(pos)
+
+        # Games without a start time sort as if starting now (like GameHelper.sort_games_by_time)
+        sort_keys = [ts if ts is not None else now_ts for ts in self._timestamps]
+        self._time_order: List[int] = sorted(range(len(self.games)), key=sort_keys.__getitem__)
+        self._rank: List[int] = [0] * len(self.games)
+        for rank, pos in enumerate(self._time_order):
+            self._rank[pos] = rank
+        # Only games with a real start time take part in time-window queries
+        self._timed_order = [pos for pos in self._time_order if self._timestamps[pos] is not None]
+        self._timed_keys: List[float] = [ts for ts in (self._timestamps[pos] for pos in self._timed_order)
+                                         if ts is not None]
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def query(
+        self,
+        states: Optional[Iterable[str]] = None,
+        teams: Optional[Iterable[str]] = None,
+        start: Union[datetime, str, None] = None,
+        end: Union[datetime, str, None] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find games matching all given constraints, sorted by start time.
+
+        Args:
+            states: Match games in any of these states (e.g. ['live', 'final'])
+            teams: Match games involving any of these team abbreviations
+            start: Only games starting at or after this time (datetime or ISO string)
+            end: Only games starting at or before this time (datetime or ISO string)
+            reverse: Newest first
+            limit: Maximum number of games returned
+
+        Returns:
+            Matching game dictionaries (the indexed objects, not copies)
+
+        Raises:
+            ValueError: If ``start`` or ``end`` is not a valid time
+        """
+        state_set = set(states) if states is not None else None
+        team_set = set(teams) if teams is not None else None
+        start_ts = _bound_timestamp(start, 'start')
+        end_ts = _bound_timestamp(end, 'end')
+
+        # Candidate positions per constraint (with a size estimate); only the
+        # smallest is materialized and scanned
+        candidates = []
+        if state_set is not None:
+            lists = [self._by_state.get(s, []) for s in state_set]
+            candidates.append((sum(map(len, lists)), lists))
+        if team_set is not None:
+            lists = [self._by_team.get(t, []) for t in team_set]
+            candidates.append((sum(map(len, lists)), lists))
+        if start_ts is not None or end_ts is not None:
+            lo = bisect_left(self._timed_keys, start_ts) if start_ts is not None else 0
+            hi = bisect_right(self._timed_keys, end_ts) if end_ts is not None else len(self._timed_keys)
+            candidates.append((max(0, hi - lo), [self._timed_order[lo:hi]]))
+        if not candidates:
+            positions = self._time_order
+        else:
+            _, lists = min(candidates, key=lambda candidate: candidate[0])
+            positions = lists[0] if len(lists) == 1 else self._union(lists)
+
+        matches = []
+        for pos in positions:
+            if state_set is not None and not (self._states[pos] & state_set):
+                continue
+            if team_set is not None and not (self._teams[pos] & team_set):
+                continue
+            ts = self._timestamps[pos]
+            if start_ts is not None and (ts is None or ts < start_ts):
+                continue
+            if end_ts is not None and (ts is None or ts > end_ts):
+                continue
+            matches.append(pos)
+
+        if positions is not self._time_order:
+            matches.sort(key=self._rank.__getitem__)
+        if reverse:
+            matches.reverse()
+        if limit is not None:
+            matches = matches[:limit]
+        return [self.games[pos] for pos in matches]
+
+    @staticmethod
+    def _union(lists: Iterable[Iterable[int]]) -> List[int]:
+        seen: Set[int] = set()
+        merged = []
+        for positions in lists:
+            for pos in positions:
+                if pos not in seen:
+                    seen.add(pos)
+                    merged.append(pos)
+        return merged
+
+    # Convenience queries mirroring GameHelper's filters
+
+    def live(self) -> List[Dict[str, Any]]:
+        """Live games, sorted by start time."""
+        return self.query(states=['live'])
+
+    def final(self) -> List[Dict[str, Any]]:
+        """Final games, sorted by start time."""
+        return self.query(states=['final'])
+
+    def upcoming(self) -> List[Dict[str, Any]]:
+        """Upcoming games, sorted by start time."""
+        return self.query(states=['upcoming'])
+
+    def for_teams(self, teams: Optional[Iterable[str]]) -> List[Dict[str, Any]]:
+        """Games involving any of ``teams`` (all games if ``teams`` is empty)."""
+        return self.query(teams=teams or None)
+
+    def recent(self, days_back: int = 7) -> List[Dict[str, Any]]:
+        """Games starting within the last ``days_back`` days (or later)."""
+        return self.query(start=datetime.now(timezone.utc) - timedelta(days=days_back))
+
+    def sorted_by_time(self, reverse: bool = False) -> List[Dict[str, Any]]:
+        """All games sorted by start time."""
+        return self.query(reverse=reverse)
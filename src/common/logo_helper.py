@@ -11,8 +11,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Union
 from urllib.parse import urlparse
 
-import requests
 from PIL import Image
+from src.http_client import get_http_client
+from src.logo_sprites import get_logo_sprite_cache
 from src.common.permission_utils import (
     ensure_directory_permissions,
     ensure_file_permissions,
@@ -49,12 +50,13 @@ class LogoHelper:
         self.cache_size = cache_size
         self.logger = logger or logging.getLogger(__name__)
         
-        # In-memory logo cache
-        self._logo_cache: Dict[str, Image.Image] = {}
-        self._cache_order: List[str] = []  # For LRU cache management
+        # Resized logos live in the process-wide sprite cache (cache_size is
+        # kept for compatibility; memory is bounded by the sprite cache)
+        self._sprites = get_logo_sprite_cache()
+        self._namespaces: set = set()
         
-        # Session for HTTP requests
-        self.session = requests.Session()
+        # Session for HTTP requests (backed by the shared pooled client)
+        self.session = get_http_client().session()
         self.session.headers.update({
             'User-Agent': 'LEDMatrix-Common/1.0',
             'Accept': 'image/*',
@@ -75,35 +77,21 @@ class LogoHelper:
         Returns:
             PIL Image object or None if loading fails
         """
-        # Check cache first
-        cache_key = f"{team_abbr}_{logo_path}"
-        if cache_key in self._logo_cache:
-            self.logger.debug(f"Using cached logo for {team_abbr}")
-            # Update LRU order (move to end)
-            if cache_key in self._cache_order:
-                self._cache_order.remove(cache_key)
-            self._cache_order.append(cache_key)
-            return self._logo_cache[cache_key]
-        
         try:
             logo_path = Path(logo_path)
             if not logo_path.exists():
                 self.logger.warning(f"Logo not found for {team_abbr} at {logo_path}")
                 return None
             
-            # Load image
-            logo = Image.open(logo_path)
-            if logo.mode != 'RGBA':
-                logo = logo.convert('RGBA')
-            
-            # Resize if needed
-            logo = self._resize_logo(logo, max_width, max_height)
-            
-            # Cache the logo
-            self._cache_logo(cache_key, logo)
-            
-            self.logger.debug(f"Loaded logo for {team_abbr} from {logo_path}")
-            return logo
+            if max_width is None:
+                max_width = int(self.display_width * 1.5)
+            if max_height is None:
+                max_height = int(self.display_height * 1.5)
+
+            # Logos are namespaced by their directory (one directory per league)
+            namespace = str(logo_path.parent)
+            self._namespaces.add(namespace)
+            return self._sprites.get_logo(namespace, team_abbr, logo_path, (max_width, max_height))
             
         except Exception as e:
             self.logger.error(f"Error loading logo for {team_abbr}: {e}")
@@ -196,8 +184,9 @@ class LogoHelper:
     
     def clear_cache(self) -> None:
         """Clear the logo cache."""
-        self._logo_cache.clear()
-        self._cache_order.clear()
+        for namespace in self._namespaces:
+            self._sprites.invalidate(league=namespace)
+        self._namespaces.clear()
         self.logger.debug("Logo cache cleared")
     
     def get_cache_stats(self) -> Dict[str, int]:
@@ -207,40 +196,15 @@ class LogoHelper:
         Returns:
             Dictionary with cache statistics
         """
+        sprite_stats = self._sprites.get_stats()
         return {
-            'cached_logos': len(self._logo_cache),
+            'cached_logos': sprite_stats['sprites'],
             'cache_size_limit': self.cache_size,
-            'cache_usage_percent': (len(self._logo_cache) / self.cache_size) * 100
+            'cache_usage_percent': (sprite_stats['bytes'] / sprite_stats['max_bytes']) * 100,
+            'cache_hits': sprite_stats['hits'],
+            'cache_misses': sprite_stats['misses'],
         }
     
-    def _resize_logo(self, logo: Image.Image, max_width: Optional[int] = None, 
-                    max_height: Optional[int] = None) -> Image.Image:
-        """Resize logo to fit display dimensions."""
-        if max_width is None:
-            max_width = int(self.display_width * 1.5)
-        if max_height is None:
-            max_height = int(self.display_height * 1.5)
-        
-        # Only resize if necessary
-        if logo.width <= max_width and logo.height <= max_height:
-            return logo
-        
-        # Maintain aspect ratio
-        logo.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-        return logo
-    
-    def _cache_logo(self, cache_key: str, logo: Image.Image) -> None:
-        """Cache a logo with LRU eviction."""
-        # Remove oldest if cache is full
-        if len(self._logo_cache) >= self.cache_size:
-            if self._cache_order:
-                oldest_key = self._cache_order.pop(0)
-                del self._logo_cache[oldest_key]
-        
-        # Add to cache
-        self._logo_cache[cache_key] = logo
-        self._cache_order.append(cache_key)
-    
     def _download_logo(self, url: str, file_path: Path) -> None:
         """Download logo from URL."""
         # Ensure directory exists with proper permissions
@@ -652,7 +652,8 @@ class ScrollHelper:
         """Alias for reset_scroll() for convenience."""
         self.reset_scroll()
 
-    def set_scrolling_image(self, image: Image.Image) -> None:
+    def set_scrolling_image(self, image: Image.Image,
+                            image_array: Optional[np.ndarray] = None) -> None:
         """
         Set a pre-rendered scrolling image and initialize all required state.
         
@@ -662,6 +663,10 @@ class ScrollHelper:
         
         Args:
             image: PIL Image containing the scrolling content
+            image_array: Optional (height, width, 3) uint8 array holding the same
+                pixels as image. Plugins that assemble their strip as an array
+                can pass it to avoid converting the image a second time. The
+                array is used as-is and must not be modified afterwards.
         """
         if image is None:
             self.logger.warning("Attempted to set None as scrolling image, clearing cache instead")
@@ -672,7 +677,11 @@ class ScrollHelper:
         self.cached_image = image
         
         # Convert to numpy array for fast operations (required for get_visible_portion)
-        self.cached_array = np.array(image)
+        if (image_array is not None and image_array.dtype == np.uint8
+                and image_array.shape == (image.height, image.width, 3)):
+            self.cached_array = image_array
+        else:
+            self.cached_array = np.array(image)
         
         # Update scroll width
         self.total_scroll_width = image.width
@@ -1,9 +1,12 @@
 import json
 import os
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 from src.exceptions import ConfigError
+from src.config_snapshot import ConfigFileWatcher, ConfigSnapshot, FileSignature, file_signature
 from src.logging_config import get_logger
 from src.config_manager_atomic import (
     AtomicConfigManager, SaveResult, SaveResultStatus,
@@ -17,6 +20,10 @@ from src.common.permission_utils import (
 )
 
 class ConfigManager:
+    # Files modified this recently are re-read even if their signature matches
+    # the snapshot's, since mtime granularity can hide a second write
+    RACY_WINDOW_NS = 1_000_000_000
+
     def __init__(self, config_path: Optional[str] = None, secrets_path: Optional[str] = None) -> None:
         # Use current working directory as base
         self.config_path: str = config_path or "config/config.json"
@@ -27,6 +34,14 @@ class ConfigManager:
         
         # Initialize atomic config manager
         self._atomic_manager: Optional[AtomicConfigManager] = None
+        
+        # Shared read-only snapshot of the merged config, reused until the files change
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._snapshot_signature: Optional[FileSignature] = None
+        self._snapshot_taken_ns: int = 0
+        self._snapshot_lock = threading.RLock()
+        self._watcher: Optional[ConfigFileWatcher] = None
+        self._watcher_callback: Optional[Callable[[], None]] = None
 
     def get_config_path(self) -> str:
         return self.config_path
@@ -83,6 +98,7 @@ class ConfigManager:
             create_backup=create_backup,
             validate_after_write=validate_after_write
         )
+        self.invalidate_snapshot()
         
         # Update in-memory config if save was successful
         if result.status == SaveResultStatus.SUCCESS:
@@ -110,6 +126,7 @@ class ConfigManager:
         """
         atomic_mgr = self._get_atomic_manager()
         success = atomic_mgr.rollback_config(backup_version)
+        self.invalidate_snapshot()
         
         if success:
             # Reload config after rollback
@@ -144,8 +161,138 @@ class ConfigManager:
         atomic_mgr = self._get_atomic_manager()
         return atomic_mgr.validate_config_file(config_path)
 
+    def _snapshot_paths(self) -> List[str]:
+        return [self.config_path, self.secrets_path, self.template_path]
+
+    def _current_snapshot(self) -> Optional[ConfigSnapshot]:
+        """Return the snapshot if the config files haven't changed since it was taken."""
+        with self._snapshot_lock:
+            if self._snapshot is None or self._snapshot_signature is None:
+                return None
+            if self._watcher is not None and self._watcher.using_inotify:
+                # The watcher invalidates on change; no need to touch the disk
+                return self._snapshot
+            signature = file_signature(self._snapshot_paths())
+            if signature != self._snapshot_signature:
+                return None
+            racy_after = self._snapshot_taken_ns - self.RACY_WINDOW_NS
+            if any(entry is not None and entry[0] >= racy_after for entry in signature):
+                return None
+            return self._snapshot
+
+    def _store_snapshot(self, config: Dict[str, Any], signature: FileSignature, taken_ns: int) -> None:
+        with self._snapshot_lock:
+            previous = self._snapshot
+            snapshot = ConfigSnapshot(config, version=(previous.version if previous else 0) + 1)
+            if previous is not None and previous.checksum == snapshot.checksum:
+                snapshot = previous  # Same content: keep the version and any cached sub-views
+            self._snapshot = snapshot
+            self._snapshot_signature = signature
+            self._snapshot_taken_ns = taken_ns
+
+    def invalidate_snapshot(self) -> None:
+        """Force the next read to reload the config files."""
+        with self._snapshot_lock:
+            self._snapshot_signature = None
+
+    def get_snapshot(self) -> ConfigSnapshot:
+        """
+        Get the shared read-only snapshot of the merged configuration.
+
+        Reloads from disk only if the config files changed since the snapshot
+        was taken. The snapshot must not be modified; use ``load_config`` or
+        ``ConfigSnapshot.to_dict`` for a mutable copy.
+
+        Returns:
+            Current ConfigSnapshot
+
+        Raises:
+            ConfigError: If the configuration cannot be loaded
+        """
+        snapshot = self._current_snapshot()
+        if snapshot is None:
+            with self._snapshot_lock:
+                snapshot = self._current_snapshot()
+                if snapshot is None:
+                    self.load_config()
+                    snapshot = self._snapshot
+                    if snapshot is None:
+                        raise ConfigError("Configuration loaded without a snapshot", config_path=self.config_path)
+        return snapshot
+
+    def get_plugin_config(self, plugin_id: str) -> Dict[str, Any]:
+        """
+        Get a mutable copy of one plugin's configuration from the shared snapshot.
+
+        Args:
+            plugin_id: Plugin identifier
+
+        Returns:
+            Plugin configuration dictionary (empty if not configured)
+        """
+        return self.get_snapshot().plugin_config(plugin_id)
+
+    def start_watching(self, on_change: Optional[Callable[[], None]] = None,
+                       poll_interval: float = 2.0) -> ConfigFileWatcher:
+        """
+        Watch the config files and invalidate the snapshot when they change.
+
+        Uses inotify where available (snapshot reads then never touch the
+        disk) and polling otherwise.
+
+        Args:
+            on_change: Optional callback run after the snapshot is invalidated
+            poll_interval: Seconds between checks when polling
+
+        Returns:
+            The running ConfigFileWatcher
+        """
+        with self._snapshot_lock:
+            if self._watcher is None:
+                def _changed() -> None:
+                    self.invalidate_snapshot()
+                    if self._watcher_callback:
+                        self._watcher_callback()
+
+                self._watcher = ConfigFileWatcher(self._snapshot_paths(), _changed, poll_interval=poll_interval,
+                                                  logger=self.logger)
+            self._watcher_callback = on_change
+            self._watcher.start()
+            return self._watcher
+
+    def stop_watching(self) -> None:
+        """Stop watching the config files."""
+        with self._snapshot_lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.stop()
+
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from JSON files."""
+        """
+        Load configuration from JSON files.
+
+        Served from the shared snapshot when the files haven't changed since
+        the last load; the returned dict is always a fresh copy the caller may
+        modify.
+        """
+        snapshot = self._current_snapshot()
+        if snapshot is not None:
+            self.config = snapshot.to_dict()
+            return self.config
+        with self._snapshot_lock:
+            snapshot = self._current_snapshot()
+            if snapshot is not None:
+                self.config = snapshot.to_dict()
+                return self.config
+            # Taken before reading so a write during the load forces another one
+            taken_ns = time.time_ns()
+            signature = file_signature(self._snapshot_paths())
+            config = self._load_config_from_disk()
+            self._store_snapshot(config, signature, taken_ns)
+            return config
+
+    def _load_config_from_disk(self) -> Dict[str, Any]:
+        """Read, migrate and merge the configuration files."""
         try:
             # Check if config file exists, if not create from template
             if not os.path.exists(self.config_path):
@@ -227,6 +374,7 @@ class ConfigManager:
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(config_to_write, f, indent=4)
+            self.invalidate_snapshot()
             
             # Update the in-memory config to the new state (which includes secrets for runtime)
             self.config = new_config_data 
@@ -467,6 +615,7 @@ class ConfigManager:
                 # This works even if target file exists and isn't writable
                 os.replace(temp_path, str(path_obj))
                 temp_path = None  # Mark as moved so we don't try to clean it up
+                self.invalidate_snapshot()
                 
                 # Ensure final file has correct permissions
                 try:
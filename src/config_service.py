@@ -5,26 +5,24 @@ Provides centralized configuration management with hot-reload support,
 versioning, and change notifications.
 
 This service wraps ConfigManager and adds:
-- File watching for automatic reload
+- File watching for automatic reload (inotify, polling as a fallback)
 - Configuration versioning
 - Change notifications to subscribers
-- Thread-safe configuration access
+- Thread-safe configuration access through shared read-only snapshots
 """
 
 import json
-import os
-import time
 import threading
-from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable, Set
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Mapping, Set
 from datetime import datetime
 from collections import defaultdict
 import logging
-import hashlib
 
 from src.exceptions import ConfigError
 from src.logging_config import get_logger
 from src.config_manager import ConfigManager
+from src.config_snapshot import ConfigFileWatcher, ConfigSnapshot
 
 
 class ConfigVersion:
@@ -92,7 +90,7 @@ class ConfigService:
         # Current configuration
         self._current_config: Dict[str, Any] = {}
         self._current_version: int = 0
-        self._last_modified: Dict[str, float] = {}
+        self._snapshot: Optional[ConfigSnapshot] = None
         
         # Version history
         self._versions: List[ConfigVersion] = []
@@ -102,9 +100,9 @@ class ConfigService:
         self._subscribers: Dict[str, List[Callable[[Dict[str, Any], Dict[str, Any]], None]]] = defaultdict(list)
         
         # File watching
+        self._watcher: Optional[ConfigFileWatcher] = None
         self._watch_thread: Optional[threading.Thread] = None
-        self._watch_interval: float = 2.0  # Check every 2 seconds
-        self._stop_watching: bool = False
+        self._watch_interval: float = 2.0  # Polling interval when inotify is unavailable
         
         # Load initial configuration
         self._load_config()
@@ -113,11 +111,6 @@ class ConfigService:
         if self.enable_hot_reload:
             self._start_file_watching()
     
-    def _calculate_checksum(self, config: Dict[str, Any]) -> str:
-        """Calculate MD5 checksum of configuration."""
-        config_str = json.dumps(config, sort_keys=True)
-        return hashlib.md5(config_str.encode()).hexdigest()
-    
     def _load_config(self) -> bool:
         """
         Load configuration from ConfigManager.
@@ -126,8 +119,8 @@ class ConfigService:
             True if config changed, False otherwise
         """
         try:
-            new_config = self.config_manager.load_config()
-            new_checksum = self._calculate_checksum(new_config)
+            snapshot = self.config_manager.get_snapshot()
+            new_checksum = snapshot.checksum
             
             with self._lock:
                 # Check if config actually changed
@@ -137,6 +130,9 @@ class ConfigService:
                         self.logger.debug("Configuration unchanged, skipping reload")
                         return False
                 
+                new_config = snapshot.to_dict()
+                self._snapshot = snapshot
+                
                 # Store old config for change detection
                 old_config = self._current_config.copy()
                 
@@ -213,86 +209,32 @@ class ConfigService:
                             exc_info=True
                         )
     
-    def _check_file_changes(self) -> bool:
-        """
-        Check if configuration files have been modified.
-        
-        Returns:
-            True if files changed, False otherwise
-        """
-        config_path = Path(self.config_manager.get_config_path())
-        secrets_path = Path(self.config_manager.get_secrets_path())
-        
-        changed = False
-        
-        # Check main config file
-        if config_path.exists():
-            mtime = config_path.stat().st_mtime
-            if mtime != self._last_modified.get(str(config_path), 0):
-                self._last_modified[str(config_path)] = mtime
-                changed = True
-        
-        # Check secrets file
-        if secrets_path.exists():
-            mtime = secrets_path.stat().st_mtime
-            if mtime != self._last_modified.get(str(secrets_path), 0):
-                self._last_modified[str(secrets_path)] = mtime
-                changed = True
-        
-        return changed
-    
-    def _file_watcher_loop(self) -> None:
-        """Main loop for file watching."""
-        self.logger.info("Configuration file watcher started")
-        
-        # Initialize last modified times
-        config_path = Path(self.config_manager.get_config_path())
-        secrets_path = Path(self.config_manager.get_secrets_path())
-        
-        if config_path.exists():
-            self._last_modified[str(config_path)] = config_path.stat().st_mtime
-        if secrets_path.exists():
-            self._last_modified[str(secrets_path)] = secrets_path.stat().st_mtime
-        
-        while not self._stop_watching:
-            try:
-                if self._check_file_changes():
-                    self.logger.info("Configuration files changed, reloading...")
-                    self._load_config()
-                
-                # Sleep with periodic checks for stop signal
-                for _ in range(int(self._watch_interval)):
-                    if self._stop_watching:
-                        break
-                    time.sleep(1)
-                    
-            except Exception as e:
-                self.logger.error("Error in file watcher loop: %s", e, exc_info=True)
-                time.sleep(self._watch_interval)
-        
-        self.logger.info("Configuration file watcher stopped")
+    def _on_files_changed(self) -> None:
+        """Reload after the watcher saw the config files change."""
+        self.logger.info("Configuration files changed, reloading...")
+        self._load_config()
     
     def _start_file_watching(self) -> None:
-        """Start the file watching thread."""
+        """Start watching the config files."""
         if self._watch_thread and self._watch_thread.is_alive():
             return
         
-        self._stop_watching = False
-        self._watch_thread = threading.Thread(
-            target=self._file_watcher_loop,
-            name="ConfigService-Watcher",
-            daemon=True
+        self._watcher = self.config_manager.start_watching(
+            self._on_files_changed,
+            poll_interval=self._watch_interval
+        )
+        self._watch_thread = self._watcher.thread
+        self.logger.info(
+            "Configuration file watcher started (%s)",
+            "inotify" if self._watcher.using_inotify else "polling"
         )
-        self._watch_thread.start()
-        self.logger.debug("File watching thread started")
     
     def _stop_file_watching(self) -> None:
-        """Stop the file watching thread."""
-        if self._watch_thread and self._watch_thread.is_alive():
-            self._stop_watching = True
-            self._watch_thread.join(timeout=5.0)
-            if self._watch_thread.is_alive():
-                self.logger.warning("File watching thread did not stop gracefully")
+        """Stop watching the config files."""
+        if self._watcher is not None:
+            self.config_manager.stop_watching()
+            self._watcher = None
+            self.logger.info("Configuration file watcher stopped")
     
     def get_config(self) -> Dict[str, Any]:
         """
@@ -314,8 +256,35 @@ class ConfigService:
         Returns:
             Plugin configuration dictionary
         """
-        config = self.get_config()
-        return config.get(plugin_id, {})
+        with self._lock:
+            snapshot = self._snapshot
+        return snapshot.plugin_config(plugin_id) if snapshot is not None else {}
+    
+    def get_snapshot(self) -> Optional[ConfigSnapshot]:
+        """
+        Get the current read-only configuration snapshot.
+        
+        The same object is shared by all readers until the configuration
+        changes, so this is O(1); it must not be modified.
+        
+        Returns:
+            Current ConfigSnapshot, or None if no configuration has loaded
+        """
+        with self._lock:
+            return self._snapshot
+    
+    def get_plugin_view(self, plugin_id: str) -> Mapping[str, Any]:
+        """
+        Get a read-only view of a plugin's configuration without copying.
+        
+        Args:
+            plugin_id: Plugin identifier
+            
+        Returns:
+            Read-only plugin configuration mapping (empty if not configured)
+        """
+        snapshot = self.get_snapshot()
+        return snapshot.plugin(plugin_id) if snapshot is not None else MappingProxyType({})
     
     def subscribe(
         self,
@@ -363,6 +332,7 @@ class ConfigService:
             True if reloaded successfully, False otherwise
         """
         self.logger.info("Manual configuration reload requested")
+        self.config_manager.invalidate_snapshot()
         return self._load_config()
     
     def get_version(self) -> int:
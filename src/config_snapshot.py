@@ -0,0 +1,291 @@
+"""
+Configuration Snapshots
+
+Immutable, versioned views of the merged configuration (main config +
+secrets, after migrations) and a file watcher that tells the owner when to
+rebuild them.
+
+A ``ConfigSnapshot`` is built once per change of the config files and
+shared by every reader: nested dicts are exposed as read-only mappings and
+lists as tuples, so handing out the same object is safe. Readers that need
+a mutable dict get a fresh copy from the snapshot's canonical JSON, which
+is far cheaper than re-reading the files, re-merging secrets and re-running
+migrations.
+
+``ConfigFileWatcher`` uses Linux inotify (through libc, no extra
+dependency) on the directories holding the config files, so atomic
+rename-based saves are seen too; elsewhere it falls back to polling file
+signatures.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import logging
+import os
+import select
+import struct
+import threading
+import time
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from src.logging_config import get_logger
+
+FileSignature = Tuple[Optional[Tuple[int, int, int]], ...]
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def file_signature(paths: Iterable[str]) -> FileSignature:
+    """
+    Get a cheap change signature for a set of files.
+
+    Args:
+        paths: File paths
+
+    Returns:
+        Tuple of (mtime_ns, size, inode) per path, None for missing files
+    """
+    signature: List[Optional[Tuple[int, int, int]]] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class ConfigSnapshot(Mapping):
+    """Read-only, versioned view of the merged configuration."""
+
+    def __init__(self, config: Dict[str, Any], version: int) -> None:
+        """
+        Build a snapshot.
+
+        Args:
+            config: Merged configuration (not retained; the snapshot keeps its own copy)
+            version: Version number, bumped whenever the content changes
+        """
+        self._blob: str = json.dumps(config, sort_keys=True)
+        self.checksum: str = hashlib.md5(self._blob.encode()).hexdigest()
+        self.version: int = version
+        self.timestamp: datetime = datetime.now()
+        self._data: Mapping[str, Any] = freeze(json.loads(self._blob))
+        self._section_blobs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def plugin(self, plugin_id: str) -> Mapping[str, Any]:
+        """
+        Get a read-only view of one plugin's (or section's) configuration.
+
+        Args:
+            plugin_id: Plugin identifier or top-level section name
+
+        Returns:
+            Read-only mapping (empty if the section is missing)
+        """
+        section = self._data.get(plugin_id)
+        return section if isinstance(section, Mapping) else _EMPTY
+
+    def plugin_config(self, plugin_id: str) -> Dict[str, Any]:
+        """
+        Get a mutable copy of one plugin's (or section's) configuration.
+
+        Args:
+            plugin_id: Plugin identifier or top-level section name
+
+        Returns:
+            Configuration dictionary owned by the caller (empty if missing)
+        """
+        with self._lock:
+            blob = self._section_blobs.get(plugin_id)
+            if blob is None:
+                blob = json.dumps(self.to_dict().get(plugin_id, {}))
+                self._section_blobs[plugin_id] = blob
+        section = json.loads(blob)
+        return section if isinstance(section, dict) else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a mutable deep copy of the whole configuration."""
+        return json.loads(self._blob)
+
+    def info(self) -> Dict[str, Any]:
+        """Get version metadata."""
+        return {
+            'version': self.version,
+            'timestamp': self.timestamp.isoformat(),
+            'checksum': self.checksum,
+            'config_size': len(self._blob)
+        }
+
+
+class ConfigFileWatcher:
+    """Calls back when any of a set of files changes (inotify, or polling as a fallback)."""
+
+    # inotify event masks (linux/inotify.h)
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(
+        self,
+        paths: List[str],
+        on_change: Callable[[], None],
+        poll_interval: float = 2.0,
+        debounce: float = 0.2,
+        use_inotify: bool = True,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            paths: Files to watch
+            on_change: Called (from the watcher thread) after the files change
+            poll_interval: Seconds between checks when polling
+            debounce: Seconds to wait for a burst of events to settle
+            use_inotify: Allow inotify (False forces polling)
+            logger: Optional logger instance
+        """
+        self.paths = [os.path.abspath(p) for p in paths]
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.logger = logger or get_logger(__name__)
+        self.thread: Optional[threading.Thread] = None
+        self.using_inotify = False
+        self._stop = threading.Event()
+        self._fd: Optional[int] = None
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self.thread and self.thread.is_alive():
+            return
+        self._stop.clear()
+        self._fd = self._open_inotify() if self.use_inotify else None
+        self.using_inotify = self._fd is not None
+        self.thread = threading.Thread(
+            target=self._inotify_loop if self.using_inotify else self._poll_loop,
+            name="ConfigFileWatcher",
+            daemon=True
+        )
+        self.thread.start()
+        self.logger.debug("Watching config files (%s)", "inotify" if self.using_inotify else "polling")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop watching and wait for the thread to exit."""
+        self._stop.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=timeout)
+            if self.thread.is_alive():
+                self.logger.warning("Config file watcher did not stop gracefully")
+
+    def _notify(self) -> None:
+        try:
+            self.on_change()
+        except Exception as e:
+            self.logger.error("Error handling config file change: %s", e, exc_info=True)
+
+    def _poll_loop(self) -> None:
+        last = file_signature(self.paths)
+        while not self._stop.wait(self.poll_interval):
+            current = file_signature(self.paths)
+            if current != last:
+                last = current
+                self._notify()
+
+    def _open_inotify(self) -> Optional[int]:
+        """Create an inotify instance watching the files' directories, or None if unavailable."""
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            self.logger.debug("inotify unavailable, polling config files: %s", e)
+            return None
+        if fd < 0:
+            self.logger.debug("inotify_init1 failed (errno %d), polling config files", ctypes.get_errno())
+            return None
+        watched = 0
+        for directory in sorted({os.path.dirname(p) for p in self.paths}):
+            if libc.inotify_add_watch(fd, os.fsencode(directory), self.WATCH_MASK) >= 0:
+                watched += 1
+            else:
+                self.logger.debug("Cannot watch %s (errno %d)", directory, ctypes.get_errno())
+        if not watched:
+            os.close(fd)
+            return None
+        return fd
+
+    def _read_names(self, fd: int) -> List[str]:
+        """Read pending inotify events and return the affected file names."""
+        names: List[str] = []
+        while True:
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            if not data:
+                return names
+            offset = 0
+            while offset + self._EVENT_HEADER.size <= len(data):
+                _, _, _, length = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += self._EVENT_HEADER.size
+                names.append(os.fsdecode(data[offset:offset + length].rstrip(b'\0')))
+                offset += length
+
+    def _inotify_loop(self) -> None:
+        fd = self._fd
+        if fd is None:
+            return
+        names = {os.path.basename(p) for p in self.paths}
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd], [], [], 1.0)
+                if not ready or not names.intersection(self._read_names(fd)):
+                    continue
+                # Let multi-step saves (temp file + rename, config + secrets) settle
+                while not self._stop.wait(self.debounce):
+                    ready, _, _ = select.select([fd], [], [], 0)
+                    if not ready:
+                        break
+                    self._read_names(fd)
+                if not self._stop.is_set():
+                    self._notify()
+        except OSError as e:
+            self.logger.warning("inotify watch failed, falling back to polling: %s", e)
+            self.using_inotify = False
+            self._poll_loop()
+        finally:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            self._fd = None
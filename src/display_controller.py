@@ -14,12 +14,22 @@ from src.display_manager import DisplayManager
 from src.config_manager import ConfigManager
 from src.config_service import ConfigService
 from src.cache_manager import CacheManager
+from src.event_bus import EventType, PathWatcher, get_event_bus
 from src.font_manager import FontManager
 from src.logging_config import get_logger
+from src.startup_profiler import default_report_path, get_startup_profiler
+from src.metrics import METRICS_SNAPSHOT_PATH, get_metrics_registry
+from src.plugin_system.plugin_executor import PLUGIN_DISPLAY_SECONDS
 
 # Get logger with consistent configuration
 logger = get_logger(__name__)
 
+LOOP_HOUSEKEEPING_SECONDS = get_metrics_registry().histogram(
+    'ledmatrix_display_loop_housekeeping_seconds',
+    'Time the display loop spends on events, plugin updates and schedule checks before rendering a mode')
+# How often the metrics snapshot is published for the web interface's /metrics
+METRICS_PUBLISH_INTERVAL = 10.0
+
 # Vegas mode import (lazy loaded to avoid circular imports)
 _vegas_mode_imported = False
 VegasModeCoordinator = None
@@ -32,27 +42,36 @@ class DisplayController:
     def __init__(self):
         start_time = time.time()
         logger.info("Starting DisplayController initialization")
+        self.startup_profiler = get_startup_profiler()
+        self._startup_report_path = None
+        self._metrics_published_at = 0.0
+        self.update_worker = None
 
         # Throttle tracking for _tick_plugin_updates in high-FPS loops
         self._last_plugin_tick_time = 0.0
 
         # Initialize ConfigManager and wrap with ConfigService for hot-reload
-        config_manager = ConfigManager()
-        enable_hot_reload = os.environ.get('LEDMATRIX_HOT_RELOAD', 'true').lower() == 'true'
-        self.config_service = ConfigService(
-            config_manager=config_manager,
-            enable_hot_reload=enable_hot_reload
-        )
-        self.config_manager = config_manager  # Keep for backward compatibility
-        self.config = self.config_service.get_config()
-        self.cache_manager = CacheManager()
+        with self.startup_profiler.phase('config'):
+            config_manager = ConfigManager()
+            enable_hot_reload = os.environ.get('LEDMATRIX_HOT_RELOAD', 'true').lower() == 'true'
+            self.config_service = ConfigService(
+                config_manager=config_manager,
+                enable_hot_reload=enable_hot_reload
+            )
+            self.config_manager = config_manager  # Keep for backward compatibility
+            self.config = self.config_service.get_config()
+        with self.startup_profiler.phase('cache_manager'):
+            self.cache_manager = CacheManager()
+        cache_dir = self.cache_manager.get_cache_dir()
+        self._startup_report_path = default_report_path(cache_dir if isinstance(cache_dir, str) else None)
         logger.info("Config loaded in %.3f seconds (hot-reload: %s)", time.time() - start_time, enable_hot_reload)
         
         # Validate startup configuration
         try:
             from src.startup_validator import StartupValidator
             validator = StartupValidator(self.config_manager)
-            is_valid, errors, warnings = validator.validate_all()
+            with self.startup_profiler.phase('startup_validation'):
+                is_valid, errors, warnings = validator.validate_all()
             
             if warnings:
                 for warning in warnings:
@@ -67,12 +86,14 @@ class DisplayController:
             logger.warning(f"Startup validation could not be completed: {e}")
         
         config_time = time.time()
-        self.display_manager = DisplayManager(self.config)
+        with self.startup_profiler.phase('display_manager'):
+            self.display_manager = DisplayManager(self.config)
         logger.info("DisplayManager initialized in %.3f seconds", time.time() - config_time)
         
         # Initialize Font Manager
         font_time = time.time()
-        self.font_manager = FontManager(self.config)
+        with self.startup_profiler.phase('font_manager'):
+            self.font_manager = FontManager(self.config)
         logger.info("FontManager initialized in %.3f seconds", time.time() - font_time)
         
         # Initialize display modes - all functionality now handled via plugins
@@ -111,6 +132,7 @@ class DisplayController:
         self.on_demand_last_event: Optional[str] = None
         self.on_demand_schedule_override = False
         self.rotation_resume_index: Optional[int] = None
+        self._deferred_plugins: Dict[str, Any] = {}  # plugin_id -> DeferredPlugin placeholder
         
         # WiFi status message tracking
         global WIFI_STATUS_FILE
@@ -121,6 +143,33 @@ class DisplayController:
         self.wifi_status_file = WIFI_STATUS_FILE
         self.wifi_status_active = False
         self.wifi_status_expires_at: Optional[float] = None
+
+        # Change notifications: the loop consumes events from the bus instead
+        # of re-reading status files and re-scanning plugins on every pass.
+        # Files written by other processes (WiFi monitor, web interface) are
+        # turned into events by the path watcher thread.
+        self.event_bus = get_event_bus()
+        self.event_bus.drain()
+        self._path_watcher = PathWatcher(self.event_bus)
+        self._path_watcher.watch(self.wifi_status_file, EventType.STATUS_MESSAGE)
+        self._on_demand_request_watched = False
+        cache_dir = self.cache_manager.get_cache_dir()
+        if isinstance(cache_dir, str):
+            self._path_watcher.watch(
+                os.path.join(cache_dir, 'display_on_demand_request.json'),
+                EventType.ON_DEMAND_REQUEST
+            )
+            self._on_demand_request_watched = True
+        self.config_service.subscribe(self._on_config_changed)
+        self._wifi_status_dirty = True
+        self._wifi_status_data: Optional[Dict[str, Any]] = None
+        self._on_demand_dirty = True
+        self._live_priority_dirty = True
+        self._live_priority_mode: Optional[str] = None
+        # Re-derive event-driven state periodically in case a change was
+        # made without a notification (e.g. plugin background threads)
+        self._event_resync_interval = 30.0
+        self._last_event_resync = time.monotonic()
         
         try:
             logger.info("Attempting to import plugin system...")
@@ -141,19 +190,21 @@ class DisplayController:
             
             logger.info("Plugin Manager initialized with plugins directory: %s", plugins_dir)
             
-            self.plugin_manager = PluginManager(
-                plugins_dir=plugins_dir,
-                config_manager=self.config_manager,
-                display_manager=self.display_manager,
-                cache_manager=self.cache_manager,
-                font_manager=self.font_manager
-            )
+            with self.startup_profiler.phase('plugin_manager'):
+                self.plugin_manager = PluginManager(
+                    plugins_dir=plugins_dir,
+                    config_manager=self.config_manager,
+                    display_manager=self.display_manager,
+                    cache_manager=self.cache_manager,
+                    font_manager=self.font_manager
+                )
             
             # Validate plugins after plugin manager is created
             try:
                 from src.startup_validator import StartupValidator
                 validator = StartupValidator(self.config_manager, self.plugin_manager)
-                is_valid, errors, warnings = validator.validate_all()
+                with self.startup_profiler.phase('plugin_validation'):
+                    is_valid, errors, warnings = validator.validate_all()
                 
                 if warnings:
                     for warning in warnings:
@@ -166,7 +217,8 @@ class DisplayController:
                 logger.warning(f"Plugin validation could not be completed: {e}")
 
             # Discover plugins
-            discovered_plugins = self.plugin_manager.discover_plugins()
+            with self.startup_profiler.phase('plugin_discovery'):
+                discovered_plugins = self.plugin_manager.discover_plugins()
             logger.info("Discovered %d plugin(s)", len(discovered_plugins))
 
             # Check for on-demand plugin filter from cache
@@ -205,6 +257,17 @@ class DisplayController:
             else:
                 enabled_plugins = [p for p in discovered_plugins if self.config.get(p, {}).get('enabled', False)]
             
+            # With lazy loading, plugins are imported and instantiated when
+            # one of their modes is first scheduled (the on-demand plugin is
+            # always loaded up front)
+            lazy_load = bool(plugin_system_config.get('lazy_load_plugins', False)) and not on_demand_plugin_id
+            if lazy_load:
+                with self.startup_profiler.phase('plugin_deferral'):
+                    for plugin_id in enabled_plugins:
+                        self._defer_plugin(plugin_id)
+                logger.info("Deferred loading of %d enabled plugin(s) until first display", len(enabled_plugins))
+                enabled_plugins = []
+
             # Count enabled plugins for progress tracking
             enabled_count = len(enabled_plugins)
             logger.info("Loading %d enabled plugin(s) in parallel (max 4 concurrent)...", enabled_count)
@@ -214,7 +277,9 @@ class DisplayController:
                 """Load a single plugin and return result."""
                 plugin_load_start = time.time()
                 try:
-                    if self.plugin_manager.load_plugin(plugin_id):
+                    with self.startup_profiler.plugin_step(plugin_id, 'load'):
+                        loaded = self.plugin_manager.load_plugin(plugin_id)
+                    if loaded:
                         plugin_load_time = time.time() - plugin_load_start
                         return {
                             'success': True,
@@ -239,7 +304,7 @@ class DisplayController:
             
             # Load enabled plugins in parallel with up to 4 concurrent workers
             loaded_count = 0
-            with ThreadPoolExecutor(max_workers=4) as executor:
+            with self.startup_profiler.phase('plugin_loading'), ThreadPoolExecutor(max_workers=4) as executor:
                 # Submit all enabled plugins for loading
                 future_to_plugin = {
                     executor.submit(load_single_plugin, plugin_id): plugin_id
@@ -256,44 +321,7 @@ class DisplayController:
                         logger.info("✓ Loaded plugin %s in %.3f seconds (%d/%d)", 
                                   plugin_id, result['load_time'], loaded_count, enabled_count)
                         
-                        # Get plugin instance and manifest
-                        plugin_instance = self.plugin_manager.get_plugin(plugin_id)
-                        manifest = self.plugin_manager.plugin_manifests.get(plugin_id, {})
-                        
-                        # Prefer plugin's modes attribute if available (dynamic based on enabled leagues)
-                        # Fall back to manifest display_modes if plugin doesn't provide modes
-                        if plugin_instance and hasattr(plugin_instance, 'modes') and plugin_instance.modes:
-                            display_modes = list(plugin_instance.modes)
-                            logger.debug("Using plugin.modes for %s: %s", plugin_id, display_modes)
-                        else:
-                            display_modes = manifest.get('display_modes', [plugin_id])
-                            logger.debug("Using manifest display_modes for %s: %s", plugin_id, display_modes)
-                        
-                        if isinstance(display_modes, list) and display_modes:
-                            self.plugin_display_modes[plugin_id] = list(display_modes)
-                        else:
-                            display_modes = [plugin_id]
-                            self.plugin_display_modes[plugin_id] = list(display_modes)
-                        
-                        # Subscribe plugin to config changes for hot-reload
-                        if hasattr(self, 'config_service') and hasattr(plugin_instance, 'on_config_change'):
-                            def config_change_callback(old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
-                                """Callback for plugin config changes."""
-                                try:
-                                    plugin_instance.on_config_change(new_config)
-                                    logger.debug("Plugin %s notified of config change", plugin_id)
-                                except Exception as e:
-                                    logger.error("Error in plugin %s config change handler: %s", plugin_id, e, exc_info=True)
-                            
-                            self.config_service.subscribe(config_change_callback, plugin_id=plugin_id)
-                            logger.debug("Subscribed plugin %s to config changes", plugin_id)
-                        
-                        # Add plugin modes to available modes
-                        for mode in display_modes:
-                            self.available_modes.append(mode)
-                            self.plugin_modes[mode] = plugin_instance
-                            self.mode_to_plugin_id[mode] = plugin_id
-                            logger.debug("  Added mode: %s", mode)
+                        self._register_loaded_plugin(plugin_id)
                         
                         # Show progress
                         progress_pct = int((loaded_count / enabled_count) * 100)
@@ -305,7 +333,7 @@ class DisplayController:
                                      result['plugin_id'], result['error'])
             
             # Log disabled plugins
-            disabled_count = len(discovered_plugins) - enabled_count
+            disabled_count = len(discovered_plugins) - enabled_count - len(self._deferred_plugins)
             if disabled_count > 0:
                 logger.debug("%d plugin(s) disabled in config", disabled_count)
 
@@ -354,15 +382,217 @@ class DisplayController:
         # Initial data update for plugins (ensures data available on first display)
         logger.info("Performing initial plugin data update...")
         update_start = time.time()
-        self._update_modules()
+        with self.startup_profiler.phase('initial_update'):
+            self._update_modules()
         logger.info("Initial plugin update completed in %.3f seconds", time.time() - update_start)
 
+        # Optionally run later plugin updates in a worker process
+        if self.plugin_manager and self.config.get('plugin_system', {}).get('separate_update_process', False):
+            with self.startup_profiler.phase('update_worker'):
+                self._start_update_worker()
+
         # Initialize Vegas mode coordinator
         self.vegas_coordinator = None
-        self._initialize_vegas_mode()
+        with self.startup_profiler.phase('vegas_mode'):
+            self._initialize_vegas_mode()
 
         logger.info("DisplayController initialization completed in %.3f seconds", time.time() - start_time)
 
+    def _register_loaded_plugin(self, plugin_id: str, insert_at: Optional[int] = None) -> List[str]:
+        """
+        Add a loaded plugin's display modes to the rotation and subscribe it to config changes.
+
+        Args:
+            plugin_id: ID of a plugin loaded by the plugin manager
+            insert_at: Position in available_modes for the plugin's modes (default: append)
+
+        Returns:
+            The plugin's display modes
+        """
+        # Get plugin instance and manifest
+        plugin_instance = self.plugin_manager.get_plugin(plugin_id)
+        manifest = self.plugin_manager.plugin_manifests.get(plugin_id, {})
+
+        # Prefer plugin's modes attribute if available (dynamic based on enabled leagues)
+        # Fall back to manifest display_modes if plugin doesn't provide modes
+        if plugin_instance and hasattr(plugin_instance, 'modes') and plugin_instance.modes:
+            display_modes = list(plugin_instance.modes)
+            logger.debug("Using plugin.modes for %s: %s", plugin_id, display_modes)
+        else:
+            display_modes = manifest.get('display_modes', [plugin_id])
+            logger.debug("Using manifest display_modes for %s: %s", plugin_id, display_modes)
+
+        if isinstance(display_modes, list) and display_modes:
+            self.plugin_display_modes[plugin_id] = list(display_modes)
+        else:
+            display_modes = [plugin_id]
+            self.plugin_display_modes[plugin_id] = list(display_modes)
+
+        # Subscribe plugin to config changes for hot-reload
+        if hasattr(self, 'config_service') and hasattr(plugin_instance, 'on_config_change'):
+            def config_change_callback(old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+                """Callback for plugin config changes."""
+                try:
+                    plugin_instance.on_config_change(new_config)
+                    logger.debug("Plugin %s notified of config change", plugin_id)
+                    if self.update_worker is not None and plugin_id in self.plugin_manager.delegated_update_plugins:
+                        self.update_worker.send_config(plugin_id, new_config)
+                except Exception as e:
+                    logger.error("Error in plugin %s config change handler: %s", plugin_id, e, exc_info=True)
+
+            self.config_service.subscribe(config_change_callback, plugin_id=plugin_id)
+            logger.debug("Subscribed plugin %s to config changes", plugin_id)
+
+        # Add plugin modes to available modes
+        position = len(self.available_modes) if insert_at is None else insert_at
+        for offset, mode in enumerate(display_modes):
+            self.available_modes.insert(position + offset, mode)
+            self.plugin_modes[mode] = plugin_instance
+            self.mode_to_plugin_id[mode] = plugin_id
+            logger.debug("  Added mode: %s", mode)
+        return list(display_modes)
+
+    def _defer_plugin(self, plugin_id: str) -> None:
+        """Register a plugin's manifest modes with a placeholder that loads it on first display."""
+        from src.plugin_system.deferred_plugin import DeferredPlugin
+
+        manifest = self.plugin_manager.plugin_manifests.get(plugin_id, {})
+        display_modes = manifest.get('display_modes')
+        if not isinstance(display_modes, list) or not display_modes:
+            display_modes = [plugin_id]
+        placeholder = DeferredPlugin(
+            plugin_id,
+            display_modes,
+            load=self._load_deferred_plugin,
+            display_manager=self.display_manager,
+            display_name=manifest.get('name'),
+            on_loaded=self._on_deferred_plugin_loaded
+        )
+        self._deferred_plugins[plugin_id] = placeholder
+        self.plugin_display_modes[plugin_id] = list(display_modes)
+        for mode in display_modes:
+            self.available_modes.append(mode)
+            self.plugin_modes[mode] = placeholder
+            self.mode_to_plugin_id[mode] = plugin_id
+        self.startup_profiler.note_plugin(plugin_id, deferred=True)
+
+    def _load_deferred_plugin(self, plugin_id: str) -> Optional[Any]:
+        """Load a deferred plugin; runs on the placeholder's loading thread."""
+        load_start = time.time()
+        with self.startup_profiler.plugin_step(plugin_id, 'load'):
+            loaded = self.plugin_manager.load_plugin(plugin_id)
+        if not loaded:
+            logger.warning("✗ Failed to load deferred plugin %s", plugin_id)
+            return None
+        logger.info("✓ Loaded deferred plugin %s in %.3f seconds", plugin_id, time.time() - load_start)
+        return self.plugin_manager.get_plugin(plugin_id)
+
+    def _on_deferred_plugin_loaded(self, plugin_id: str) -> None:
+        """Placeholder callback; runs on the loading thread."""
+        self.event_bus.publish(EventType.PLUGIN_LOADED, source=plugin_id)
+
+    def _activate_deferred_plugin(self, plugin_id: Optional[str]) -> None:
+        """Swap a deferred plugin's placeholder modes for the loaded plugin's modes."""
+        if plugin_id is None:
+            return
+        placeholder = self._deferred_plugins.get(plugin_id)
+        if placeholder is None or placeholder.instance is None:
+            # Failed loads keep their placeholder, whose display() returns False
+            # so the rotation skips its modes
+            return
+        del self._deferred_plugins[plugin_id]
+
+        placeholder_modes = [m for m in self.available_modes if self.plugin_modes.get(m) is placeholder]
+        insert_at = self.available_modes.index(placeholder_modes[0]) if placeholder_modes else None
+        for mode in placeholder_modes:
+            self.available_modes.remove(mode)
+            self.plugin_modes.pop(mode, None)
+            self.mode_to_plugin_id.pop(mode, None)
+        display_modes = self._register_loaded_plugin(plugin_id, insert_at=insert_at)
+
+        # Keep the rotation position on the mode being shown
+        if self.current_display_mode in self.available_modes:
+            self.current_mode_index = self.available_modes.index(self.current_display_mode)
+        elif self.available_modes:
+            self.current_mode_index = min(self.current_mode_index, len(self.available_modes) - 1)
+        logger.info("Activated deferred plugin %s with modes %s", plugin_id, display_modes)
+        self._write_startup_report()
+
+    def _write_startup_report(self) -> None:
+        """Write the startup profiler report (if there is a report path)."""
+        if self._startup_report_path is not None:
+            self.startup_profiler.write_report(self._startup_report_path)
+
+    def _publish_metrics_if_due(self) -> None:
+        """Write the metrics snapshot served by the web interface's /metrics (throttled)."""
+        now = time.monotonic()
+        if now - self._metrics_published_at >= METRICS_PUBLISH_INTERVAL:
+            self._metrics_published_at = now
+            get_metrics_registry().write_snapshot(METRICS_SNAPSHOT_PATH)
+
+    def _start_update_worker(self) -> None:
+        """Move scheduled updates of plugins that support update snapshots to a worker process."""
+        from src.plugin_system.update_worker import UpdateWorker, supports_update_snapshots
+
+        plugin_ids = [plugin_id for plugin_id, plugin in self.plugin_manager.plugins.items()
+                      if supports_update_snapshots(plugin)]
+        if not plugin_ids:
+            logger.info("No loaded plugin supports update snapshots; plugin updates stay in the display process")
+            return
+        worker = UpdateWorker(
+            plugin_ids,
+            str(self.plugin_manager.plugins_dir),
+            config_path=self.config_manager.config_path,
+            secrets_path=self.config_manager.secrets_path
+        )
+        try:
+            worker.start()
+        except (OSError, RuntimeError) as e:
+            logger.error("Could not start the plugin update worker: %s", e)
+            return
+        # Plugins are handed over once the worker reports them loaded
+        self.update_worker = worker
+        logger.info("Started plugin update worker for %s", plugin_ids)
+
+    def _apply_worker_updates(self) -> None:
+        """Apply plugin data published by the update worker."""
+        worker = self.update_worker
+        if worker is None:
+            return
+        plugin_manager = self.plugin_manager
+        updates = worker.receive()
+        if updates.ready is not None:
+            plugin_manager.delegated_update_plugins = set(updates.ready)
+            logger.info("Plugin update worker is updating %s", updates.ready)
+
+        for plugin_id, (updated_at, snapshot) in updates.snapshots.items():
+            plugin = plugin_manager.get_plugin(plugin_id)
+            if plugin is None:
+                continue
+            try:
+                plugin.apply_update_snapshot(snapshot)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Error applying update snapshot of plugin %s: %s", plugin_id, e, exc_info=True)
+                if plugin_manager.health_tracker:
+                    plugin_manager.health_tracker.record_failure(plugin_id, e)
+                continue
+            plugin_manager.plugin_last_update[plugin_id] = updated_at
+            plugin_manager.state_manager.record_update(plugin_id)
+            if plugin_manager.health_tracker:
+                plugin_manager.health_tracker.record_success(plugin_id)
+            self.event_bus.publish(EventType.PLUGIN_UPDATED, source=plugin_id)
+
+        for plugin_id, message in updates.failures:
+            logger.warning("Plugin %s update failed in the update worker: %s", plugin_id, message)
+            if plugin_manager.health_tracker:
+                plugin_manager.health_tracker.record_failure(plugin_id, Exception(message))
+
+        if not worker.alive:
+            logger.error("Plugin update worker exited; updating plugins in the display process again")
+            plugin_manager.delegated_update_plugins = set()
+            worker.stop()
+            self.update_worker = None
+
     def _initialize_vegas_mode(self):
         """Initialize Vegas mode coordinator if enabled."""
         global _vegas_mode_imported, VegasModeCoordinator
@@ -434,12 +664,15 @@ class DisplayController:
         Returns:
             True if Vegas should yield control, False to continue
         """
+        # Pick up on-demand requests and status changes posted since the last check
+        self._process_display_events()
+
         # Check for pending on-demand request
         if self.on_demand_active:
             return True
 
         # Check for wifi status that needs display
-        if self._check_wifi_status_message():
+        if self._get_wifi_status_message():
             return True
 
         return False
@@ -713,9 +946,12 @@ class DisplayController:
 
     def _tick_plugin_updates(self):
         """Run scheduled plugin updates if the plugin manager supports them."""
+        # Every display loop (including high-FPS ones) ticks here periodically
+        self._publish_metrics_if_due()
         if not self.plugin_manager:
             return
 
+        self._apply_worker_updates()
         if hasattr(self.plugin_manager, "run_scheduled_updates"):
             try:
                 self.plugin_manager.run_scheduled_updates()
@@ -739,12 +975,17 @@ class DisplayController:
             self._tick_plugin_updates()
 
     def _sleep_with_plugin_updates(self, duration: float, tick_interval: float = 1.0):
-        """Sleep while continuing to service plugin update schedules."""
+        """Sleep while continuing to service plugin update schedules.
+
+        Blocks on the event bus rather than sleeping, and returns early if an
+        event switches the display mode or starts/stops on-demand mode.
+        """
         if duration <= 0:
             return
 
         end_time = time.time() + duration
         tick_interval = max(0.001, tick_interval)
+        start_state = (self.current_display_mode, self.on_demand_active)
 
         while True:
             remaining = end_time - time.time()
@@ -752,8 +993,77 @@ class DisplayController:
                 break
 
             sleep_time = min(tick_interval, remaining)
-            time.sleep(sleep_time)
+            self._process_display_events(timeout=sleep_time)
             self._tick_plugin_updates()
+            if (self.current_display_mode, self.on_demand_active) != start_state:
+                break
+
+    def _on_config_changed(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+        """Config service callback; runs on the config watcher thread."""
+        self.event_bus.publish(EventType.CONFIG_CHANGED, source='config_service')
+
+    def _process_display_events(self, timeout: float = 0.0) -> bool:
+        """
+        Consume pending bus events and refresh the state they invalidate.
+
+        With no timeout this is a single queue check when nothing changed.
+
+        Args:
+            timeout: Seconds to block waiting for an event (0 = don't block)
+
+        Returns:
+            True if any events were handled
+        """
+        if timeout > 0:
+            events = self.event_bus.wait(timeout)
+        elif self.event_bus.has_pending():
+            events = self.event_bus.drain()
+        else:
+            events = []
+
+        for event in events:
+            if event.event_type == EventType.STATUS_MESSAGE:
+                self._wifi_status_dirty = True
+            elif event.event_type == EventType.PLUGIN_LOADED:
+                self._activate_deferred_plugin(event.source)
+                self._live_priority_dirty = True
+            elif event.event_type == EventType.ON_DEMAND_REQUEST:
+                self._on_demand_dirty = True
+            else:
+                # LIVE_CONTENT_CHANGED, PLUGIN_UPDATED, CONFIG_CHANGED
+                self._live_priority_dirty = True
+
+        now = time.monotonic()
+        if now - self._last_event_resync >= self._event_resync_interval:
+            self._last_event_resync = now
+            self._live_priority_dirty = True
+            self._on_demand_dirty = True
+
+        # Without a watchable cache file, fall back to polling every pass
+        if self._on_demand_dirty or not self._on_demand_request_watched:
+            self._on_demand_dirty = False
+            self._poll_on_demand_requests()
+        return bool(events)
+
+    def _get_live_priority_mode(self) -> Optional[str]:
+        """Return the live priority mode, re-scanning plugins only after a change event."""
+        if self._live_priority_dirty:
+            self._live_priority_dirty = False
+            self._live_priority_mode = self._check_live_priority()
+        return self._live_priority_mode
+
+    def _get_wifi_status_message(self) -> Optional[Dict[str, Any]]:
+        """Return the current WiFi status message, re-reading the file only after a change event."""
+        if self._wifi_status_dirty:
+            self._wifi_status_dirty = False
+            self._wifi_status_data = self._check_wifi_status_message()
+        status_data = self._wifi_status_data
+        if status_data and time.time() >= status_data['expires_at']:
+            # Re-read on the next pass so the expired file gets cleaned up
+            self._wifi_status_data = None
+            self._wifi_status_dirty = True
+            return None
+        return status_data
 
     def _get_display_duration(self, mode_key):
         """Get display duration for a mode."""
@@ -1325,9 +1635,11 @@ class DisplayController:
             self.current_display_mode = self.available_modes[self.current_mode_index] if self.available_modes else 'none'
             logger.info(f"Initial mode set to: {self.current_display_mode} (index: {self.current_mode_index}, total modes: {len(self.available_modes)})")
             
+            self._path_watcher.start()
             while True:
-                # Handle on-demand commands before rendering
-                self._poll_on_demand_requests()
+                loop_start = time.perf_counter()
+                # Handle on-demand commands and change notifications before rendering
+                self._process_display_events()
                 self._check_on_demand_expiration()
                 self._tick_plugin_updates()
                 
@@ -1376,12 +1688,13 @@ class DisplayController:
                 # Process any deferred updates that may have accumulated
                 # This also cleans up expired updates to prevent memory leaks
                 self.display_manager.process_deferred_updates()
+                LOOP_HOUSEKEEPING_SECONDS.observe(time.perf_counter() - loop_start)
 
                 # Check for WiFi status message (interrupts normal rotation, but respects on-demand)
                 # Priority: on-demand > wifi-status > live-priority > normal rotation
                 wifi_status_data = None
                 if not self.on_demand_active:
-                    wifi_status_data = self._check_wifi_status_message()
+                    wifi_status_data = self._get_wifi_status_message()
                     if wifi_status_data:
                         # Display WiFi status message and skip normal rotation
                         if self._display_wifi_status_message(wifi_status_data):
@@ -1395,7 +1708,7 @@ class DisplayController:
 
                 # Check for live priority content and switch to it immediately
                 if not self.on_demand_active and not wifi_status_data:
-                    live_priority_mode = self._check_live_priority()
+                    live_priority_mode = self._get_live_priority_mode()
                     if live_priority_mode and self.current_display_mode != live_priority_mode:
                         logger.info("Live content detected - switching immediately to %s", live_priority_mode)
                         self.current_display_mode = live_priority_mode
@@ -1409,7 +1722,7 @@ class DisplayController:
                 # Vegas scroll mode - continuous ticker across all plugins
                 # Priority: on-demand > wifi-status > live-priority > vegas > normal rotation
                 if self._is_vegas_mode_active() and not wifi_status_data:
-                    live_mode = self._check_live_priority()
+                    live_mode = self._get_live_priority_mode()
                     if not live_mode:
                         try:
                             # Run Vegas mode iteration
@@ -1484,6 +1797,7 @@ class DisplayController:
                     display_result = False
                 elif manager_to_display:
                     plugin_id = getattr(manager_to_display, 'plugin_id', active_mode)
+                    self.display_manager.begin_frame(active_mode, plugin_id)
                     try:
                         logger.debug(f"Calling display() for {active_mode} with force_clear={self.force_change}")
                         if hasattr(manager_to_display, 'display'):
@@ -1531,6 +1845,10 @@ class DisplayController:
                         self.force_change = True
                         display_result = False
                         display_failed_due_to_exception = True  # Mark that this was an exception, not just no content
+
+                if display_result and self.startup_profiler.mark('first_frame'):
+                    logger.info("First frame shown %.3f seconds after startup", self.startup_profiler.elapsed())
+                    self._write_startup_report()
                 
                 # If display() returned False, skip to next mode immediately
                 if not display_result:
@@ -1793,12 +2111,15 @@ class DisplayController:
                             )
 
                             while True:
+                                self.display_manager.begin_frame(active_mode, plugin_id)
+                                frame_start = time.perf_counter()
                                 try:
                                     # Pass display_mode to maintain sticky manager state
                                     if 'display_mode' in sig.parameters:
                                         result = manager_to_display.display(display_mode=active_mode, force_clear=False)
                                     else:
                                         result = manager_to_display.display(force_clear=False)
+                                    PLUGIN_DISPLAY_SECONDS.labels(plugin_id).observe(time.perf_counter() - frame_start)
                                     if isinstance(result, bool) and not result:
                                         logger.debug("Display returned False, breaking early")
                                         break
@@ -1807,16 +2128,20 @@ class DisplayController:
 
                                 time.sleep(display_interval)
                                 self._tick_plugin_updates_throttled(min_interval=1.0)
-                                self._poll_on_demand_requests()
+                                self._process_display_events()
                                 self._check_on_demand_expiration()
 
-                                # Check for live priority every ~30s so live
-                                # games can interrupt long display durations
+                                # Check for live priority on change events (and
+                                # at least every ~30s) so live games can
+                                # interrupt long display durations
                                 elapsed = time.monotonic() - start_time
                                 now = time.monotonic()
-                                if not self.on_demand_active and now >= self._next_live_priority_check:
+                                if not self.on_demand_active and (
+                                    self._live_priority_dirty or now >= self._next_live_priority_check
+                                ):
                                     self._next_live_priority_check = now + 30.0
-                                    live_mode = self._check_live_priority()
+                                    self._live_priority_dirty = True
+                                    live_mode = self._get_live_priority_mode()
                                     if live_mode and live_mode != active_mode:
                                         logger.info("Live priority detected during high-FPS loop: %s", live_mode)
                                         self.current_display_mode = live_mode
@@ -1859,7 +2184,9 @@ class DisplayController:
                             )
 
                             while True:
-                                time.sleep(display_interval)
+                                # Wake early if something changed so on-demand
+                                # and live takeovers don't wait out the frame
+                                self._process_display_events(timeout=display_interval)
                                 self._tick_plugin_updates()
 
                                 elapsed = time.monotonic() - start_time
@@ -1872,12 +2199,15 @@ class DisplayController:
                                     loop_completed = True
                                     break
 
+                                self.display_manager.begin_frame(active_mode, plugin_id)
+                                frame_start = time.perf_counter()
                                 try:
                                     # Pass display_mode to maintain sticky manager state
                                     if 'display_mode' in sig.parameters:
                                         result = manager_to_display.display(display_mode=active_mode, force_clear=False)
                                     else:
                                         result = manager_to_display.display(force_clear=False)
+                                    PLUGIN_DISPLAY_SECONDS.labels(plugin_id).observe(time.perf_counter() - frame_start)
                                     if isinstance(result, bool) and not result:
                                         # For dynamic duration plugins, don't exit on False - keep looping
                                         # until cycle is complete or max duration is reached
@@ -1889,15 +2219,18 @@ class DisplayController:
                                 except Exception:  # pylint: disable=broad-except
                                     logger.exception("Error during display update")
 
-                                self._poll_on_demand_requests()
                                 self._check_on_demand_expiration()
 
-                                # Check for live priority every ~30s so live
-                                # games can interrupt long display durations
+                                # Check for live priority on change events (and
+                                # at least every ~30s) so live games can
+                                # interrupt long display durations
                                 now = time.monotonic()
-                                if not self.on_demand_active and now >= self._next_live_priority_check:
+                                if not self.on_demand_active and (
+                                    self._live_priority_dirty or now >= self._next_live_priority_check
+                                ):
                                     self._next_live_priority_check = now + 30.0
-                                    live_mode = self._check_live_priority()
+                                    self._live_priority_dirty = True
+                                    live_mode = self._get_live_priority_mode()
                                     if live_mode and live_mode != active_mode:
                                         logger.info("Live priority detected during display loop: %s", live_mode)
                                         self.current_display_mode = live_mode
@@ -2194,6 +2527,8 @@ class DisplayController:
 
     def cleanup(self):
         """Clean up resources."""
+        if hasattr(self, '_path_watcher'):
+            self._path_watcher.stop()
         # Shutdown config service if it exists
         if hasattr(self, 'config_service'):
             try:
@@ -2201,6 +2536,9 @@ class DisplayController:
             except Exception as e:
                 logger.warning("Error shutting down config service: %s", e)
         logger.info("Cleaning up display controller...")
+        if getattr(self, 'update_worker', None) is not None:
+            self.update_worker.stop()
+            self.update_worker = None
         if hasattr(self, 'display_manager'):
             self.display_manager.cleanup()
         logger.info("Cleanup complete.")
@@ -5,18 +5,29 @@ else:
     from rgbmatrix import RGBMatrix, RGBMatrixOptions
 from PIL import Image, ImageDraw, ImageFont
 import time
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 import math
 import freetype
 
+from src.frame_recorder import RECORD_PATH_ENV, FrameRecorder
+from src.metrics import get_metrics_registry
+
 # Get logger without configuring
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)  # Set to INFO level
 
+UPDATE_DISPLAY_SECONDS = get_metrics_registry().histogram(
+    'ledmatrix_update_display_seconds', 'Time to push a frame to the matrix')
+FRAME_INTERVAL_SECONDS = get_metrics_registry().histogram(
+    'ledmatrix_frame_interval_seconds', 'Time between consecutive frames pushed to the matrix',
+    buckets=(0.005, 0.008, 0.01, 0.0125, 0.0167, 0.025, 0.033, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0))
+
 class DisplayManager:
     _instance = None
     _initialized = False
+    frame_recorder = None
+    _last_push_ts = None
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -42,9 +53,16 @@ class DisplayManager:
             'max_deferred_updates': 50,  # Limit queue size to prevent memory issues
             'deferred_update_ttl': 300.0  # 5 minutes TTL for deferred updates
         }
+
+        # Optional capture of every pushed frame for offline replay
+        self.frame_recorder = None
         
         self._setup_matrix()
         logger.info("Matrix setup completed in %.3f seconds", time.time() - start_time)
+
+        record_path = os.getenv(RECORD_PATH_ENV)
+        if record_path:
+            self.start_recording(record_path)
         
         font_time = time.time()
         self._load_fonts()
@@ -261,24 +279,58 @@ class DisplayManager:
             if self.matrix is None:
                 # Fallback mode - no actual hardware to update
                 logger.debug("Update display called in fallback mode (no hardware)")
+                if self.frame_recorder is not None:
+                    self.frame_recorder.record(self.image)
                 # Still write a snapshot so the web UI can preview
                 self._write_snapshot_if_due()
                 return
                 
+            push_start = time.perf_counter()
             # Copy the current image to the offscreen canvas   
             self.offscreen_canvas.SetImage(self.image)
             
             # Swap buffers immediately
             self.matrix.SwapOnVSync(self.offscreen_canvas)
+            pushed_at = time.perf_counter()
+            UPDATE_DISPLAY_SECONDS.observe(pushed_at - push_start)
+            if self._last_push_ts is not None:
+                FRAME_INTERVAL_SECONDS.observe(pushed_at - self._last_push_ts)
+            self._last_push_ts = pushed_at
             
             # Swap our canvas references
             self.offscreen_canvas, self.current_canvas = self.current_canvas, self.offscreen_canvas
 
+            if self.frame_recorder is not None:
+                self.frame_recorder.record(self.image)
+
             # Write a snapshot for the web preview (throttled)
             self._write_snapshot_if_due()
         except Exception as e:
             logger.error(f"Error updating display: {e}")
 
+    def start_recording(self, path: str, keyframe_interval: int = 300) -> bool:
+        """Record every frame pushed by update_display() to a file (see src/frame_recorder.py)."""
+        self.stop_recording()
+        try:
+            recorder = FrameRecorder(path, keyframe_interval=keyframe_interval)
+            recorder.start(self.width, self.height)
+        except OSError as e:
+            logger.error("Could not start frame recording to %s: %s", path, e)
+            return False
+        self.frame_recorder = recorder
+        return True
+
+    def stop_recording(self) -> None:
+        """Stop recording frames and close the recording file."""
+        recorder, self.frame_recorder = self.frame_recorder, None
+        if recorder is not None:
+            recorder.stop()
+
+    def begin_frame(self, display_mode: Optional[str] = None, plugin_id: Optional[str] = None) -> None:
+        """Mark the start of rendering a frame (tags and times recorded frames)."""
+        if self.frame_recorder is not None:
+            self.frame_recorder.begin_frame(display_mode, plugin_id)
+
     def clear(self):
         """Clear the display completely."""
         try:
@@ -704,6 +756,8 @@ class DisplayManager:
 
     def cleanup(self):
         """Clean up resources."""
+        if getattr(self, 'frame_recorder', None) is not None:
+            self.stop_recording()
         if hasattr(self, 'matrix') and self.matrix is not None:
             try:
                 self.matrix.Clear()
@@ -18,10 +18,11 @@ Usage:
 
 import logging
 import time
-import requests
 from typing import Dict, List, Set, Optional, Any
 from datetime import datetime, timezone
 
+from src.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 class DynamicTeamResolver:
@@ -142,7 +143,7 @@ class DynamicTeamResolver:
             self.logger.info("Fetching fresh NCAA Football rankings from ESPN API")
             rankings_url = "https://site.api.espn.com/apis/site/v2/sports/football/college-football/rankings"
             
-            response = requests.get(rankings_url, timeout=self.request_timeout)
+            response = get_http_client().get(rankings_url, timeout=self.request_timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -7,12 +7,18 @@ error frequency, patterns, and context.
 
 This is a local-only implementation with no external dependencies.
 Errors are stored in memory with optional JSON export.
+
+Storage is bounded: recent records live in a ring buffer, and each error
+type keeps a bucketed sliding-window counter, so recording an error,
+pattern detection and health/summary queries stay O(1) amortized even
+during an error storm.
 """
 
 import threading
 import traceback
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -70,6 +76,48 @@ class ErrorPattern:
         }
 
 
+class _TypeWindow:
+    """Sliding-window occurrence counter for one error type."""
+
+    BUCKETS = 60
+    SAMPLE_MESSAGES = 5
+
+    def __init__(self, window: timedelta):
+        self.bucket_seconds = max(window.total_seconds() / self.BUCKETS, 1.0)
+        # (bucket index, first timestamp in bucket, count), oldest first
+        self.buckets: deque = deque()
+        self.count = 0
+        self.plugins: Dict[str, datetime] = {}
+        self.messages: deque = deque(maxlen=self.SAMPLE_MESSAGES)
+
+    def _expire(self, now_index: int) -> None:
+        while self.buckets and self.buckets[0][0] <= now_index - self.BUCKETS:
+            self.count -= self.buckets.popleft()[2]
+
+    def add(self, record: ErrorRecord) -> int:
+        """Count a record and return the occurrences within the window."""
+        index = int(record.timestamp.timestamp() // self.bucket_seconds)
+        self._expire(index)
+        if self.buckets and self.buckets[-1][0] == index:
+            bucket_index, first, count = self.buckets[-1]
+            self.buckets[-1] = (bucket_index, first, count + 1)
+        else:
+            self.buckets.append((index, record.timestamp, 1))
+        self.count += 1
+        if record.plugin_id:
+            self.plugins[record.plugin_id] = record.timestamp
+        if record.message not in self.messages:
+            self.messages.append(record.message)
+        return self.count
+
+    @property
+    def first_seen(self) -> datetime:
+        return self.buckets[0][1]
+
+    def recent_plugins(self, cutoff: datetime) -> List[str]:
+        return [p for p, seen in self.plugins.items() if seen > cutoff]
+
+
 class ErrorAggregator:
     """
     Aggregates and analyzes errors across the system.
@@ -83,6 +131,9 @@ class ErrorAggregator:
     Thread-safe for concurrent access.
     """
 
+    # Plugin health looks at this many of the most recent records
+    PLUGIN_HEALTH_WINDOW = 100
+
     def __init__(
         self,
         max_records: int = 1000,
@@ -105,9 +156,13 @@ class ErrorAggregator:
         self.pattern_window = timedelta(minutes=pattern_window_minutes)
         self.export_path = export_path
 
-        self._records: List[ErrorRecord] = []
+        self._records: deque = deque(maxlen=max_records)
+        self._recorded_total = 0
         self._error_counts: Dict[str, int] = defaultdict(int)
         self._plugin_error_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # Per-type pattern windows and each plugin's records among the last 100 recorded
+        self._type_windows: Dict[str, _TypeWindow] = {}
+        self._plugin_recent: Dict[str, deque] = {}
         self._patterns: Dict[str, ErrorPattern] = {}
         self._pattern_callbacks: List[Callable[[ErrorPattern], None]] = []
         self._lock = threading.RLock()  # RLock allows nested acquisition for export_to_file
@@ -152,15 +207,18 @@ class ErrorAggregator:
                 stack_trace=traceback.format_exc()
             )
 
-            # Add record (with size limit)
+            # Add record (the ring buffer drops the oldest beyond max_records)
             self._records.append(record)
-            if len(self._records) > self.max_records:
-                self._records.pop(0)
+            self._recorded_total += 1
 
             # Update counts
             self._error_counts[error_type] += 1
             if plugin_id:
                 self._plugin_error_counts[plugin_id][error_type] += 1
+                recent = self._plugin_recent.get(plugin_id)
+                if recent is None:
+                    recent = self._plugin_recent[plugin_id] = deque(maxlen=self.PLUGIN_HEALTH_WINDOW)
+                recent.append((self._recorded_total, record))
 
             # Check for patterns
             self._detect_pattern(record)
@@ -175,18 +233,16 @@ class ErrorAggregator:
 
     def _detect_pattern(self, record: ErrorRecord) -> None:
         """Detect recurring error patterns."""
-        cutoff = datetime.now() - self.pattern_window
-        recent_same_type = [
-            r for r in self._records
-            if r.error_type == record.error_type and r.timestamp > cutoff
-        ]
+        window = self._type_windows.get(record.error_type)
+        if window is None:
+            window = self._type_windows[record.error_type] = _TypeWindow(self.pattern_window)
+        count = window.add(record)
 
-        if len(recent_same_type) >= self.pattern_threshold:
+        if count >= self.pattern_threshold:
             pattern_key = record.error_type
             is_new_pattern = pattern_key not in self._patterns
 
             # Determine severity based on count
-            count = len(recent_same_type)
             if count > self.pattern_threshold * 3:
                 severity = "critical"
             elif count > self.pattern_threshold * 2:
@@ -194,20 +250,17 @@ class ErrorAggregator:
             else:
                 severity = "warning"
 
-            # Collect affected plugins
-            affected_plugins = [r.plugin_id for r in recent_same_type if r.plugin_id]
-
-            # Collect sample messages
-            sample_messages = list(set(r.message for r in recent_same_type[:5]))
-
             if is_new_pattern:
+                # Collect affected plugins
+                affected_plugins = window.recent_plugins(record.timestamp - self.pattern_window)
+
                 pattern = ErrorPattern(
                     error_type=record.error_type,
                     count=count,
-                    first_seen=recent_same_type[0].timestamp,
+                    first_seen=window.first_seen,
                     last_seen=record.timestamp,
                     affected_plugins=affected_plugins,
-                    sample_messages=sample_messages,
+                    sample_messages=list(window.messages),
                     severity=severity
                 )
                 self._patterns[pattern_key] = pattern
@@ -230,10 +283,12 @@ class ErrorAggregator:
                     self._auto_export()
             else:
                 # Update existing pattern
-                self._patterns[pattern_key].count = count
-                self._patterns[pattern_key].last_seen = record.timestamp
-                self._patterns[pattern_key].severity = severity
-                self._patterns[pattern_key].affected_plugins.extend(affected_plugins)
+                pattern = self._patterns[pattern_key]
+                pattern.count = count
+                pattern.last_seen = record.timestamp
+                pattern.severity = severity
+                if record.plugin_id and record.plugin_id not in pattern.affected_plugins:
+                    pattern.affected_plugins.append(record.plugin_id)
 
     def on_pattern_detected(self, callback: Callable[[ErrorPattern], None]) -> None:
         """
@@ -268,7 +323,7 @@ class ErrorAggregator:
                     k: v.to_dict() for k, v in self._patterns.items()
                 },
                 "recent_errors": [
-                    r.to_dict() for r in self._records[-20:]
+                    r.to_dict() for r in reversed(list(islice(reversed(self._records), 20)))
                 ]
             }
 
@@ -284,9 +339,11 @@ class ErrorAggregator:
         """
         with self._lock:
             plugin_errors = self._plugin_error_counts.get(plugin_id, {})
+            # The plugin's errors among the last PLUGIN_HEALTH_WINDOW records
+            oldest_seq = self._recorded_total - self.PLUGIN_HEALTH_WINDOW
             recent_plugin_errors = [
-                r for r in self._records[-100:]
-                if r.plugin_id == plugin_id
+                r for seq, r in self._plugin_recent.get(plugin_id, ())
+                if seq > oldest_seq
             ]
 
             # Determine health status
@@ -319,9 +376,16 @@ class ErrorAggregator:
         """
         with self._lock:
             cutoff = datetime.now() - timedelta(hours=max_age_hours)
-            original_count = len(self._records)
-            self._records = [r for r in self._records if r.timestamp > cutoff]
-            cleared = original_count - len(self._records)
+            # Records are kept oldest first
+            cleared = 0
+            while self._records and self._records[0].timestamp <= cutoff:
+                self._records.popleft()
+                cleared += 1
+            for plugin_id, recent in list(self._plugin_recent.items()):
+                while recent and recent[0][1].timestamp <= cutoff:
+                    recent.popleft()
+                if not recent:
+                    del self._plugin_recent[plugin_id]
 
             if cleared > 0:
                 self.logger.info(f"Cleared {cleared} old error records")
@@ -0,0 +1,259 @@
+"""
+Display Event Bus
+
+Lightweight in-process notification channel for the display controller.
+
+Plugins, the plugin manager and the config service publish events when
+something that affects what the display should show changes (live content
+started or ended, a status message was posted, configuration was reloaded,
+an on-demand request arrived). The display controller blocks on the bus with
+a timeout instead of re-scanning plugins and re-reading status files on every
+loop iteration.
+
+Publishers that live in other processes (the web interface and the WiFi
+monitor daemon) communicate through files they already write. A
+``PathWatcher`` thread in the display process turns changes to those files
+into bus events, so the render loop itself never touches the filesystem to
+look for them.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.logging_config import get_logger
+
+
+class EventType(Enum):
+    """Display event types."""
+    LIVE_CONTENT_CHANGED = "live_content_changed"  # A plugin's live content started or ended
+    PLUGIN_UPDATED = "plugin_updated"  # A plugin finished a data update
+    STATUS_MESSAGE = "status_message"  # A status message (e.g. WiFi) was posted or cleared
+    CONFIG_CHANGED = "config_changed"  # Configuration was reloaded
+    ON_DEMAND_REQUEST = "on_demand_request"  # An on-demand start/stop request was written
+    PLUGIN_LOADED = "plugin_loaded"  # A deferred plugin finished loading (source = plugin ID)
+
+
+@dataclass
+class DisplayEvent:
+    """A single event published to the bus."""
+    event_type: EventType
+    source: Optional[str] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+class EventBus:
+    """
+    Bounded, thread-safe event queue with a single consumer.
+
+    ``publish`` never blocks; when the queue is full the event is dropped and
+    counted. Consumers only need to know *that* something changed, and the
+    controller re-derives state from the source when it handles an event, so
+    dropping a duplicate notification is harmless.
+    """
+
+    def __init__(self, maxsize: int = 256, logger: Optional[logging.Logger] = None) -> None:
+        """
+        Initialize the event bus.
+
+        Args:
+            maxsize: Maximum number of undelivered events
+            logger: Optional logger instance
+        """
+        self.logger = logger or get_logger(__name__)
+        self._queue: "queue.Queue[DisplayEvent]" = queue.Queue(maxsize=maxsize)
+        self.published_count = 0
+        self.dropped_count = 0
+
+    def publish(
+        self,
+        event_type: EventType,
+        source: Optional[str] = None,
+        **payload: Any
+    ) -> bool:
+        """
+        Publish an event without blocking.
+
+        Args:
+            event_type: Type of event
+            source: Optional publisher identifier (plugin ID, subsystem name)
+            **payload: Optional event details
+
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        try:
+            self._queue.put_nowait(DisplayEvent(event_type, source, payload))
+        except queue.Full:
+            self.dropped_count += 1
+            self.logger.debug("Event bus full, dropped %s from %s", event_type.value, source)
+            return False
+        self.published_count += 1
+        return True
+
+    def has_pending(self) -> bool:
+        """Return True if undelivered events are waiting."""
+        return not self._queue.empty()
+
+    def drain(self) -> List[DisplayEvent]:
+        """Return all pending events without blocking."""
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def wait(self, timeout: float) -> List[DisplayEvent]:
+        """
+        Block until at least one event arrives or the timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            All pending events (empty list on timeout)
+        """
+        if timeout <= 0:
+            return self.drain()
+        try:
+            first = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return []
+        return [first] + self.drain()
+
+
+class PathWatcher:
+    """
+    Background thread that publishes an event when a watched file changes.
+
+    Changes are detected by comparing ``(mtime_ns, size)`` so that a file
+    being created, rewritten or deleted all produce a notification. Runs off
+    the render thread; the display loop only sees the resulting events.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        interval: float = 0.25,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the path watcher.
+
+        Args:
+            bus: Event bus to publish to
+            interval: Seconds between checks
+            logger: Optional logger instance
+        """
+        self.bus = bus
+        self.interval = interval
+        self.logger = logger or get_logger(__name__)
+        self._watches: Dict[str, Tuple[EventType, Optional[Tuple[int, int]]]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, path: Union[str, os.PathLike], event_type: EventType) -> None:
+        """
+        Start watching a file.
+
+        The file's current state is recorded as the baseline; only later
+        changes are published.
+
+        Args:
+            path: File to watch (does not need to exist yet)
+            event_type: Event to publish when the file changes
+        """
+        path = os.fspath(path)
+        with self._lock:
+            self._watches[path] = (event_type, self._signature(path))
+
+    def start(self) -> None:
+        """Start the watcher thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="display-path-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval * 4)
+            self._thread = None
+
+    def check(self) -> int:
+        """
+        Check all watched files once and publish events for changes.
+
+        Returns:
+            Number of events published
+        """
+        changed = []
+        with self._lock:
+            for path, (event_type, previous) in self._watches.items():
+                current = self._signature(path)
+                if current != previous:
+                    self._watches[path] = (event_type, current)
+                    changed.append((path, event_type, current is not None))
+        for path, event_type, exists in changed:
+            self.bus.publish(event_type, source="path_watcher", path=path, exists=exists)
+        return len(changed)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.debug("Path watcher check failed: %s", e)
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+# Global singleton instance
+_event_bus: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """
+    Get or create the global event bus instance.
+
+    Returns:
+        The global EventBus instance
+    """
+    global _event_bus
+
+    with _bus_lock:
+        if _event_bus is None:
+            _event_bus = EventBus()
+        return _event_bus
+
+
+def publish_event(event_type: EventType, source: Optional[str] = None, **payload: Any) -> bool:
+    """
+    Convenience function to publish an event to the global bus.
+
+    Args:
+        event_type: Type of event
+        source: Optional publisher identifier
+        **payload: Optional event details
+
+    Returns:
+        True if the event was queued, False if it was dropped
+    """
+    return get_event_bus().publish(event_type, source, **payload)
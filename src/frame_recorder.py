@@ -0,0 +1,389 @@
+"""
+Frame Recorder
+
+Captures every frame DisplayManager.update_display() pushes to the matrix,
+with timings, display mode and plugin ID, so rendering can be replayed and
+compared offline (see scripts/dev/replay_frames.py).
+
+Recording format (one file per recording):
+
+    MAGIC
+    u32 header length, header JSON (width, height, keyframe interval, ...)
+    per frame: u32 meta length, u32 payload length, meta JSON, payload
+
+The payload is the zlib-compressed frame as RGB bytes. Keyframes store the
+frame itself; other frames store it XORed with the previous frame, which is
+mostly zeros for the small changes between consecutive frames and
+compresses to a few bytes.
+
+Frame meta fields:
+    i        frame index
+    t        seconds since the recording started
+    render   seconds from the start of the frame (begin_frame() or the
+             previous push, whichever is later) to the push
+    interval seconds since the previous push
+    mode     display mode active when the frame was pushed
+    plugin   plugin ID active when the frame was pushed
+    key      True for keyframes
+"""
+
+import json
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b'LEDREC1\n'
+FORMAT_VERSION = 1
+# Overrides where DisplayManager records frames (recording is off when unset)
+RECORD_PATH_ENV = 'LEDMATRIX_RECORD_FRAMES'
+
+_LENGTH = struct.Struct('>I')
+_FRAME_LENGTHS = struct.Struct('>II')
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class RecordedFrame:
+    """One decoded frame of a recording."""
+    index: int
+    timestamp: float
+    render_time: float
+    interval: float
+    display_mode: Optional[str]
+    plugin_id: Optional[str]
+    keyframe: bool
+    pixels: np.ndarray  # (height, width, 3) uint8
+
+
+class FrameRecorder:
+    """Writes pushed frames to a delta-encoded, compressed recording."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        keyframe_interval: int = 300,
+        compression_level: int = 1
+    ) -> None:
+        """
+        Open a recording for writing.
+
+        Args:
+            path: Recording file (overwritten)
+            keyframe_interval: Store a full frame every N frames so a damaged
+                recording can be resynchronised
+            compression_level: zlib level; 1 keeps the cost on the render
+                thread low while still shrinking deltas to a few bytes
+        """
+        self.path = Path(path)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.compression_level = compression_level
+        self.frame_count = 0
+        self.bytes_written = 0
+        self._file: Optional[BinaryIO] = None
+        self._previous: Optional[np.ndarray] = None
+        self._origin = 0.0
+        self._last_push: Optional[float] = None
+        self._frame_start: Optional[float] = None
+        self._display_mode: Optional[str] = None
+        self._plugin_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def recording(self) -> bool:
+        return self._file is not None
+
+    def start(self, width: int, height: int) -> None:
+        """Create the file and write the header."""
+        with self._lock:
+            if self._file is not None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'wb')
+            header = json.dumps({
+                'version': FORMAT_VERSION,
+                'width': width,
+                'height': height,
+                'keyframe_interval': self.keyframe_interval,
+                'started_at': datetime.now().isoformat(),
+            }).encode('utf-8')
+            self._file.write(MAGIC + _LENGTH.pack(len(header)) + header)
+            self.bytes_written = len(MAGIC) + _LENGTH.size + len(header)
+            self._origin = time.perf_counter()
+            logger.info("Recording frames (%dx%d) to %s", width, height, self.path)
+
+    def stop(self) -> None:
+        """Flush and close the recording."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            self._previous = None
+        logger.info("Recorded %d frames (%d bytes) to %s", self.frame_count, self.bytes_written, self.path)
+
+    def begin_frame(self, display_mode: Optional[str] = None, plugin_id: Optional[str] = None) -> None:
+        """
+        Mark the start of rendering a frame and tag the frames that follow.
+
+        Args:
+            display_mode: Display mode being rendered
+            plugin_id: Plugin rendering it
+        """
+        with self._lock:
+            self._frame_start = time.perf_counter()
+            self._display_mode = display_mode
+            self._plugin_id = plugin_id
+
+    def record(self, image: Any) -> None:
+        """
+        Append a pushed frame.
+
+        Args:
+            image: PIL image (or array) that was pushed to the matrix
+        """
+        now = time.perf_counter()
+        if getattr(image, 'mode', 'RGB') != 'RGB':
+            image = image.convert('RGB')
+        # A copy, so later drawing into the image doesn't change the delta base
+        pixels = np.array(image, dtype=np.uint8)
+        with self._lock:
+            if self._file is None:
+                return
+            previous = self._previous
+            keyframe = (
+                previous is None
+                or previous.shape != pixels.shape
+                or self.frame_count % self.keyframe_interval == 0
+            )
+            data = pixels if keyframe or previous is None else np.bitwise_xor(pixels, previous)
+            payload = zlib.compress(data.tobytes(), self.compression_level)
+
+            last_push = self._last_push
+            start = self._frame_start
+            if start is None or (last_push is not None and last_push > start):
+                start = last_push
+            meta: Dict[str, Any] = {
+                'i': self.frame_count,
+                't': round(now - self._origin, 6),
+                'render': round(now - start, 6) if start is not None else 0.0,
+                'interval': round(now - last_push, 6) if last_push is not None else 0.0,
+                'mode': self._display_mode,
+                'plugin': self._plugin_id,
+                'key': keyframe,
+            }
+            if keyframe:
+                meta['shape'] = list(pixels.shape)
+            meta_bytes = json.dumps(meta, separators=(',', ':')).encode('utf-8')
+            try:
+                self._file.write(_FRAME_LENGTHS.pack(len(meta_bytes), len(payload)) + meta_bytes + payload)
+            except OSError as e:
+                logger.error("Stopping frame recording, write to %s failed: %s", self.path, e)
+                self._file.close()
+                self._file = None
+                return
+            self.bytes_written += _FRAME_LENGTHS.size + len(meta_bytes) + len(payload)
+            self.frame_count += 1
+            self._previous = pixels
+            self._last_push = now
+
+
+class FrameReader:
+    """Reads a recording written by FrameRecorder."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a frame recording")
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            self.header: Dict[str, Any] = json.loads(f.read(length).decode('utf-8'))
+            self._data_offset = f.tell()
+
+    @property
+    def width(self) -> int:
+        return self.header['width']
+
+    @property
+    def height(self) -> int:
+        return self.header['height']
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        previous: Optional[np.ndarray] = None
+        with open(self.path, 'rb') as f:
+            f.seek(self._data_offset)
+            while True:
+                lengths = f.read(_FRAME_LENGTHS.size)
+                if len(lengths) < _FRAME_LENGTHS.size:
+                    return  # End of file (or a frame cut off by a crash)
+                meta_length, payload_length = _FRAME_LENGTHS.unpack(lengths)
+                meta_bytes = f.read(meta_length)
+                payload = f.read(payload_length)
+                if len(payload) < payload_length:
+                    return
+                meta = json.loads(meta_bytes.decode('utf-8'))
+                data = np.frombuffer(zlib.decompress(payload), dtype=np.uint8)
+                if meta['key']:
+                    pixels = data.reshape(meta['shape'])
+                elif previous is None:
+                    continue  # Delta without a keyframe to apply it to
+                else:
+                    pixels = np.bitwise_xor(previous, data.reshape(previous.shape))
+                previous = pixels
+                yield RecordedFrame(
+                    index=meta['i'],
+                    timestamp=meta['t'],
+                    render_time=meta['render'],
+                    interval=meta['interval'],
+                    display_mode=meta.get('mode'),
+                    plugin_id=meta.get('plugin'),
+                    keyframe=meta['key'],
+                    pixels=pixels,
+                )
+
+
+def latency_percentiles(
+    values: Sequence[float],
+    percentiles: Iterable[int] = DEFAULT_PERCENTILES
+) -> Dict[str, float]:
+    """
+    Summarize latencies (in seconds) as count, percentiles and max.
+
+    Returns:
+        Dict like {'count': 120, 'p50': 0.004, ..., 'max': 0.02}
+    """
+    if not values:
+        return {'count': 0}
+    ordered = np.asarray(values, dtype=np.float64)
+    summary: Dict[str, float] = {'count': len(values)}
+    for p in percentiles:
+        summary[f'p{p}'] = float(np.percentile(ordered, p))
+    summary['max'] = float(ordered.max())
+    return summary
+
+
+def summarize_render_latency(frames: Iterable[RecordedFrame]) -> Dict[str, Any]:
+    """
+    Render latency percentiles overall and per plugin.
+
+    Returns:
+        {'overall': {...}, 'by_plugin': {plugin_id: {...}}}
+    """
+    overall: List[float] = []
+    by_plugin: Dict[str, List[float]] = {}
+    for frame in frames:
+        overall.append(frame.render_time)
+        by_plugin.setdefault(frame.plugin_id or frame.display_mode or 'unknown', []).append(frame.render_time)
+    return {
+        'overall': latency_percentiles(overall),
+        'by_plugin': {pid: latency_percentiles(times) for pid, times in sorted(by_plugin.items())},
+    }
+
+
+def compare_recordings(
+    actual: Iterable[RecordedFrame],
+    golden: Iterable[RecordedFrame],
+    tolerance: int = 0,
+    latency_factor: float = 1.5,
+    max_reported: int = 20
+) -> Dict[str, Any]:
+    """
+    Compare a recording frame by frame against a golden recording.
+
+    Args:
+        actual: Frames under test
+        golden: Reference frames
+        tolerance: Per-channel difference that still counts as equal
+        latency_factor: Flag a plugin whose p95 render latency exceeds the
+            golden p95 by this factor
+        max_reported: Maximum number of mismatching frames listed
+
+    Returns:
+        Report dict; 'passed' is False on any visual or latency regression
+    """
+    actual_frames: List[RecordedFrame] = []
+    golden_frames: List[RecordedFrame] = []
+    mismatches: List[Dict[str, Any]] = []
+    mismatch_count = 0
+
+    for actual_frame, golden_frame in _zip_longest(actual, golden):
+        if actual_frame is not None:
+            actual_frames.append(_without_pixels(actual_frame))
+        if golden_frame is not None:
+            golden_frames.append(_without_pixels(golden_frame))
+        if actual_frame is None or golden_frame is None:
+            continue
+        reason = None
+        changed = 0
+        if actual_frame.pixels.shape != golden_frame.pixels.shape:
+            reason = 'size'
+        else:
+            diff = np.abs(actual_frame.pixels.astype(np.int16) - golden_frame.pixels.astype(np.int16))
+            changed = int(np.count_nonzero(diff.max(axis=2) > tolerance))
+            if changed:
+                reason = 'pixels'
+            elif (actual_frame.display_mode, actual_frame.plugin_id) != (golden_frame.display_mode, golden_frame.plugin_id):
+                reason = 'mode'
+        if reason:
+            mismatch_count += 1
+            if len(mismatches) < max_reported:
+                mismatches.append({
+                    'index': actual_frame.index,
+                    'reason': reason,
+                    'pixels_changed': changed,
+                    'display_mode': actual_frame.display_mode,
+                    'golden_display_mode': golden_frame.display_mode,
+                })
+
+    actual_latency = summarize_render_latency(actual_frames)
+    golden_latency = summarize_render_latency(golden_frames)
+    latency_regressions = []
+    for plugin_id, stats in actual_latency['by_plugin'].items():
+        reference = golden_latency['by_plugin'].get(plugin_id)
+        if not reference or 'p95' not in reference or 'p95' not in stats:
+            continue
+        if reference['p95'] > 0 and stats['p95'] > reference['p95'] * latency_factor:
+            latency_regressions.append({
+                'plugin_id': plugin_id,
+                'p95': stats['p95'],
+                'golden_p95': reference['p95'],
+            })
+
+    frame_count_matches = len(actual_frames) == len(golden_frames)
+    return {
+        'passed': mismatch_count == 0 and frame_count_matches and not latency_regressions,
+        'frames': len(actual_frames),
+        'golden_frames': len(golden_frames),
+        'mismatched_frames': mismatch_count,
+        'mismatches': mismatches,
+        'latency': actual_latency,
+        'golden_latency': golden_latency,
+        'latency_regressions': latency_regressions,
+    }
+
+
+def _zip_longest(a: Iterable[RecordedFrame], b: Iterable[RecordedFrame]) -> Iterator[tuple]:
+    a_iter, b_iter = iter(a), iter(b)
+    while True:
+        x = next(a_iter, None)
+        y = next(b_iter, None)
+        if x is None and y is None:
+            return
+        yield x, y
+
+
+def _without_pixels(frame: RecordedFrame) -> RecordedFrame:
+    # Only timings are kept across the whole comparison; pixels are compared as they stream
+    return RecordedFrame(frame.index, frame.timestamp, frame.render_time, frame.interval,
+                         frame.display_mode, frame.plugin_id, frame.keyframe, np.empty(0, dtype=np.uint8))
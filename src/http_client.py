@@ -0,0 +1,660 @@
+"""
+HTTP Client
+
+Process-wide HTTP client shared by core managers and plugins.
+
+- One pooled, retrying ``requests.Session`` per host, so connections (and
+  TLS sessions) are reused across every manager and plugin talking to it.
+- A private HTTP cache (RFC 9111 subset): ``Cache-Control`` (``max-age``,
+  ``no-cache``, ``no-store``), ``Expires``/``Age`` and ``ETag`` /
+  ``Last-Modified`` revalidation. Text and JSON responses are stored in the
+  cache manager when one is attached, otherwise in a small in-memory LRU.
+  A ``304`` only refreshes the entry's freshness metadata, which is kept in
+  memory; the stored body is not rewritten.
+  Callers can set a client-side freshness window with ``max_age``.
+- Identical GETs issued concurrently share one network request.
+- Per-host token-bucket rate limits and concurrency caps.
+- Per-host metrics: requests, cache hits, revalidations, errors, bytes and
+  latency (``get_stats``).
+
+Responses are regular ``requests.Response`` objects; those served from the
+cache have ``from_cache = True``.
+
+    from src.http_client import get_http_client
+
+    response = get_http_client().get(url, params=params, timeout=10)
+    response.raise_for_status()
+"""
+
+import base64
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from src.logging_config import get_logger
+from src.metrics import get_metrics_registry
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_HEADERS = {
+    'User-Agent': 'LEDMatrix/1.0 (https://github.com/ChuckBuilds/LEDMatrix)',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+# Headers that describe the connection or the encoded body, not the resource
+_UNSTORED_HEADERS = {
+    'connection', 'keep-alive', 'transfer-encoding', 'content-encoding',
+    'content-length', 'set-cookie', 'proxy-authenticate', 'trailer', 'upgrade',
+}
+_CACHEABLE_TYPES = ('application/json', 'text/', 'application/xml', '+json', '+xml', 'application/javascript')
+_metrics = get_metrics_registry()
+HTTP_REQUESTS = _metrics.counter(
+    'ledmatrix_http_requests_total',
+    'HTTP requests by how they were served, one result each (network, cache_hit, revalidated, collapsed, error)',
+    ('host', 'result'))
+HTTP_REQUEST_SECONDS = _metrics.histogram(
+    'ledmatrix_http_request_seconds', 'Duration of HTTP requests sent over the network', ('host',))
+
+# Oldest cached response reused; the cache manager's disk cleanup deletes
+# 'http_cache' entries after the same period
+CACHE_RETENTION = 2 * 24 * 3600
+
+_CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since', 'if-match', 'if-unmodified-since', 'range')
+
+
+class TokenBucket:
+    """Token bucket rate limiter; callers reserve a token and sleep off any deficit."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, blocking until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class _HostState:
+    """Session, limits and metrics for one host."""
+
+    def __init__(self, host: str, rate: float, burst: int, max_concurrent: int, retries: int) -> None:
+        self.host = host
+        self.bucket = TokenBucket(rate, burst)
+        self.slots = threading.BoundedSemaphore(max(1, max_concurrent))
+        self.session = requests.Session()
+        retry_strategy = Retry(
+            total=retries,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD", "OPTIONS"],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=1, pool_maxsize=max(1, max_concurrent))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'network_requests': 0,
+            'cache_hits': 0,
+            'revalidated': 0,
+            'collapsed': 0,
+            'errors': 0,
+            'bytes_received': 0,
+            'latency_total': 0.0,
+            'latency_max': 0.0,
+            'throttled_seconds': 0.0,
+        }
+
+
+class HttpSession:
+    """``requests.Session``-like view of the shared client with its own default headers."""
+
+    def __init__(self, client: "HttpClient", headers: Optional[Dict[str, str]] = None) -> None:
+        self.client = client
+        self.headers = CaseInsensitiveDict(headers or {})
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        merged = CaseInsensitiveDict(self.headers)
+        if headers:
+            merged.update(headers)
+        return self.client.request(method, url, headers=dict(merged), **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def close(self) -> None:
+        """No-op; connections belong to the shared client."""
+
+
+class HttpClient:
+    """Shared HTTP client with per-host pooling, caching and rate limits."""
+
+    def __init__(
+        self,
+        cache_manager=None,
+        rate: float = 10.0,
+        burst: int = 20,
+        max_concurrent: int = 6,
+        retries: int = 3,
+        max_cached_bytes: int = 1024 * 1024,
+        memory_entries: int = 256,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            cache_manager: CacheManager for persisting cached responses (None = memory only)
+            rate: Default requests per second per host
+            burst: Default burst size per host
+            max_concurrent: Default maximum concurrent requests per host
+            retries: Retry attempts for idempotent requests
+            max_cached_bytes: Largest response body that is cached
+            memory_entries: Size of the in-memory cache used without a cache manager
+            logger: Optional logger instance
+        """
+        self.cache_manager = cache_manager
+        self.retries = retries
+        self.max_cached_bytes = max_cached_bytes
+        self.logger = logger or get_logger(__name__)
+        self._defaults = {'rate': rate, 'burst': burst, 'max_concurrent': max_concurrent}
+        self._host_config: Dict[str, Dict[str, Any]] = {}
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_entries = memory_entries
+        # Freshness metadata from 304 revalidations, merged over stored entries
+        self._refreshed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def set_cache_manager(self, cache_manager) -> None:
+        """Persist cached responses through a cache manager."""
+        self.cache_manager = cache_manager
+
+    def configure_host(
+        self,
+        host: str,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrent: Optional[int] = None
+    ) -> None:
+        """
+        Override rate limits for a host (applies to connections made afterwards).
+
+        Args:
+            host: Host name (e.g. 'site.api.espn.com')
+            rate: Requests per second
+            burst: Burst size
+            max_concurrent: Maximum concurrent requests
+        """
+        overrides = {k: v for k, v in (('rate', rate), ('burst', burst), ('max_concurrent', max_concurrent))
+                     if v is not None}
+        with self._lock:
+            self._host_config.setdefault(host, {}).update(overrides)
+            state = self._hosts.get(host)
+            if state is not None:
+                config = dict(self._defaults, **self._host_config[host])
+                state.bucket = TokenBucket(config['rate'], config['burst'])
+                state.slots = threading.BoundedSemaphore(max(1, config['max_concurrent']))
+
+    def session(self, headers: Optional[Dict[str, str]] = None) -> HttpSession:
+        """
+        Get a session-like object with default headers, backed by the shared client.
+
+        Args:
+            headers: Headers sent with every request made through the session
+
+        Returns:
+            HttpSession
+        """
+        return HttpSession(self, headers)
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL; see ``request`` for arguments."""
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """HEAD a URL; see ``request`` for arguments."""
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST to a URL (never cached); see ``request`` for arguments."""
+        return self.request('POST', url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Any = DEFAULT_TIMEOUT,
+        cache: bool = True,
+        max_age: Optional[float] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Send a request through the host's shared session.
+
+        GETs are served from and stored in the HTTP cache unless ``cache`` is
+        False, the request is streamed, or the caller sends its own
+        conditional headers (it is then managing validation itself).
+
+        Args:
+            method: HTTP method
+            url: URL
+            params: Query parameters
+            headers: Request headers (merged over the client defaults)
+            timeout: Request timeout in seconds
+            cache: Whether the HTTP cache may be used
+            max_age: Client-side freshness window in seconds, overriding the
+                server's max-age/Expires (``no-store`` is still honored)
+            **kwargs: Passed through to ``requests.Session.request``
+
+        Returns:
+            requests.Response
+
+        Raises:
+            requests.RequestException: As raised by requests
+        """
+        request_headers = dict(DEFAULT_HEADERS)
+        if headers:
+            request_headers.update(headers)
+        host = urlsplit(url).hostname or ''
+        state = self._host_state(host)
+        with state.lock:
+            state.stats['requests'] += 1
+
+        lowered = {k.lower() for k in request_headers}
+        use_cache = (cache and method.upper() == 'GET' and not kwargs.get('stream')
+                     and not lowered.intersection(_CONDITIONAL_HEADERS))
+        if not use_cache:
+            return self._send(state, method, url, params, request_headers, timeout, kwargs)
+
+        key = self._cache_key(url, params, request_headers)
+        entry = self._load(key)
+        if entry is not None and self._is_fresh(entry, max_age):
+            with state.lock:
+                state.stats['cache_hits'] += 1
+            HTTP_REQUESTS.labels(host, 'cache_hit').inc()
+            return self._response_from_entry(entry)
+
+        # Collapse identical concurrent requests into one
+        with self._lock:
+            future: Optional[Future] = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            shared = future.result()
+            if isinstance(shared, dict):
+                with state.lock:
+                    state.stats['collapsed'] += 1
+                HTTP_REQUESTS.labels(host, 'collapsed').inc()
+                return self._response_from_entry(shared)
+            # The shared request wasn't cacheable; send our own
+            return self._send(state, method, url, params, request_headers, timeout, kwargs)
+
+        result: Any = None
+        try:
+            response = self._fetch(state, key, entry, url, params, request_headers, timeout, kwargs)
+            stored = getattr(response, '_cache_entry', None)
+            result = stored
+            return response
+        except BaseException as e:
+            result = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_result(result if isinstance(result, dict) else None)
+
+    def _fetch(self, state: _HostState, key: str, entry: Optional[Dict[str, Any]], url: str,
+               params: Optional[Dict[str, Any]], headers: Dict[str, str], timeout: Any,
+               kwargs: Dict[str, Any]) -> requests.Response:
+        if entry is not None:
+            headers = dict(headers)
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self._send(state, 'GET', url, params, headers, timeout, kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            with state.lock:
+                state.stats['revalidated'] += 1
+            metadata = self._refresh_metadata(entry, response)
+            self._store_metadata(key, metadata)
+            entry = dict(entry, **metadata)
+            cached = self._response_from_entry(entry)
+            setattr(cached, '_cache_entry', entry)
+            return cached
+
+        if response.status_code == 200:
+            new_entry = self._entry_from_response(response)
+            if new_entry is not None:
+                self._store(key, new_entry)
+                setattr(response, '_cache_entry', new_entry)
+            elif entry is not None:
+                self._delete(key)
+        setattr(response, 'from_cache', False)
+        return response
+
+    def _send(self, state: _HostState, method: str, url: str, params: Optional[Dict[str, Any]],
+              headers: Dict[str, str], timeout: Any, kwargs: Dict[str, Any]) -> requests.Response:
+        waited = state.bucket.acquire()
+        with state.slots:
+            start = time.monotonic()
+            try:
+                response = state.session.request(method, url, params=params, headers=headers,
+                                                 timeout=timeout, **kwargs)
+            except requests.RequestException:
+                with state.lock:
+                    state.stats['errors'] += 1
+                HTTP_REQUESTS.labels(state.host, 'error').inc()
+                raise
+            elapsed = time.monotonic() - start
+        HTTP_REQUEST_SECONDS.labels(state.host).observe(elapsed)
+        if response.status_code >= 400:
+            result = 'error'
+        elif response.status_code == 304:
+            result = 'revalidated'
+        else:
+            result = 'network'
+        HTTP_REQUESTS.labels(state.host, result).inc()
+        received = len(response.content) if not kwargs.get('stream') else int(response.headers.get('Content-Length') or 0)
+        with state.lock:
+            stats = state.stats
+            stats['network_requests'] += 1
+            stats['bytes_received'] += received
+            stats['latency_total'] += elapsed
+            stats['latency_max'] = max(stats['latency_max'], elapsed)
+            stats['throttled_seconds'] += waited
+            if response.status_code >= 400:
+                stats['errors'] += 1
+        setattr(response, 'from_cache', False)
+        return response
+
+    # ------------------------------------------------------------------
+    # Cache entries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]) -> str:
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        varying = {k.lower(): v for k, v in headers.items() if k.lower() in ('accept', 'authorization')}
+        raw = repr((url, query, sorted(varying.items())))
+        return "http_cache_" + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+        directives: Dict[str, Optional[str]] = {}
+        for part in (value or '').split(','):
+            name, _, arg = part.strip().partition('=')
+            if name:
+                directives[name.lower()] = arg.strip('"') or None
+        return directives
+
+    @staticmethod
+    def _http_date(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+
+    def _freshness_lifetime(self, headers: CaseInsensitiveDict) -> float:
+        directives = self._parse_cache_control(headers.get('Cache-Control'))
+        if 'no-cache' in directives:
+            return 0.0
+        max_age = directives.get('max-age')
+        if max_age:
+            try:
+                return max(0.0, float(max_age))
+            except ValueError:
+                return 0.0
+        expires = self._http_date(headers.get('Expires'))
+        if expires is not None:
+            date = self._http_date(headers.get('Date')) or time.time()
+            return max(0.0, expires - date)
+        # Heuristic freshness: 10% of the time since last modification, capped at 5 minutes
+        last_modified = self._http_date(headers.get('Last-Modified'))
+        if last_modified is not None:
+            date = self._http_date(headers.get('Date')) or time.time()
+            return min(300.0, max(0.0, (date - last_modified) * 0.1))
+        return 0.0
+
+    def _entry_from_response(self, response: requests.Response) -> Optional[Dict[str, Any]]:
+        directives = self._parse_cache_control(response.headers.get('Cache-Control'))
+        if 'no-store' in directives:
+            return None
+        content_type = response.headers.get('Content-Type', '').lower()
+        if not any(t in content_type for t in _CACHEABLE_TYPES):
+            return None
+        body = response.content
+        if len(body) > self.max_cached_bytes:
+            return None
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _UNSTORED_HEADERS}
+        lifetime = self._freshness_lifetime(response.headers)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if lifetime <= 0 and not etag and not last_modified:
+            # Would never be fresh and can't be revalidated
+            return None
+        try:
+            age = float(response.headers.get('Age', 0))
+        except ValueError:
+            age = 0.0
+        return {
+            'url': response.url,
+            'status': response.status_code,
+            'headers': headers,
+            'encoding': response.encoding,
+            'body': base64.b64encode(body).decode('ascii'),
+            'stored_at': time.time() - age,
+            'lifetime': lifetime,
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+
+    def _refresh_metadata(self, entry: Dict[str, Any], response: requests.Response) -> Dict[str, Any]:
+        headers = CaseInsensitiveDict(entry['headers'])
+        for name, value in response.headers.items():
+            if name.lower() not in _UNSTORED_HEADERS:
+                headers[name] = value
+        return dict(
+            headers=dict(headers),
+            stored_at=time.time(),
+            lifetime=self._freshness_lifetime(headers),
+            etag=headers.get('ETag') or entry.get('etag'),
+            last_modified=headers.get('Last-Modified') or entry.get('last_modified'),
+        )
+
+    @staticmethod
+    def _is_fresh(entry: Dict[str, Any], max_age: Optional[float]) -> bool:
+        age = time.time() - entry['stored_at']
+        lifetime = max_age if max_age is not None else entry['lifetime']
+        return age < lifetime
+
+    @staticmethod
+    def _response_from_entry(entry: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = entry.get('encoding')
+        response._content = base64.b64decode(entry['body'])
+        setattr(response, 'from_cache', True)
+        return response
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        entry: Optional[Dict[str, Any]] = None
+        if self.cache_manager is not None:
+            try:
+                entry = self.cache_manager.get(key, max_age=CACHE_RETENTION)
+            except Exception as e:
+                self.logger.debug("HTTP cache read failed for %s: %s", key, e)
+            if not (isinstance(entry, dict) and 'body' in entry):
+                entry = None
+        with self._lock:
+            if entry is None:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    self._memory.move_to_end(key)
+            metadata = self._refreshed.get(key)
+        if entry is None or not metadata:
+            return entry
+        return dict(entry, **metadata)
+
+    def _store_metadata(self, key: str, metadata: Dict[str, Any]) -> None:
+        with self._lock:
+            self._refreshed[key] = metadata
+            self._refreshed.move_to_end(key)
+            while len(self._refreshed) > self._memory_entries:
+                self._refreshed.popitem(last=False)
+
+    def _store(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._refreshed.pop(key, None)
+        if self.cache_manager is not None:
+            try:
+                self.cache_manager.set(key, entry)
+                return
+            except Exception as e:
+                self.logger.debug("HTTP cache write failed for %s: %s", key, e)
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_entries:
+                self._memory.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        if self.cache_manager is not None:
+            try:
+                self.cache_manager.clear_cache(key)
+            except Exception as e:
+                self.logger.debug("HTTP cache delete failed for %s: %s", key, e)
+        with self._lock:
+            self._memory.pop(key, None)
+            self._refreshed.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Hosts and metrics
+    # ------------------------------------------------------------------
+
+    def _host_state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                config = dict(self._defaults, **self._host_config.get(host, {}))
+                state = _HostState(host, config['rate'], config['burst'], config['max_concurrent'], self.retries)
+                self._hosts[host] = state
+            return state
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-host request metrics.
+
+        Returns:
+            Mapping of host to counters, bytes received and latency
+            (average and maximum, in milliseconds)
+        """
+        with self._lock:
+            hosts = list(self._hosts.items())
+        result = {}
+        for host, state in hosts:
+            with state.lock:
+                stats = dict(state.stats)
+            network = stats['network_requests']
+            result[host] = {
+                'requests': stats['requests'],
+                'network_requests': network,
+                'cache_hits': stats['cache_hits'],
+                'revalidated': stats['revalidated'],
+                'collapsed': stats['collapsed'],
+                'errors': stats['errors'],
+                'bytes_received': stats['bytes_received'],
+                'avg_latency_ms': round(stats['latency_total'] / network * 1000, 1) if network else 0.0,
+                'max_latency_ms': round(stats['latency_max'] * 1000, 1),
+                'throttled_seconds': round(stats['throttled_seconds'], 3),
+            }
+        return result
+
+
+# Global singleton instance
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client(cache_manager=None) -> HttpClient:
+    """
+    Get or create the global HTTP client.
+
+    Args:
+        cache_manager: CacheManager to persist cached responses in; applied
+            if the client doesn't have one yet
+
+    Returns:
+        The global HttpClient instance
+    """
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+        if cache_manager is not None and _http_client.cache_manager is None:
+            from src.cache_manager import CacheManager
+            if isinstance(cache_manager, CacheManager):
+                _http_client.set_cache_manager(cache_manager)
+        return _http_client
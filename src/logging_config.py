@@ -3,13 +3,24 @@ Centralized Logging Configuration
 
 Provides consistent logging configuration across the LEDMatrix application.
 Supports structured logging with context information and appropriate log levels.
+
+Records are handed to a bounded queue and formatted and written by a
+dedicated listener thread, so threads that log (including the display
+loop) never block on console, journald or SD card I/O. When the queue is
+full, records are dropped and counted rather than waited on, and
+repetitive DEBUG output is rate limited per logger.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 import json
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -86,11 +97,199 @@ class ContextualFormatter(logging.Formatter):
         return super().format(record)
 
 
+class DebugRateLimiter(logging.Filter):
+    """Per-logger token bucket for DEBUG (and lower) records."""
+
+    def __init__(self, rate: float = 20.0, burst: int = 100):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained DEBUG records per second allowed per logger
+            burst: Records a logger may emit at once before being limited
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.suppressed = 0
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [float(self.burst), now]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                self.suppressed += 1
+                return False
+            bucket[0] = tokens - 1.0
+            return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the logging thread.
+
+    Records are enqueued unformatted; formatting happens on the listener
+    thread. Arguments are therefore rendered when the record is written, so
+    mutable objects passed as log arguments may show later state. Records
+    that don't fit in the queue are dropped and counted.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class LogPipeline:
+    """Bounded log queue feeding output handlers from one listener thread."""
+
+    # Minimum seconds between reports of dropped/suppressed records
+    REPORT_INTERVAL = 10.0
+
+    def __init__(
+        self,
+        handlers: List[logging.Handler],
+        queue_size: int = 10000,
+        debug_rate: Optional[float] = 20.0,
+        debug_burst: int = 100
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            handlers: Output handlers, run on the listener thread
+            queue_size: Maximum records waiting to be written
+            debug_rate: DEBUG records per second allowed per logger (None disables)
+            debug_burst: DEBUG burst size per logger
+        """
+        self.handlers = handlers
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.handler = DroppingQueueHandler(self.queue)
+        self.rate_limiter: Optional[DebugRateLimiter] = None
+        if debug_rate is not None:
+            self.rate_limiter = DebugRateLimiter(rate=debug_rate, burst=debug_burst)
+            self.handler.addFilter(self.rate_limiter)
+        self._listener = _ReportingQueueListener(self, self.queue, *handlers, respect_handler_level=True)
+        self._reported_dropped = 0
+        self._reported_suppressed = 0
+        self._last_report = 0.0
+        self._running = False
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if not self._running:
+            self._last_report = time.monotonic()
+            self._listener.start()
+            self._running = True
+
+    def stop(self) -> None:
+        """Write all queued records and stop the listener thread."""
+        if self._running:
+            self._running = False
+            self._listener.stop()
+            for report in self._pending_report(force=True):
+                self._listener.handle(report)
+            for handler in self.handlers:
+                handler.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and counts of dropped and rate-limited records."""
+        return {
+            'queued': self.queue.qsize(),
+            'dropped': self.handler.dropped,
+            'rate_limited': self.rate_limiter.suppressed if self.rate_limiter else 0,
+        }
+
+    def _pending_report(self, force: bool = False) -> List[logging.LogRecord]:
+        """Summary records for drops and suppressions since the last report."""
+        now = time.monotonic()
+        if not force and now - self._last_report < self.REPORT_INTERVAL:
+            return []
+        stats = self.stats()
+        dropped = stats['dropped'] - self._reported_dropped
+        suppressed = stats['rate_limited'] - self._reported_suppressed
+        records = []
+        if dropped > 0:
+            records.append(logging.makeLogRecord({
+                'name': __name__, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                'msg': 'Dropped %d log records (log queue full)', 'args': (dropped,)}))
+        if suppressed > 0:
+            records.append(logging.makeLogRecord({
+                'name': __name__, 'levelno': logging.DEBUG, 'levelname': 'DEBUG',
+                'msg': 'Rate limited %d debug records', 'args': (suppressed,)}))
+        self._last_report = now
+        self._reported_dropped = stats['dropped']
+        self._reported_suppressed = stats['rate_limited']
+        return records
+
+
+class _ReportingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that also reports the pipeline's dropped records."""
+
+    def __init__(self, pipeline: LogPipeline, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pipeline = pipeline
+        self._queue: queue.Queue = pipeline.queue
+
+    def handle(self, record: logging.LogRecord) -> None:
+        for report in self._pipeline._pending_report():
+            super().handle(report)
+        super().handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        # Block rather than put_nowait: the sentinel must get through even if the queue is full
+        self._queue.put(None)  # QueueListener's sentinel
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline() -> Optional[LogPipeline]:
+    """The pipeline installed by setup_logging, if any."""
+    return _pipeline
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the log pipeline (registered with atexit)."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is not None:
+            logging.getLogger().removeHandler(_pipeline.handler)
+            _pipeline.stop()
+            _pipeline = None
+
+
+atexit.register(shutdown_logging)
+
+
 def setup_logging(
     level: Optional[int] = None,
     format_type: str = 'readable',
     include_location: bool = False,
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    use_queue: bool = True,
+    queue_size: int = 10000,
+    debug_rate: Optional[float] = 20.0
 ) -> None:
     """
     Set up centralized logging configuration.
@@ -100,7 +299,11 @@ def setup_logging(
         format_type: 'readable' for human-readable, 'json' for structured JSON
         include_location: Include module/function/line in readable format
         log_file: Optional file path for file logging
+        use_queue: Write records on a listener thread instead of the logging thread
+        queue_size: Maximum records waiting to be written (use_queue only)
+        debug_rate: DEBUG records per second allowed per logger, None for no limit (use_queue only)
     """
+    global _pipeline
     # Determine log level
     if level is None:
         if os.environ.get('LEDMATRIX_DEBUG', '').lower() == 'true':
@@ -113,7 +316,9 @@ def setup_logging(
     root_logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates
+    shutdown_logging()
     root_logger.handlers.clear()
+    handlers: List[logging.Handler] = []
     
     # Create formatter based on type
     if format_type == 'json':
@@ -125,7 +330,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler (if specified)
     if log_file:
@@ -133,11 +338,21 @@ def setup_logging(
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except (IOError, OSError, PermissionError) as e:
             # Log to stderr since file logging failed
             sys.stderr.write(f"Warning: Could not set up file logging to {log_file}: {e}\n")
 
+    if not use_queue:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return
+
+    with _pipeline_lock:
+        _pipeline = LogPipeline(handlers, queue_size=queue_size, debug_rate=debug_rate)
+        _pipeline.start()
+        root_logger.addHandler(_pipeline.handler)
+
 
 def get_logger(name: str, plugin_id: Optional[str] = None) -> logging.Logger:
     """
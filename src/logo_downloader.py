@@ -14,14 +14,13 @@ import json
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from src.common.permission_utils import (
     ensure_directory_permissions,
     ensure_file_permissions,
     get_assets_dir_mode,
     get_assets_file_mode
 )
+from src.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -90,17 +89,8 @@ class LogoDownloader:
         self.request_timeout = request_timeout
         self.retry_attempts = retry_attempts
         
-        # Set up session with retry logic
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=retry_attempts,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        # Shared pooled client (retries, HTTP caching, per-host rate limits)
+        self.session = get_http_client().session()
         
         # Set up headers
         self.headers = {
@@ -348,6 +338,7 @@ class LogoDownloader:
                             team_category = self._determine_ncaa_football_division(team_info, league_data)
                         
                         teams.append({
+                            'id': team_info.get('id'),
                             'abbreviation': abbreviation,
                             'display_name': display_name,
                             'logo_url': logo_url,
@@ -474,35 +465,8 @@ class LogoDownloader:
             logger.warning(f"No teams found for {league}")
             return 0, 0
         
-        # Download missing logos
-        downloaded_count = 0
-        failed_count = 0
-        
-        for team in teams:
-            abbreviation = team['abbreviation']
-            display_name = team['display_name']
-            logo_url = team['logo_url']
-            
-            # Create filename
-            filename = f"{self.normalize_abbreviation(abbreviation)}.png"
-            filepath = Path(logo_dir) / filename
-            
-            # Skip if already exists and not forcing download
-            if filepath.exists() and not force_download:
-                logger.debug(f"Skipping {display_name}: {filename} already exists")
-                continue
-            
-            # Download logo
-            if self.download_logo(logo_url, filepath, display_name):
-                downloaded_count += 1
-            else:
-                failed_count += 1
-            
-            # Small delay to be respectful to the API
-            time.sleep(0.1)
-        
-        logger.info(f"Logo download complete for {league}: {downloaded_count} downloaded, {failed_count} failed")
-        return downloaded_count, failed_count
+        # Download missing, stale and corrupt logos concurrently
+        return self._sync_logos(league, logo_dir, teams, force_download)
     
     def download_all_ncaa_football_logos(self, include_fcs: bool = True, force_download: bool = False) -> Tuple[int, int]:
         """Download all NCAA football team logos including FCS teams."""
@@ -532,39 +496,18 @@ class LogoDownloader:
             teams = [team for team in teams if team.get('category') == 'FBS']
             logger.info(f"Filtered to FBS teams only: {len(teams)} teams")
         
-        # Download missing logos
-        downloaded_count = 0
-        failed_count = 0
-        
-        for team in teams:
-            abbreviation = team['abbreviation']
-            display_name = team['display_name']
-            logo_url = team['logo_url']
-            category = team.get('category', 'Unknown')
-            conference = team.get('conference', 'Unknown')
-            
-            # Create filename
-            filename = f"{self.normalize_abbreviation(abbreviation)}.png"
-            filepath = Path(logo_dir) / filename
-            
-            # Skip if already exists and not forcing download
-            if filepath.exists() and not force_download:
-                logger.debug(f"Skipping {display_name} ({category}, {conference}): {filename} already exists")
-                continue
-            
-            # Download logo
-            if self.download_logo(logo_url, filepath, display_name):
-                downloaded_count += 1
-                logger.info(f"Downloaded {display_name} ({category}, {conference}) -> {filename}")
-            else:
-                failed_count += 1
-                logger.warning(f"Failed to download {display_name} ({category}, {conference})")
-            
-            # Small delay to be respectful to the API
-            time.sleep(0.1)
-        
-        logger.info(f"Comprehensive NCAA football logo download complete: {downloaded_count} downloaded, {failed_count} failed")
-        return downloaded_count, failed_count
+        # Download missing, stale and corrupt logos concurrently
+        return self._sync_logos(league, logo_dir, teams, force_download)
+    
+    def _sync_logos(self, league: str, logo_dir: str, teams: List[Dict[str, str]], force_download: bool) -> Tuple[int, int]:
+        """Download a team list's logos through a LogoPrefetcher sharing this downloader."""
+        from src.logo_prefetcher import LogoPrefetcher
+
+        prefetcher = LogoPrefetcher(downloader=self)
+        try:
+            return prefetcher.sync_league(league, logo_dir, force=force_download, teams=teams)
+        finally:
+            prefetcher.shutdown()
     
     def download_missing_logo_for_team(self, league: str, team_id: str, team_abbreviation: str, logo_path: Path) -> bool:
         """Download a specific team's logo if it's missing."""
@@ -0,0 +1,471 @@
+"""
+Logo Prefetcher
+
+Background team logo downloads, so renderers never block on the network.
+
+- Each league keeps a manifest next to its logos
+  (``.logo_manifest_<league>.json``) recording, per logo file, the team id,
+  source URL, HTTP ``ETag`` / ``Last-Modified`` validators, a SHA-256 of the
+  file as written and when a download last failed.
+- ``prefetch_league`` fetches the league's team list once at startup and
+  downloads missing, stale (revalidated with conditional requests) or
+  corrupt logos concurrently; logos whose download failed are retried after
+  a delay.
+- ``request`` schedules a single missing logo; sports managers call it when
+  a scoreboard references a team whose logo isn't on disk and draw an
+  in-memory placeholder (``placeholder_logo``) until the file arrives.
+  Placeholders are never written to disk, so a file at a logo path is
+  always a real logo.
+
+A logo whose checksum no longer matches the manifest but still decodes is
+treated as user-provided and left alone.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import requests
+from PIL import Image, ImageDraw, ImageFont
+
+from src.common.permission_utils import ensure_file_permissions, get_assets_file_mode
+from src.logging_config import get_logger
+from src.logo_downloader import LogoDownloader
+
+
+@lru_cache(maxsize=64)
+def placeholder_logo(team_abbr: str, max_size: Tuple[int, int]) -> Image.Image:
+    """
+    Return an in-memory placeholder logo (the abbreviation in a square box).
+
+    The image is shared; callers must treat it as read-only.
+    """
+    side = max(8, min(max_size))
+    logo = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(logo)
+    draw.rectangle([0, 0, side - 1, side - 1], fill=(40, 40, 40, 255), outline=(120, 120, 120, 255))
+    font = ImageFont.load_default()
+    text = team_abbr[:4]
+    bbox = draw.textbbox((0, 0), text, font=font)
+    x = (side - (bbox[2] - bbox[0])) // 2 - bbox[0]
+    y = (side - (bbox[3] - bbox[1])) // 2 - bbox[1]
+    draw.text((x, y), text, font=font, fill=(220, 220, 220, 255))
+    return logo
+
+
+def _file_sha256(path: Path) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class LogoPrefetcher:
+    """Concurrent background logo downloader with per-league manifests."""
+
+    STALE_AFTER = 7 * 24 * 3600  # Revalidate downloaded logos weekly
+    FAILED_RETRY_AFTER = 3600  # Retry logos whose download failed hourly
+    LEAGUE_REFRESH_INTERVAL = 24 * 3600  # Re-run a league prefetch at most daily
+
+    def __init__(
+        self,
+        downloader: Optional[LogoDownloader] = None,
+        max_workers: int = 4,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the prefetcher.
+
+        Args:
+            downloader: LogoDownloader used for team lookups and its HTTP session
+            max_workers: Maximum concurrent logo downloads
+            logger: Optional logger instance
+        """
+        self.downloader = downloader or LogoDownloader()
+        self.logger = logger or get_logger(__name__)
+        self._download_pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="logo-download")
+        # League prefetches wait on downloads, so they get their own thread
+        self._league_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logo-prefetch")
+        self._lock = threading.Lock()
+        self._manifest_locks: Dict[str, threading.Lock] = {}
+        self._pending: Dict[str, Future] = {}
+        # Failed downloads, by path -> time of failure (also kept in the manifests)
+        self._failures: Dict[str, float] = {}
+        self._league_runs: Dict[Tuple[str, str], float] = {}
+        self.stats = {'downloaded': 0, 'not_modified': 0, 'failed': 0}
+
+    # ------------------------------------------------------------------
+    # Manifests
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def manifest_path(league: str, logo_dir: Union[str, Path]) -> Path:
+        """Path of a league's manifest file."""
+        return Path(logo_dir) / f".logo_manifest_{league}.json"
+
+    def load_manifest(self, league: str, logo_dir: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load a league manifest.
+
+        Returns:
+            Mapping of logo filename to its manifest entry (empty if none)
+        """
+        try:
+            with open(self.manifest_path(league, logo_dir), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable logo manifest for %s: %s", league, e)
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _update_manifest(self, league: str, logo_dir: Path, filename: str, entry: Dict[str, Any]) -> None:
+        path = self.manifest_path(league, logo_dir)
+        with self._lock:
+            lock = self._manifest_locks.setdefault(str(path), threading.Lock())
+        with lock:
+            manifest = self.load_manifest(league, logo_dir)
+            manifest[filename] = entry
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=1, sort_keys=True)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                self.logger.debug("Could not write logo manifest %s: %s", path, e)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def request(
+        self,
+        league: str,
+        team_id: Optional[str],
+        team_abbr: str,
+        logo_path: Union[str, Path],
+        logo_url: Optional[str] = None
+    ) -> bool:
+        """
+        Schedule a background download if a logo file is missing.
+
+        Never blocks. Duplicate requests for a logo already being downloaded
+        are ignored, and a failed download (this session or recorded in the
+        league manifest) is retried once ``FAILED_RETRY_AFTER`` has passed.
+
+        Args:
+            league: League identifier (e.g. 'nfl', 'ncaa_fb')
+            team_id: ESPN team id (used to look up the URL if none is given)
+            team_abbr: Team abbreviation
+            logo_path: Where the logo should be saved
+            logo_url: Direct logo URL, if known
+
+        Returns:
+            True if a download was scheduled
+        """
+        logo_path = Path(logo_path)
+        if logo_path.exists() or self.is_pending(logo_path):
+            return False
+        with self._lock:
+            failed_at = self._failures.get(str(logo_path))
+        if failed_at is None:
+            # Failures from an earlier run; remembered so the manifest is read once
+            entry = self.load_manifest(league, logo_path.parent).get(logo_path.name) or {}
+            failed_at = entry.get('failed_at', 0.0)
+            with self._lock:
+                self._failures.setdefault(str(logo_path), failed_at)
+        if time.time() - failed_at < self.FAILED_RETRY_AFTER:
+            return False
+        team = {'id': team_id, 'abbreviation': team_abbr, 'logo_url': logo_url}
+        return self._submit(league, logo_path, team) is not None
+
+    def is_pending(self, logo_path: Union[str, Path]) -> bool:
+        """Return True while a download for this path is queued or running."""
+        with self._lock:
+            return str(Path(logo_path)) in self._pending
+
+    def prefetch_league(
+        self,
+        league: str,
+        logo_dir: Optional[Union[str, Path]] = None,
+        max_teams: Optional[int] = None,
+        force: bool = False
+    ) -> Optional[Future]:
+        """
+        Download missing, stale and corrupt logos for a league in the background.
+
+        Args:
+            league: League identifier
+            logo_dir: Logo directory (defaults to the league's standard directory)
+            max_teams: If the league has more teams than this, only logos already
+                on disk or in the manifest are checked; the rest are fetched on
+                demand when they appear in a scoreboard
+            force: Run even if the league was prefetched recently
+
+        Returns:
+            Future resolving to (downloaded, failed), or None if not scheduled
+        """
+        if not self.downloader._resolve_api_url(league):
+            return None
+        logo_dir = Path(logo_dir or self.downloader.get_logo_directory(league))
+        run_key = (league, str(logo_dir))
+        now = time.time()
+        with self._lock:
+            last_run = self._league_runs.get(run_key)
+            if not force and last_run is not None and now - last_run < self.LEAGUE_REFRESH_INTERVAL:
+                return None
+            self._league_runs[run_key] = now
+        try:
+            return self._league_pool.submit(self.sync_league, league, logo_dir, max_teams, force)
+        except RuntimeError:
+            return None
+
+    def sync_league(
+        self,
+        league: str,
+        logo_dir: Optional[Union[str, Path]] = None,
+        max_teams: Optional[int] = None,
+        force: bool = False,
+        teams: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[int, int]:
+        """
+        Bring a league's logos up to date, downloading concurrently (blocking).
+
+        Args:
+            league: League identifier
+            logo_dir: Logo directory (defaults to the league's standard directory)
+            max_teams: See ``prefetch_league``
+            force: Re-download every logo
+            teams: Team list (from ``LogoDownloader.extract_teams_from_data``);
+                fetched from the API if not given
+
+        Returns:
+            Tuple of (downloaded_count, failed_count)
+        """
+        logo_dir = Path(logo_dir or self.downloader.get_logo_directory(league))
+        if not self.downloader.ensure_logo_directory(logo_dir):
+            return 0, 0
+        if teams is None:
+            data = self.downloader.fetch_teams_data(league)
+            teams = self.downloader.extract_teams_from_data(data, league) if data else []
+        if not teams:
+            return 0, 0
+
+        manifest = self.load_manifest(league, logo_dir)
+        limited = max_teams is not None and len(teams) > max_teams
+        if limited:
+            self.logger.info(
+                "%s has %d teams; only checking known logos, others download on demand",
+                league, len(teams)
+            )
+
+        futures = []
+        for team in teams:
+            filename = f"{self.downloader.normalize_abbreviation(team['abbreviation'])}.png"
+            logo_path = logo_dir / filename
+            if limited and filename not in manifest and not logo_path.exists():
+                continue
+            if force or self._needs_download(league, logo_path, manifest.get(filename)):
+                future = self._submit(league, logo_path, team, force=force)
+                if future is not None:
+                    futures.append(future)
+
+        downloaded = failed = 0
+        for future in futures:
+            result = future.result()
+            if result is True:
+                downloaded += 1
+            elif result is False:
+                failed += 1
+        self.logger.info("Logo prefetch for %s: %d downloaded, %d failed", league, downloaded, failed)
+        return downloaded, failed
+
+    def shutdown(self) -> None:
+        """Stop worker threads (queued downloads are cancelled)."""
+        self._league_pool.shutdown(wait=False, cancel_futures=True)
+        self._download_pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _needs_download(self, league: str, logo_path: Path, entry: Optional[Dict[str, Any]]) -> bool:
+        now = time.time()
+        if not logo_path.exists():
+            return now - (entry or {}).get('failed_at', 0) >= self.FAILED_RETRY_AFTER
+        if not entry:
+            # Bundled or hand-placed logo we didn't download; leave it alone
+            return False
+        if entry.get('placeholder'):
+            # Placeholder file written by an earlier version; replace it
+            return True
+        if entry.get('custom'):
+            return False
+        if entry.get('sha256') and _file_sha256(logo_path) != entry['sha256']:
+            if self._is_valid_image(logo_path):
+                # Replaced by the user; stop managing this file
+                self._update_manifest(league, logo_path.parent, logo_path.name, dict(entry, custom=True))
+                return False
+            return True
+        return now - entry.get('checked_at', 0) >= self.STALE_AFTER
+
+    @staticmethod
+    def _is_valid_image(path: Path) -> bool:
+        try:
+            with Image.open(path) as img:
+                img.verify()
+            return True
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def _submit(self, league: str, logo_path: Path, team: Dict[str, Any], force: bool = False) -> Optional[Future]:
+        key = str(logo_path)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            try:
+                future = self._download_pool.submit(self._fetch_logo, league, logo_path, team, force)
+            except RuntimeError:
+                return None
+            self._pending[key] = future
+
+        def _done(_future, key=key):
+            with self._lock:
+                self._pending.pop(key, None)
+
+        future.add_done_callback(_done)
+        return future
+
+    def _fetch_logo(self, league: str, logo_path: Path, team: Dict[str, Any], force: bool) -> Optional[bool]:
+        """
+        Download one logo.
+
+        Returns:
+            True if a new file was written, None if unchanged, False on failure
+        """
+        abbr = team.get('abbreviation') or logo_path.stem
+        entry: Dict[str, Any] = {}
+        try:
+            entry = self.load_manifest(league, logo_path.parent).get(logo_path.name) or {}
+            url = team.get('logo_url') or entry.get('url')
+            if not url and team.get('id'):
+                data = self.downloader.fetch_single_team(league, team['id']) or {}
+                try:
+                    url = data["team"]["logos"][0]["href"]
+                except (KeyError, IndexError, TypeError):
+                    url = None
+            if not url:
+                return self._fail(league, logo_path, team, entry, "no logo URL")
+
+            headers = {'User-Agent': self.downloader.headers.get('User-Agent', 'LEDMatrix/1.0'), 'Accept': 'image/*'}
+            # Only revalidate a file that is exactly what we last downloaded
+            have_file = (not entry.get('placeholder') and entry.get('sha256') is not None
+                         and _file_sha256(logo_path) == entry['sha256'])
+            if have_file and not force and entry.get('url') == url:
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+
+            response = self.downloader.session.get(url, headers=headers, timeout=self.downloader.request_timeout)
+            if response.status_code == 304 and have_file:
+                self.stats['not_modified'] += 1
+                self._update_manifest(league, logo_path.parent, logo_path.name, dict(entry, checked_at=time.time()))
+                return None
+            response.raise_for_status()
+
+            content_type = response.headers.get('content-type', '').lower()
+            if not content_type.startswith('image/'):
+                return self._fail(league, logo_path, team, entry, f"not an image ({content_type})")
+            with Image.open(BytesIO(response.content)) as img:
+                logo = img.convert('RGBA')
+
+            self._write_logo(logo, logo_path)
+            with self._lock:
+                self._failures.pop(str(logo_path), None)
+            self._update_manifest(league, logo_path.parent, logo_path.name, {
+                'league': league,
+                'team_id': team.get('id') or entry.get('team_id'),
+                'abbreviation': abbr,
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'sha256': _file_sha256(logo_path),
+                'checked_at': time.time(),
+            })
+            self.stats['downloaded'] += 1
+            self.logger.info("Downloaded logo for %s -> %s", abbr, logo_path.name)
+            return True
+        except (requests.RequestException, OSError, ValueError) as e:
+            return self._fail(league, logo_path, team, entry, str(e))
+
+    @staticmethod
+    def _write_logo(logo: Image.Image, logo_path: Path) -> None:
+        # Write atomically so renderers never read a half-written file
+        logo_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = logo_path.with_name(f".{logo_path.name}.{threading.get_ident()}.tmp")
+        try:
+            logo.save(tmp_path, 'PNG')
+            os.replace(tmp_path, logo_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        ensure_file_permissions(logo_path, get_assets_file_mode())
+
+    def _fail(self, league: str, logo_path: Path, team: Dict[str, Any], entry: Dict[str, Any], reason: str) -> bool:
+        self.stats['failed'] += 1
+        self.logger.warning("Logo download failed for %s (%s): %s", team.get('abbreviation'), league, reason)
+        now = time.time()
+        if entry.get('placeholder'):
+            # Renderers draw placeholders themselves; drop one written by an earlier version
+            try:
+                logo_path.unlink()
+            except OSError:
+                pass
+            entry = {k: v for k, v in entry.items() if k not in ('placeholder', 'sha256', 'etag', 'last_modified')}
+        if logo_path.exists():
+            # Keep the logo we have and check it again later
+            if entry:
+                self._update_manifest(league, logo_path.parent, logo_path.name, dict(entry, checked_at=now))
+            return False
+        with self._lock:
+            self._failures[str(logo_path)] = now
+        self._update_manifest(league, logo_path.parent, logo_path.name, dict(
+            entry,
+            league=league,
+            team_id=team.get('id') or entry.get('team_id'),
+            abbreviation=team.get('abbreviation') or logo_path.stem,
+            url=team.get('logo_url') or entry.get('url'),
+            failed_at=now,
+        ))
+        return False
+
+
+# Global singleton instance
+_prefetcher: Optional[LogoPrefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_logo_prefetcher() -> LogoPrefetcher:
+    """
+    Get or create the global logo prefetcher.
+
+    Returns:
+        The global LogoPrefetcher instance
+    """
+    global _prefetcher
+
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = LogoPrefetcher()
+        return _prefetcher
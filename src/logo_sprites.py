@@ -0,0 +1,263 @@
+"""
+Logo Sprite Cache
+
+Process-wide cache of team logos, pre-resized for the display and shared by
+every sports manager and plugin.
+
+- Sprites are keyed by ``(league, team, target size)``, so the upcoming,
+  recent and live managers of a league (and any plugin drawing the same
+  logo at the same size) share one RGBA image instead of each holding its
+  own full-size copy.
+- The in-memory store is an ``OrderedDict`` LRU bounded by total pixel
+  bytes, with O(1) lookups, promotion and eviction.
+- Resized variants are written to ``<cache_dir>/logo_sprites`` keyed by the
+  source file's mtime and size, so restarts skip decoding and LANCZOS
+  resampling of the originals.
+- Source files are re-stat'ed at most every ``revalidate_interval`` seconds;
+  a replaced logo (e.g. a downloaded logo replacing a placeholder) is picked
+  up without restarting.
+
+Sprites are shared: callers must treat returned images as read-only.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from PIL import Image
+
+from src.logging_config import get_logger
+
+SpriteKey = Tuple[str, str, Tuple[int, int]]
+
+
+class LogoSpriteCache:
+    """Byte-bounded LRU of resized RGBA logos with an optional disk tier."""
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        cache_dir: Optional[Union[str, Path]] = None,
+        revalidate_interval: float = 30.0,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the sprite cache.
+
+        Args:
+            max_bytes: Maximum total size of cached sprites (width * height * 4)
+            cache_dir: Directory for persisted resized variants (None = memory only)
+            revalidate_interval: Seconds between source file checks per sprite
+            logger: Optional logger instance
+        """
+        self.max_bytes = max_bytes
+        self.revalidate_interval = revalidate_interval
+        self.logger = logger or get_logger(__name__)
+        self.cache_dir: Optional[Path] = None
+        if cache_dir:
+            self.set_cache_dir(cache_dir)
+
+        self._sprites: "OrderedDict[SpriteKey, Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.stats = {'hits': 0, 'misses': 0, 'disk_hits': 0, 'resizes': 0, 'evictions': 0}
+
+    def set_cache_dir(self, cache_dir: Union[str, Path]) -> None:
+        """Set the directory resized variants are persisted to."""
+        self.cache_dir = Path(cache_dir) / 'logo_sprites'
+
+    def get_logo(
+        self,
+        league: str,
+        team: str,
+        source_path: Union[str, Path],
+        max_size: Tuple[int, int]
+    ) -> Optional[Image.Image]:
+        """
+        Return a logo resized to fit within ``max_size``.
+
+        Logos are only ever shrunk (``Image.thumbnail`` semantics), keeping
+        the aspect ratio.
+
+        Args:
+            league: League or namespace identifier (e.g. 'nfl', 'ncaa_fb')
+            team: Team identifier (usually the abbreviation)
+            source_path: Original logo file
+            max_size: (max_width, max_height) bounding box
+
+        Returns:
+            Shared RGBA image, or None if the source can't be read
+        """
+        max_size = (int(max_size[0]), int(max_size[1]))
+        key: SpriteKey = (league, team, max_size)
+        source_path = os.fspath(source_path)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._sprites.get(key)
+            if entry is not None and entry['path'] == source_path:
+                if now - entry['checked_at'] < self.revalidate_interval:
+                    self._sprites.move_to_end(key)
+                    self.stats['hits'] += 1
+                    return entry['image']
+                signature = self._signature(source_path)
+                if signature is not None and signature == entry['signature']:
+                    entry['checked_at'] = now
+                    self._sprites.move_to_end(key)
+                    self.stats['hits'] += 1
+                    return entry['image']
+
+        # Load outside the lock; a concurrent load of the same sprite is harmless
+        self.stats['misses'] += 1
+        signature = self._signature(source_path)
+        if signature is None:
+            with self._lock:
+                self._remove(key)
+            return None
+
+        image = self._load_variant(key, source_path, signature) or self._resize_source(key, source_path, signature)
+        if image is None:
+            return None
+
+        with self._lock:
+            self._remove(key)
+            self._sprites[key] = {
+                'image': image,
+                'path': source_path,
+                'signature': signature,
+                'checked_at': now,
+                'bytes': image.width * image.height * 4,
+            }
+            self._bytes += self._sprites[key]['bytes']
+            self._evict()
+        return image
+
+    def invalidate(self, league: Optional[str] = None, team: Optional[str] = None) -> int:
+        """
+        Drop cached sprites from memory.
+
+        Args:
+            league: Only drop sprites for this league (None = all leagues)
+            team: Only drop sprites for this team (None = all teams)
+
+        Returns:
+            Number of sprites dropped
+        """
+        with self._lock:
+            keys = [k for k in self._sprites
+                    if (league is None or k[0] == league) and (team is None or k[1] == team)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with counters, sprite count and memory use
+        """
+        with self._lock:
+            return dict(self.stats, sprites=len(self._sprites), bytes=self._bytes, max_bytes=self.max_bytes)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _remove(self, key: SpriteKey) -> None:
+        entry = self._sprites.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry['bytes']
+
+    def _evict(self) -> None:
+        # Always keep the most recent sprite, even if it alone exceeds the budget
+        while self._bytes > self.max_bytes and len(self._sprites) > 1:
+            _, entry = self._sprites.popitem(last=False)
+            self._bytes -= entry['bytes']
+            self.stats['evictions'] += 1
+
+    def _variant_path(self, key: SpriteKey, source_path: str, signature: Tuple[int, int]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        league, team, (width, height) = key
+        digest = hashlib.sha1(repr((key, source_path, signature)).encode('utf-8')).hexdigest()[:12]
+        safe_league = re.sub(r'[^A-Za-z0-9_.-]', '_', league) or '_'
+        safe_team = re.sub(r'[^A-Za-z0-9_.-]', '_', team) or '_'
+        return self.cache_dir / safe_league / f"{safe_team}_{width}x{height}_{digest}.png"
+
+    def _load_variant(self, key: SpriteKey, source_path: str, signature: Tuple[int, int]) -> Optional[Image.Image]:
+        path = self._variant_path(key, source_path, signature)
+        if path is None or not path.exists():
+            return None
+        try:
+            with Image.open(path) as variant:
+                image = variant.convert('RGBA')
+        except (OSError, ValueError) as e:
+            self.logger.debug("Ignoring unreadable logo sprite %s: %s", path, e)
+            return None
+        self.stats['disk_hits'] += 1
+        return image
+
+    def _resize_source(self, key: SpriteKey, source_path: str, signature: Tuple[int, int]) -> Optional[Image.Image]:
+        try:
+            with Image.open(source_path) as source:
+                image = source.convert('RGBA')
+        except (OSError, ValueError) as e:
+            self.logger.error("Error loading logo %s: %s", source_path, e)
+            return None
+        image.thumbnail(key[2], Image.Resampling.LANCZOS)
+        self.stats['resizes'] += 1
+
+        path = self._variant_path(key, source_path, signature)
+        if path is not None:
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Drop variants rendered from older versions of this source
+                for stale in path.parent.glob(f"{path.name.rsplit('_', 1)[0]}_*.png"):
+                    stale.unlink()
+                image.save(tmp_path, format='PNG')
+                os.replace(tmp_path, path)
+            except OSError as e:
+                self.logger.debug("Could not persist logo sprite %s: %s", path, e)
+        return image
+
+
+# Global singleton instance
+_sprite_cache: Optional[LogoSpriteCache] = None
+_sprite_cache_lock = threading.Lock()
+
+
+def get_logo_sprite_cache(cache_dir: Optional[Union[str, Path]] = None) -> LogoSpriteCache:
+    """
+    Get or create the global logo sprite cache.
+
+    Args:
+        cache_dir: Cache directory for persisted variants; applied if the
+            cache doesn't have one yet
+
+    Returns:
+        The global LogoSpriteCache instance
+    """
+    global _sprite_cache
+
+    with _sprite_cache_lock:
+        if _sprite_cache is None:
+            _sprite_cache = LogoSpriteCache()
+        if isinstance(cache_dir, (str, os.PathLike)) and cache_dir and _sprite_cache.cache_dir is None:
+            _sprite_cache.set_cache_dir(cache_dir)
+        return _sprite_cache
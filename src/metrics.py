@@ -0,0 +1,436 @@
+"""
+Metrics
+
+Lightweight in-process metrics registry: counters, gauges and fixed-bucket
+histograms, rendered in the Prometheus text exposition format.
+
+Counters and histograms accumulate into per-thread cells, so recording on
+the hot paths (every frame, every plugin call) never takes a lock: a thread
+only ever writes its own cell, and collection sums the cells of all
+threads. Cells of threads that have exited are folded into a retired total.
+
+The display service and the web interface are separate processes. The
+display service periodically writes its snapshot to METRICS_SNAPSHOT_PATH,
+and the web interface's /metrics endpoint renders that snapshot next to its
+own metrics, distinguished by a ``process`` label.
+
+    from src.metrics import get_metrics_registry
+
+    FRAME_SECONDS = get_metrics_registry().histogram(
+        'ledmatrix_frame_seconds', 'Time to render a frame')
+    with FRAME_SECONDS.time():
+        render()
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Where the display service publishes its metrics for the web interface
+METRICS_SNAPSHOT_PATH = '/tmp/led_matrix_metrics.json'
+# Snapshots older than this are from a display service that is no longer running
+SNAPSHOT_MAX_AGE = 120.0
+
+# Cell count above which a new thread's registration first drops exited threads
+_PRUNE_THRESHOLD = 32
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _ThreadCells:
+    """Per-thread float accumulators, summed on collection."""
+
+    __slots__ = ('_size', '_local', '_cells', '_retired', '_lock')
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[Tuple[threading.Thread, List[float]]] = []
+        self._retired = [0.0] * size
+        self._lock = threading.Lock()
+
+    def cell(self) -> List[float]:
+        """The calling thread's accumulator (only that thread writes it)."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0.0] * self._size
+            with self._lock:
+                if len(self._cells) >= _PRUNE_THRESHOLD:
+                    # Short-lived threads (e.g. one per request) would otherwise pile up
+                    self._retire_dead_threads()
+                self._cells.append((threading.current_thread(), cell))
+            self._local.cell = cell
+            return cell
+
+    def _retire_dead_threads(self) -> None:
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+            else:
+                # The thread can't write any more, so fold it in for good
+                for i, value in enumerate(cell):
+                    self._retired[i] += value
+        self._cells = live
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            self._retire_dead_threads()
+            totals = list(self._retired)
+            for _, cell in self._cells:
+                for i, value in enumerate(cell):
+                    totals[i] += value
+        return totals
+
+
+class _CounterChild:
+    __slots__ = ('_cells',)
+
+    def __init__(self) -> None:
+        self._cells = _ThreadCells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter (amount must not be negative)."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._cells.cell()[0] += amount
+
+    def value(self) -> float:
+        return self._cells.totals()[0]
+
+
+class _GaugeChild:
+    __slots__ = ('_value', '_function', '_lock')
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the gauge from a callback at collection time."""
+        self._function = function
+
+    def value(self) -> float:
+        function = self._function
+        if function is not None:
+            try:
+                return float(function())
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug("Gauge callback failed: %s", e)
+                return math.nan
+        return self._value
+
+
+class _HistogramChild:
+    __slots__ = ('_upper', '_cells')
+
+    def __init__(self, upper: Sequence[float]) -> None:
+        self._upper = upper
+        # One count per bucket plus +Inf, then the sum of observations
+        self._cells = _ThreadCells(len(upper) + 2)
+
+    def observe(self, value: float) -> None:
+        cell = self._cells.cell()
+        cell[bisect_left(self._upper, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def value(self) -> Dict[str, Any]:
+        totals = self._cells.totals()
+        counts = [int(c) for c in totals[:-1]]
+        return {'buckets': counts, 'sum': totals[-1], 'count': sum(counts)}
+
+
+class _Metric(ABC):
+    """A metric family: one child per combination of label values."""
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        self._unlabelled = None if self.labelnames else self.labels()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the child that holds one label combination's value."""
+
+    def labels(self, *values: Any) -> Any:
+        """Child for the given label values (in labelnames order)."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _require_unlabelled(self) -> Any:
+        if self._unlabelled is None:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return self._unlabelled
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            children = list(self._children.items())
+        return {
+            'name': self.name,
+            'type': self.type_name,
+            'help': self.documentation,
+            'labelnames': list(self.labelnames),
+            'samples': [{'labels': list(key), 'value': child.value()} for key, child in children],
+        }
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = 'counter'
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._require_unlabelled().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = 'gauge'
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._require_unlabelled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._require_unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._require_unlabelled().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._require_unlabelled().set_function(function)
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._require_unlabelled().observe(value)
+
+    def time(self):
+        return self._require_unlabelled().time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot = super().snapshot()
+        snapshot['buckets'] = list(self.buckets)
+        return snapshot
+
+
+class MetricsRegistry:
+    """Named collection of metrics."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a different {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Current values of all metrics (JSON-serializable)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return [metric.snapshot() for metric in metrics]
+
+    def render(self) -> str:
+        """Current values in the Prometheus text format."""
+        return render_prometheus([({}, self.snapshot())])
+
+    def write_snapshot(self, path: str = METRICS_SNAPSHOT_PATH) -> bool:
+        """
+        Write the snapshot to a JSON file (atomically) for another process to serve.
+
+        Returns:
+            True if the snapshot was written
+        """
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.time(), 'metrics': self.snapshot()}, f)
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write metrics snapshot to %s: %s", path, e)
+            return False
+
+
+def load_snapshot(path: str = METRICS_SNAPSHOT_PATH,
+                  max_age: float = SNAPSHOT_MAX_AGE) -> Optional[List[Dict[str, Any]]]:
+    """
+    Read a snapshot written by MetricsRegistry.write_snapshot().
+
+    Returns:
+        The metrics, or None if the file is missing, unreadable or stale
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - data.get('timestamp', 0) > max_age:
+        return None
+    return data.get('metrics')
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        return str(int(value))
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(value)
+
+
+def render_prometheus(sources: Iterable[Tuple[Dict[str, str], List[Dict[str, Any]]]]) -> str:
+    """
+    Render snapshots in the Prometheus text exposition format (0.0.4).
+
+    Args:
+        sources: (constant labels, snapshot) pairs; families with the same
+            name are merged, each sample carrying its source's labels
+
+    Returns:
+        Exposition text
+    """
+    families: Dict[str, Dict[str, Any]] = {}
+    order: List[str] = []
+    for constant_labels, snapshot in sources:
+        for metric in snapshot or ():
+            family = families.get(metric['name'])
+            if family is None:
+                family = {'metric': metric, 'samples': []}
+                families[metric['name']] = family
+                order.append(metric['name'])
+            elif family['metric']['type'] != metric['type']:
+                continue
+            extra_names = list(constant_labels)
+            extra_values = [constant_labels[k] for k in extra_names]
+            for sample in metric['samples']:
+                family['samples'].append((extra_names + metric['labelnames'],
+                                          extra_values + sample['labels'], sample['value'], metric))
+
+    lines: List[str] = []
+    for name in order:
+        family = families[name]
+        metric = family['metric']
+        lines.append(f"# HELP {name} {_escape(metric['help'])}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for labelnames, labelvalues, value, source in family['samples']:
+            if metric['type'] != 'histogram':
+                lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+                continue
+            cumulative = 0
+            for upper, count in zip(list(source['buckets']) + [math.inf], value['buckets']):
+                cumulative += count
+                bucket_labels = _format_labels(labelnames + ['le'], labelvalues + [_format_value(float(upper))])
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            labels = _format_labels(labelnames, labelvalues)
+            lines.append(f"{name}_sum{labels} {_format_value(value['sum'])}")
+            lines.append(f"{name}_count{labels} {value['count']}")
+    return '\n'.join(lines) + '\n'
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+        return _registry
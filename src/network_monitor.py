@@ -0,0 +1,226 @@
+"""
+Event-driven network status cache.
+
+Network status probes (``nmcli``, ``ip``, ``systemctl``) are answered from
+memory and only re-run after something changed. A single long-lived
+``nmcli monitor`` process reports NetworkManager state changes; every line
+it prints invalidates the cached results. While the monitor is running,
+cached values are trusted up to ``max_age`` seconds (signal strength and
+hostapd state do not produce NetworkManager events); without it, values
+are reused for the short ``ttl`` only.
+
+An event source that keeps exiting soon after starting (no NetworkManager,
+D-Bus access denied) is restarted with exponential backoff and abandoned
+after ``MAX_FAST_EXITS`` attempts in a row, leaving the ``ttl`` cache.
+
+Code that changes network state itself can force fresh probes for its
+duration with ``uncached()``; the cache is invalidated when it exits.
+"""
+
+import logging
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class NetworkStatusMonitor:
+    """Status cache invalidated by NetworkManager events."""
+
+    RESTART_DELAY = 5.0  # Doubles after each consecutive fast exit
+    MAX_RESTART_DELAY = 300.0
+    FAST_EXIT = 30.0  # A source that ran for less than this counts as failing
+    MAX_FAST_EXITS = 5
+
+    def __init__(self, command: Optional[List[str]] = None, ttl: float = 5.0,
+                 max_age: float = 60.0) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            command: Event source command; each line of output is one event
+                (default: ``nmcli monitor``)
+            ttl: Seconds a probe result is reused when no event source is running
+            max_age: Seconds a probe result is reused while the event source runs
+        """
+        self.command = command or ['nmcli', 'monitor']
+        self.ttl = ttl
+        self.max_age = max_age
+        self._cache: Dict[str, Tuple[int, float, Any]] = {}
+        self._generation = 0
+        self._watching = False
+        self._stopping = False
+        self._unavailable = False
+        self._lock = threading.Condition()
+        self._local = threading.local()
+        self._thread: Optional[threading.Thread] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def watching(self) -> bool:
+        """Whether the event source is currently running."""
+        with self._lock:
+            return self._watching
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far."""
+        with self._lock:
+            return self._generation
+
+    def start(self) -> None:
+        """Start the event source thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None or self._unavailable:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='NetworkStatusMonitor', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the event source and wait for its thread."""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+            if self._process is not None:
+                self._process.terminate()
+            self._lock.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def invalidate(self, *keys: str) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            keys: Cache keys to drop (default: all)
+        """
+        with self._lock:
+            if keys:
+                for key in keys:
+                    self._cache.pop(key, None)
+            else:
+                self._generation += 1
+                self._cache.clear()
+
+    @contextmanager
+    def uncached(self) -> Iterator[None]:
+        """Probe directly for the duration of the block, then invalidate."""
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        self.invalidate()
+        try:
+            yield
+        finally:
+            self._local.depth -= 1
+            self.invalidate()
+
+    def cached(self, key: str, probe: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for ``key``, running ``probe`` on a miss.
+
+        Args:
+            key: Cache key
+            probe: Callable producing the current value
+
+        Returns:
+            Cached or freshly probed value
+        """
+        bypass = getattr(self._local, 'depth', 0) > 0
+        with self._lock:
+            generation = self._generation
+            entry = self._cache.get(key)
+            if entry is not None and not bypass:
+                stored_generation, stored_at, value = entry
+                limit = self.max_age if self._watching else self.ttl
+                if stored_generation == generation and time.monotonic() - stored_at < limit:
+                    return value
+        value = probe()
+        with self._lock:
+            # An event that arrived during the probe makes its result stale
+            if self._generation == generation:
+                self._cache[key] = (generation, time.monotonic(), value)
+        return value
+
+    def _watch_once(self) -> Optional[int]:
+        """
+        Run the event source until it exits or the monitor stops.
+
+        Returns:
+            The source's exit code, or None if it could not be started at all
+        """
+        try:
+            process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                       text=True, bufsize=1)
+        except OSError as e:
+            logger.info("Network event source unavailable (%s); using %.0fs status cache", e, self.ttl)
+            return None
+        with self._lock:
+            self._process = process
+            if self._stopping:
+                process.terminate()
+            else:
+                # Results probed before the source started may have missed events
+                self._watching = True
+                self._generation += 1
+                self._cache.clear()
+        stdout = process.stdout
+        try:
+            if stdout is not None:
+                for line in stdout:
+                    if line.strip():
+                        self.invalidate()
+        finally:
+            if stdout is not None:
+                stdout.close()
+            returncode = process.wait()
+            with self._lock:
+                self._process = None
+                self._watching = False
+                self._generation += 1
+                self._cache.clear()
+        return returncode
+
+    def _run(self) -> None:
+        fast_exits = 0
+        while True:
+            started = time.monotonic()
+            returncode = self._watch_once()
+            fast_exits = fast_exits + 1 if time.monotonic() - started < self.FAST_EXIT else 0
+            with self._lock:
+                if self._stopping:
+                    self._thread = None
+                    return
+                if returncode is None or fast_exits >= self.MAX_FAST_EXITS:
+                    if returncode is not None:
+                        logger.warning("Network event source exited %d times in a row (last code %s); "
+                                       "using %.0fs status cache", fast_exits, returncode, self.ttl)
+                    self._thread = None
+                    self._unavailable = True
+                    return
+                delay = min(self.MAX_RESTART_DELAY, self.RESTART_DELAY * 2 ** max(0, fast_exits - 1))
+                if fast_exits <= 1:
+                    logger.warning("Network event source exited with code %s; restarting in %.0fs",
+                                   returncode, delay)
+                else:
+                    logger.debug("Network event source exited with code %s; restarting in %.0fs",
+                                 returncode, delay)
+                self._lock.wait_for(lambda: self._stopping, timeout=delay)
+                if self._stopping:
+                    self._thread = None
+                    return
+
+
+_monitor: Optional[NetworkStatusMonitor] = None
+_monitor_lock = threading.Lock()
+
+
+def get_network_monitor() -> NetworkStatusMonitor:
+    """Get the process-wide network status monitor."""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = NetworkStatusMonitor()
+        return _monitor
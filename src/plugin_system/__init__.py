@@ -12,6 +12,7 @@ __api_version__ = "1.0.0"
 
 from .base_plugin import BasePlugin
 from .plugin_manager import PluginManager
+from .render_cache import memoize_render, skip_render_cache
 
 # Import store_manager only when needed to avoid dependency issues
 def get_store_manager():
@@ -25,6 +26,8 @@ def get_store_manager():
 __all__ = [
     'BasePlugin',
     'PluginManager',
+    'memoize_render',
+    'skip_render_cache',
     'get_store_manager',
 ]
 
@@ -10,8 +10,10 @@ Stability: Stable - maintains backward compatibility
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
+from src.event_bus import EventType, publish_event
+from src.plugin_system.render_cache import get_render_cache
 from src.logging_config import get_logger
 
 
@@ -50,6 +52,12 @@ class BasePlugin(ABC):
 
     API_VERSION = "1.0.0"
 
+    # Attributes that update() sets and display() reads. Listing them allows
+    # update() to run in the plugin update worker process (see
+    # plugin_system.separate_update_process), which sends their values back
+    # to the display process after each successful update.
+    UPDATE_SNAPSHOT_ATTRIBUTES: Tuple[str, ...] = ()
+
     def __init__(
         self,
         plugin_id: str,
@@ -75,6 +83,7 @@ class BasePlugin(ABC):
         self.plugin_manager: Any = plugin_manager
         self.logger: logging.Logger = get_logger(f"plugin.{plugin_id}", plugin_id=plugin_id)
         self.enabled: bool = config.get("enabled", True)
+        self.data_version: int = 0
 
         self.logger.info("Initialized plugin: %s", plugin_id)
 
@@ -339,6 +348,62 @@ class BasePlugin(ABC):
         """
         return False
 
+    def notify_live_content_changed(self) -> None:
+        """
+        Tell the display controller that has_live_content() may have changed.
+
+        The controller re-checks live priority after each scheduled update(),
+        so plugins only need to call this when live state changes elsewhere
+        (e.g. from a background data thread) to get an immediate takeover.
+        """
+        publish_event(EventType.LIVE_CONTENT_CHANGED, source=self.plugin_id)
+
+    def bump_data_version(self) -> None:
+        """
+        Record that the data behind this plugin's display changed.
+
+        Render methods decorated with ``memoize_render`` typically include
+        ``self.data_version`` in their render key; bumping it makes the next
+        display() redraw instead of presenting a cached frame.
+        """
+        self.data_version += 1
+
+    def get_update_snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the data produced by update() (in the update worker process).
+
+        Override for data that needs converting before it can be pickled.
+
+        Returns:
+            Dictionary of the UPDATE_SNAPSHOT_ATTRIBUTES that are set
+        """
+        return {name: getattr(self, name) for name in self.UPDATE_SNAPSHOT_ATTRIBUTES if hasattr(self, name)}
+
+    def apply_update_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Take over data captured by get_update_snapshot() in the update worker.
+
+        Args:
+            snapshot: Attribute values produced by the worker's update()
+        """
+        for name, value in snapshot.items():
+            if name in self.UPDATE_SNAPSHOT_ATTRIBUTES:
+                setattr(self, name, value)
+        self.bump_data_version()
+
+    def invalidate_render_cache(self) -> None:
+        """Drop all memoized frames (e.g. after a config change affecting layout)."""
+        get_render_cache(self).invalidate()
+
+    def get_render_stats(self) -> Dict[str, Any]:
+        """
+        Get memoized render statistics for this plugin.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and cached frame count
+        """
+        return get_render_cache(self).get_stats()
+
     def get_live_modes(self) -> List[str]:
         """
         Get list of display modes that should be used during live priority takeover.
@@ -588,6 +653,7 @@ class BasePlugin(ABC):
         """
         # Update config reference
         self.config = new_config or {}
+        self.invalidate_render_cache()
 
         # Update simple flags
         self.enabled = self.config.get("enabled", self.enabled)
@@ -614,6 +680,7 @@ class BasePlugin(ABC):
             "enabled": self.enabled,
             "config": self.config,
             "api_version": self.API_VERSION,
+            "render_cache": self.get_render_stats(),
         }
 
     def on_enable(self) -> None:
@@ -0,0 +1,137 @@
+"""
+Deferred Plugin
+
+Placeholder for a plugin whose import and instantiation are postponed
+until one of its display modes is first scheduled. The first display()
+call starts loading the plugin on a background thread and shows a
+"loading" frame; once the plugin is loaded, calls are forwarded to the
+real instance.
+"""
+
+import inspect
+import threading
+from typing import Any, Callable, List, Optional
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class DeferredPlugin:
+    """Stands in for a plugin until its first display."""
+
+    def __init__(
+        self,
+        plugin_id: str,
+        display_modes: List[str],
+        load: Callable[[str], Optional[Any]],
+        display_manager: Any,
+        display_name: Optional[str] = None,
+        on_loaded: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        Initialize the placeholder.
+
+        Args:
+            plugin_id: Plugin identifier
+            display_modes: Display modes registered for the plugin (from its manifest)
+            load: Loads the plugin and returns its instance (None on failure);
+                called on a background thread
+            display_manager: Display manager used for the placeholder frame
+            display_name: Name shown on the placeholder frame
+            on_loaded: Called with the plugin ID after loading finished
+                (successfully or not), on the loading thread
+        """
+        self.plugin_id = plugin_id
+        self.modes = list(display_modes)
+        self.display_name = display_name or plugin_id
+        self._load = load
+        self._on_loaded = on_loaded
+        self._display_manager = display_manager
+        self._instance: Optional[Any] = None
+        self._failed = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._placeholder_shown = False
+
+    @property
+    def instance(self) -> Optional[Any]:
+        """The loaded plugin instance, if loading has finished."""
+        return self._instance
+
+    @property
+    def failed(self) -> bool:
+        return self._failed
+
+    @property
+    def loading(self) -> bool:
+        with self._lock:
+            return self._thread is not None and self._instance is None and not self._failed
+
+    def start_loading(self) -> None:
+        """Start loading the plugin in the background (no-op if already started)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._load_in_background, name=f"DeferredLoad-{self.plugin_id}", daemon=True
+            )
+            self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """Wait for a started load to finish and return the instance."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._instance
+
+    def _load_in_background(self) -> None:
+        try:
+            instance = self._load(self.plugin_id)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Deferred load of plugin %s failed: %s", self.plugin_id, e, exc_info=True)
+            instance = None
+        if instance is None:
+            self._failed = True
+        else:
+            self._instance = instance
+        if self._on_loaded is not None:
+            self._on_loaded(self.plugin_id)
+
+    def _show_placeholder(self) -> None:
+        try:
+            self._display_manager.clear()
+            height = getattr(self._display_manager, 'height', 32)
+            self._display_manager.draw_text("Loading", y=max(0, height // 2 - 8), small_font=True)
+            self._display_manager.draw_text(self.display_name, y=max(0, height // 2 + 1), small_font=True)
+            self._display_manager.update_display()
+            self._placeholder_shown = True
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Could not draw placeholder for %s: %s", self.plugin_id, e)
+
+    def display(self, display_mode: Optional[str] = None, force_clear: bool = False) -> bool:
+        """
+        Show the plugin, or a placeholder frame while it loads.
+
+        Returns:
+            The plugin's display() result once loaded, True while loading,
+            False if loading failed (so the mode is skipped)
+        """
+        instance = self._instance
+        if instance is not None:
+            if display_mode is not None and 'display_mode' in inspect.signature(instance.display).parameters:
+                return instance.display(display_mode=display_mode, force_clear=force_clear)
+            return instance.display(force_clear=force_clear)
+        if self._failed:
+            return False
+        self.start_loading()
+        if force_clear or not self._placeholder_shown:
+            self._show_placeholder()
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined here: defer to the loaded plugin
+        instance = self.__dict__.get('_instance')
+        if instance is None:
+            raise AttributeError(name)
+        return getattr(instance, name)
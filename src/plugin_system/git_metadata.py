@@ -0,0 +1,395 @@
+"""
+Git Metadata Reader
+
+Reads HEAD commit, branch, remote URL and commit date for a plugin checkout
+directly from the files under ``.git`` (refs, packed-refs, config, loose and
+packed objects) instead of running ``git`` subprocesses. On a Raspberry Pi
+each ``git`` invocation costs tens of milliseconds, and listing installed
+plugins used to spawn four of them per plugin.
+
+Only what is needed to describe HEAD is implemented: ref resolution,
+``remote.origin.url`` lookup and decoding a single commit object (including
+commits stored as deltas inside pack files).
+"""
+
+import os
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+PathLike = Union[str, os.PathLike]
+
+# Pack object types
+_OBJ_COMMIT = 1
+_OBJ_OFS_DELTA = 6
+_OBJ_REF_DELTA = 7
+_MAX_DELTA_CHAIN = 64
+
+
+class GitMetadataError(Exception):
+    """Raised when repository files can't be parsed."""
+
+
+def find_git_dir(repo_path: PathLike) -> Optional[Path]:
+    """
+    Locate the git directory for a checkout.
+
+    Handles both a ``.git`` directory and a ``.git`` file containing a
+    ``gitdir:`` pointer (worktrees and submodules).
+
+    Returns:
+        Path to the git directory, or None if the path is not a checkout
+    """
+    dot_git = Path(repo_path) / '.git'
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        try:
+            content = dot_git.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        if content.startswith('gitdir:'):
+            git_dir = Path(content[len('gitdir:'):].strip())
+            if not git_dir.is_absolute():
+                git_dir = (dot_git.parent / git_dir).resolve()
+            return git_dir if git_dir.is_dir() else None
+    return None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """Return the directory holding shared refs and objects (differs for worktrees)."""
+    commondir_file = git_dir / 'commondir'
+    try:
+        common = Path(commondir_file.read_text(encoding='utf-8').strip())
+    except OSError:
+        return git_dir
+    return common if common.is_absolute() else (git_dir / common).resolve()
+
+
+def _read_packed_refs(common_dir: Path) -> Dict[str, str]:
+    refs: Dict[str, str] = {}
+    try:
+        with open(common_dir / 'packed-refs', 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] in '#^':
+                    continue
+                parts = line.split(' ', 1)
+                if len(parts) == 2:
+                    refs[parts[1]] = parts[0]
+    except OSError:
+        pass
+    return refs
+
+
+def _resolve_ref(git_dir: Path, common_dir: Path, ref: str) -> Optional[str]:
+    """Resolve a ref name (following symbolic refs) to a commit SHA."""
+    packed: Optional[Dict[str, str]] = None
+    for _ in range(10):
+        # Per-worktree refs (HEAD) live in git_dir, shared refs in common_dir
+        for base in (git_dir, common_dir):
+            try:
+                content = (base / ref).read_text(encoding='utf-8').strip()
+                break
+            except OSError:
+                continue
+        else:
+            if packed is None:
+                packed = _read_packed_refs(common_dir)
+            return packed.get(ref)
+
+        if content.startswith('ref:'):
+            ref = content[len('ref:'):].strip()
+            continue
+        return content or None
+    return None
+
+
+def read_head(repo_path: PathLike) -> Tuple[Optional[str], str]:
+    """
+    Resolve HEAD for a checkout.
+
+    Returns:
+        Tuple of (commit SHA or None, branch name or '' when detached)
+    """
+    git_dir = find_git_dir(repo_path)
+    if git_dir is None:
+        return None, ''
+    common_dir = _common_dir(git_dir)
+    try:
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+    except OSError:
+        return None, ''
+
+    if head.startswith('ref:'):
+        ref = head[len('ref:'):].strip()
+        branch = ref[len('refs/heads/'):] if ref.startswith('refs/heads/') else ref
+        return _resolve_ref(git_dir, common_dir, ref), branch
+    return head or None, ''
+
+
+def read_remote_url(repo_path: PathLike, remote: str = 'origin') -> Optional[str]:
+    """Return ``remote.<remote>.url`` from the repository config."""
+    git_dir = find_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    target = f'remote "{remote}"'
+    in_section = False
+    try:
+        with open(_common_dir(git_dir) / 'config', 'r', encoding='utf-8') as f:
+            for raw in f:
+                line = raw.strip()
+                if not line or line[0] in '#;':
+                    continue
+                if line.startswith('['):
+                    in_section = line.strip('[]').strip() == target
+                    continue
+                if in_section and '=' in line:
+                    key, value = line.split('=', 1)
+                    if key.strip().lower() == 'url':
+                        return value.strip().strip('"')
+    except OSError:
+        pass
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Object access
+# ---------------------------------------------------------------------------
+
+def _read_loose_object(common_dir: Path, sha: str) -> Optional[Tuple[str, bytes]]:
+    path = common_dir / 'objects' / sha[:2] / sha[2:]
+    try:
+        with open(path, 'rb') as f:
+            raw = zlib.decompress(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, zlib.error) as e:
+        raise GitMetadataError(f"Unreadable loose object {sha}: {e}") from e
+    header, _, body = raw.partition(b'\0')
+    obj_type = header.split(b' ', 1)[0].decode('ascii')
+    return obj_type, body
+
+
+def _pack_index_offset(idx_path: Path, sha: str) -> Optional[int]:
+    """Look up an object's offset in a version 2 pack index."""
+    binsha = bytes.fromhex(sha)
+    with open(idx_path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'\xfftOc' or struct.unpack('>I', data[4:8])[0] != 2:
+        raise GitMetadataError(f"Unsupported pack index format: {idx_path.name}")
+
+    fanout = struct.unpack('>256I', data[8:8 + 1024])
+    total = fanout[255]
+    first = binsha[0]
+    lo = fanout[first - 1] if first else 0
+    hi = fanout[first]
+    sha_table = 8 + 1024
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = sha_table + mid * 20
+        candidate = data[start:start + 20]
+        if candidate < binsha:
+            lo = mid + 1
+        elif candidate > binsha:
+            hi = mid
+        else:
+            offsets = sha_table + total * 24  # skip SHA and CRC tables
+            offset = struct.unpack('>I', data[offsets + mid * 4:offsets + mid * 4 + 4])[0]
+            if offset & 0x80000000:
+                large = offsets + total * 4 + (offset & 0x7fffffff) * 8
+                offset = struct.unpack('>Q', data[large:large + 8])[0]
+            return offset
+    return None
+
+
+def _inflate_at(f, offset: int) -> bytes:
+    f.seek(offset)
+    decompressor = zlib.decompressobj()
+    out = []
+    while not decompressor.eof:
+        chunk = f.read(8192)
+        if not chunk:
+            break
+        out.append(decompressor.decompress(chunk))
+    return b''.join(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Apply a git delta to its base object."""
+    _, pos = _read_varint(delta, 0)  # source size
+    _, pos = _read_varint(delta, pos)  # target size
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            copy_offset = copy_size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    copy_offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (1 << (4 + i)):
+                    copy_size |= delta[pos] << (8 * i)
+                    pos += 1
+            copy_size = copy_size or 0x10000
+            out += base[copy_offset:copy_offset + copy_size]
+        elif op:
+            out += delta[pos:pos + op]
+            pos += op
+        else:
+            raise GitMetadataError("Invalid delta opcode")
+    return bytes(out)
+
+
+def _read_pack_entry(common_dir: Path, pack_path: Path, offset: int, depth: int = 0) -> Tuple[int, bytes]:
+    if depth > _MAX_DELTA_CHAIN:
+        raise GitMetadataError("Delta chain too long")
+    with open(pack_path, 'rb') as f:
+        f.seek(offset)
+        byte = f.read(1)[0]
+        obj_type = (byte >> 4) & 0x7
+        while byte & 0x80:
+            byte = f.read(1)[0]
+        header_end = f.tell()
+
+        if obj_type == _OBJ_OFS_DELTA:
+            byte = f.read(1)[0]
+            rel = byte & 0x7f
+            while byte & 0x80:
+                byte = f.read(1)[0]
+                rel = ((rel + 1) << 7) | (byte & 0x7f)
+            delta = _inflate_at(f, f.tell())
+            base_type, base = _read_pack_entry(common_dir, pack_path, offset - rel, depth + 1)
+            return base_type, _apply_delta(base, delta)
+
+        if obj_type == _OBJ_REF_DELTA:
+            base_sha = f.read(20).hex()
+            delta = _inflate_at(f, f.tell())
+            base_obj = _read_object(common_dir, base_sha, depth + 1)
+            if base_obj is None:
+                raise GitMetadataError(f"Missing delta base {base_sha}")
+            base_type = {'commit': _OBJ_COMMIT}.get(base_obj[0], 0)
+            return base_type, _apply_delta(base_obj[1], delta)
+
+        return obj_type, _inflate_at(f, header_end)
+
+
+def _read_object(common_dir: Path, sha: str, depth: int = 0) -> Optional[Tuple[str, bytes]]:
+    """Read an object from loose storage or any pack."""
+    loose = _read_loose_object(common_dir, sha)
+    if loose is not None:
+        return loose
+    pack_dir = common_dir / 'objects' / 'pack'
+    try:
+        idx_files: List[Path] = sorted(pack_dir.glob('*.idx'))
+    except OSError:
+        return None
+    for idx_path in idx_files:
+        offset = _pack_index_offset(idx_path, sha)
+        if offset is None:
+            continue
+        obj_type, body = _read_pack_entry(common_dir, idx_path.with_suffix('.pack'), offset, depth)
+        return ('commit' if obj_type == _OBJ_COMMIT else str(obj_type)), body
+    return None
+
+
+def _parse_committer_date(commit_body: bytes) -> Optional[str]:
+    """Return the committer date in strict ISO 8601 (``git log --format=%cI``)."""
+    for line in commit_body.split(b'\n'):
+        if not line:
+            break  # end of headers
+        if line.startswith(b'committer '):
+            parts = line.rsplit(b' ', 2)
+            if len(parts) != 3:
+                return None
+            timestamp = int(parts[1])
+            tz = parts[2].decode('ascii')
+            sign = -1 if tz.startswith('-') else 1
+            offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5])) * sign
+            return datetime.fromtimestamp(timestamp, timezone(offset)).isoformat()
+    return None
+
+
+def read_commit_date(repo_path: PathLike, sha: str) -> Optional[str]:
+    """Return the ISO committer date for a commit in the checkout."""
+    git_dir = find_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    obj = _read_object(_common_dir(git_dir), sha)
+    if obj is None or obj[0] != 'commit':
+        return None
+    return _parse_committer_date(obj[1])
+
+
+def read_git_info(repo_path: PathLike) -> Optional[Dict[str, str]]:
+    """
+    Describe HEAD of a checkout without running git.
+
+    Returns:
+        Dict with 'sha', 'short_sha', 'branch' and, when available,
+        'remote_url' and 'date_iso'; None if HEAD can't be resolved
+    """
+    sha, branch = read_head(repo_path)
+    if not sha:
+        return None
+    result = {
+        'sha': sha,
+        'short_sha': sha[:7],
+        'branch': branch,
+    }
+    remote_url = read_remote_url(repo_path)
+    if remote_url:
+        result['remote_url'] = remote_url
+    try:
+        date_iso = read_commit_date(repo_path, sha)
+    except (GitMetadataError, OSError, ValueError, IndexError, zlib.error):
+        date_iso = None
+    if date_iso:
+        result['date_iso'] = date_iso
+    return result
+
+
+def git_signature(repo_path: PathLike, branch: Optional[str] = None) -> Optional[tuple]:
+    """
+    Cheap change signature for a checkout, based on file mtimes.
+
+    Covers HEAD, packed-refs, config and (if known) the branch's loose ref,
+    which together change whenever a checkout, pull or fetch moves HEAD.
+
+    Args:
+        repo_path: Checkout directory
+        branch: Current branch, as returned by a previous read
+
+    Returns:
+        Tuple of stat results, or None if the path is not a checkout
+    """
+    git_dir = find_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    common_dir = _common_dir(git_dir)
+    paths = [git_dir / 'HEAD', common_dir / 'packed-refs', common_dir / 'config']
+    if branch:
+        paths.append(common_dir / 'refs' / 'heads' / branch)
+    signature: List[Optional[Tuple[int, int]]] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
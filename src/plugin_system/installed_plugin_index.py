@@ -0,0 +1,142 @@
+"""
+Installed Plugin Index
+
+Caches the per-plugin data behind the "installed plugins" listing (fresh
+manifest contents and local git metadata) and revalidates it with file
+mtimes instead of rescanning and re-reading everything on each request.
+
+- The plugins directory's mtime changes when a plugin directory is added,
+  removed or renamed; only then is a full discovery run.
+- Each plugin's manifest.json is re-read only when its mtime changes.
+- Git metadata is re-read only when HEAD, packed-refs, the repo config or
+  the current branch ref changes, and is read straight from ``.git`` files
+  (see ``git_metadata``) rather than by running git.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.logging_config import get_logger
+from src.plugin_system.git_metadata import git_signature, read_git_info
+
+
+def _stat_signature(path: Any) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class InstalledPluginIndex:
+    """mtime-validated cache of installed plugin manifests and git metadata."""
+
+    def __init__(self, plugin_manager: Any, logger: Optional[logging.Logger] = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            plugin_manager: PluginManager used for discovery
+            logger: Optional logger instance
+        """
+        self.plugin_manager = plugin_manager
+        self.logger = logger or get_logger(__name__)
+        self._lock = threading.Lock()
+        self._dir_signature: Optional[tuple] = None
+        self._plugin_ids: List[str] = []
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def invalidate(self, plugin_id: Optional[str] = None) -> None:
+        """
+        Drop cached data so it is rebuilt on the next read.
+
+        Args:
+            plugin_id: Plugin to invalidate, or None for everything
+        """
+        with self._lock:
+            if plugin_id is None:
+                self._dir_signature = None
+                self._entries.clear()
+            else:
+                self._entries.pop(plugin_id, None)
+
+    def get_entries(self) -> List[Dict[str, Any]]:
+        """
+        Return index entries for all installed plugins.
+
+        Each entry has 'id', 'directory' (Path or None), 'manifest' (dict) and
+        'git_info' (dict or None). Entries are shared; callers must copy
+        before modifying.
+        """
+        with self._lock:
+            self._refresh_listing()
+            entries = []
+            for plugin_id in self._plugin_ids:
+                entry = self._entries.get(plugin_id)
+                if entry is None:
+                    continue
+                self._revalidate(entry)
+                entries.append(entry)
+            return entries
+
+    def _refresh_listing(self) -> None:
+        """Re-run discovery if the plugins directory changed (or can't be checked)."""
+        signature = _stat_signature(self.plugin_manager.plugins_dir)
+        if signature is not None and signature == self._dir_signature:
+            return
+
+        self.plugin_manager.discover_plugins()
+        plugin_ids = []
+        for info in self.plugin_manager.get_all_plugin_info():
+            plugin_id = info.get('id')
+            if not plugin_id:
+                continue
+            plugin_ids.append(plugin_id)
+            directory = self.plugin_manager.get_plugin_directory(plugin_id)
+            directory = Path(directory) if isinstance(directory, (str, os.PathLike)) else None
+            existing = self._entries.get(plugin_id)
+            if existing is None or existing['directory'] != directory:
+                self._entries[plugin_id] = {
+                    'id': plugin_id,
+                    'directory': directory,
+                    'manifest': {k: v for k, v in info.items() if k not in ('loaded', 'state', 'runtime_info')},
+                    'git_info': None,
+                    '_manifest_signature': None,
+                    '_git_signature': None,
+                }
+
+        for stale_id in set(self._entries) - set(plugin_ids):
+            del self._entries[stale_id]
+        self._plugin_ids = plugin_ids
+        self._dir_signature = signature
+
+    def _revalidate(self, entry: Dict[str, Any]) -> None:
+        directory = entry['directory']
+        if directory is None:
+            return
+
+        manifest_path = directory / 'manifest.json'
+        signature = _stat_signature(manifest_path)
+        if signature is not None and signature != entry['_manifest_signature']:
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    entry['manifest'] = json.load(f)
+                entry['_manifest_signature'] = signature
+            except (OSError, ValueError) as e:
+                # Keep the previous manifest; retry on the next read
+                self.logger.warning("Could not read manifest for %s: %s", entry['id'], e)
+
+        branch = entry['git_info'].get('branch') if entry['git_info'] else None
+        signature = git_signature(directory, branch)
+        if signature != entry['_git_signature']:
+            git_info = read_git_info(directory) if signature is not None else None
+            new_branch = git_info.get('branch') if git_info else None
+            if new_branch != branch:
+                # Track the new branch's ref file from now on
+                signature = git_signature(directory, new_branch)
+            entry['git_info'] = git_info
+            entry['_git_signature'] = signature
@@ -14,6 +14,15 @@ import logging
 from src.exceptions import PluginError
 from src.logging_config import get_logger
 from src.error_aggregator import record_error
+from src.metrics import get_metrics_registry
+
+_metrics = get_metrics_registry()
+PLUGIN_UPDATE_SECONDS = _metrics.histogram(
+    'ledmatrix_plugin_update_seconds', 'Duration of plugin update() calls', ('plugin_id',))
+PLUGIN_DISPLAY_SECONDS = _metrics.histogram(
+    'ledmatrix_plugin_display_seconds', 'Duration of plugin display() calls', ('plugin_id',))
+PLUGIN_FAILURES = _metrics.counter(
+    'ledmatrix_plugin_failures_total', 'Failed plugin calls', ('plugin_id', 'operation', 'reason'))
 
 
 class TimeoutError(Exception):
@@ -119,6 +128,7 @@ class PluginExecutor:
                 plugin_id=plugin_id
             )
             duration = time.time() - start_time
+            PLUGIN_UPDATE_SECONDS.labels(plugin_id).observe(duration)
             
             if duration > 5.0:  # Warn if update takes more than 5 seconds
                 self.logger.warning(
@@ -130,11 +140,14 @@ class PluginExecutor:
             return True
         except TimeoutError:
             self.logger.error("Plugin %s update() timed out", plugin_id)
+            PLUGIN_FAILURES.labels(plugin_id, 'update', 'timeout').inc()
             return False
         except PluginError:
             # Already logged and recorded in execute_with_timeout
+            PLUGIN_FAILURES.labels(plugin_id, 'update', 'error').inc()
             return False
         except Exception as e:
+            PLUGIN_FAILURES.labels(plugin_id, 'update', 'error').inc()
             self.logger.error(
                 "Unexpected error executing update() for plugin %s: %s",
                 plugin_id,
@@ -188,6 +201,7 @@ class PluginExecutor:
                 )
             
             duration = time.time() - start_time
+            PLUGIN_DISPLAY_SECONDS.labels(plugin_id).observe(duration)
             
             if duration > 2.0:  # Warn if display takes more than 2 seconds
                 self.logger.warning(
@@ -206,11 +220,14 @@ class PluginExecutor:
             return True
         except TimeoutError:
             self.logger.error("Plugin %s display() timed out", plugin_id)
+            PLUGIN_FAILURES.labels(plugin_id, 'display', 'timeout').inc()
             return False
         except PluginError:
             # Already logged and recorded in execute_with_timeout
+            PLUGIN_FAILURES.labels(plugin_id, 'display', 'error').inc()
             return False
         except Exception as e:
+            PLUGIN_FAILURES.labels(plugin_id, 'display', 'error').inc()
             self.logger.error(
                 "Unexpected error executing display() for plugin %s: %s",
                 plugin_id,
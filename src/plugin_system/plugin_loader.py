@@ -17,6 +17,7 @@ import logging
 
 from src.exceptions import PluginError
 from src.logging_config import get_logger
+from src.startup_profiler import get_startup_profiler
 from src.common.permission_utils import (
     ensure_file_permissions,
     get_plugin_file_mode
@@ -522,13 +523,17 @@ class PluginLoader:
         Raises:
             PluginError: If loading fails
         """
+        profiler = get_startup_profiler()
+
         # Install dependencies if needed
         if install_deps:
-            self.install_dependencies(plugin_dir, plugin_id)
+            with profiler.plugin_step(plugin_id, 'dependencies'):
+                self.install_dependencies(plugin_dir, plugin_id)
         
         # Load module
         entry_point = manifest.get('entry_point', 'manager.py')
-        module = self.load_module(plugin_id, plugin_dir, entry_point)
+        with profiler.plugin_step(plugin_id, 'import'):
+            module = self.load_module(plugin_id, plugin_dir, entry_point)
         if module is None:
             raise PluginError(f"Failed to load module for plugin {plugin_id}", plugin_id=plugin_id)
         
@@ -540,14 +545,15 @@ class PluginLoader:
         plugin_class = self.get_plugin_class(plugin_id, module, class_name)
         
         # Instantiate plugin
-        plugin_instance = self.instantiate_plugin(
-            plugin_id,
-            plugin_class,
-            config,
-            display_manager,
-            cache_manager,
-            plugin_manager
-        )
+        with profiler.plugin_step(plugin_id, 'instantiate'):
+            plugin_instance = self.instantiate_plugin(
+                plugin_id,
+                plugin_class,
+                config,
+                display_manager,
+                cache_manager,
+                plugin_manager
+            )
         
         return (plugin_instance, module)
 
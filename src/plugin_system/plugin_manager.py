@@ -16,8 +16,9 @@ import subprocess
 import time
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 import logging
+from src.event_bus import EventType, publish_event
 from src.exceptions import PluginError
 from src.logging_config import get_logger
 from src.plugin_system.plugin_loader import PluginLoader
@@ -84,6 +85,8 @@ class PluginManager:
         self.plugin_manifests: Dict[str, Dict[str, Any]] = {}
         self.plugin_modules: Dict[str, Any] = {}
         self.plugin_last_update: Dict[str, float] = {}
+        # Plugins whose scheduled updates run in the update worker process
+        self.delegated_update_plugins: Set[str] = set()
         
         # Health tracking (optional, set by display_controller if available)
         self.health_tracker = None
@@ -312,8 +315,8 @@ class PluginManager:
             
             # Get plugin config
             if self.config_manager:
-                full_config = self.config_manager.load_config()
-                config = full_config.get(plugin_id, {})
+                # Per-plugin copy from the shared snapshot (no re-read per plugin)
+                config = self.config_manager.get_plugin_config(plugin_id)
             else:
                 config = {}
             
@@ -623,7 +626,7 @@ class PluginManager:
 
         return None
 
-    def _get_plugin_update_interval(self, plugin_id: str, plugin_instance: Any) -> Optional[float]:
+    def get_plugin_update_interval(self, plugin_id: str, plugin_instance: Any) -> Optional[float]:
         """
         Get the update interval for a plugin.
         
@@ -677,6 +680,9 @@ class PluginManager:
             if not hasattr(plugin_instance, "update"):
                 continue
 
+            if plugin_id in self.delegated_update_plugins:
+                continue
+
             # Check circuit breaker before attempting update
             if self.health_tracker and self.health_tracker.should_skip_plugin(plugin_id):
                 continue
@@ -685,7 +691,7 @@ class PluginManager:
             if not self.state_manager.can_execute(plugin_id):
                 continue
 
-            interval = self._get_plugin_update_interval(plugin_id, plugin_instance)
+            interval = self.get_plugin_update_interval(plugin_id, plugin_instance)
             if interval is None:
                 continue
 
@@ -717,6 +723,8 @@ class PluginManager:
                         # Record success
                         if self.health_tracker:
                             self.health_tracker.record_success(plugin_id)
+                        # Live content can only change when data changes
+                        publish_event(EventType.PLUGIN_UPDATED, source=plugin_id)
                     else:
                         # Execution failed (timeout or error)
                         self.state_manager.set_state(plugin_id, PluginState.ERROR)
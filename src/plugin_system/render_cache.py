@@ -0,0 +1,174 @@
+"""
+Render Cache
+
+Memoizes rendered frames so display() can skip drawing when nothing visible
+has changed. A plugin declares a *render key* - typically its data version,
+the current mode and, for clock-driven content, the current minute - and the
+frame rendered for that key is reused until the key changes.
+
+Opt in with the ``memoize_render`` decorator:
+
+    class MyPlugin(BasePlugin):
+        @memoize_render(lambda self: (self.data_version, self.mode))
+        def _render_frame(self) -> Image.Image:
+            ...
+
+        def update(self):
+            self.data = fetch()
+            self.bump_data_version()
+
+Render methods either return a PIL image (cached and handed back as a copy)
+or, with ``present=True``, draw straight into ``display_manager.image`` and
+push it; on a hit the cached frame is pasted and pushed without calling the
+drawing code.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+
+class RenderCache:
+    """Small per-instance LRU of rendered frames with hit/miss counters."""
+
+    def __init__(self, max_entries: int = 8) -> None:
+        """
+        Initialize the render cache.
+
+        Args:
+            max_entries: Maximum number of frames kept (least recently used
+                frames are evicted first)
+        """
+        self.max_entries = max(1, max_entries)
+        self._frames: "OrderedDict[Tuple[str, Hashable], Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._skip = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, Hashable]) -> Optional[Image.Image]:
+        """Return the cached frame for a key (counts a hit or miss)."""
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+    def put(self, key: Tuple[str, Hashable], frame: Image.Image) -> None:
+        """Store a frame, evicting the least recently used one if full."""
+        with self._lock:
+            self._frames[key] = frame
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+
+    def skip_current(self) -> None:
+        """Don't cache the frame currently being rendered (e.g. an error frame)."""
+        self._skip = True
+
+    def invalidate(self) -> None:
+        """Drop all cached frames (counters are kept)."""
+        with self._lock:
+            self._frames.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and cached frame count
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._frames),
+            }
+
+
+def get_render_cache(owner: Any) -> RenderCache:
+    """Return the render cache attached to an object, creating it on first use."""
+    cache = getattr(owner, '_render_cache', None)
+    if cache is None:
+        cache = RenderCache()
+        owner._render_cache = cache
+    return cache
+
+
+def skip_render_cache(owner: Any) -> None:
+    """
+    Mark the frame being rendered by ``owner`` as uncacheable.
+
+    Call from inside a memoized render method when the result is transient
+    (a loading or error frame) and should be redrawn next time.
+    """
+    get_render_cache(owner).skip_current()
+
+
+def memoize_render(
+    key: Callable[..., Optional[Hashable]],
+    present: bool = False
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that caches a render method's frame per render key.
+
+    Args:
+        key: Called with the same arguments as the render method; returns a
+            hashable render key, or None to render without caching
+        present: False if the method returns an image; True if it draws into
+            ``self.display_manager.image`` and pushes it itself
+
+    Returns:
+        Decorator for the render method
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            render_key = key(self, *args, **kwargs)
+            if render_key is None:
+                return func(self, *args, **kwargs)
+
+            cache = get_render_cache(self)
+            cache_key = (name, render_key)
+            frame = cache.get(cache_key)
+            if frame is not None:
+                if not present:
+                    return frame.copy()
+                display_manager = self.display_manager
+                if display_manager.image.size == frame.size:
+                    display_manager.image.paste(frame, (0, 0))
+                else:
+                    display_manager.image = frame.copy()
+                    display_manager.draw = ImageDraw.Draw(display_manager.image)
+                display_manager.update_display()
+                return None
+
+            cache._skip = False
+            result = func(self, *args, **kwargs)
+            if cache._skip:
+                cache._skip = False
+                return result
+
+            if not present:
+                if isinstance(result, Image.Image):
+                    cache.put(cache_key, result.copy())
+                return result
+
+            image = getattr(self.display_manager, 'image', None)
+            if isinstance(image, Image.Image):
+                cache.put(cache_key, image.copy())
+            return result
+
+        return wrapper
+
+    return decorator
@@ -20,6 +20,8 @@ from typing import List, Dict, Optional, Any
 import logging
 
 from src.common.permission_utils import sudo_remove_directory
+from src.plugin_system.git_metadata import read_git_info
+from src.plugin_system.store_metadata import StoreMetadataCache
 
 try:
     import jsonschema
@@ -40,23 +42,29 @@ class PluginStoreManager:
     
     REGISTRY_URL = "https://raw.githubusercontent.com/ChuckBuilds/ledmatrix-plugins/main/plugins.json"
     
-    def __init__(self, plugins_dir: str = "plugins"):
+    def __init__(self, plugins_dir: str = "plugins", metadata_cache_file: Optional[str] = None,
+                 max_workers: int = 6):
         """
         Initialize the plugin store manager.
 
         Args:
             plugins_dir: Directory where plugins are installed
+            metadata_cache_file: JSON file for persisting GitHub metadata and
+                                 ETags across restarts (None = memory only)
+            max_workers: Maximum concurrent GitHub metadata requests
         """
         self.plugins_dir = Path(plugins_dir)
         self.logger = logging.getLogger(__name__)
-        self.registry_cache = None
-        self.registry_cache_time = None  # Timestamp of when registry was cached
-        self.github_cache = {}  # Cache for GitHub API responses
-        self.cache_timeout = 3600  # 1 hour cache timeout
+        # Registry, repo info, commit and manifest responses share one
+        # conditional (ETag) cache; these are their revalidation intervals
+        self._metadata = StoreMetadataCache(
+            cache_file=metadata_cache_file,
+            max_workers=max_workers,
+            logger=self.logger
+        )
+        self.cache_timeout = 3600  # 1 hour for repo info (stars, default branch)
         self.registry_cache_timeout = 300  # 5 minutes for registry cache
-        self.commit_info_cache = {}  # Cache for latest commit info: {key: (timestamp, data)}
         self.commit_cache_timeout = 300  # 5 minutes (same as registry)
-        self.manifest_cache = {}  # Cache for GitHub manifest fetches: {key: (timestamp, data)}
         self.manifest_cache_timeout = 300  # 5 minutes
         self.github_token = self._load_github_token()
         self._token_validation_cache = {}  # Cache for token validation results: {token: (is_valid, timestamp, error_message)}
@@ -276,7 +284,17 @@ class PluginStoreManager:
             self.logger.debug(f"Error validating manifest schema for {plugin_id}: {e}")
             return []
 
-    def _get_github_repo_info(self, repo_url: str) -> Dict[str, Any]:
+    def _github_api_headers(self) -> Dict[str, str]:
+        """Headers for GitHub REST API requests (with auth if a token is configured)."""
+        headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'LEDMatrix-Plugin-Manager/1.0'
+        }
+        if self.github_token:
+            headers['Authorization'] = f'token {self.github_token}'
+        return headers
+
+    def _get_github_repo_info(self, repo_url: str, allow_stale: bool = False) -> Dict[str, Any]:
         """Fetch GitHub repository information (stars, etc.)"""
         # Extract owner/repo from URL
         try:
@@ -289,30 +307,17 @@ class PluginStoreManager:
                     if repo.endswith('.git'):
                         repo = repo[:-4]
 
-                    cache_key = f"{owner}/{repo}"
-
-                    # Check cache first
-                    if cache_key in self.github_cache:
-                        cached_time, cached_data = self.github_cache[cache_key]
-                        if time.time() - cached_time < self.cache_timeout:
-                            return cached_data
-
-                    # Fetch from GitHub API
                     api_url = f"https://api.github.com/repos/{owner}/{repo}"
-                    headers = {
-                        'Accept': 'application/vnd.github.v3+json',
-                        'User-Agent': 'LEDMatrix-Plugin-Manager/1.0'
-                    }
-                    
-                    # Add authentication if token is available
-                    if self.github_token:
-                        headers['Authorization'] = f'token {self.github_token}'
-
-                    response = requests.get(api_url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
+                    response = self._metadata.get_json(
+                        api_url,
+                        headers=self._github_api_headers(),
+                        ttl=self.cache_timeout,
+                        allow_stale=allow_stale
+                    )
+                    if response.status == 200 and isinstance(response.data, dict):
+                        data = response.data
                         pushed_at = data.get('pushed_at', '') or data.get('updated_at', '')
-                        repo_info = {
+                        return {
                             'stars': data.get('stargazers_count', 0),
                             'forks': data.get('forks_count', 0),
                             'open_issues': data.get('open_issues_count', 0),
@@ -323,11 +328,10 @@ class PluginStoreManager:
                             'license': data.get('license', {}).get('name', '') if data.get('license') else '',
                             'default_branch': data.get('default_branch', 'main')
                         }
-
-                        # Cache the result
-                        self.github_cache[cache_key] = (time.time(), repo_info)
-                        return repo_info
-                    elif response.status_code == 403:
+                    elif response.from_cache:
+                        # Failure already reported when it was fetched
+                        pass
+                    elif response.status == 403:
                         # Rate limit or authentication issue
                         if not self.github_token:
                             self.logger.warning(
@@ -341,7 +345,7 @@ class PluginStoreManager:
                                 f"Your token may have insufficient permissions or rate limit exceeded."
                             )
                     else:
-                        self.logger.warning(f"GitHub API request failed: {response.status_code} for {api_url}")
+                        self.logger.warning(f"GitHub API request failed: {response.status} for {api_url}")
 
             return {
                 'stars': 0,
@@ -424,9 +428,9 @@ class PluginStoreManager:
             # Try each URL
             for url in registry_urls:
                 try:
-                    response = self._http_get_with_retries(url, timeout=10)
-                    if response.status_code == 200:
-                        registry = response.json()
+                    response = self._metadata.get_json(url, ttl=self.registry_cache_timeout, allow_stale=True)
+                    if response.status == 200:
+                        registry = response.data
                         # Validate it looks like a registry
                         if isinstance(registry, dict) and 'plugins' in registry:
                             self.logger.info(f"Successfully fetched registry from {url}")
@@ -442,37 +446,32 @@ class PluginStoreManager:
             self.logger.error(f"Error fetching registry from URL: {e}", exc_info=True)
             return None
     
-    def fetch_registry(self, force_refresh: bool = False) -> Dict:
+    def fetch_registry(self, force_refresh: bool = False, allow_stale: bool = False) -> Dict:
         """
         Fetch the plugin registry from GitHub.
         
         Args:
             force_refresh: Force refresh even if cached
+            allow_stale: Return an expired cached registry immediately and
+                         refresh it in the background
             
         Returns:
             Registry data with list of available plugins
         """
-        # Check if cache is still valid (within timeout)
-        current_time = time.time()
-        if (self.registry_cache and self.registry_cache_time and 
-            not force_refresh and 
-            (current_time - self.registry_cache_time) < self.registry_cache_timeout):
-            return self.registry_cache
-        
-        try:
-            self.logger.info(f"Fetching plugin registry from {self.REGISTRY_URL}")
-            response = self._http_get_with_retries(self.REGISTRY_URL, timeout=10)
-            response.raise_for_status()
-            self.registry_cache = response.json()
-            self.registry_cache_time = current_time
-            self.logger.info(f"Fetched registry with {len(self.registry_cache.get('plugins', []))} plugins")
-            return self.registry_cache
-        except requests.RequestException as e:
-            self.logger.error(f"Error fetching registry: {e}")
-            return {"plugins": []}
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Error parsing registry JSON: {e}")
-            return {"plugins": []}
+        response = self._metadata.get_json(
+            self.REGISTRY_URL,
+            ttl=self.registry_cache_timeout,
+            force_refresh=force_refresh,
+            allow_stale=allow_stale
+        )
+        if response.status == 200 and isinstance(response.data, dict):
+            if not response.from_cache:
+                self.logger.info(f"Fetched registry with {len(response.data.get('plugins', []))} plugins")
+            return response.data
+
+        if not response.from_cache:
+            self.logger.error(f"Error fetching registry from {self.REGISTRY_URL}: status {response.status}")
+        return {"plugins": []}
     
     def search_plugins(self, query: str = "", category: str = "", tags: List[str] = None, fetch_commit_info: bool = True, include_saved_repos: bool = True, saved_repositories_manager = None) -> List[Dict]:
         """
@@ -482,6 +481,10 @@ class PluginStoreManager:
         stars and last commit timestamps. The registry provides descriptive
         information (name, description, repo URL, etc.).
 
+        Cached metadata is returned immediately even when expired (it is
+        revalidated in the background); anything not cached yet is fetched
+        concurrently.
+
         Args:
             query: Search query string (searches name, description, id)
             category: Filter by category (e.g., 'sports', 'weather', 'time')
@@ -494,9 +497,9 @@ class PluginStoreManager:
         if tags is None:
             tags = []
 
-        # Fetch from official registry
-        registry = self.fetch_registry()
-        plugins = registry.get('plugins', []) or []
+        # Fetch from official registry (copy the list; the registry is cached)
+        registry = self.fetch_registry(allow_stale=True)
+        plugins = list(registry.get('plugins', []) or [])
         
         # Also fetch from saved repositories if enabled
         if include_saved_repos and saved_repositories_manager:
@@ -510,14 +513,15 @@ class PluginStoreManager:
                             custom_plugins = custom_registry.get('plugins', []) or []
                             # Mark these as from custom repository
                             for plugin in custom_plugins:
+                                plugin = dict(plugin)
                                 plugin['_source'] = 'custom_repository'
                                 plugin['_repository_url'] = repo_url
                                 plugin['_repository_name'] = repo_info.get('name', repo_url)
-                            plugins.extend(custom_plugins)
+                                plugins.append(plugin)
                     except Exception as e:
                         self.logger.warning(f"Failed to fetch plugins from saved repository {repo_url}: {e}")
 
-        results = []
+        matches = []
         for plugin in plugins:
             # Category filter
             if category and plugin.get('category') != category:
@@ -540,47 +544,58 @@ class PluginStoreManager:
                 if query_lower not in searchable_text:
                     continue
 
-            # Enhance plugin data with GitHub metadata
-            enhanced_plugin = plugin.copy()
-
-            # Get real GitHub stars
-            repo_url = plugin.get('repo', '')
-            if repo_url:
-                github_info = self._get_github_repo_info(repo_url)
-                enhanced_plugin['stars'] = github_info.get('stars', plugin.get('stars', 0))
-                enhanced_plugin['default_branch'] = github_info.get('default_branch', plugin.get('branch', 'main'))
-                enhanced_plugin['last_updated_iso'] = github_info.get('last_commit_iso')
-                enhanced_plugin['last_updated'] = github_info.get('last_commit_date')
-
-                if fetch_commit_info:
-                    branch = plugin.get('branch') or github_info.get('default_branch', 'main')
-
-                    commit_info = self._get_latest_commit_info(repo_url, branch)
-                    if commit_info:
-                        enhanced_plugin['last_commit'] = commit_info.get('short_sha')
-                        enhanced_plugin['last_commit_sha'] = commit_info.get('sha')
-                        enhanced_plugin['last_updated'] = commit_info.get('date') or enhanced_plugin.get('last_updated')
-                        enhanced_plugin['last_updated_iso'] = commit_info.get('date_iso') or enhanced_plugin.get('last_updated_iso')
-                        enhanced_plugin['last_commit_message'] = commit_info.get('message')
-                        enhanced_plugin['last_commit_author'] = commit_info.get('author')
-                        enhanced_plugin['branch'] = commit_info.get('branch', branch)
-                        enhanced_plugin['last_commit_branch'] = commit_info.get('branch')
-
-                    # Fetch manifest from GitHub for additional metadata (description, etc.)
-                    plugin_subpath = plugin.get('plugin_path', '')
-                    manifest_rel = f"{plugin_subpath}/manifest.json" if plugin_subpath else "manifest.json"
-                    github_manifest = self._fetch_manifest_from_github(repo_url, branch, manifest_rel)
-                    if github_manifest:
-                        if 'last_updated' in github_manifest and not enhanced_plugin.get('last_updated'):
-                            enhanced_plugin['last_updated'] = github_manifest['last_updated']
-                        if 'description' in github_manifest:
-                            enhanced_plugin['description'] = github_manifest['description']
-
-            results.append(enhanced_plugin)
+            matches.append(plugin)
 
+        # Enhance plugin data with GitHub metadata, one worker per plugin
+        results = self._metadata.map(
+            lambda plugin: self._enhance_with_github_metadata(plugin, fetch_commit_info),
+            matches
+        )
+        self._metadata.flush()
         return results
+
+    def _enhance_with_github_metadata(self, plugin: Dict[str, Any], fetch_commit_info: bool) -> Dict[str, Any]:
+        """Return a copy of a registry entry enriched with (possibly cached) GitHub metadata."""
+        enhanced_plugin = plugin.copy()
+
+        # Get real GitHub stars
+        repo_url = plugin.get('repo', '')
+        if not repo_url:
+            return enhanced_plugin
+
+        github_info = self._get_github_repo_info(repo_url, allow_stale=True)
+        enhanced_plugin['stars'] = github_info.get('stars', plugin.get('stars', 0))
+        enhanced_plugin['default_branch'] = github_info.get('default_branch', plugin.get('branch', 'main'))
+        enhanced_plugin['last_updated_iso'] = github_info.get('last_commit_iso')
+        enhanced_plugin['last_updated'] = github_info.get('last_commit_date')
+
+        if fetch_commit_info:
+            branch = plugin.get('branch') or github_info.get('default_branch', 'main')
+
+            commit_info = self._get_latest_commit_info(repo_url, branch, allow_stale=True)
+            if commit_info:
+                enhanced_plugin['last_commit'] = commit_info.get('short_sha')
+                enhanced_plugin['last_commit_sha'] = commit_info.get('sha')
+                enhanced_plugin['last_updated'] = commit_info.get('date') or enhanced_plugin.get('last_updated')
+                enhanced_plugin['last_updated_iso'] = commit_info.get('date_iso') or enhanced_plugin.get('last_updated_iso')
+                enhanced_plugin['last_commit_message'] = commit_info.get('message')
+                enhanced_plugin['last_commit_author'] = commit_info.get('author')
+                enhanced_plugin['branch'] = commit_info.get('branch', branch)
+                enhanced_plugin['last_commit_branch'] = commit_info.get('branch')
+
+            # Fetch manifest from GitHub for additional metadata (description, etc.)
+            plugin_subpath = plugin.get('plugin_path', '')
+            manifest_rel = f"{plugin_subpath}/manifest.json" if plugin_subpath else "manifest.json"
+            github_manifest = self._fetch_manifest_from_github(repo_url, branch, manifest_rel, allow_stale=True)
+            if github_manifest:
+                if 'last_updated' in github_manifest and not enhanced_plugin.get('last_updated'):
+                    enhanced_plugin['last_updated'] = github_manifest['last_updated']
+                if 'description' in github_manifest:
+                    enhanced_plugin['description'] = github_manifest['description']
+
+        return enhanced_plugin
     
-    def _fetch_manifest_from_github(self, repo_url: str, branch: str = "master", manifest_path: str = "manifest.json", force_refresh: bool = False) -> Optional[Dict]:
+    def _fetch_manifest_from_github(self, repo_url: str, branch: str = "master", manifest_path: str = "manifest.json", force_refresh: bool = False, allow_stale: bool = False) -> Optional[Dict]:
         """
         Fetch manifest.json directly from a GitHub repository.
 
@@ -590,6 +605,7 @@ class PluginStoreManager:
             manifest_path: Path to manifest within the repo (default: manifest.json).
                           For monorepo plugins this will be e.g. "plugins/football-scoreboard/manifest.json".
             force_refresh: If True, bypass the cache.
+            allow_stale: If True, serve an expired cached manifest and refresh it in the background.
 
         Returns:
             Manifest data or None if not found
@@ -608,38 +624,26 @@ class PluginStoreManager:
                     owner = parts[-2]
                     repo = parts[-1]
 
-                    # Check cache first
-                    cache_key = f"{owner}/{repo}:{branch}:{manifest_path}"
-                    if not force_refresh and cache_key in self.manifest_cache:
-                        cached_time, cached_data = self.manifest_cache[cache_key]
-                        if time.time() - cached_time < self.manifest_cache_timeout:
-                            return cached_data
-
-                    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{manifest_path}"
-
-                    response = self._http_get_with_retries(raw_url, timeout=10)
-                    if response.status_code == 200:
-                        result = response.json()
-                        self.manifest_cache[cache_key] = (time.time(), result)
-                        return result
-                    elif response.status_code == 404:
-                        # Try main branch instead
-                        if branch != "main":
-                            raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{manifest_path}"
-                            response = self._http_get_with_retries(raw_url, timeout=10)
-                            if response.status_code == 200:
-                                result = response.json()
-                                self.manifest_cache[cache_key] = (time.time(), result)
-                                return result
-
-                    # Cache negative result
-                    self.manifest_cache[cache_key] = (time.time(), None)
+                    branches = [branch] if branch == "main" else [branch, "main"]
+                    for branch_name in branches:
+                        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch_name}/{manifest_path}"
+                        response = self._metadata.get_json(
+                            raw_url,
+                            ttl=self.manifest_cache_timeout,
+                            force_refresh=force_refresh,
+                            allow_stale=allow_stale
+                        )
+                        if response.status == 200:
+                            return response.data
+                        if response.status != 404:
+                            # Only a missing file falls back to the main branch
+                            break
         except Exception as e:
             self.logger.debug(f"Could not fetch manifest from GitHub for {repo_url}: {e}")
 
         return None
     
-    def _get_latest_commit_info(self, repo_url: str, branch: str = "main", force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+    def _get_latest_commit_info(self, repo_url: str, branch: str = "main", force_refresh: bool = False, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
         """Return metadata about the latest commit on the given branch."""
         try:
             if 'github.com' not in repo_url:
@@ -656,36 +660,28 @@ class PluginStoreManager:
             owner = parts[-2]
             repo = parts[-1]
 
-            # Check cache first
-            cache_key = f"{owner}/{repo}:{branch}"
-            if not force_refresh and cache_key in self.commit_info_cache:
-                cached_time, cached_data = self.commit_info_cache[cache_key]
-                if time.time() - cached_time < self.commit_cache_timeout:
-                    return cached_data
-
             branches_to_try = self._distinct_sequence([branch, 'main', 'master'])
+            headers = self._github_api_headers()
 
-            headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'LEDMatrix-Plugin-Manager/1.0'
-            }
-
-            if self.github_token:
-                headers['Authorization'] = f'token {self.github_token}'
-
-            last_error = None
+            last_status = None
             for branch_name in branches_to_try:
                 api_url = f"https://api.github.com/repos/{owner}/{repo}/commits/{branch_name}"
-                response = requests.get(api_url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    commit_data = response.json()
+                response = self._metadata.get_json(
+                    api_url,
+                    headers=headers,
+                    ttl=self.commit_cache_timeout,
+                    force_refresh=force_refresh,
+                    allow_stale=allow_stale
+                )
+                if response.status == 200 and isinstance(response.data, dict):
+                    commit_data = response.data
                     commit_sha_full = commit_data.get('sha', '')
                     commit_sha_short = commit_sha_full[:7] if commit_sha_full else ''
                     commit_meta = commit_data.get('commit', {})
                     commit_author = commit_meta.get('author', {})
                     commit_date_iso = commit_author.get('date', '')
 
-                    result = {
+                    return {
                         'branch': branch_name,
                         'sha': commit_sha_full,
                         'short_sha': commit_sha_short,
@@ -694,27 +690,19 @@ class PluginStoreManager:
                         'author': commit_author.get('name', ''),
                         'message': commit_meta.get('message', ''),
                     }
-                    self.commit_info_cache[cache_key] = (time.time(), result)
-                    return result
 
-                if response.status_code == 403 and not self.github_token:
+                if response.status == 403 and not self.github_token:
                     self.logger.debug("GitHub commit API rate limited (403). Consider adding a token.")
-                    last_error = response.text
-                else:
-                    last_error = response.text
-
-            if last_error:
-                self.logger.debug(f"Unable to fetch commit info for {repo_url}: {last_error}")
+                last_status = response.status
 
-            # Cache negative result to avoid repeated failing calls
-            self.commit_info_cache[cache_key] = (time.time(), None)
+            if last_status is not None:
+                self.logger.debug(f"Unable to fetch commit info for {repo_url}: status {last_status}")
 
         except Exception as e:
             self.logger.debug(f"Error fetching latest commit metadata for {repo_url}: {e}")
 
         return None
-    
-    
+
     def get_plugin_info(self, plugin_id: str, fetch_latest_from_github: bool = True, force_refresh: bool = False) -> Optional[Dict]:
         """
         Get detailed information about a plugin from the registry.
@@ -1561,75 +1549,22 @@ class PluginStoreManager:
             return False
 
     def _get_local_git_info(self, plugin_path: Path) -> Optional[Dict[str, str]]:
-        """Return local git branch, commit hash, and commit date if the plugin is a git checkout."""
-        git_dir = plugin_path / '.git'
-        if not git_dir.exists():
-            return None
+        """Return local git branch, commit hash, and commit date if the plugin is a git checkout.
 
+        Reads the ``.git`` files directly rather than running git, so listing
+        many plugins doesn't spawn several processes per plugin.
+        """
         try:
-            sha_result = subprocess.run(
-                ['git', '-C', str(plugin_path), 'rev-parse', 'HEAD'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=True
-            )
-            sha = sha_result.stdout.strip()
-
-            branch_result = subprocess.run(
-                ['git', '-C', str(plugin_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=True
-            )
-            branch = branch_result.stdout.strip()
-
-            if branch == 'HEAD':
-                branch = ''
-
-            # Get remote URL
-            remote_url_result = subprocess.run(
-                ['git', '-C', str(plugin_path), 'config', '--get', 'remote.origin.url'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False
-            )
-            remote_url = remote_url_result.stdout.strip() if remote_url_result.returncode == 0 else None
-
-            # Get commit date in ISO format
-            date_result = subprocess.run(
-                ['git', '-C', str(plugin_path), 'log', '-1', '--format=%cI', 'HEAD'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=True
-            )
-            commit_date_iso = date_result.stdout.strip()
-
-            result = {
-                'sha': sha,
-                'short_sha': sha[:7] if sha else '',
-                'branch': branch
-            }
-            
-            # Add remote URL if available
-            if remote_url:
-                result['remote_url'] = remote_url
-
-            # Add commit date if available
-            if commit_date_iso:
-                result['date_iso'] = commit_date_iso
-                result['date'] = self._iso_to_date(commit_date_iso)
-
-            return result
-        except subprocess.CalledProcessError as err:
+            result = read_git_info(plugin_path)
+        except (OSError, ValueError) as err:
             self.logger.debug(f"Failed to read git info for {plugin_path.name}: {err}")
-        except subprocess.TimeoutExpired:
-            self.logger.debug(f"Timed out reading git info for {plugin_path.name}")
+            return None
+        if result is None:
+            return None
 
-        return None
+        if result.get('date_iso'):
+            result['date'] = self._iso_to_date(result['date_iso'])
+        return result
     
     def _safe_remove_directory(self, path: Path) -> bool:
         """
@@ -0,0 +1,279 @@
+"""
+Plugin Store Metadata Cache
+
+HTTP layer for the plugin store's GitHub metadata (registry JSON, repository
+info, latest commits and remote manifests):
+
+- One pooled ``requests.Session`` shared by a bounded worker pool, so the
+  store can fetch metadata for many plugins concurrently.
+- Conditional requests: responses are stored with their ``ETag`` /
+  ``Last-Modified`` validators and revalidated with ``If-None-Match`` /
+  ``If-Modified-Since``. An unchanged resource costs a 304, which GitHub
+  does not count against the API rate limit.
+- Entries are persisted to a JSON file, so validators and data survive a
+  restart of the web interface.
+- Stale-while-revalidate: callers that pass ``allow_stale=True`` get an
+  expired entry back immediately while it is refreshed in the background.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class MetadataResponse(NamedTuple):
+    """Result of a metadata lookup."""
+    status: Optional[int]  # HTTP status of the stored response (None on network failure)
+    data: Any  # Parsed JSON body (None unless status is 200)
+    from_cache: bool  # True if no request was needed to answer
+
+
+class StoreMetadataCache:
+    """Concurrent, conditional, disk-persisted JSON fetcher."""
+
+    SAVE_INTERVAL = 5.0  # Minimum seconds between automatic saves
+    MAX_ENTRY_AGE = 7 * 24 * 3600  # Entries older than this are dropped on load
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        max_workers: int = 6,
+        timeout: float = 10,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the metadata cache.
+
+        Args:
+            cache_file: JSON file to persist entries to (None = memory only)
+            max_workers: Maximum concurrent requests
+            timeout: Request timeout in seconds
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        retry = Retry(total=2, connect=2, read=1, status=0, backoff_factor=0.75)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._refreshing: Set[str] = set()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="store-metadata")
+        self._dirty = False
+        self._last_save = 0.0
+
+        self.stats = {'hits': 0, 'not_modified': 0, 'fetched': 0, 'errors': 0}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_json(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: float = 300,
+        force_refresh: bool = False,
+        allow_stale: bool = False
+    ) -> MetadataResponse:
+        """
+        Return the JSON body for a URL, using the cache where possible.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers (e.g. Accept, Authorization)
+            ttl: Seconds an entry is served without revalidation
+            force_refresh: Revalidate now even if the entry is fresh
+            allow_stale: Return an expired entry immediately and revalidate
+                it in the background
+
+        Returns:
+            MetadataResponse for the URL
+        """
+        entry = self._get_entry(url)
+        if entry is not None and not force_refresh:
+            if time.time() - entry['fetched_at'] < ttl:
+                self.stats['hits'] += 1
+                return self._response(entry, from_cache=True)
+            if allow_stale:
+                self.stats['hits'] += 1
+                self.refresh_async(url, headers, ttl)
+                return self._response(entry, from_cache=True)
+
+        with self._url_lock(url):
+            # Another thread may have refreshed this URL while we waited
+            entry = self._get_entry(url)
+            if entry is not None and not force_refresh and time.time() - entry['fetched_at'] < ttl:
+                return self._response(entry, from_cache=True)
+            return self._fetch(url, headers, entry)
+
+    def refresh_async(self, url: str, headers: Optional[Dict[str, str]] = None, ttl: float = 300) -> bool:
+        """
+        Revalidate a URL in the background.
+
+        Returns:
+            True if a refresh was scheduled (False if one is already running)
+        """
+        with self._lock:
+            if url in self._refreshing:
+                return False
+            self._refreshing.add(url)
+
+        def _run():
+            try:
+                self.get_json(url, headers=headers, ttl=ttl, force_refresh=True)
+                self.flush()
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.debug(f"Background refresh failed for {url}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(url)
+
+        try:
+            self._executor.submit(_run)
+        except RuntimeError:
+            with self._lock:
+                self._refreshing.discard(url)
+            return False
+        return True
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Run ``func`` over items on the worker pool, preserving order."""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._executor.map(func, items))
+
+    def flush(self) -> None:
+        """Persist entries to disk if anything changed."""
+        if self._dirty:
+            self._save()
+
+    def shutdown(self) -> None:
+        """Save entries and stop the worker pool."""
+        self.flush()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(url)
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            lock = self._url_locks.get(url)
+            if lock is None:
+                lock = self._url_locks[url] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _response(entry: Dict[str, Any], from_cache: bool) -> MetadataResponse:
+        return MetadataResponse(entry.get('status'), entry.get('data'), from_cache)
+
+    def _fetch(self, url: str, headers: Optional[Dict[str, str]], entry: Optional[Dict[str, Any]]) -> MetadataResponse:
+        request_headers = dict(headers or {})
+        if entry is not None and entry.get('status') == 200:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self.session.get(url, headers=request_headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.stats['errors'] += 1
+            self.logger.debug(f"Metadata request failed for {url}: {e}")
+            if entry is not None:
+                return self._response(entry, from_cache=True)
+            return MetadataResponse(None, None, False)
+
+        now = time.time()
+        if response.status_code == 304 and entry is not None:
+            self.stats['not_modified'] += 1
+            updated = dict(entry, fetched_at=now)
+        elif response.status_code == 200:
+            self.stats['fetched'] += 1
+            try:
+                data = response.json()
+            except ValueError as e:
+                self.stats['errors'] += 1
+                self.logger.debug(f"Invalid JSON from {url}: {e}")
+                return self._response(entry, from_cache=True) if entry else MetadataResponse(200, None, False)
+            updated = {
+                'status': 200,
+                'data': data,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': now,
+            }
+        else:
+            self.stats['errors'] += 1
+            if entry is not None and entry.get('status') == 200:
+                # Keep serving the last good body; back off until the TTL expires
+                updated = dict(entry, fetched_at=now)
+            else:
+                updated = {'status': response.status_code, 'data': None, 'fetched_at': now}
+
+        with self._lock:
+            self._entries[url] = updated
+            self._dirty = True
+        if now - self._last_save >= self.SAVE_INTERVAL:
+            self._save()
+        return MetadataResponse(updated['status'], updated['data'], False)
+
+    def _load(self) -> None:
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable plugin store cache {self.cache_file}: {e}")
+            return
+
+        cutoff = time.time() - self.MAX_ENTRY_AGE
+        if isinstance(stored, dict):
+            self._entries = {
+                url: entry for url, entry in stored.items()
+                if isinstance(entry, dict) and entry.get('fetched_at', 0) >= cutoff
+            }
+
+    def _save(self) -> None:
+        if not self.cache_file:
+            self._dirty = False
+            return
+        with self._lock:
+            snapshot = dict(self._entries)
+            self._dirty = False
+            self._last_save = time.time()
+        tmp_path = self.cache_file.with_name(f"{self.cache_file.name}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not write plugin store cache {self.cache_file}: {e}")
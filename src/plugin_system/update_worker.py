@@ -0,0 +1,341 @@
+"""
+Plugin Update Worker
+
+Runs scheduled plugin update() calls in a separate process, so that heavy
+data work in a plugin (JSON parsing, image processing) no longer competes
+with frame composition for the display process's GIL.
+
+Plugins opt in by listing the attributes their update() sets in
+BasePlugin.UPDATE_SNAPSHOT_ATTRIBUTES. The worker loads its own instances
+of those plugins and runs their updates on schedule. After each successful
+update it pickles the listed attributes into a shared-memory slot and
+announces the slot over a pipe. The display process copies the snapshot
+onto its own plugin instance and returns the slot. Snapshots larger than a
+slot, or sent while every slot is in use, travel over the pipe instead.
+
+Pipe messages, worker to display process:
+    ('ready', [plugin_id, ...])
+    ('snapshot', plugin_id, updated_at, slot, length)
+    ('snapshot_inline', plugin_id, updated_at, payload)
+    ('failed', plugin_id, message)
+
+Display process to worker:
+    ('free', slot)
+    ('config', plugin_id, config)
+    ('stop',)
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+import signal
+import time
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_SLOT_SIZE = 1024 * 1024
+DEFAULT_SLOT_COUNT = 8
+# Longest the worker waits for messages before re-checking its schedule
+MAX_IDLE_SECONDS = 1.0
+STOP_TIMEOUT_SECONDS = 5.0
+
+
+def supports_update_snapshots(plugin: Any) -> bool:
+    """Whether a plugin's updates can run in the update worker."""
+    return bool(getattr(plugin, 'UPDATE_SNAPSHOT_ATTRIBUTES', ())) and hasattr(plugin, 'apply_update_snapshot')
+
+
+@dataclass
+class WorkerUpdates:
+    """Messages received from the update worker since the last receive()."""
+    ready: Optional[List[str]] = None  # Plugins the worker loaded (once, after startup)
+    snapshots: Dict[str, Tuple[float, Dict[str, Any]]] = field(default_factory=dict)  # Latest per plugin
+    failures: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class UpdateWorker:
+    """Display-process handle of the plugin update worker."""
+
+    def __init__(
+        self,
+        plugin_ids: Sequence[str],
+        plugins_dir: str,
+        config_path: Optional[str] = None,
+        secrets_path: Optional[str] = None,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        slot_count: int = DEFAULT_SLOT_COUNT
+    ) -> None:
+        """
+        Initialize the worker handle (start() launches the process).
+
+        Args:
+            plugin_ids: Plugins whose updates the worker runs
+            plugins_dir: Directory the worker discovers plugins in
+            config_path: Main config file (default: config/config.json)
+            secrets_path: Secrets config file (default: config/config_secrets.json)
+            slot_size: Size in bytes of each shared-memory snapshot slot
+            slot_count: Number of snapshot slots
+        """
+        self.plugin_ids = list(plugin_ids)
+        self.plugins_dir = str(plugins_dir)
+        self.config_path = config_path
+        self.secrets_path = secrets_path
+        self.slot_size = slot_size
+        self.slot_count = slot_count
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._conn: Optional[Connection] = None
+        self._process: Optional[BaseProcess] = None
+        self._closed = False
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running and reachable."""
+        return self._process is not None and not self._closed and self._process.is_alive()
+
+    def start(self) -> None:
+        """Create the shared-memory slots and launch the worker process."""
+        context = multiprocessing.get_context('spawn')
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slot_size * self.slot_count)
+        self._conn, child_conn = context.Pipe(duplex=True)
+        self._process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self._shm.name, self.slot_size, self.slot_count, self.plugin_ids,
+                  self.plugins_dir, self.config_path, self.secrets_path, logging.getLogger().level),
+            name='plugin-update-worker',
+            daemon=True
+        )
+        try:
+            self._process.start()
+        except Exception:
+            self.stop()
+            raise
+        finally:
+            child_conn.close()
+
+    def send_config(self, plugin_id: str, config: Dict[str, Any]) -> None:
+        """Forward a plugin's changed config to the worker's instance."""
+        self._send(('config', plugin_id, config))
+
+    def receive(self) -> WorkerUpdates:
+        """
+        Collect the worker's messages without blocking.
+
+        Returns:
+            Readiness, the newest snapshot per plugin and update failures
+        """
+        updates = WorkerUpdates()
+        if self._conn is None or self._closed:
+            return updates
+        try:
+            while self._conn.poll(0):
+                self._handle_message(self._conn.recv(), updates)
+        except (EOFError, OSError):
+            self._closed = True
+        return updates
+
+    def stop(self) -> None:
+        """Stop the worker process and release the shared memory."""
+        if self._process is not None and self._process.is_alive():
+            self._send(('stop',))
+            self._process.join(STOP_TIMEOUT_SECONDS)
+            if self._process.is_alive():
+                logger.warning("Plugin update worker did not stop in time; terminating it")
+                self._process.terminate()
+                self._process.join(1.0)
+        self._closed = True
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _send(self, message: Tuple) -> None:
+        if self._conn is None or self._closed:
+            return
+        try:
+            self._conn.send(message)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not send %s to the plugin update worker: %s", message[0], e)
+            self._closed = True
+
+    def _handle_message(self, message: Tuple, updates: WorkerUpdates) -> None:
+        kind = message[0]
+        if kind == 'ready':
+            updates.ready = list(message[1])
+        elif kind == 'snapshot':
+            _, plugin_id, updated_at, slot, length = message
+            buf = self._shm.buf if self._shm is not None else None
+            if buf is None:
+                return
+            offset = slot * self.slot_size
+            payload = bytes(buf[offset:offset + length])
+            self._send(('free', slot))
+            self._decode_snapshot(plugin_id, updated_at, payload, updates)
+        elif kind == 'snapshot_inline':
+            _, plugin_id, updated_at, payload = message
+            self._decode_snapshot(plugin_id, updated_at, payload, updates)
+        elif kind == 'failed':
+            updates.failures.append((message[1], message[2]))
+        else:
+            logger.warning("Unknown message from the plugin update worker: %r", kind)
+
+    @staticmethod
+    def _decode_snapshot(plugin_id: str, updated_at: float, payload: bytes, updates: WorkerUpdates) -> None:
+        try:
+            updates.snapshots[plugin_id] = (updated_at, pickle.loads(payload))
+        except Exception as e:  # pylint: disable=broad-except
+            updates.failures.append((plugin_id, f"Could not decode update snapshot: {e}"))
+
+
+def _worker_main(conn, shm_name: str, slot_size: int, slot_count: int, plugin_ids: List[str],
+                 plugins_dir: str, config_path: Optional[str], secrets_path: Optional[str],
+                 log_level: int) -> None:
+    """Entry point of the worker process."""
+    from src.frame_recorder import RECORD_PATH_ENV
+    from src.logging_config import setup_logging
+
+    # Ctrl+C reaches the whole process group; the display process decides when we stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Only the display process records frames
+    os.environ.pop(RECORD_PATH_ENV, None)
+    setup_logging(level=log_level)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        plugin_manager = _load_plugins(plugins_dir, config_path, secrets_path, plugin_ids)
+        loaded = [plugin_id for plugin_id in plugin_ids if plugin_manager.get_plugin(plugin_id) is not None]
+        conn.send(('ready', loaded))
+        _UpdateLoop(conn, shm, slot_size, slot_count, plugin_manager, loaded).run()
+    except (EOFError, OSError):
+        pass  # The display process went away
+    finally:
+        shm.close()
+        conn.close()
+
+
+def _load_plugins(plugins_dir: str, config_path: Optional[str], secrets_path: Optional[str],
+                  plugin_ids: List[str]) -> Any:
+    """Create a plugin manager in the worker with the given plugins loaded."""
+    from src.cache_manager import CacheManager
+    from src.config_manager import ConfigManager
+    from src.font_manager import FontManager
+    from src.plugin_system.plugin_manager import PluginManager
+
+    config_manager = ConfigManager(config_path, secrets_path)
+    config = config_manager.load_config()
+    try:
+        from src.display_manager import DisplayManager
+    except ImportError as e:
+        # Plugins that need a display manager to construct fail to load and
+        # keep updating in the display process
+        logger.warning("Update worker has no display manager (%s)", e)
+        display_manager = None
+    else:
+        display_manager = DisplayManager(config, force_fallback=True, suppress_test_pattern=True)
+        # The display process writes the web preview snapshot
+        display_manager._snapshot_min_interval_sec = float('inf')
+
+    plugin_manager = PluginManager(
+        plugins_dir=plugins_dir,
+        config_manager=config_manager,
+        display_manager=display_manager,
+        cache_manager=CacheManager(),
+        font_manager=FontManager(config)
+    )
+    plugin_manager.discover_plugins()
+    for plugin_id in plugin_ids:
+        if not plugin_manager.load_plugin(plugin_id):
+            logger.warning("Update worker could not load plugin %s; it updates in the display process", plugin_id)
+    return plugin_manager
+
+
+class _UpdateLoop:
+    """Runs plugin updates on schedule and publishes their snapshots."""
+
+    def __init__(self, conn, shm: shared_memory.SharedMemory, slot_size: int, slot_count: int,
+                 plugin_manager: Any, plugin_ids: List[str]) -> None:
+        self.conn = conn
+        self.shm = shm
+        self.slot_size = slot_size
+        self.free_slots = list(range(slot_count))
+        self.plugin_manager = plugin_manager
+        self.plugin_ids = plugin_ids
+        # The display process ran the initial update before starting us
+        started = time.time()
+        self.last_update = {plugin_id: started for plugin_id in plugin_ids}
+
+    def run(self) -> None:
+        while True:
+            next_due = self._run_due_updates()
+            timeout = min(max(0.0, next_due - time.time()), MAX_IDLE_SECONDS)
+            if self.conn.poll(timeout):
+                while True:
+                    if not self._handle_message(self.conn.recv()):
+                        return
+                    if not self.conn.poll(0):
+                        break
+
+    def _run_due_updates(self) -> float:
+        """Update every plugin that is due; returns when the next one is due."""
+        next_due = time.time() + MAX_IDLE_SECONDS
+        for plugin_id in self.plugin_ids:
+            plugin = self.plugin_manager.get_plugin(plugin_id)
+            interval = self.plugin_manager.get_plugin_update_interval(plugin_id, plugin)
+            if interval is None:
+                continue
+            now = time.time()
+            if now - self.last_update[plugin_id] >= interval:
+                # Failed updates are retried after the interval too
+                self.last_update[plugin_id] = now
+                if self.plugin_manager.plugin_executor.execute_update(plugin, plugin_id):
+                    self._publish(plugin_id, plugin)
+                else:
+                    self.conn.send(('failed', plugin_id, "Plugin execution failed"))
+            next_due = min(next_due, self.last_update[plugin_id] + interval)
+        return next_due
+
+    def _publish(self, plugin_id: str, plugin: Any) -> None:
+        try:
+            payload = pickle.dumps(plugin.get_update_snapshot(), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Could not pickle update snapshot of %s: %s", plugin_id, e)
+            self.conn.send(('failed', plugin_id, f"Could not pickle update snapshot: {e}"))
+            return
+        updated_at = time.time()
+        buf = self.shm.buf
+        if buf is not None and len(payload) <= self.slot_size and self.free_slots:
+            slot = self.free_slots.pop()
+            offset = slot * self.slot_size
+            buf[offset:offset + len(payload)] = payload
+            self.conn.send(('snapshot', plugin_id, updated_at, slot, len(payload)))
+        else:
+            self.conn.send(('snapshot_inline', plugin_id, updated_at, payload))
+
+    def _handle_message(self, message: Tuple) -> bool:
+        """Handle a message from the display process; returns False on stop."""
+        kind = message[0]
+        if kind == 'free':
+            self.free_slots.append(message[1])
+        elif kind == 'config':
+            _, plugin_id, config = message
+            self.plugin_manager.config_manager.get_config()[plugin_id] = config
+            plugin = self.plugin_manager.get_plugin(plugin_id)
+            if plugin is None:
+                return True
+            try:
+                plugin.on_config_change(config)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Error in plugin %s config change handler", plugin_id)
+        elif kind == 'stop':
+            return False
+        return True
@@ -0,0 +1,156 @@
+"""
+Startup Profiler
+
+Records how long each startup phase of the display controller takes, and
+per plugin how long dependency checks, module import and instantiation
+took. The report is written as JSON once the first frame has been shown
+(and refreshed when deferred plugins finish loading) so slow plugins can be
+identified without reading through the logs.
+
+Plugins load in parallel, so per-plugin times overlap and don't sum to
+the plugin loading phase.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Overrides where the startup report is written
+REPORT_PATH_ENV = 'LEDMATRIX_STARTUP_REPORT'
+REPORT_FILENAME = 'startup_report.json'
+
+
+class StartupProfiler:
+    """Thread-safe recorder of startup phase and per-plugin timings."""
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now()
+        self._origin = time.perf_counter()
+        self._phases: List[Dict[str, Any]] = []
+        self._plugins: Dict[str, Dict[str, Any]] = {}
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created."""
+        return time.perf_counter() - self._origin
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase."""
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            duration = self.elapsed() - start
+            with self._lock:
+                self._phases.append({'name': name, 'start': round(start, 4), 'duration': round(duration, 4)})
+
+    @contextmanager
+    def plugin_step(self, plugin_id: str, step: str) -> Iterator[None]:
+        """
+        Time one step of loading a plugin (e.g. 'import', 'instantiate').
+
+        Repeated steps for the same plugin accumulate.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                timings = self._plugins.setdefault(plugin_id, {})
+                timings[step] = round(timings.get(step, 0.0) + duration, 4)
+
+    def note_plugin(self, plugin_id: str, **fields: Any) -> None:
+        """Attach extra fields to a plugin's entry (e.g. deferred=True)."""
+        with self._lock:
+            self._plugins.setdefault(plugin_id, {}).update(fields)
+
+    def mark(self, name: str) -> bool:
+        """
+        Record the first time a milestone is reached (e.g. 'first_frame').
+
+        Returns:
+            True if this call recorded the milestone
+        """
+        with self._lock:
+            if name in self._marks:
+                return False
+            self._marks[name] = round(self.elapsed(), 4)
+            return True
+
+    def report(self) -> Dict[str, Any]:
+        """Startup report as a JSON-serializable dict."""
+        with self._lock:
+            plugins = {pid: dict(timings) for pid, timings in self._plugins.items()}
+            slowest = sorted(
+                plugins,
+                key=lambda pid: plugins[pid].get('load', sum(
+                    v for v in plugins[pid].values() if isinstance(v, float))),
+                reverse=True
+            )
+            return {
+                'started_at': self.started_at.isoformat(),
+                'elapsed': round(self.elapsed(), 4),
+                'marks': dict(self._marks),
+                'phases': list(self._phases),
+                'plugins': plugins,
+                'slowest_plugins': slowest[:10],
+            }
+
+    def write_report(self, path: Union[str, Path]) -> bool:
+        """
+        Write the report to a JSON file (atomically).
+
+        Returns:
+            True if the report was written
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write startup report to %s: %s", path, e)
+            return False
+
+
+def default_report_path(cache_dir: Optional[str] = None) -> Optional[Path]:
+    """
+    Where the startup report goes: $LEDMATRIX_STARTUP_REPORT, else the cache directory.
+
+    Returns:
+        Report path, or None if there is nowhere to write it
+    """
+    override = os.environ.get(REPORT_PATH_ENV)
+    if override:
+        return Path(override)
+    if isinstance(cache_dir, str) and cache_dir:
+        return Path(cache_dir) / REPORT_FILENAME
+    return None
+
+
+_profiler: Optional[StartupProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get the process-wide startup profiler."""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = StartupProfiler()
+        return _profiler
@@ -194,6 +194,7 @@ class RenderPipeline:
             True if frame was rendered, False if no content
         """
         frame_start = time.time()
+        self.display_manager.begin_frame('vegas')
 
         try:
             if not self.scroll_helper.cached_image:
@@ -35,9 +35,12 @@ import logging
 import os
 import time
 import re
+import functools
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+from src.network_monitor import get_network_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +81,15 @@ NM_CONNECTIONS_PATHS = [
 ]
 
 
+def _changes_network_state(method):
+    """Probe status directly while the method runs and invalidate the status cache afterwards."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._status_cache.uncached():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 @dataclass
 class WiFiNetwork:
     """Represents a WiFi network"""
@@ -133,6 +145,11 @@ class WiFiManager:
         # Detect if we're running on Trixie (Netplan-based NetworkManager)
         self._is_trixie = self._detect_trixie()
 
+        # Status probes are cached process-wide and invalidated by `nmcli monitor` events
+        self._status_cache = get_network_monitor()
+        if self.has_nmcli:
+            self._status_cache.start()
+
         # Initialize disconnected check counter for grace period
         # This prevents AP mode from enabling on transient network hiccups
         self._disconnected_checks = 0
@@ -331,6 +348,11 @@ class WiFiManager:
         Returns:
             WiFiStatus object with connection information
         """
+        # Callers get their own copy of the cached status
+        return replace(self._status_cache.cached('wifi_status', self._probe_wifi_status))
+
+    def _probe_wifi_status(self) -> WiFiStatus:
+        """Query the current WiFi status from the system"""
         try:
             if self.has_nmcli:
                 return self._get_status_nmcli()
@@ -543,6 +565,10 @@ class WiFiManager:
         Returns:
             True if Ethernet is connected and has an IP address
         """
+        return self._status_cache.cached('ethernet_connected', self._probe_ethernet_connected)
+
+    def _probe_ethernet_connected(self) -> bool:
+        """Query Ethernet connection state from the system"""
         try:
             # Check for Ethernet interfaces (eth0, enp*, etc.)
             # First try nmcli if available
@@ -639,6 +665,10 @@ class WiFiManager:
     
     def _is_ap_mode_active(self) -> bool:
         """Check if access point mode is currently active"""
+        return self._status_cache.cached('ap_mode_active', self._probe_ap_mode_active)
+
+    def _probe_ap_mode_active(self) -> bool:
+        """Query access point state from the system"""
         try:
             # Check if hostapd is running (captive portal mode)
             result = subprocess.run(
@@ -914,6 +944,7 @@ class WiFiManager:
             logger.error(f"Error scanning with iwlist: {e}")
             return []
     
+    @_changes_network_state
     def connect_to_network(self, ssid: str, password: str) -> Tuple[bool, str]:
         """
         Connect to a WiFi network with failsafe to restore original connection on failure.
@@ -1311,6 +1342,7 @@ class WiFiManager:
             logger.error(f"Error connecting with wpa_supplicant: {e}")
             return False, str(e)
     
+    @_changes_network_state
     def disconnect_from_network(self, skip_ap_check: bool = False) -> Tuple[bool, str]:
         """
         Disconnect from the current WiFi network
@@ -1535,6 +1567,7 @@ class WiFiManager:
         logger.warning(f"Failed to enable WiFi radio after {max_retries} attempts")
         return False
     
+    @_changes_network_state
     def enable_ap_mode(self) -> Tuple[bool, str]:
         """
         Enable access point mode
@@ -2008,6 +2041,7 @@ class WiFiManager:
             logger.error(f"Error getting AP status with nmcli: {e}")
             return {'active': False}
     
+    @_changes_network_state
     def disable_ap_mode(self) -> Tuple[bool, str]:
         """
         Disable access point mode
@@ -2382,6 +2416,9 @@ address=/detectportal.firefox.com/192.168.4.1
             WiFiStatus object
         """
         for attempt in range(max_retries + 1):
+            if attempt > 0:
+                # A retry must re-probe rather than re-read the cached result
+                self._status_cache.invalidate('wifi_status')
             status = self.get_wifi_status()
             # If we get a connected status, trust it immediately
             if status.connected:
@@ -83,6 +83,7 @@ def mock_config_manager():
     
     mock.load_config = Mock(side_effect=mock_load_config)
     mock.get_config = Mock(side_effect=mock_get_config)
+    mock.get_plugin_config = Mock(side_effect=lambda plugin_id: mock.config.get(plugin_id, {}))
     mock.get_secret = Mock(side_effect=mock_get_secret)
     mock.get_config_path = Mock(return_value=mock.config_path)
     mock.get_secrets_path = Mock(return_value=mock.secrets_path)
@@ -0,0 +1,154 @@
+"""
+Tests for the calendar plugin's incremental sync, using a fake
+Google Calendar discovery service.
+"""
+
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip('googleapiclient')
+from googleapiclient.errors import HttpError
+
+PLUGIN_DIR = Path(__file__).parent.parent.parent / 'plugin-repos' / 'calendar'
+
+
+def _event(event_id, hours_ahead, summary, etag='1'):
+    start = datetime.now(timezone.utc) + timedelta(hours=hours_ahead)
+    return {
+        'id': event_id,
+        'etag': etag,
+        'status': 'confirmed',
+        'summary': summary,
+        'start': {'dateTime': start.isoformat()},
+        'end': {'dateTime': (start + timedelta(hours=1)).isoformat()},
+    }
+
+
+class FakeEventsResource:
+    """Stands in for service.events(); replays queued responses per calendar."""
+
+    def __init__(self):
+        self.responses = {}
+        self.calls = []
+
+    def list(self, **params):
+        self.calls.append(params)
+        response = self.responses[params['calendarId']].pop(0)
+        request = MagicMock()
+        if isinstance(response, Exception):
+            request.execute.side_effect = response
+        else:
+            request.execute.return_value = response
+        return request
+
+
+class FakeCalendarService:
+    def __init__(self):
+        self.events_resource = FakeEventsResource()
+
+    def events(self):
+        return self.events_resource
+
+
+class _DictCache:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key, max_age=300):
+        return self.store.get(key)
+
+    def set(self, key, data, ttl=None):
+        self.store[key] = data
+
+
+@pytest.fixture
+def calendar_module():
+    spec = importlib.util.spec_from_file_location('calendar_plugin_manager', PLUGIN_DIR / 'manager.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def plugin(calendar_module, mock_display_manager, mock_plugin_manager, tmp_path, monkeypatch):
+    monkeypatch.setattr(calendar_module.CalendarPlugin, '_authenticate', lambda self: False)
+    mock_plugin_manager.font_manager = None
+    mock_plugin_manager.config_manager = None
+    config = {'enabled': True, 'calendars': ['home', 'work'], 'max_events': 3, 'update_interval': 60}
+    instance = calendar_module.CalendarPlugin('calendar', config, mock_display_manager,
+                                              _DictCache(), mock_plugin_manager)
+    instance.service = FakeCalendarService()
+    return instance
+
+
+def _force_due(plugin):
+    for state in plugin._sync_state.values():
+        state['last_sync'] = 0
+
+
+class TestCalendarSync:
+
+    def test_full_then_incremental_sync(self, plugin):
+        responses = plugin.service.events_resource.responses
+        responses['home'] = [
+            {'items': [_event('a', 2, 'Dentist'), _event('b', 5, 'Dinner')], 'nextSyncToken': 'home-1'},
+            {'items': [{'id': 'a', 'status': 'cancelled'}, _event('c', 1, 'Gym')], 'nextSyncToken': 'home-2'},
+        ]
+        responses['work'] = [
+            {'items': [_event('w', 3, 'Standup')], 'nextPageToken': 'p2'},
+            {'items': [_event('x', 4, 'Review')], 'nextSyncToken': 'work-1'},
+            {'items': [], 'nextSyncToken': 'work-2'},
+        ]
+
+        plugin.update()
+        assert [e['summary'] for e in plugin.events] == ['Dentist', 'Standup', 'Review']
+        assert plugin._sync_state['work']['sync_token'] == 'work-1'
+
+        _force_due(plugin)
+        plugin.update()
+        assert [e['summary'] for e in plugin.events] == ['Gym', 'Standup', 'Review']
+
+        incremental = [call for call in plugin.service.events_resource.calls if 'syncToken' in call]
+        assert {call['syncToken'] for call in incremental} == {'home-1', 'work-1'}
+        assert all('timeMin' not in call for call in incremental)
+
+    def test_expired_sync_token_triggers_full_sync(self, plugin):
+        gone = HttpError(MagicMock(status=410), b'{"error": "gone"}')
+        plugin.service.events_resource.responses = {
+            'home': [
+                {'items': [_event('a', 2, 'Old')], 'nextSyncToken': 'home-1'},
+                gone,
+                {'items': [_event('b', 2, 'New')], 'nextSyncToken': 'home-2'},
+            ],
+            'work': [{'items': [], 'nextSyncToken': 'work-1'}, {'items': [], 'nextSyncToken': 'work-2'}],
+        }
+
+        plugin.update()
+        _force_due(plugin)
+        plugin.update()
+
+        assert [e['summary'] for e in plugin.events] == ['New']
+        assert plugin._sync_state['home']['sync_token'] == 'home-2'
+
+    def test_index_persists_and_rendered_images_are_reused(self, plugin, calendar_module,
+                                                           mock_display_manager, mock_plugin_manager):
+        plugin.service.events_resource.responses = {
+            'home': [{'items': [_event('a', 2, 'Dentist')], 'nextSyncToken': 'home-1'}],
+            'work': [{'items': [], 'nextSyncToken': 'work-1'}],
+        }
+        plugin.update()
+
+        first = plugin._get_event_image(plugin.events[0], 64, 32)
+        assert plugin._get_event_image(plugin.events[0], 64, 32) is first
+
+        # A new instance restores the index from cache without calling the API
+        restored = calendar_module.CalendarPlugin('calendar', plugin.config, mock_display_manager,
+                                                  plugin.cache_manager, mock_plugin_manager)
+        restored.service = FakeCalendarService()
+        restored.update()
+        assert [e['summary'] for e in restored.events] == ['Dentist']
+        assert restored.service.events_resource.calls == []
@@ -0,0 +1,69 @@
+"""
+Tests for the leaderboard plugin's tile-cached strip rendering.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+PLUGIN_DIR = Path(__file__).parent.parent.parent / 'plugin-repos' / 'ledmatrix-leaderboard'
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    monkeypatch.syspath_prepend(str(PLUGIN_DIR))
+    monkeypatch.delitem(sys.modules, 'image_renderer', raising=False)
+    import image_renderer
+    return image_renderer.ImageRenderer(32, logging.getLogger('test.leaderboard'))
+
+
+@pytest.fixture
+def logo_dir(tmp_path):
+    for index, abbr in enumerate(['AAA', 'BBB', 'CCC', 'DDD']):
+        Image.new('RGBA', (40, 40), (50 * index, 100, 200, 255)).save(tmp_path / f"{abbr}.png")
+    Image.new('RGBA', (40, 40), (255, 255, 255, 255)).save(tmp_path / 'league.png')
+    return tmp_path
+
+
+def _league(logo_dir, abbrs):
+    return {
+        'league': 'nfl',
+        'league_config': {'league_logo': str(logo_dir / 'league.png'), 'logo_dir': str(logo_dir)},
+        'teams': [{'abbreviation': abbr, 'id': abbr} for abbr in abbrs],
+    }
+
+
+class TestLeaderboardTiles:
+
+    def test_unchanged_data_reuses_strip(self, renderer, logo_dir):
+        data = [_league(logo_dir, ['AAA', 'BBB', 'CCC', 'DDD'])]
+        first = renderer.create_leaderboard_image(data)
+        rendered = renderer.tiles_rendered
+
+        second = renderer.create_leaderboard_image(data)
+
+        assert second is first
+        assert renderer.tiles_rendered == rendered == 5
+
+    def test_rank_change_only_rerenders_changed_entries(self, renderer, logo_dir):
+        renderer.create_leaderboard_image([_league(logo_dir, ['AAA', 'BBB', 'CCC', 'DDD'])])
+        rendered = renderer.tiles_rendered
+
+        image = renderer.create_leaderboard_image([_league(logo_dir, ['AAA', 'CCC', 'BBB', 'DDD'])])
+
+        # BBB and CCC swapped ranks; the header, AAA and DDD tiles are reused
+        assert renderer.tiles_rendered - rendered == 2
+        assert np.array_equal(np.array(image), renderer.last_strip_array)
+
+    def test_strip_matches_fresh_render(self, renderer, logo_dir):
+        renderer.create_leaderboard_image([_league(logo_dir, ['AAA', 'BBB', 'CCC', 'DDD'])])
+        incremental = renderer.create_leaderboard_image([_league(logo_dir, ['DDD', 'CCC', 'BBB', 'AAA'])])
+
+        renderer.clear_tile_cache()
+        fresh = renderer.create_leaderboard_image([_league(logo_dir, ['DDD', 'CCC', 'BBB', 'AAA'])])
+
+        assert np.array_equal(np.array(incremental), np.array(fresh))
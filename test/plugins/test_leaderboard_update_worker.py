@@ -0,0 +1,60 @@
+"""
+Tests for running the leaderboard plugin's updates in the update worker.
+"""
+
+import pickle
+
+import pytest
+
+from src.plugin_system.plugin_loader import PluginLoader
+from src.plugin_system.update_worker import supports_update_snapshots
+
+PLUGIN_ID = 'ledmatrix-leaderboard'
+
+STANDINGS = [{
+    'league': 'nfl',
+    'league_config': {'league': 'nfl', 'logo_dir': 'assets/sports/nfl_logos'},
+    'teams': [{'abbreviation': 'AAA', 'id': '1', 'wins': 10, 'losses': 2}],
+}]
+
+
+@pytest.fixture
+def make_plugin(plugins_dir, mock_display_manager, mock_cache_manager, mock_plugin_manager):
+    plugin_dir = plugins_dir / PLUGIN_ID
+    if not (plugin_dir / 'manifest.json').exists():
+        pytest.skip(f"{PLUGIN_ID} not found")
+    loader = PluginLoader()
+    module = loader.load_module(plugin_id=PLUGIN_ID, plugin_dir=plugin_dir, entry_point='manager.py')
+    plugin_class = loader.get_plugin_class(plugin_id=PLUGIN_ID, module=module, class_name='LeaderboardPlugin')
+    # No enabled leagues, so construction doesn't fetch standings
+    config = {'enabled': True, 'enabled_sports': {key: {'enabled': False}
+                                                  for key in ('nfl', 'ncaa_fb', 'ncaam_hockey')}}
+
+    def make():
+        return loader.instantiate_plugin(
+            plugin_id=PLUGIN_ID, plugin_class=plugin_class, config=dict(config),
+            display_manager=mock_display_manager, cache_manager=mock_cache_manager,
+            plugin_manager=mock_plugin_manager
+        )
+    return make
+
+
+def test_leaderboard_standings_cross_the_process_boundary(make_plugin):
+    worker_side, display_side = make_plugin(), make_plugin()
+    assert supports_update_snapshots(display_side)
+
+    # What update() leaves behind in the worker
+    worker_side.leaderboard_data = STANDINGS
+    worker_side.last_update = 1000.0
+    snapshot = pickle.loads(pickle.dumps(worker_side.get_update_snapshot()))
+
+    display_side.scroll_helper.cached_image = object()
+    display_side.apply_update_snapshot(snapshot)
+    assert display_side.leaderboard_data == STANDINGS
+    assert display_side.last_update == 1000.0
+    assert display_side.scroll_helper.cached_image is None
+
+    # Re-sent data that didn't refresh keeps the scrolling image
+    display_side.scroll_helper.cached_image = image = object()
+    display_side.apply_update_snapshot(snapshot)
+    assert display_side.scroll_helper.cached_image is image
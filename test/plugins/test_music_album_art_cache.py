@@ -0,0 +1,147 @@
+"""
+Tests for the music plugin's persistent album art cache.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+PLUGIN_DIR = Path(__file__).parent.parent.parent / 'plugin-repos' / 'ledmatrix-music'
+
+
+def _png_bytes(color):
+    buffer = BytesIO()
+    Image.new('RGB', (300, 300), color).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+COVERS = {
+    '/red.png': _png_bytes((200, 0, 0)),
+    '/red-alt.png': _png_bytes((200, 0, 0)),
+    '/blue.png': _png_bytes((0, 0, 200)),
+    '/green.png': _png_bytes((0, 200, 0)),
+}
+
+
+class _ArtServer(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        body = COVERS.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def art_server():
+    _ArtServer.hits = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ArtServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache_module(monkeypatch):
+    monkeypatch.syspath_prepend(str(PLUGIN_DIR))
+    monkeypatch.delitem(sys.modules, 'album_art_cache', raising=False)
+    import album_art_cache
+    return album_art_cache
+
+
+def _make_cache(cache_module, cache_dir, **kwargs):
+    return cache_module.AlbumArtCache(str(cache_dir), logger=logging.getLogger('test.music'), **kwargs)
+
+
+class TestAlbumArtCache:
+
+    def test_fetch_resizes_and_persists_across_instances(self, cache_module, art_server, tmp_path):
+        cache = _make_cache(cache_module, tmp_path)
+        image = cache.fetch(f"{art_server}/red.png", (32, 32))
+        assert image.size == (32, 32)
+        assert len(list(tmp_path.glob('*_32x32.png'))) == 1
+        cache.shutdown()
+
+        restarted = _make_cache(cache_module, tmp_path)
+        assert restarted.get_cached(f"{art_server}/red.png", (32, 32)) is not None
+        assert _ArtServer.hits == ['/red.png']
+        restarted.shutdown()
+
+    def test_identical_content_shares_one_file(self, cache_module, art_server, tmp_path):
+        cache = _make_cache(cache_module, tmp_path)
+        cache.fetch(f"{art_server}/red.png", (32, 32))
+        cache.fetch(f"{art_server}/red-alt.png", (32, 32))
+        assert len(list(tmp_path.glob('*_32x32.png'))) == 1
+        cache.shutdown()
+
+    def test_prefetch_runs_in_background(self, cache_module, art_server, tmp_path):
+        cache = _make_cache(cache_module, tmp_path)
+        url = f"{art_server}/blue.png"
+        assert cache.get_cached(url, (64, 64)) is None
+        assert cache.prefetch(url, (64, 64)) is True
+
+        deadline = time.time() + 5
+        while cache.get_cached(url, (64, 64)) is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get_cached(url, (64, 64)).size == (64, 64)
+        assert cache.prefetch(url, (64, 64)) is False
+        cache.shutdown()
+
+    def test_memory_lru_is_bounded(self, cache_module, art_server):
+        cache = cache_module.AlbumArtCache(None, max_memory_items=1, logger=logging.getLogger('test.music'))
+        cache.fetch(f"{art_server}/red.png", (32, 32))
+        cache.fetch(f"{art_server}/blue.png", (32, 32))
+        assert cache.get_cached(f"{art_server}/blue.png", (32, 32)) is not None
+        assert cache.get_cached(f"{art_server}/red.png", (32, 32)) is None
+        cache.shutdown()
+
+    def test_disk_store_evicts_least_recently_used(self, cache_module, art_server, tmp_path):
+        cache = _make_cache(cache_module, tmp_path, max_memory_items=0, max_disk_items=2)
+        red, blue, green = (f"{art_server}/{name}.png" for name in ('red', 'blue', 'green'))
+        cache.fetch(red, (32, 32))
+        cache.fetch(blue, (32, 32))
+        # Age the files, then use red so blue is the least recently used
+        for path in tmp_path.glob('*_32x32.png'):
+            os.utime(path, (time.time() - 60, time.time() - 60))
+        assert cache.get_cached(red, (32, 32)) is not None
+
+        cache.fetch(green, (32, 32))
+        assert len(list(tmp_path.glob('*_32x32.png'))) == 2
+        assert cache.get_cached(red, (32, 32)) is not None
+        assert cache.get_cached(green, (32, 32)) is not None
+        assert cache.get_cached(blue, (32, 32)) is None
+        cache.shutdown()
+
+    def test_failed_url_is_not_prefetched_until_backoff_expires(self, cache_module, art_server, tmp_path):
+        cache = _make_cache(cache_module, tmp_path)
+        url = f"{art_server}/missing.png"
+        assert cache.prefetch(url, (32, 32)) is True
+        deadline = time.time() + 5
+        while url not in cache._failures and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert cache.prefetch(url, (32, 32)) is False
+        assert _ArtServer.hits == ['/missing.png']
+
+        cache._failures[url] = (0.0, 1)
+        assert cache.prefetch(url, (32, 32)) is True
+        cache.shutdown()
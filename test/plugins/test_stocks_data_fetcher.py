@@ -0,0 +1,198 @@
+"""
+Tests for the stock ticker plugin's batched data fetcher.
+
+Requests are served by a local HTTP stand-in that replays recorded Yahoo
+Finance chart and spark responses.
+"""
+
+import json
+import logging
+import sys
+import threading
+from array import array
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+PLUGIN_DIR = Path(__file__).parent.parent.parent / 'plugin-repos' / 'ledmatrix-stocks'
+
+
+def _chart_result(symbol, price, previous_close, closes):
+    """Build a recorded chart result for a symbol."""
+    return {
+        'meta': {
+            'symbol': symbol,
+            'regularMarketPrice': price,
+            'previousClose': previous_close,
+        },
+        'timestamp': [1700000000 + i * 300 for i in range(len(closes))],
+        'indicators': {'quote': [{'close': closes}]},
+    }
+
+
+RECORDED_CHARTS = {
+    'AAPL': _chart_result('AAPL', 190.0, 188.0, [188.5, None, 189.2, 190.0]),
+    'MSFT': _chart_result('MSFT', 410.0, 400.0, [401.0, 405.0, 410.0]),
+    'NVDA': _chart_result('NVDA', 900.0, 950.0, [940.0, 920.0, 900.0]),
+    'BTC-USD': _chart_result('BTC-USD', 65000.0, 64000.0, [64100.0, 64800.0, 65000.0]),
+}
+
+
+class _YahooStandIn(BaseHTTPRequestHandler):
+    """Serves recorded responses; the spark endpoint omits NVDA."""
+
+    requests_seen = []
+    spark_omits = {'NVDA'}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self.requests_seen.append(parsed.path)
+        if parsed.path == '/v7/finance/spark':
+            symbols = parse_qs(parsed.query)['symbols'][0].split(',')
+            body = {'spark': {'result': [
+                {'symbol': symbol, 'response': [RECORDED_CHARTS[symbol]]}
+                for symbol in symbols
+                if symbol in RECORDED_CHARTS and symbol not in self.spark_omits
+            ], 'error': None}}
+        elif parsed.path.startswith('/v8/finance/chart/'):
+            symbol = parsed.path.rsplit('/', 1)[-1]
+            if symbol not in RECORDED_CHARTS:
+                self.send_error(404)
+                return
+            body = {'chart': {'result': [RECORDED_CHARTS[symbol]], 'error': None}}
+        else:
+            self.send_error(404)
+            return
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _DictCache:
+    """Minimal cache manager that round-trips values through JSON like the disk cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key, max_age=300):
+        raw = self.store.get(key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key, data, ttl=None):
+        self.store[key] = json.dumps(data)
+
+
+@pytest.fixture
+def yahoo_server():
+    _YahooStandIn.requests_seen = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _YahooStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stocks_modules(monkeypatch):
+    """Import the plugin's modules without leaking them to other plugin tests."""
+    monkeypatch.syspath_prepend(str(PLUGIN_DIR))
+    for name in ('data_fetcher', 'price_history'):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    import data_fetcher
+    import price_history
+    return data_fetcher, price_history
+
+
+def _make_fetcher(stocks_modules, base_url, cache, **overrides):
+    data_fetcher, _ = stocks_modules
+    settings = dict(
+        plugin_config={}, api_config={}, timeout=5, retry_count=0, rate_limit_delay=0,
+        stock_symbols=['AAPL', 'MSFT', 'NVDA'], crypto_symbols=['BTC'],
+        update_interval=600, batch_requests=True, batch_size=20, max_workers=4,
+    )
+    settings.update(overrides)
+    fetcher = data_fetcher.StockDataFetcher(SimpleNamespace(**settings), cache, logging.getLogger('test.stocks'))
+    fetcher.chart_url = base_url + '/v8/finance/chart/{symbol}'
+    fetcher.spark_url = base_url + '/v7/finance/spark'
+    return fetcher
+
+
+class TestStockDataFetcher:
+    """Batched and concurrent fetching against the recorded stand-in."""
+
+    def test_batched_fetch_falls_back_for_missing_symbols(self, stocks_modules, yahoo_server):
+        fetcher = _make_fetcher(stocks_modules, yahoo_server, _DictCache())
+
+        data = fetcher.fetch_all_data()
+
+        assert set(data) == {'AAPL', 'MSFT', 'NVDA', 'BTC'}
+        # One spark request for all four symbols, one chart request for NVDA only
+        assert _YahooStandIn.requests_seen.count('/v7/finance/spark') == 1
+        assert _YahooStandIn.requests_seen.count('/v8/finance/chart/NVDA') == 1
+        assert len(_YahooStandIn.requests_seen) == 2
+        assert data['BTC']['symbol'] == 'BTC'
+        assert data['BTC']['is_crypto'] is True
+        assert data['NVDA']['change'] == -50.0
+
+    def test_unbatched_fetch_uses_per_symbol_requests(self, stocks_modules, yahoo_server):
+        fetcher = _make_fetcher(stocks_modules, yahoo_server, _DictCache(), batch_requests=False, max_workers=2)
+
+        data = fetcher.fetch_all_data()
+
+        assert set(data) == {'AAPL', 'MSFT', 'NVDA', 'BTC'}
+        assert '/v7/finance/spark' not in _YahooStandIn.requests_seen
+        assert len(_YahooStandIn.requests_seen) == 4
+
+    def test_per_symbol_fallback_goes_through_background_service(self, stocks_modules, yahoo_server):
+        cache = _DictCache()
+        fetcher = _make_fetcher(stocks_modules, yahoo_server, cache, batch_requests=False)
+        submitted = []
+
+        def submit(task):
+            submitted.append(task)
+            return task()
+
+        fetcher.background_service = SimpleNamespace(submit=submit)
+        data = fetcher.fetch_all_data()
+
+        assert set(data) == {'AAPL', 'MSFT', 'NVDA', 'BTC'}
+        assert len(submitted) == 4
+        assert set(cache.store) == {'stock_data_AAPL', 'stock_data_MSFT', 'stock_data_NVDA', 'stock_data_BTC'}
+
+    def test_price_history_is_compact_and_survives_cache(self, stocks_modules, yahoo_server):
+        _, price_history = stocks_modules
+        cache = _DictCache()
+        fetcher = _make_fetcher(stocks_modules, yahoo_server, cache)
+
+        history = fetcher.fetch_all_data()['AAPL']['price_history']
+        assert isinstance(history, price_history.PriceHistory)
+        assert isinstance(history.prices, array)
+        # The null close is dropped along with its timestamp
+        assert list(history.prices) == [188.5, 189.2, 190.0]
+        assert len(history.timestamps) == 3
+
+        _YahooStandIn.requests_seen = []
+        cached = fetcher.fetch_all_data()['AAPL']['price_history']
+        assert _YahooStandIn.requests_seen == []
+        assert list(cached.prices) == list(history.prices)
+        assert list(cached.timestamps) == list(history.timestamps)
+
+    def test_legacy_history_points_are_converted(self, stocks_modules):
+        _, price_history = stocks_modules
+        legacy = [
+            {'timestamp': '2024-01-01T09:30:00', 'price': 10.0},
+            {'timestamp': '2024-01-01T09:35:00', 'price': 11.0},
+        ]
+        history = price_history.PriceHistory.coerce(legacy)
+        assert list(history.prices) == [10.0, 11.0]
+        assert history.datetime_at(1).strftime('%H:%M') == '09:35'
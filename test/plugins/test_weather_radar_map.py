@@ -0,0 +1,84 @@
+"""
+Tests for the weather plugin's vector map renderer and map cache.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw
+
+PLUGIN_DIR = Path(__file__).parent.parent.parent / 'plugin-repos' / 'ledmatrix-weather'
+
+
+@pytest.fixture
+def radar_module(monkeypatch):
+    monkeypatch.syspath_prepend(str(PLUGIN_DIR))
+    monkeypatch.delitem(sys.modules, 'radar', raising=False)
+    import radar
+    return radar
+
+
+def _reference_render(radar, center_lat, center_lon, width, height, zoom, line_color, fill_color):
+    """Per-point renderer the vectorized version must match pixel for pixel."""
+    img = Image.new("RGB", (width, height), (0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for feature in radar._load_geojson().get("features", []):
+        geom = feature.get("geometry", {})
+        coords = geom.get("coordinates", [])
+        polygons = [coords] if geom.get("type") == "Polygon" else coords
+        for polygon in polygons:
+            for ring in polygon:
+                points = [radar._latlon_to_pixel(c[1], c[0], center_lat, center_lon, width, height, zoom)
+                          for c in ring]
+                if len(points) < 3:
+                    continue
+                margin = max(width, height)
+                if not any(-margin < x < width + margin and -margin < y < height + margin for x, y in points):
+                    continue
+                if fill_color:
+                    draw.polygon(points, fill=fill_color)
+                draw.polygon(points, outline=line_color)
+    return img
+
+
+@pytest.mark.parametrize('center_lat, center_lon, width, height, zoom, fill_color', [
+    (32.78, -96.80, 128, 32, 6, (15, 25, 15)),
+    (40.71, -74.01, 192, 64, 7, None),
+    (47.61, -122.33, 64, 32, 4, (15, 25, 15)),
+])
+def test_vectorized_render_matches_reference(radar_module, center_lat, center_lon, width, height, zoom, fill_color):
+    line_color = (0, 130, 70)
+    expected = _reference_render(radar_module, center_lat, center_lon, width, height, zoom, line_color, fill_color)
+    actual = radar_module.render_vector_map(center_lat, center_lon, width, height, zoom,
+                                            line_color=line_color, fill_color=fill_color)
+    assert ImageChops.difference(expected, actual).getbbox() is None
+
+
+def test_geojson_is_parsed_once(radar_module, monkeypatch):
+    radar_module.render_vector_map(32.78, -96.80, 64, 32, 6)
+    load = MagicMock(side_effect=AssertionError("GeoJSON re-read"))
+    monkeypatch.setattr(radar_module, '_load_geojson', load)
+    radar_module.render_vector_map(35.0, -90.0, 128, 32, 5)
+    load.assert_not_called()
+
+
+def test_rendered_map_persisted_and_keyed_by_settings(radar_module, tmp_path, monkeypatch):
+    cache_manager = MagicMock(cache_dir=str(tmp_path))
+    fetcher = radar_module.RadarFetcher(32.78, -96.80, 6, cache_manager)
+    first = fetcher._render_map(128, 32)
+    assert len(list((tmp_path / 'radar_maps').glob('map_*.png'))) == 1
+
+    render = MagicMock(side_effect=AssertionError("map re-rendered"))
+    monkeypatch.setattr(radar_module, 'render_vector_map', render)
+    again = radar_module.RadarFetcher(32.78, -96.80, 6, cache_manager)._render_map(128, 32)
+    assert ImageChops.difference(first, again).getbbox() is None
+
+    # A different size or color needs its own render
+    render.side_effect = None
+    render.return_value = Image.new("RGB", (64, 32))
+    radar_module.RadarFetcher(32.78, -96.80, 6, cache_manager)._render_map(64, 32)
+    radar_module.RadarFetcher(32.78, -96.80, 6, cache_manager, line_color=(255, 0, 0))._render_map(128, 32)
+    assert render.call_count == 2
+    assert len(list((tmp_path / 'radar_maps').glob('map_*.png'))) == 3
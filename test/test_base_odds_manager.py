@@ -0,0 +1,150 @@
+"""
+Tests for BaseOddsManager's concurrent, deduplicated odds fetching.
+
+A local HTTP server stands in for the ESPN odds API.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.base_odds_manager import BaseOddsManager
+
+
+class _FakeESPN:
+    """Serves odds documents for any event and records every request."""
+
+    def __init__(self, delay=0.0):
+        self.requests = []
+        self.delay = delay
+        self.empty = set()
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with fake.lock:
+                    fake.requests.append(self.path)
+                if fake.delay:
+                    time.sleep(fake.delay)
+                event_id = self.path.rstrip('/').split('/')[-2]
+                if event_id in fake.empty:
+                    doc = {'count': 0, 'items': []}
+                else:
+                    doc = {'count': 1, 'items': [{'details': f'DAL -{event_id}', 'overUnder': 44.5, 'spread': -3}]}
+                body = json.dumps(doc).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _DictCache:
+    """Minimal stand-in for CacheManager's get/set with max_age."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key, max_age=300):
+        entry = self.entries.get(key)
+        if entry and time.time() - entry['timestamp'] <= max_age:
+            return entry['data']
+        return None
+
+    def set(self, key, data, ttl=None):
+        self.entries[key] = {'data': data, 'timestamp': time.time(), 'ttl': ttl}
+
+
+@pytest.fixture
+def espn():
+    server = _FakeESPN()
+    yield server
+    server.close()
+
+
+def _manager(espn, cache=None):
+    manager = BaseOddsManager(cache or _DictCache())
+    manager.base_url = espn.base_url
+    manager.request_timeout = 5
+    return manager
+
+
+def _game(event_id, **extra):
+    return dict({'id': event_id, 'sport': 'football', 'league': 'nfl'}, **extra)
+
+
+def test_ttl_shrinks_toward_kickoff():
+    manager = BaseOddsManager(_DictCache())
+    now = datetime.now(timezone.utc)
+    assert manager.get_odds_ttl(now + timedelta(days=5)) == BaseOddsManager.FAR_FUTURE_TTL
+    assert manager.get_odds_ttl(now + timedelta(hours=12)) == 1800
+    assert manager.get_odds_ttl((now + timedelta(minutes=30)).isoformat()) == 300
+    assert manager.get_odds_ttl(now + timedelta(minutes=30), is_live=True) == manager.live_cache_ttl
+    assert manager.get_odds_ttl(now + timedelta(days=5), max_ttl=600) == 600
+    assert manager.get_odds_ttl(None) == manager.cache_ttl
+
+
+def test_games_fetched_concurrently(espn):
+    espn.delay = 0.2
+    games = [_game(str(i)) for i in range(4)]
+
+    start = time.monotonic()
+    _manager(espn).get_odds_for_games(games)
+    assert time.monotonic() - start < 0.6
+    assert [g['odds']['details'] for g in games] == [f'DAL -{i}' for i in range(4)]
+
+
+def test_concurrent_requests_for_an_event_share_one_fetch(espn):
+    espn.delay = 0.2
+    cache = _DictCache()
+    upcoming, live = _manager(espn, cache), _manager(espn, cache)
+
+    first = upcoming.get_odds_async('football', 'nfl', '42')
+    second = live.get_odds_async('football', 'nfl', '42')
+    assert first is second
+    assert first.result()['over_under'] == 44.5
+    assert len(espn.requests) == 1
+
+    # Later callers are served from the cache
+    assert live.get_odds('football', 'nfl', '42')['spread'] == -3
+    assert len(espn.requests) == 1
+
+
+def test_non_blocking_batch_fills_in_odds_later(espn):
+    espn.delay = 0.2
+    games = [_game('7')]
+
+    start = time.monotonic()
+    _manager(espn).get_odds_for_games(games, wait=False)
+    assert time.monotonic() - start < 0.1
+    assert games[0]['odds'] is None
+
+    deadline = time.monotonic() + 5
+    while games[0]['odds'] is None and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert games[0]['odds']['details'] == 'DAL -7'
+
+
+def test_events_without_odds_are_cached_as_none(espn):
+    espn.empty.add('9')
+    manager = _manager(espn)
+    assert manager.get_odds('football', 'nfl', '9') is None
+    assert manager.get_odds('football', 'nfl', '9') is None
+    assert len(espn.requests) == 1
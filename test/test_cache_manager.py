@@ -4,6 +4,7 @@ Tests for CacheManager and cache components.
 Tests cache functionality including memory cache, disk cache, strategy, and metrics.
 """
 
+import os
 import pytest
 import time
 import json
@@ -83,6 +84,7 @@ class TestCacheStrategy:
         assert strategy.get_data_type_from_key("weather") == "weather_current"
         assert strategy.get_data_type_from_key("weather_data") == "weather_current"
         assert strategy.get_data_type_from_key("unknown_key") == "default"
+        assert strategy.get_data_type_from_key("http_cache_0dd5c0e4") == "http_cache"
 
 
 class TestMemoryCache:
@@ -287,6 +289,20 @@ class TestDiskCache:
         result = cache.get("test_key", max_age=0)
         assert result is None
     
+    def test_cleanup_prunes_old_http_cache_entries(self, tmp_path):
+        """HTTP client responses expire under their own short retention."""
+        cache = DiskCache(cache_dir=str(tmp_path))
+        cache.set("http_cache_old", {"body": ""})
+        cache.set("http_cache_new", {"body": ""})
+        cache.set("unknown_key", {"data": "value"})
+        three_days_ago = time.time() - 3 * 86400
+        for key in ("http_cache_old", "unknown_key"):
+            os.utime(tmp_path / f"{key}.json", (three_days_ago, three_days_ago))
+
+        stats = cache.cleanup_expired_files(CacheStrategy(), {'http_cache': 2, 'default': 30})
+        assert stats['files_deleted'] == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["http_cache_new.json", "unknown_key.json"]
+
     def test_get_nonexistent(self, tmp_path):
         """Test getting non-existent key."""
         cache = DiskCache(cache_dir=str(tmp_path))
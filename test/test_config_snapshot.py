@@ -0,0 +1,131 @@
+"""
+Tests for shared config snapshots and the config file watcher.
+"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from src.config_manager import ConfigManager
+from src.config_snapshot import ConfigFileWatcher, ConfigSnapshot
+
+
+def _write(path, data, age=10):
+    with open(path, 'w') as f:
+        json.dump(data, f)
+    # Backdate so the snapshot isn't considered racy; keep mtimes distinct per write
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def manager(tmp_path):
+    config_path = tmp_path / 'config.json'
+    secrets_path = tmp_path / 'config_secrets.json'
+    template_path = tmp_path / 'config.template.json'
+    _write(config_path, {'display': {'brightness': 50}, 'weather': {'enabled': True, 'units': ['F']}})
+    _write(secrets_path, {'weather': {'api_key': 'secret'}})
+    _write(template_path, {'display': {'brightness': 100}})
+    manager = ConfigManager(config_path=str(config_path), secrets_path=str(secrets_path))
+    manager.template_path = str(template_path)
+    yield manager
+    manager.stop_watching()
+
+
+def _count_disk_loads(manager):
+    calls = []
+    original = manager._load_config_from_disk
+
+    def _counting():
+        calls.append(1)
+        return original()
+
+    manager._load_config_from_disk = _counting
+    return calls
+
+
+def test_snapshot_is_read_only_with_plugin_views():
+    snapshot = ConfigSnapshot({'weather': {'enabled': True, 'units': ['F']}}, version=1)
+    view = snapshot.plugin('weather')
+    assert view['units'] == ('F',)
+    with pytest.raises(TypeError):
+        view['enabled'] = False
+    assert snapshot.plugin('missing') == {}
+
+    copy = snapshot.plugin_config('weather')
+    copy['units'].append('C')
+    assert snapshot.plugin_config('weather') == {'enabled': True, 'units': ['F']}
+    assert snapshot.to_dict() == {'weather': {'enabled': True, 'units': ['F']}}
+
+
+def test_unchanged_files_reuse_the_snapshot(manager):
+    loads = _count_disk_loads(manager)
+    first = manager.load_config()
+    first['display']['brightness'] = 1  # Callers own what load_config returns
+    second = manager.load_config()
+    assert second['display']['brightness'] == 50
+    assert second['weather']['api_key'] == 'secret'
+    assert manager.get_snapshot() is manager.get_snapshot()
+    assert manager.get_plugin_config('weather')['api_key'] == 'secret'
+    assert len(loads) == 1
+
+
+def test_file_changes_produce_a_new_version(manager):
+    loads = _count_disk_loads(manager)
+    before = manager.get_snapshot()
+    _write(manager.config_path, {'display': {'brightness': 75}}, age=5)
+    after = manager.get_snapshot()
+    assert after is not before
+    assert after.version == before.version + 1
+    assert after['display']['brightness'] == 75
+    assert len(loads) == 2
+
+    # Rewriting identical content keeps the version
+    _write(manager.config_path, {'display': {'brightness': 75}}, age=4)
+    assert manager.get_snapshot() is after
+
+
+def test_recently_modified_files_are_not_trusted(manager):
+    loads = _count_disk_loads(manager)
+    _write(manager.config_path, {'display': {'brightness': 60}}, age=0)
+    manager.load_config()
+    manager.load_config()
+    assert len(loads) == 2
+
+
+def test_saves_invalidate_the_snapshot(manager):
+    manager.get_snapshot()
+    manager.save_config({'display': {'brightness': 20}, 'weather': {'enabled': False}})
+    assert manager.get_snapshot()['display']['brightness'] == 20
+
+
+def test_watcher_reports_atomic_replacements(tmp_path):
+    target = tmp_path / 'config.json'
+    target.write_text('{}')
+    changed = threading.Event()
+    watcher = ConfigFileWatcher([str(target)], changed.set, poll_interval=0.05, debounce=0.05)
+    watcher.start()
+    try:
+        time.sleep(0.1)
+        temp = tmp_path / 'config.json.tmp'
+        temp.write_text('{"a": 1}')
+        os.replace(temp, target)
+        assert changed.wait(3.0)
+    finally:
+        watcher.stop()
+    assert not watcher.thread.is_alive()
+
+
+def test_watching_manager_serves_snapshot_without_stat(manager):
+    reloaded = threading.Event()
+    watcher = manager.start_watching(reloaded.set, poll_interval=0.05)
+    watcher.debounce = 0.05
+    first = manager.get_snapshot()
+    time.sleep(0.1)
+    _write(manager.config_path, {'display': {'brightness': 90}}, age=3)
+    assert reloaded.wait(3.0)
+    assert manager.get_snapshot() is not first
+    assert manager.get_snapshot()['display']['brightness'] == 90
@@ -175,6 +175,41 @@ class TestDisplayControllerLivePriority:
         assert controller.force_change is True
 
 
+class TestDisplayControllerEvents:
+    """Test event-driven refresh of live priority and on-demand state."""
+
+    def test_live_priority_rescanned_only_after_event(self, test_display_controller, mock_plugin_with_live):
+        """Plugins are not re-scanned until an update event arrives."""
+        from src.event_bus import EventType
+        controller = test_display_controller
+        controller.plugin_modes = {"test_plugin_live": mock_plugin_with_live}
+        controller.event_bus.drain()
+
+        assert controller._get_live_priority_mode() == "test_plugin_live"
+        mock_plugin_with_live.has_live_content.return_value = False
+        controller._process_display_events()
+        assert controller._get_live_priority_mode() == "test_plugin_live"
+
+        controller.event_bus.publish(EventType.PLUGIN_UPDATED, source="test_plugin")
+        controller._process_display_events()
+        assert controller._get_live_priority_mode() is None
+
+    def test_on_demand_polled_only_after_event(self, test_display_controller):
+        """The on-demand request cache is read when the watcher reports a change."""
+        from src.event_bus import EventType
+        controller = test_display_controller
+        controller._on_demand_request_watched = True
+        controller._process_display_events()
+
+        with patch.object(controller, '_poll_on_demand_requests') as poll:
+            controller._process_display_events()
+            poll.assert_not_called()
+
+            controller.event_bus.publish(EventType.ON_DEMAND_REQUEST, source="path_watcher")
+            controller._process_display_events()
+            poll.assert_called_once()
+
+
 class TestDisplayControllerDynamicDuration:
     """Test dynamic duration handling."""
     
@@ -272,6 +272,58 @@ class TestPluginHealth:
         assert health["recent_error_count"] == 10
 
 
+class TestBoundedStorage:
+    """Test ring-buffered storage and sliding-window counters."""
+
+    def test_pattern_window_expires_old_occurrences(self):
+        """Occurrences older than the pattern window should stop counting."""
+        aggregator = ErrorAggregator(pattern_threshold=3, pattern_window_minutes=60)
+        old = datetime.now() - timedelta(hours=2)
+
+        with patch('src.error_aggregator.datetime') as mock_datetime:
+            mock_datetime.now.return_value = old
+            for _ in range(2):
+                aggregator.record_error(error=ValueError("Old"))
+
+        aggregator.record_error(error=ValueError("New"))
+
+        assert "ValueError" not in aggregator._patterns
+        assert aggregator._type_windows["ValueError"].count == 1
+        assert aggregator._error_counts["ValueError"] == 3
+
+    def test_plugin_health_only_counts_last_100_records(self):
+        """Plugin health should only consider the most recent records."""
+        aggregator = ErrorAggregator(max_records=1000)
+
+        for _ in range(5):
+            aggregator.record_error(error=ValueError("Error"), plugin_id="flaky")
+        for _ in range(98):
+            aggregator.record_error(error=ValueError("Other"), plugin_id="other")
+
+        health = aggregator.get_plugin_health("flaky")
+
+        assert health["recent_error_count"] == 2
+        assert health["total_errors"] == 5
+
+    def test_error_storm_keeps_storage_bounded(self):
+        """An error storm should not grow records or pattern state without bound."""
+        aggregator = ErrorAggregator(max_records=50, pattern_threshold=5)
+
+        for i in range(2000):
+            aggregator.record_error(error=ValueError(f"Error {i}"), plugin_id="flaky")
+
+        pattern = aggregator._patterns["ValueError"]
+        summary = aggregator.get_error_summary()
+
+        assert len(aggregator._records) == 50
+        assert pattern.count == 2000
+        assert pattern.affected_plugins == ["flaky"]
+        assert len(pattern.sample_messages) <= 5
+        assert len(aggregator._type_windows["ValueError"].buckets) <= 60
+        assert summary["recent_errors"][-1]["message"] == "Error 1999"
+        assert len(summary["recent_errors"]) == 20
+
+
 class TestRecordClearing:
     """Test clearing old records."""
 
@@ -0,0 +1,75 @@
+"""
+Tests for the display event bus and path watcher.
+"""
+
+import time
+
+from src.event_bus import EventBus, EventType, PathWatcher
+
+
+class TestEventBus:
+    """Test publishing and consuming events."""
+
+    def test_wait_returns_all_pending_events(self):
+        bus = EventBus()
+        bus.publish(EventType.PLUGIN_UPDATED, source='nhl')
+        bus.publish(EventType.CONFIG_CHANGED)
+
+        events = bus.wait(timeout=1.0)
+
+        assert [e.event_type for e in events] == [EventType.PLUGIN_UPDATED, EventType.CONFIG_CHANGED]
+        assert events[0].source == 'nhl'
+        assert not bus.has_pending()
+
+    def test_wait_times_out_without_events(self):
+        bus = EventBus()
+        start = time.monotonic()
+        assert bus.wait(timeout=0.05) == []
+        assert time.monotonic() - start >= 0.04
+
+    def test_full_queue_drops_and_counts(self):
+        bus = EventBus(maxsize=2)
+        assert bus.publish(EventType.PLUGIN_UPDATED)
+        assert bus.publish(EventType.PLUGIN_UPDATED)
+        assert bus.publish(EventType.PLUGIN_UPDATED) is False
+        assert bus.dropped_count == 1
+        assert len(bus.drain()) == 2
+
+
+class TestPathWatcher:
+    """Test file change detection."""
+
+    def test_create_rewrite_and_delete_publish_events(self, tmp_path):
+        bus = EventBus()
+        watcher = PathWatcher(bus)
+        status_file = tmp_path / 'wifi_status.json'
+        watcher.watch(status_file, EventType.STATUS_MESSAGE)
+
+        assert watcher.check() == 0
+
+        status_file.write_text('{"message": "Connecting"}')
+        assert watcher.check() == 1
+        event = bus.drain()[0]
+        assert event.event_type == EventType.STATUS_MESSAGE
+        assert event.payload == {'path': str(status_file), 'exists': True}
+
+        status_file.write_text('{"message": "Connected to home network"}')
+        assert watcher.check() == 1
+
+        status_file.unlink()
+        assert watcher.check() == 1
+        assert bus.drain()[-1].payload['exists'] is False
+
+    def test_thread_publishes_changes(self, tmp_path):
+        bus = EventBus()
+        watcher = PathWatcher(bus, interval=0.01)
+        request_file = tmp_path / 'display_on_demand_request.json'
+        watcher.watch(request_file, EventType.ON_DEMAND_REQUEST)
+        watcher.start()
+        try:
+            request_file.write_text('{}')
+            events = bus.wait(timeout=2.0)
+        finally:
+            watcher.stop()
+
+        assert [e.event_type for e in events] == [EventType.ON_DEMAND_REQUEST]
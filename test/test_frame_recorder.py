@@ -0,0 +1,138 @@
+"""
+Tests for frame recording and golden comparison.
+"""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.frame_recorder import (
+    FrameReader,
+    FrameRecorder,
+    compare_recordings,
+    latency_percentiles,
+)
+
+
+def _scroll_frames(count, offset=0):
+    """Frames of a bar scrolling across a 64x32 display."""
+    frames = []
+    for i in range(count):
+        image = Image.new('RGB', (64, 32))
+        ImageDraw.Draw(image).rectangle([(i + offset) % 64, 8, (i + offset) % 64 + 6, 20], fill=(255, 128, 0))
+        frames.append(image)
+    return frames
+
+
+def _record(path, frames, plugin_id='ticker', keyframe_interval=4):
+    recorder = FrameRecorder(path, keyframe_interval=keyframe_interval)
+    recorder.start(64, 32)
+    for image in frames:
+        recorder.begin_frame('ticker', plugin_id)
+        recorder.record(image)
+    recorder.stop()
+    return recorder
+
+
+def test_recording_round_trips_frames(tmp_path):
+    frames = _scroll_frames(10)
+    recorder = _record(tmp_path / 'frames.ledrec', frames)
+
+    reader = FrameReader(tmp_path / 'frames.ledrec')
+    assert (reader.width, reader.height) == (64, 32)
+    decoded = list(reader)
+    assert len(decoded) == 10
+    for image, frame in zip(frames, decoded):
+        assert np.array_equal(frame.pixels, np.asarray(image))
+        assert frame.plugin_id == 'ticker'
+        assert frame.display_mode == 'ticker'
+    assert [f.keyframe for f in decoded[:5]] == [True, False, False, False, True]
+    # Deltas compress far below the 6 KB of a raw frame
+    assert recorder.bytes_written < 10 * 64 * 32 * 3 / 10
+
+
+def test_later_drawing_does_not_change_recorded_frame(tmp_path):
+    recorder = FrameRecorder(tmp_path / 'frames.ledrec')
+    recorder.start(64, 32)
+    image = Image.new('RGB', (64, 32))
+    recorder.record(image)
+    ImageDraw.Draw(image).point((1, 1), fill=(255, 255, 255))
+    recorder.record(image)
+    recorder.stop()
+
+    first, second = FrameReader(tmp_path / 'frames.ledrec')
+    assert not first.pixels.any()
+    assert tuple(second.pixels[1, 1]) == (255, 255, 255)
+
+
+def test_identical_recordings_pass(tmp_path):
+    _record(tmp_path / 'golden.ledrec', _scroll_frames(8))
+    _record(tmp_path / 'actual.ledrec', _scroll_frames(8))
+
+    report = compare_recordings(FrameReader(tmp_path / 'actual.ledrec'), FrameReader(tmp_path / 'golden.ledrec'),
+                                latency_factor=1000)
+    assert report['passed']
+    assert report['mismatched_frames'] == 0
+    assert report['latency']['by_plugin']['ticker']['count'] == 8
+
+
+def test_visual_regression_is_reported(tmp_path):
+    _record(tmp_path / 'golden.ledrec', _scroll_frames(8))
+    _record(tmp_path / 'actual.ledrec', _scroll_frames(4) + _scroll_frames(4, offset=1)[:4])
+
+    report = compare_recordings(FrameReader(tmp_path / 'actual.ledrec'), FrameReader(tmp_path / 'golden.ledrec'),
+                                latency_factor=1000)
+    assert not report['passed']
+    assert report['mismatched_frames'] == 4
+    assert [m['index'] for m in report['mismatches']] == [4, 5, 6, 7]
+    assert all(m['reason'] == 'pixels' for m in report['mismatches'])
+
+
+def test_latency_regression_is_reported(tmp_path):
+    frames = _scroll_frames(6)
+    _record(tmp_path / 'golden.ledrec', frames)
+
+    recorder = FrameRecorder(tmp_path / 'actual.ledrec')
+    recorder.start(64, 32)
+    for i, image in enumerate(frames):
+        with patch('src.frame_recorder.time.perf_counter', side_effect=[10.0 * i, 10.0 * i + 0.5]):
+            recorder.begin_frame('ticker', 'ticker')
+            recorder.record(image)
+    recorder.stop()
+
+    report = compare_recordings(FrameReader(tmp_path / 'actual.ledrec'), FrameReader(tmp_path / 'golden.ledrec'))
+    assert report['mismatched_frames'] == 0
+    assert not report['passed']
+    assert report['latency_regressions'][0]['plugin_id'] == 'ticker'
+    assert report['latency_regressions'][0]['p95'] == 0.5
+
+
+def test_latency_percentiles():
+    stats = latency_percentiles([0.001 * i for i in range(1, 101)])
+    assert stats['count'] == 100
+    assert abs(stats['p50'] - 0.0505) < 1e-9
+    assert stats['max'] == 0.1
+    assert latency_percentiles([]) == {'count': 0}
+
+
+def test_display_manager_records_pushed_frames(tmp_path, test_config):
+    from src.display_manager import DisplayManager
+
+    record_path = tmp_path / 'frames.ledrec'
+    with patch.dict(os.environ, {'LEDMATRIX_RECORD_FRAMES': str(record_path)}), \
+         patch('src.display_manager.freetype'):
+        DisplayManager._instance = None
+        dm = DisplayManager(test_config, force_fallback=True, suppress_test_pattern=True)
+        try:
+            dm.begin_frame('clock', 'clock')
+            dm.draw.point((0, 0), fill=(0, 255, 0))
+            dm.update_display()
+        finally:
+            dm.cleanup()
+
+    frames = list(FrameReader(record_path))
+    assert len(frames) == 1
+    assert frames[0].plugin_id == 'clock'
+    assert tuple(frames[0].pixels[0, 0]) == (0, 255, 0)
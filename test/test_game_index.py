@@ -0,0 +1,85 @@
+"""
+Tests for the indexed game query layer.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.common.game_helper import GameHelper
+from src.common.game_index import GameIndex
+
+NOW = datetime.now(timezone.utc)
+
+
+def _game(game_id, home, away, hours, state):
+    return {
+        'id': game_id,
+        'home_abbr': home,
+        'away_abbr': away,
+        'start_time_utc': NOW + timedelta(hours=hours) if hours is not None else None,
+        'is_live': state == 'live',
+        'is_final': state == 'final',
+        'is_upcoming': state == 'upcoming',
+        'is_halftime': False,
+        'is_period_break': False,
+    }
+
+
+@pytest.fixture
+def games():
+    return [
+        _game('1', 'UGA', 'BAMA', -30, 'final'),
+        _game('2', 'OSU', 'MICH', -1, 'live'),
+        _game('3', 'UGA', 'TENN', 20, 'upcoming'),
+        _game('4', 'LSU', 'OSU', -100, 'final'),
+        _game('5', 'TEX', 'OU', -2, 'live'),
+        _game('6', 'UGA', 'UF', None, 'upcoming'),
+    ]
+
+
+def _ids(games):
+    return [g['id'] for g in games]
+
+
+def test_single_filters_match_game_helper(games):
+    helper = GameHelper()
+    index = helper.build_index(games)
+    by_time = helper.sort_games_by_time
+
+    assert _ids(index.live()) == _ids(by_time(helper.filter_live_games(games)))
+    assert _ids(index.final()) == _ids(by_time(helper.filter_final_games(games)))
+    assert _ids(index.upcoming()) == _ids(by_time(helper.filter_upcoming_games(games)))
+    assert _ids(index.for_teams(['UGA', 'OSU'])) == _ids(by_time(helper.filter_favorite_teams(games, ['UGA', 'OSU'])))
+    assert _ids(index.recent(2)) == _ids(by_time(helper.filter_recent_games(games, 2)))
+    assert _ids(index.sorted_by_time(reverse=True)) == _ids(by_time(games, reverse=True))
+
+
+def test_composite_query(games):
+    index = GameIndex(games)
+    result = index.query(states=['live', 'final'], teams=['UGA', 'OSU'],
+                         start=NOW - timedelta(hours=48), reverse=True)
+    assert _ids(result) == ['2', '1']
+    assert _ids(index.query(teams=['UGA'], limit=1)) == ['1']
+    assert _ids(index.query(states=['upcoming'], end=NOW + timedelta(days=1))) == ['3']
+    assert index.query(teams=['NOPE']) == []
+
+
+def test_unparseable_time_bound_is_rejected(games):
+    index = GameIndex(games)
+    with pytest.raises(ValueError):
+        index.query(start='yesterday')
+
+
+def test_results_are_the_indexed_objects(games):
+    index = GameIndex(games)
+    assert index.query(teams=['TEX'])[0] is games[4]
+    assert len(index) == 6
+
+
+def test_iso_string_start_times_are_parsed_once(games):
+    for game in games:
+        if game['start_time_utc'] is not None:
+            game['start_time_utc'] = game['start_time_utc'].isoformat().replace('+00:00', 'Z')
+    index = GameIndex(games)
+    assert _ids(index.query(start=NOW - timedelta(hours=3))) == ['5', '2', '3']
@@ -0,0 +1,236 @@
+"""
+Tests for the shared HTTP client: caching, revalidation, request collapsing,
+rate limits and metrics.
+
+A local HTTP server stands in for upstream APIs.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.http_client import HTTP_REQUESTS, HttpClient, TokenBucket
+
+
+class _FakeAPI:
+    """Serves JSON documents with per-path caching headers and counts requests."""
+
+    def __init__(self):
+        self.hits = {}
+        self.not_modified = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                with fake.lock:
+                    fake.hits[path] = fake.hits.get(path, 0) + 1
+                    fake.active += 1
+                    fake.max_active = max(fake.max_active, fake.active)
+                try:
+                    self._respond(path)
+                finally:
+                    with fake.lock:
+                        fake.active -= 1
+
+            def _respond(self, path):
+                headers = {}
+                if path == '/fresh':
+                    headers['Cache-Control'] = 'max-age=60'
+                elif path == '/etag':
+                    headers['Cache-Control'] = 'no-cache'
+                    headers['ETag'] = '"v1"'
+                    if self.headers.get('If-None-Match') == '"v1"':
+                        with fake.lock:
+                            fake.not_modified += 1
+                        self.send_response(304)
+                        for name, value in headers.items():
+                            self.send_header(name, value)
+                        self.end_headers()
+                        return
+                elif path == '/no-store':
+                    headers['Cache-Control'] = 'no-store, max-age=60'
+                elif path == '/slow':
+                    time.sleep(0.2)
+                    headers['Cache-Control'] = 'max-age=60'
+                body = json.dumps({'path': path, 'hit': fake.hits[path]}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _DictCache:
+    """Minimal stand-in for CacheManager's get/set with max_age."""
+
+    def __init__(self):
+        self.entries = {}
+        self.writes = 0
+
+    def get(self, key, max_age=300):
+        entry = self.entries.get(key)
+        if entry and time.time() - entry['timestamp'] <= max_age:
+            return entry['data']
+        return None
+
+    def set(self, key, data, ttl=None):
+        self.entries[key] = {'data': data, 'timestamp': time.time()}
+        self.writes += 1
+
+    def clear_cache(self, key=None):
+        self.entries.pop(key, None)
+
+
+@pytest.fixture
+def api():
+    server = _FakeAPI()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def client():
+    return HttpClient(rate=1000, burst=1000, retries=0)
+
+
+def test_max_age_responses_are_served_from_cache(api, client):
+    first = client.get(f"{api.base_url}/fresh", params={'a': 1})
+    second = client.get(f"{api.base_url}/fresh", params={'a': 1})
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert second.json() == first.json()
+    assert api.hits['/fresh'] == 1
+
+    # Different query parameters are different resources
+    client.get(f"{api.base_url}/fresh", params={'a': 2})
+    assert api.hits['/fresh'] == 2
+
+
+def test_caller_max_age_overrides_server_freshness(api, client):
+    client.get(f"{api.base_url}/plain", max_age=60)
+    assert client.get(f"{api.base_url}/plain", max_age=60).from_cache is False
+    assert api.hits['/plain'] == 2  # No validators and no lifetime: never stored
+
+    client.get(f"{api.base_url}/fresh")
+    assert client.get(f"{api.base_url}/fresh", max_age=0).from_cache is False
+    assert api.hits['/fresh'] == 2
+
+
+def test_etag_responses_are_revalidated(api):
+    cache = _DictCache()
+    client = HttpClient(cache_manager=cache, rate=1000, burst=1000, retries=0)
+    first = client.get(f"{api.base_url}/etag")
+    second = client.get(f"{api.base_url}/etag")
+    assert api.hits['/etag'] == 2
+    assert api.not_modified == 1
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert second.from_cache is True
+    assert any(key.startswith('http_cache_') for key in cache.entries)
+    assert client.get_stats()['127.0.0.1']['revalidated'] == 1
+
+
+def test_revalidation_does_not_rewrite_the_stored_body(api):
+    cache = _DictCache()
+    client = HttpClient(cache_manager=cache, rate=1000, burst=1000, retries=0)
+    first = client.get(f"{api.base_url}/etag")
+    for _ in range(3):
+        assert client.get(f"{api.base_url}/etag").json() == first.json()
+    assert api.not_modified == 3
+    assert cache.writes == 1
+
+
+def test_each_request_counts_one_result(api, client):
+    def counts():
+        return {result: HTTP_REQUESTS.labels('127.0.0.1', result).value()
+                for result in ('network', 'cache_hit', 'revalidated', 'collapsed', 'error')}
+
+    before = counts()
+    client.get(f"{api.base_url}/etag")
+    client.get(f"{api.base_url}/etag")
+    client.get(f"{api.base_url}/fresh")
+    client.get(f"{api.base_url}/fresh")
+    after = counts()
+    assert {result: after[result] - before[result] for result in after} == {
+        'network': 2, 'cache_hit': 1, 'revalidated': 1, 'collapsed': 0, 'error': 0}
+
+
+def test_caller_conditional_headers_bypass_the_cache(api, client):
+    client.get(f"{api.base_url}/etag")
+    response = client.get(f"{api.base_url}/etag", headers={'If-None-Match': '"v1"'})
+    assert response.status_code == 304
+
+
+def test_no_store_and_opt_out_are_not_cached(api, client):
+    client.get(f"{api.base_url}/no-store")
+    client.get(f"{api.base_url}/no-store")
+    client.get(f"{api.base_url}/fresh", cache=False)
+    client.get(f"{api.base_url}/fresh", cache=False)
+    assert api.hits['/no-store'] == 2
+    assert api.hits['/fresh'] == 2
+
+
+def test_concurrent_identical_requests_share_one_fetch(api, client):
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        responses = list(pool.map(lambda _: client.get(f"{api.base_url}/slow"), range(6)))
+    assert api.hits['/slow'] == 1
+    assert {r.json()['hit'] for r in responses} == {1}
+
+
+def test_per_host_concurrency_cap(api):
+    client = HttpClient(rate=1000, burst=1000, max_concurrent=2, retries=0)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(lambda i: client.get(f"{api.base_url}/slow", cache=False), range(6)))
+    assert api.max_active <= 2
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, burst=2)
+    start = time.monotonic()
+    for _ in range(7):
+        bucket.acquire()
+    # Two requests ride the burst; the other five wait 20ms each
+    assert time.monotonic() - start >= 0.09
+
+
+def test_stats_track_requests_bytes_and_latency(api, client):
+    client.configure_host('127.0.0.1', rate=1000, burst=1000)
+    client.get(f"{api.base_url}/fresh")
+    client.get(f"{api.base_url}/fresh")
+    client.get(f"{api.base_url}/missing-status", cache=False)
+    stats = client.get_stats()['127.0.0.1']
+    assert stats['requests'] == 3
+    assert stats['network_requests'] == 2
+    assert stats['cache_hits'] == 1
+    assert stats['bytes_received'] > 0
+    assert stats['max_latency_ms'] >= stats['avg_latency_ms'] > 0
+
+
+def test_session_facade_merges_default_headers(api, client):
+    session = client.session({'Accept': 'application/json'})
+    session.headers.update({'X-Test': '1'})
+    response = session.get(f"{api.base_url}/fresh")
+    assert response.status_code == 200
+    assert session.get(f"{api.base_url}/fresh").from_cache is True
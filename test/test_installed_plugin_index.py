@@ -0,0 +1,147 @@
+"""
+Tests for the installed plugin index and subprocess-free git metadata.
+
+Repositories are created with the git CLI; the reader's output is compared
+against what git itself reports.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.plugin_system.git_metadata import read_commit_date, read_git_info
+from src.plugin_system.installed_plugin_index import InstalledPluginIndex
+from src.plugin_system.plugin_manager import PluginManager
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git not installed")
+
+
+def _git(repo, *args, env=None):
+    full_env = dict(os.environ, GIT_CONFIG_NOSYSTEM='1', HOME=str(repo))
+    full_env.update(env or {})
+    return subprocess.run(['git', '-C', str(repo), *args], capture_output=True, text=True,
+                          check=True, env=full_env).stdout.strip()
+
+
+def _make_repo(path, commits=3, message_body=''):
+    path.mkdir(parents=True, exist_ok=True)
+    _git(path, 'init', '-q', '-b', 'main')
+    _git(path, 'config', 'user.email', 'dev@example.com')
+    _git(path, 'config', 'user.name', 'Dev')
+    _git(path, 'remote', 'add', 'origin', 'https://github.com/example/plugin.git')
+    for i in range(commits):
+        (path / 'file.txt').write_text(f"revision {i}\n")
+        _git(path, 'add', 'file.txt')
+        _git(path, 'commit', '-q', '-m', f"Commit {i}\n\n{message_body}",
+             env={'GIT_COMMITTER_DATE': f"2024-03-0{i + 1}T12:00:00+05:30"})
+    return path
+
+
+def _git_reference(repo):
+    return {
+        'sha': _git(repo, 'rev-parse', 'HEAD'),
+        'date_iso': _git(repo, 'log', '-1', '--format=%cI', 'HEAD'),
+    }
+
+
+class TestGitMetadata:
+    """Compare the file-based reader with git's own output."""
+
+    def test_loose_objects_and_refs(self, tmp_path):
+        repo = _make_repo(tmp_path / 'repo')
+        info = read_git_info(repo)
+
+        assert info['sha'] == _git_reference(repo)['sha']
+        assert info['short_sha'] == info['sha'][:7]
+        assert info['branch'] == 'main'
+        assert info['remote_url'] == 'https://github.com/example/plugin.git'
+        assert info['date_iso'] == _git_reference(repo)['date_iso'] == '2024-03-03T12:00:00+05:30'
+
+    def test_packed_refs_and_deltified_commits(self, tmp_path):
+        body = '\n'.join(f"details line {i} for a long, repetitive commit body" for i in range(100))
+        repo = _make_repo(tmp_path / 'repo', commits=6, message_body=body)
+        _git(repo, 'repack', '-adf', '-q', '--window=250', '--depth=50')
+        _git(repo, 'pack-refs', '--all')
+        assert not (repo / '.git' / 'refs' / 'heads' / 'main').exists()
+
+        info = read_git_info(repo)
+        assert info['sha'] == _git_reference(repo)['sha']
+        for sha in _git(repo, 'rev-list', '--all').split():
+            assert read_commit_date(repo, sha) == _git(repo, 'log', '-1', '--format=%cI', sha)
+
+    def test_detached_head_has_no_branch(self, tmp_path):
+        repo = _make_repo(tmp_path / 'repo')
+        _git(repo, 'checkout', '-q', 'HEAD~1')
+
+        info = read_git_info(repo)
+        assert info['branch'] == ''
+        assert info['sha'] == _git_reference(repo)['sha']
+
+    def test_non_repository_returns_none(self, tmp_path):
+        assert read_git_info(tmp_path) is None
+
+
+@pytest.fixture
+def plugin_manager(tmp_path):
+    plugins_dir = tmp_path / 'plugins'
+    plugins_dir.mkdir()
+    with patch('src.common.permission_utils.ensure_directory_permissions'):
+        manager = PluginManager(plugins_dir=str(plugins_dir), config_manager=MagicMock(),
+                                display_manager=MagicMock(), cache_manager=MagicMock(),
+                                font_manager=MagicMock())
+    return manager
+
+
+def _add_plugin(plugins_dir, plugin_id, version='1.0.0'):
+    plugin_dir = plugins_dir / plugin_id
+    _make_repo(plugin_dir, commits=1)
+    (plugin_dir / 'manifest.json').write_text(json.dumps({'id': plugin_id, 'version': version}))
+    return plugin_dir
+
+
+class TestInstalledPluginIndex:
+    """Index revalidation by mtime."""
+
+    def test_unchanged_tree_is_served_from_cache(self, plugin_manager):
+        _add_plugin(plugin_manager.plugins_dir, 'clock')
+        index = InstalledPluginIndex(plugin_manager)
+        entries = index.get_entries()
+        assert [e['id'] for e in entries] == ['clock']
+        assert entries[0]['git_info']['branch'] == 'main'
+
+        with patch.object(plugin_manager, 'discover_plugins', wraps=plugin_manager.discover_plugins) as discover, \
+             patch('src.plugin_system.installed_plugin_index.read_git_info') as read_git:
+            index.get_entries()
+            discover.assert_not_called()
+            read_git.assert_not_called()
+
+    def test_added_plugin_and_manifest_edit_are_picked_up(self, plugin_manager):
+        clock_dir = _add_plugin(plugin_manager.plugins_dir, 'clock')
+        index = InstalledPluginIndex(plugin_manager)
+        index.get_entries()
+
+        _add_plugin(plugin_manager.plugins_dir, 'weather')
+        time.sleep(0.01)
+        (clock_dir / 'manifest.json').write_text(json.dumps({'id': 'clock', 'version': '2.0.0'}))
+
+        entries = {e['id']: e for e in index.get_entries()}
+        assert set(entries) == {'clock', 'weather'}
+        assert entries['clock']['manifest']['version'] == '2.0.0'
+
+    def test_new_commit_refreshes_git_info(self, plugin_manager):
+        clock_dir = _add_plugin(plugin_manager.plugins_dir, 'clock')
+        index = InstalledPluginIndex(plugin_manager)
+        before = index.get_entries()[0]['git_info']['sha']
+
+        time.sleep(0.01)
+        (clock_dir / 'file.txt').write_text('changed\n')
+        _git(clock_dir, 'commit', '-q', '-am', 'Update')
+
+        after = index.get_entries()[0]['git_info']['sha']
+        assert after != before
+        assert after == _git(clock_dir, 'rev-parse', 'HEAD')
@@ -0,0 +1,113 @@
+"""
+Tests for the queue-based logging pipeline.
+"""
+
+import logging
+import threading
+import time
+
+from src.logging_config import LogPipeline, get_log_pipeline, setup_logging, shutdown_logging
+
+
+class SlowHandler(logging.Handler):
+    """Handler that stalls like a slow SD card, optionally until released."""
+
+    def __init__(self, delay=0.0, gate=None):
+        super().__init__()
+        self.delay = delay
+        self.gate = gate
+        self.messages = []
+        self.threads = set()
+        self.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        self.threads.add(threading.current_thread().name)
+        self.messages.append(self.format(record))
+
+
+def _logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_frame_loop_does_not_wait_for_slow_handler():
+    output = SlowHandler(delay=0.01)
+    pipeline = LogPipeline([output], debug_rate=None)
+    pipeline.start()
+    logger = _logger('test.logging.frames', pipeline.handler)
+
+    frame_overheads = []
+    for frame in range(50):
+        start = time.perf_counter()
+        logger.info("frame %d rendered", frame)
+        frame_overheads.append(time.perf_counter() - start)
+    pipeline.stop()
+
+    # Synchronous writes would cost 10ms per frame
+    assert max(frame_overheads) < 0.005
+    assert len(output.messages) == 50
+    assert output.messages[-1] == 'INFO frame 49 rendered'
+    assert threading.current_thread().name not in output.threads
+
+
+def test_queue_overflow_drops_and_reports():
+    gate = threading.Event()
+    output = SlowHandler(gate=gate)
+    pipeline = LogPipeline([output], queue_size=5, debug_rate=None)
+    pipeline.start()
+    logger = _logger('test.logging.overflow', pipeline.handler)
+
+    start = time.perf_counter()
+    for i in range(50):
+        logger.warning("burst %d", i)
+    assert time.perf_counter() - start < 0.5
+    dropped = pipeline.stats()['dropped']
+    assert dropped > 0
+
+    gate.set()
+    pipeline.stop()
+    assert len(output.messages) == 50 - dropped + 1
+    assert output.messages[-1] == f'WARNING Dropped {dropped} log records (log queue full)'
+
+
+def test_debug_spam_is_rate_limited_per_logger():
+    output = SlowHandler()
+    pipeline = LogPipeline([output], debug_rate=0.001, debug_burst=10)
+    pipeline.start()
+    spammy = _logger('test.logging.spammy', pipeline.handler)
+    quiet = _logger('test.logging.quiet', pipeline.handler)
+
+    for i in range(100):
+        spammy.debug("tick %d", i)
+    spammy.error("real problem")
+    quiet.debug("still heard")
+    pipeline.stop()
+
+    assert pipeline.stats()['rate_limited'] == 90
+    assert sum(1 for m in output.messages if 'tick' in m) == 10
+    assert 'ERROR real problem' in output.messages
+    assert 'DEBUG still heard' in output.messages
+    assert output.messages[-1] == 'DEBUG Rate limited 90 debug records'
+
+
+def test_setup_logging_installs_pipeline_on_root():
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        setup_logging(level=logging.INFO)
+        pipeline = get_log_pipeline()
+        assert pipeline is not None
+        assert root.handlers == [pipeline.handler]
+        shutdown_logging()
+        assert get_log_pipeline() is None
+        assert pipeline.handler not in root.handlers
+    finally:
+        shutdown_logging()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
@@ -0,0 +1,203 @@
+"""
+Tests for the background logo prefetcher.
+
+A local HTTP server stands in for the ESPN logo CDN so that concurrent
+downloads, ETag revalidation and failed-download retries run over real
+connections.
+"""
+
+import hashlib
+import io
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from PIL import Image
+
+from src.logo_downloader import LogoDownloader
+from src.logo_prefetcher import LogoPrefetcher, placeholder_logo
+
+
+def _png(color):
+    buffer = io.BytesIO()
+    Image.new('RGBA', (20, 20), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class _FakeLogoServer:
+    """Serves PNGs with ETags and records every request."""
+
+    def __init__(self, delay=0.0):
+        self.logos = {}
+        self.requests = []
+        self.delay = delay
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with fake.lock:
+                    fake.requests.append((self.path, self.headers.get('If-None-Match')))
+                if fake.delay:
+                    time.sleep(fake.delay)
+                body = fake.logos.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                etag = f'"{hashlib.sha1(body).hexdigest()[:10]}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'image/png')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def team(self, abbr, color=(255, 0, 0, 255)):
+        self.logos[f'/{abbr}.png'] = _png(color)
+        return {'id': abbr.lower(), 'abbreviation': abbr, 'logo_url': f'{self.base_url}/{abbr}.png'}
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def cdn():
+    server = _FakeLogoServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def prefetcher():
+    prefetcher = LogoPrefetcher(downloader=LogoDownloader(request_timeout=5, retry_attempts=0), max_workers=4)
+    yield prefetcher
+    prefetcher.shutdown()
+
+
+def test_sync_downloads_concurrently_and_records_manifest(cdn, prefetcher, tmp_path):
+    cdn.delay = 0.2
+    teams = [cdn.team(abbr) for abbr in ('DAL', 'NYG', 'PHI', 'WAS')]
+
+    start = time.monotonic()
+    assert prefetcher.sync_league('nfl', tmp_path, teams=teams) == (4, 0)
+    assert time.monotonic() - start < 0.6
+
+    manifest = prefetcher.load_manifest('nfl', tmp_path)
+    entry = manifest['DAL.png']
+    assert entry['team_id'] == 'dal' and entry['url'] == teams[0]['logo_url']
+    assert entry['etag'] and 'failed_at' not in entry
+    assert entry['sha256'] == hashlib.sha256((tmp_path / 'DAL.png').read_bytes()).hexdigest()
+    assert Image.open(tmp_path / 'DAL.png').mode == 'RGBA'
+
+
+def test_fresh_logos_skipped_and_stale_logos_revalidated(cdn, prefetcher, tmp_path):
+    teams = [cdn.team('DAL')]
+    prefetcher.sync_league('nfl', tmp_path, teams=teams)
+    cdn.requests.clear()
+
+    assert prefetcher.sync_league('nfl', tmp_path, teams=teams) == (0, 0)
+    assert cdn.requests == []
+
+    prefetcher.STALE_AFTER = 0
+    assert prefetcher.sync_league('nfl', tmp_path, teams=teams) == (0, 0)
+    assert cdn.requests[0][1] is not None  # conditional request answered with 304
+    assert prefetcher.stats['not_modified'] == 1
+
+
+def test_request_returns_immediately(cdn, prefetcher, tmp_path):
+    cdn.delay = 0.3
+    team = cdn.team('DAL')
+    logo_path = tmp_path / 'DAL.png'
+
+    start = time.monotonic()
+    assert prefetcher.request('nfl', 'dal', 'DAL', logo_path, team['logo_url'])
+    assert not prefetcher.request('nfl', 'dal', 'DAL', logo_path, team['logo_url'])
+    assert time.monotonic() - start < 0.1
+    assert prefetcher.is_pending(logo_path)
+
+    deadline = time.monotonic() + 5
+    while prefetcher.is_pending(logo_path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert logo_path.exists()
+    assert len(cdn.requests) == 1
+
+
+def test_failed_download_is_not_written_and_is_retried(cdn, prefetcher, tmp_path):
+    team = {'id': 'bad', 'abbreviation': 'BAD', 'logo_url': f'{cdn.base_url}/BAD.png'}
+    logo_path = tmp_path / 'BAD.png'
+    assert prefetcher.sync_league('nfl', tmp_path, teams=[team]) == (0, 1)
+    assert prefetcher.load_manifest('nfl', tmp_path)['BAD.png']['failed_at']
+    assert not logo_path.exists()
+
+    cdn.logos['/BAD.png'] = _png((0, 0, 255, 255))
+    assert prefetcher.sync_league('nfl', tmp_path, teams=[team]) == (0, 0)
+    assert not prefetcher.request('nfl', 'bad', 'BAD', logo_path, team['logo_url'])
+
+    # A restart still backs off: the failure is read from the manifest
+    restarted = LogoPrefetcher(downloader=prefetcher.downloader, max_workers=1)
+    try:
+        assert not restarted.request('nfl', 'bad', 'BAD', logo_path, team['logo_url'])
+    finally:
+        restarted.shutdown()
+
+    prefetcher.FAILED_RETRY_AFTER = 0
+    assert prefetcher.sync_league('nfl', tmp_path, teams=[team]) == (1, 0)
+    assert Image.open(logo_path).getpixel((0, 0)) == (0, 0, 255, 255)
+    assert 'failed_at' not in prefetcher.load_manifest('nfl', tmp_path)['BAD.png']
+
+
+def test_legacy_placeholder_file_is_replaced(cdn, prefetcher, tmp_path):
+    team = cdn.team('OLD', color=(0, 0, 255, 255))
+    logo_path = tmp_path / 'OLD.png'
+    placeholder_logo('OLD', (64, 64)).save(logo_path)
+    prefetcher._update_manifest('nfl', tmp_path, 'OLD.png', {
+        'team_id': 'old', 'url': team['logo_url'], 'placeholder': True, 'checked_at': time.time(),
+        'sha256': hashlib.sha256(logo_path.read_bytes()).hexdigest(),
+    })
+
+    assert prefetcher.sync_league('nfl', tmp_path, teams=[team]) == (1, 0)
+    assert Image.open(logo_path).getpixel((0, 0)) == (0, 0, 255, 255)
+    assert not prefetcher.load_manifest('nfl', tmp_path)['OLD.png'].get('placeholder')
+
+
+def test_corrupt_logo_redownloaded_but_custom_logo_kept(cdn, prefetcher, tmp_path):
+    teams = [cdn.team('DAL'), cdn.team('NYG')]
+    prefetcher.sync_league('nfl', tmp_path, teams=teams)
+
+    (tmp_path / 'DAL.png').write_bytes(b'truncated')
+    Image.new('RGBA', (10, 10), (0, 255, 0, 255)).save(tmp_path / 'NYG.png')
+
+    assert prefetcher.sync_league('nfl', tmp_path, teams=teams) == (1, 0)
+    assert Image.open(tmp_path / 'DAL.png').getpixel((0, 0)) == (255, 0, 0, 255)
+    assert Image.open(tmp_path / 'NYG.png').getpixel((0, 0)) == (0, 255, 0, 255)
+    assert prefetcher.load_manifest('nfl', tmp_path)['NYG.png']['custom']
+
+
+def test_large_league_only_checks_known_logos(cdn, prefetcher, tmp_path):
+    teams = [cdn.team(abbr) for abbr in ('A', 'B', 'C')]
+    Image.new('RGBA', (4, 4)).save(tmp_path / 'A.png')
+    assert prefetcher.sync_league('ncaa_fb', tmp_path, max_teams=2, teams=teams) == (0, 0)
+    assert not (tmp_path / 'B.png').exists()
+
+
+def test_placeholder_image_is_sized_to_fit():
+    logo = placeholder_logo('DAL', (96, 48))
+    assert logo.size == (48, 48) and logo.mode == 'RGBA'
+    assert placeholder_logo('DAL', (96, 48)) is logo
@@ -0,0 +1,101 @@
+"""
+Tests for the shared logo sprite cache.
+"""
+
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from src.common.logo_helper import LogoHelper
+from src.logo_sprites import LogoSpriteCache, get_logo_sprite_cache
+
+
+def _write_logo(path, size=(200, 100), color=(255, 0, 0, 255)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new('RGBA', size, color).save(path)
+    return path
+
+
+@pytest.fixture
+def logo_dir(tmp_path):
+    return tmp_path / 'nfl_logos'
+
+
+def test_sprites_shared_per_league_team_and_size(logo_dir):
+    cache = LogoSpriteCache()
+    path = _write_logo(logo_dir / 'DAL.png')
+
+    first = cache.get_logo('nfl', 'DAL', path, (96, 48))
+    second = cache.get_logo('nfl', 'DAL', path, (96, 48))
+    assert first is second
+    assert first.size == (96, 48) and first.mode == 'RGBA'
+
+    smaller = cache.get_logo('nfl', 'DAL', path, (32, 32))
+    assert smaller.size == (32, 16)
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['resizes'] == 2 and stats['sprites'] == 2
+
+
+def test_logos_never_upscaled(logo_dir):
+    cache = LogoSpriteCache()
+    path = _write_logo(logo_dir / 'SMALL.png', size=(10, 10))
+    assert cache.get_logo('nfl', 'SMALL', path, (96, 48)).size == (10, 10)
+
+
+def test_lru_bounded_by_bytes(logo_dir):
+    # Each 20x10 sprite is 800 bytes
+    cache = LogoSpriteCache(max_bytes=2000)
+    for team in ('A', 'B', 'C'):
+        cache.get_logo('nfl', team, _write_logo(logo_dir / f'{team}.png'), (20, 10))
+    cache.get_logo('nfl', 'A', logo_dir / 'A.png', (20, 10))
+
+    # C evicted A (least recently used); reloading A then evicted B
+    stats = cache.get_stats()
+    assert stats['sprites'] == 2 and stats['bytes'] == 1600 and stats['evictions'] == 2
+    assert stats['hits'] == 0
+    cache.get_logo('nfl', 'C', logo_dir / 'C.png', (20, 10))
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_resized_variants_persist_across_instances(logo_dir, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    path = _write_logo(logo_dir / 'DAL.png')
+
+    LogoSpriteCache(cache_dir=cache_dir).get_logo('nfl', 'DAL', path, (96, 48))
+    variants = list((cache_dir / 'logo_sprites' / 'nfl').glob('DAL_96x48_*.png'))
+    assert len(variants) == 1
+
+    restarted = LogoSpriteCache(cache_dir=cache_dir)
+    logo = restarted.get_logo('nfl', 'DAL', path, (96, 48))
+    assert logo.size == (96, 48)
+    assert restarted.get_stats()['disk_hits'] == 1
+    assert restarted.get_stats()['resizes'] == 0
+
+
+def test_replaced_source_is_reloaded(logo_dir, tmp_path):
+    cache = LogoSpriteCache(cache_dir=tmp_path / 'cache', revalidate_interval=0)
+    path = _write_logo(logo_dir / 'DAL.png', color=(255, 0, 0, 255))
+    assert cache.get_logo('nfl', 'DAL', path, (96, 48)).getpixel((0, 0)) == (255, 0, 0, 255)
+
+    _write_logo(path, size=(100, 50), color=(0, 0, 255, 255))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert cache.get_logo('nfl', 'DAL', path, (96, 48)).getpixel((0, 0)) == (0, 0, 255, 255)
+    # The variant rendered from the old file was replaced
+    assert len(list((tmp_path / 'cache' / 'logo_sprites' / 'nfl').glob('DAL_96x48_*.png'))) == 1
+
+
+def test_missing_source_returns_none(logo_dir):
+    cache = LogoSpriteCache()
+    assert cache.get_logo('nfl', 'NONE', logo_dir / 'NONE.png', (96, 48)) is None
+
+
+def test_logo_helper_uses_shared_cache(logo_dir):
+    path = _write_logo(logo_dir / 'AAPL.png')
+    first = LogoHelper(64, 32).load_logo('AAPL', path)
+    second = LogoHelper(64, 32).load_logo('AAPL', path)
+    assert first is second
+    assert first.size == (96, 48)
+    assert get_logo_sprite_cache().invalidate(league=str(logo_dir)) == 1
@@ -0,0 +1,95 @@
+"""
+Tests for the in-process metrics registry.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.metrics import MetricsRegistry, load_snapshot, render_prometheus
+
+
+def test_counter_sums_increments_from_many_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter('test_events_total', 'Events', ('kind',))
+    start = threading.Event()
+
+    def work():
+        start.wait(5)
+        for _ in range(10000):
+            counter.labels('frame').inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+    counter.labels('frame').inc(5)
+
+    # Exited threads are folded in, and their counts are kept
+    assert counter.labels('frame').value() == 80005
+    assert counter.labels('frame').value() == 80005
+    with pytest.raises(ValueError):
+        counter.labels('frame').inc(-1)
+
+
+def test_histogram_buckets_and_rendering():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('test_frame_seconds', 'Frame time', buckets=(0.01, 0.1, 1.0))
+    for value in (0.005, 0.01, 0.05, 0.5, 2.0):
+        histogram.observe(value)
+
+    text = registry.render()
+    assert '# TYPE test_frame_seconds histogram' in text
+    assert 'test_frame_seconds_bucket{le="0.01"} 2' in text
+    assert 'test_frame_seconds_bucket{le="0.1"} 3' in text
+    assert 'test_frame_seconds_bucket{le="1"} 4' in text
+    assert 'test_frame_seconds_bucket{le="+Inf"} 5' in text
+    assert 'test_frame_seconds_count 5' in text
+    assert 'test_frame_seconds_sum 2.565' in text
+
+
+def test_gauge_and_label_escaping():
+    registry = MetricsRegistry()
+    gauge = registry.gauge('test_queue_depth', 'Queue depth', ('queue',))
+    gauge.labels('a"b').set(3)
+    registry.gauge('test_callback', 'From a callback').set_function(lambda: 7)
+
+    text = registry.render()
+    assert 'test_queue_depth{queue="a\\"b"} 3' in text
+    assert 'test_callback 7' in text
+
+
+def test_registry_returns_existing_metric_and_rejects_conflicts():
+    registry = MetricsRegistry()
+    counter = registry.counter('test_total', 'Total', ('plugin_id',))
+    assert registry.counter('test_total', 'Total', ('plugin_id',)) is counter
+    with pytest.raises(ValueError):
+        registry.gauge('test_total', 'Total')
+    with pytest.raises(ValueError):
+        counter.inc()  # Labelled metrics need labels()
+
+
+def test_snapshot_round_trip_merges_processes(tmp_path):
+    display = MetricsRegistry()
+    display.counter('ledmatrix_requests_total', 'Requests', ('host',)).labels('api.example').inc(3)
+    web = MetricsRegistry()
+    web.counter('ledmatrix_requests_total', 'Requests', ('host',)).labels('api.example').inc()
+
+    path = str(tmp_path / 'metrics.json')
+    assert display.write_snapshot(path)
+    text = render_prometheus([({'process': 'web'}, web.snapshot()), ({'process': 'display'}, load_snapshot(path))])
+
+    assert text.count('# TYPE ledmatrix_requests_total counter') == 1
+    assert 'ledmatrix_requests_total{process="web",host="api.example"} 1' in text
+    assert 'ledmatrix_requests_total{process="display",host="api.example"} 3' in text
+
+
+def test_stale_or_missing_snapshot_is_ignored(tmp_path):
+    path = tmp_path / 'metrics.json'
+    assert load_snapshot(str(path)) is None
+    path.write_text(json.dumps({'timestamp': time.time() - 600, 'metrics': []}))
+    assert load_snapshot(str(path), max_age=120) is None
@@ -0,0 +1,127 @@
+"""
+Tests for the event-driven network status cache.
+"""
+
+import sys
+import time
+from unittest.mock import MagicMock
+
+from src.network_monitor import NetworkStatusMonitor
+from src.wifi_manager import WiFiManager, WiFiStatus
+
+# Stand-in for `nmcli monitor`: prints one event per line written to the events file
+FAKE_MONITOR = r'''
+import os, sys, time
+path = sys.argv[1]
+sent = 0
+while True:
+    try:
+        with open(path) as f:
+            lines = f.read().splitlines()
+    except OSError:
+        lines = []
+    for line in lines[sent:]:
+        print(line, flush=True)
+    sent = len(lines)
+    time.sleep(0.02)
+'''
+
+
+def _wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def _counting_probe(value='up'):
+    calls = []
+
+    def probe():
+        calls.append(1)
+        return value
+
+    return probe, calls
+
+
+def test_results_are_cached_until_an_event(tmp_path):
+    events = tmp_path / 'events'
+    monitor = NetworkStatusMonitor(command=[sys.executable, '-c', FAKE_MONITOR, str(events)], ttl=0)
+    monitor.start()
+    try:
+        assert _wait_for(lambda: monitor.watching)
+        probe, calls = _counting_probe()
+        assert monitor.cached('wifi', probe) == 'up'
+        assert monitor.cached('wifi', probe) == 'up'
+        assert len(calls) == 1
+
+        generation = monitor.generation
+        events.write_text('wlan0: disconnected\n')
+        assert _wait_for(lambda: monitor.generation > generation)
+        monitor.cached('wifi', probe)
+        assert len(calls) == 2
+    finally:
+        monitor.stop()
+    assert not monitor.watching
+
+
+def test_ttl_cache_without_event_source():
+    monitor = NetworkStatusMonitor(command=['/nonexistent/nmcli', 'monitor'], ttl=60)
+    monitor.start()
+    assert _wait_for(lambda: monitor._thread is None)
+    assert not monitor.watching
+    probe, calls = _counting_probe()
+    monitor.cached('wifi', probe)
+    monitor.cached('wifi', probe)
+    assert len(calls) == 1
+
+    monitor.ttl = 0
+    monitor.cached('wifi', probe)
+    assert len(calls) == 2
+
+
+def test_event_source_that_keeps_exiting_is_abandoned(caplog):
+    monitor = NetworkStatusMonitor(command=[sys.executable, '-c', 'raise SystemExit(1)'], ttl=60)
+    monitor.RESTART_DELAY = 0.01
+    monitor.MAX_FAST_EXITS = 3
+    monitor.start()
+    assert _wait_for(lambda: monitor._thread is None)
+    assert monitor._unavailable
+    warnings = [r for r in caplog.records if r.name == 'src.network_monitor' and r.levelname == 'WARNING']
+    assert len(warnings) == 2  # The first exit and giving up
+
+    monitor.start()
+    assert monitor._thread is None
+
+
+def test_uncached_block_probes_directly_and_invalidates():
+    monitor = NetworkStatusMonitor(ttl=60)
+    probe, calls = _counting_probe()
+    monitor.cached('wifi', probe)
+    with monitor.uncached():
+        monitor.cached('wifi', probe)
+        monitor.cached('wifi', probe)
+    assert len(calls) == 3
+    monitor.cached('wifi', probe)
+    assert len(calls) == 4
+    monitor.cached('wifi', probe)
+    assert len(calls) == 4
+
+
+def test_wifi_manager_answers_status_from_cache():
+    manager = WiFiManager.__new__(WiFiManager)
+    manager._status_cache = NetworkStatusMonitor(ttl=60)
+    manager._probe_wifi_status = MagicMock(return_value=WiFiStatus(connected=True, ssid='home'))
+    manager._probe_ethernet_connected = MagicMock(return_value=False)
+
+    status = manager.get_wifi_status()
+    status.ssid = 'changed'
+    assert manager.get_wifi_status().ssid == 'home'
+    assert manager._is_ethernet_connected() is False
+    assert manager._is_ethernet_connected() is False
+    assert manager._probe_wifi_status.call_count == 1
+    assert manager._probe_ethernet_connected.call_count == 1
+
+    manager._status_cache.invalidate()
+    manager.get_wifi_status()
+    assert manager._probe_wifi_status.call_count == 2
@@ -0,0 +1,209 @@
+"""
+Tests for the plugin store's concurrent, conditional metadata cache.
+
+A local HTTP server stands in for GitHub so that ETag handling, persistence
+and concurrency are exercised over real connections.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.plugin_system.store_manager import PluginStoreManager
+from src.plugin_system.store_metadata import StoreMetadataCache
+
+
+class _FakeGitHub:
+    """Serves JSON documents with ETags and records every request."""
+
+    def __init__(self, delay=0.0):
+        self.documents = {}
+        self.requests = []
+        self.delay = delay
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with fake.lock:
+                    fake.requests.append((self.path, self.headers.get('If-None-Match')))
+                if fake.delay:
+                    time.sleep(fake.delay)
+                if self.path not in fake.documents:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                body = json.dumps(fake.documents[self.path]).encode()
+                etag = f'"{hash(body) & 0xffffffff:x}"'
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def paths(self):
+        with self.lock:
+            return [path for path, _ in self.requests]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def github():
+    server = _FakeGitHub()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    metadata = StoreMetadataCache(cache_file=str(tmp_path / 'store_cache.json'))
+    yield metadata
+    metadata.shutdown()
+
+
+def test_fresh_entry_is_served_without_request(github, cache):
+    github.documents['/repo'] = {'stars': 5}
+    url = github.base_url + '/repo'
+
+    first = cache.get_json(url, ttl=60)
+    second = cache.get_json(url, ttl=60)
+
+    assert first.status == 200 and first.data == {'stars': 5} and not first.from_cache
+    assert second.data == {'stars': 5} and second.from_cache
+    assert github.paths() == ['/repo']
+
+
+def test_expired_entry_is_revalidated_with_etag(github, cache):
+    github.documents['/repo'] = {'stars': 5}
+    url = github.base_url + '/repo'
+
+    cache.get_json(url, ttl=60)
+    response = cache.get_json(url, ttl=60, force_refresh=True)
+
+    assert response.data == {'stars': 5}
+    assert github.requests[1][1] is not None  # If-None-Match was sent
+    assert cache.stats['not_modified'] == 1
+
+    github.documents['/repo'] = {'stars': 6}
+    response = cache.get_json(url, ttl=0)
+    assert response.data == {'stars': 6}
+    assert cache.stats['fetched'] == 2
+
+
+def test_entries_persist_across_instances(github, tmp_path):
+    github.documents['/repo'] = {'stars': 5}
+    url = github.base_url + '/repo'
+    cache_file = str(tmp_path / 'store_cache.json')
+
+    first = StoreMetadataCache(cache_file=cache_file)
+    first.get_json(url, ttl=60)
+    first.shutdown()
+
+    second = StoreMetadataCache(cache_file=cache_file)
+    try:
+        assert second.get_json(url, ttl=60).from_cache
+        # Once expired, the persisted ETag turns the refetch into a 304
+        assert second.get_json(url, ttl=0).data == {'stars': 5}
+        assert second.stats['not_modified'] == 1
+    finally:
+        second.shutdown()
+    assert len(github.requests) == 2
+
+
+def test_stale_entry_returned_while_refreshing(github, cache):
+    github.documents['/repo'] = {'stars': 5}
+    url = github.base_url + '/repo'
+    cache.get_json(url, ttl=60)
+    github.documents['/repo'] = {'stars': 9}
+
+    response = cache.get_json(url, ttl=0, allow_stale=True)
+    assert response.data == {'stars': 5} and response.from_cache
+
+    deadline = time.time() + 5
+    while cache.get_json(url, ttl=60).data != {'stars': 9} and time.time() < deadline:
+        time.sleep(0.02)
+    assert cache.get_json(url, ttl=60).data == {'stars': 9}
+
+
+def test_errors_keep_last_good_body(github, cache):
+    github.documents['/repo'] = {'stars': 5}
+    url = github.base_url + '/repo'
+    cache.get_json(url, ttl=60)
+    del github.documents['/repo']
+
+    assert cache.get_json(url, ttl=0).data == {'stars': 5}
+    missing = cache.get_json(github.base_url + '/missing', ttl=60)
+    assert missing.status == 404 and missing.data is None
+    # Negative entries are cached too
+    assert cache.get_json(github.base_url + '/missing', ttl=60).from_cache
+
+
+def test_concurrent_requests_for_same_url_are_deduplicated(cache):
+    slow = _FakeGitHub(delay=0.2)
+    try:
+        slow.documents['/repo'] = {'stars': 1}
+        url = slow.base_url + '/repo'
+        results = cache.map(lambda _: cache.get_json(url, ttl=60).data, range(6))
+        assert results == [{'stars': 1}] * 6
+        assert slow.paths() == ['/repo']
+    finally:
+        slow.close()
+
+
+def test_map_runs_concurrently(cache):
+    slow = _FakeGitHub(delay=0.3)
+    try:
+        for i in range(6):
+            slow.documents[f'/repo{i}'] = {'id': i}
+        start = time.time()
+        results = cache.map(lambda i: cache.get_json(f"{slow.base_url}/repo{i}", ttl=60).data, range(6))
+        elapsed = time.time() - start
+        assert results == [{'id': i} for i in range(6)]
+        assert elapsed < 0.3 * 6 / 2
+    finally:
+        slow.close()
+
+
+def test_search_plugins_enhances_from_cache_and_does_not_mutate_registry(tmp_path):
+    store = PluginStoreManager(plugins_dir=str(tmp_path / 'plugins'),
+                               metadata_cache_file=str(tmp_path / 'store_cache.json'))
+    registry = {'plugins': [
+        {'id': 'alpha', 'name': 'Alpha', 'repo': 'https://github.com/example/alpha', 'category': 'time'},
+        {'id': 'beta', 'name': 'Beta', 'repo': 'https://github.com/example/beta', 'category': 'sports'},
+    ]}
+    repo_info = {'stars': 42, 'default_branch': 'main', 'last_commit_iso': '', 'last_commit_date': ''}
+
+    try:
+        with patch.object(store, 'fetch_registry', return_value=registry), \
+             patch.object(store, '_get_github_repo_info', return_value=repo_info) as repo_mock:
+            results = store.search_plugins(category='sports', fetch_commit_info=False)
+
+        assert [plugin['id'] for plugin in results] == ['beta']
+        assert results[0]['stars'] == 42
+        # Only the filtered plugin was enhanced, and the cached registry is untouched
+        repo_mock.assert_called_once_with('https://github.com/example/beta', allow_stale=True)
+        assert 'stars' not in registry['plugins'][1]
+    finally:
+        store._metadata.shutdown()
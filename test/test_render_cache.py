@@ -0,0 +1,118 @@
+"""
+Tests for memoized plugin rendering.
+"""
+
+from unittest.mock import MagicMock
+
+from PIL import Image, ImageDraw
+
+from src.plugin_system.base_plugin import BasePlugin
+from src.plugin_system.render_cache import RenderCache, memoize_render, skip_render_cache
+
+
+class _FakeDisplayManager:
+    def __init__(self, width=32, height=16):
+        self.image = Image.new('RGB', (width, height))
+        self.draw = ImageDraw.Draw(self.image)
+        self.update_display = MagicMock()
+
+
+class _RenderPlugin(BasePlugin):
+    def __init__(self):
+        super().__init__('render-test', {'enabled': True}, _FakeDisplayManager(), MagicMock(), MagicMock())
+        self.mode = 'a'
+        self.color = (255, 0, 0)
+        self.draw_calls = 0
+        self.present_calls = 0
+        self.fail = False
+
+    def update(self):
+        pass
+
+    def display(self, force_clear=False):
+        self.display_manager.image = self._render_frame()
+        self.display_manager.update_display()
+
+    @memoize_render(lambda self: (self.data_version, self.mode))
+    def _render_frame(self):
+        self.draw_calls += 1
+        return Image.new('RGB', self.display_manager.image.size, self.color)
+
+    @memoize_render(lambda self, label: None if label is None else (self.data_version, label), present=True)
+    def _present(self, label):
+        self.present_calls += 1
+        if self.fail:
+            skip_render_cache(self)
+        self.display_manager.image.paste(self.color, (0, 0, 32, 16))
+        self.display_manager.update_display()
+
+
+def test_frame_reused_until_key_changes():
+    plugin = _RenderPlugin()
+    plugin.display()
+    plugin.display()
+    assert plugin.draw_calls == 1
+
+    plugin.mode = 'b'
+    plugin.display()
+    assert plugin.draw_calls == 2
+
+    plugin.color = (0, 255, 0)
+    plugin.bump_data_version()
+    plugin.display()
+    assert plugin.draw_calls == 3
+    assert plugin.display_manager.image.getpixel((0, 0)) == (0, 255, 0)
+
+    stats = plugin.get_render_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 3
+    assert stats['hit_rate'] == 0.25
+    assert plugin.get_info()['render_cache'] == stats
+
+
+def test_cached_frame_is_returned_as_copy():
+    plugin = _RenderPlugin()
+    first = plugin._render_frame()
+    first.paste((0, 0, 255), (0, 0, 32, 16))
+    assert plugin._render_frame().getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_present_mode_pastes_cached_frame_without_drawing():
+    plugin = _RenderPlugin()
+    plugin._present('score')
+    plugin.display_manager.image.paste((0, 0, 0), (0, 0, 32, 16))
+
+    plugin._present('score')
+    assert plugin.present_calls == 1
+    assert plugin.display_manager.image.getpixel((5, 5)) == (255, 0, 0)
+    assert plugin.display_manager.update_display.call_count == 2
+
+
+def test_none_key_and_skip_bypass_cache():
+    plugin = _RenderPlugin()
+    plugin._present(None)
+    plugin._present(None)
+    assert plugin.present_calls == 2
+
+    plugin.fail = True
+    plugin._present('error')
+    plugin.fail = False
+    plugin._present('error')
+    plugin._present('error')
+    assert plugin.present_calls == 4
+
+
+def test_config_change_invalidates_frames():
+    plugin = _RenderPlugin()
+    plugin.display()
+    plugin.on_config_change({'enabled': True})
+    plugin.display()
+    assert plugin.draw_calls == 2
+
+
+def test_lru_eviction():
+    cache = RenderCache(max_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.put(('f', key), Image.new('RGB', (1, 1)))
+    assert cache.get(('f', 'a')) is None
+    assert cache.get(('f', 'c')) is not None
+    assert cache.get_stats()['entries'] == 2
@@ -0,0 +1,129 @@
+"""
+Tests for delta-aware live scoreboard refreshes.
+"""
+
+import copy
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.base_classes.scoreboard_delta import ScoreboardDelta, event_fingerprint
+
+
+def _event(event_id, home_score='0', away_score='0', clock='15:00', state='in', news=None):
+    return {
+        'id': event_id,
+        'date': '2026-10-17T16:00Z',
+        'news': news or [],
+        'competitions': [{
+            'status': {
+                'displayClock': clock,
+                'period': 1,
+                'type': {'name': 'STATUS_IN_PROGRESS', 'state': state, 'shortDetail': f'{clock} - 1st',
+                         'detail': f'{clock} - 1st'},
+            },
+            'competitors': [
+                {'id': '1', 'homeAway': 'home', 'score': home_score,
+                 'team': {'id': '1', 'abbreviation': f'H{event_id}'}},
+                {'id': '2', 'homeAway': 'away', 'score': away_score,
+                 'team': {'id': '2', 'abbreviation': f'A{event_id}'}},
+            ],
+            'situation': {'down': 1, 'distance': 10},
+        }],
+    }
+
+
+def test_fingerprint_ignores_non_display_fields():
+    event = _event('1')
+    assert event_fingerprint(event) == event_fingerprint(_event('1', news=[{'headline': 'x'}]))
+    assert event_fingerprint(event) != event_fingerprint(_event('1', home_score='7'))
+    assert event_fingerprint(event) != event_fingerprint(_event('1', clock='14:55'))
+    moved = copy.deepcopy(event)
+    moved['competitions'][0]['situation']['down'] = 2
+    assert event_fingerprint(event) != event_fingerprint(moved)
+
+
+def test_fingerprint_covers_competitor_statistics():
+    event = _event('1')
+    event['competitions'][0]['competitors'][0]['statistics'] = [
+        {'name': 'saves', 'displayValue': '12'}, {'name': 'savePct', 'displayValue': '.923'}]
+    stopped = copy.deepcopy(event)
+    # Only the shots-on-goal inputs change, e.g. during a stoppage
+    stopped['competitions'][0]['competitors'][0]['statistics'][0]['displayValue'] = '13'
+    assert event_fingerprint(event) != event_fingerprint(stopped)
+
+
+def test_update_reports_changed_events_and_feeds_changes():
+    delta = ScoreboardDelta()
+    received = []
+    delta.subscribe(received.append)
+
+    assert delta.update([_event('1'), _event('2')]) == {'1', '2'}
+    assert delta.update([_event('1'), _event('2')]) == set()
+    assert delta.update([_event('1', home_score='3'), _event('2')]) == {'1'}
+    assert delta.update([_event('1', home_score='3')]) == set()
+
+    seq, changes = delta.changes_since(0)
+    assert seq == 4
+    assert [(c.event_id, c.kind) for c in changes] == [
+        ('1', 'added'), ('2', 'added'), ('1', 'changed'), ('2', 'removed')]
+    assert [c.kind for c in delta.changes_since(2)[1]] == ['changed', 'removed']
+    assert len(received) == 3
+
+
+@pytest.fixture
+def live_manager(emulator_mode):
+    try:
+        from src.base_classes.football import FootballLive
+    except ImportError as e:
+        pytest.skip(f"display stack unavailable: {e}")
+
+    class _LiveManager(FootballLive):
+        payload = None
+
+        def _fetch_data(self):
+            return self.payload
+
+    display_manager = MagicMock()
+    display_manager.matrix.width = 64
+    display_manager.matrix.height = 32
+    cache_manager = MagicMock()
+    cache_manager.cache_dir = None
+    config = {'timezone': 'UTC', 'nfl_scoreboard': {'enabled': True, 'prefetch_logos': False}}
+    manager = _LiveManager(config, display_manager, cache_manager, logging.getLogger(__name__), 'nfl')
+    manager.sport, manager.league = 'football', 'nfl'
+    manager._logo_prefetcher = MagicMock()
+    return manager
+
+
+def test_live_update_reextracts_only_changed_games(live_manager):
+    extracted = []
+    original = live_manager._extract_game_details
+
+    def _tracking_extract(event):
+        extracted.append(event['id'])
+        return original(event)
+
+    live_manager._extract_game_details = _tracking_extract
+
+    live_manager.payload = {'events': [_event('1'), _event('2'), _event('3')]}
+    live_manager.update()
+    assert sorted(extracted) == ['1', '2', '3']
+    first_details = {g['id']: g for g in live_manager.live_games}
+
+    extracted.clear()
+    live_manager.last_update = 0
+    live_manager.payload = {'events': [_event('1'), _event('2', away_score='7'), _event('3')]}
+    live_manager.update()
+    assert extracted == ['2']
+    games = {g['id']: g for g in live_manager.live_games}
+    assert games['1'] is first_details['1']
+    assert games['2']['away_score'] == '7'
+
+    # The same payload object (a 304 from upstream) skips fingerprinting too
+    extracted.clear()
+    live_manager.last_update = 0
+    live_manager.update()
+    assert extracted == []
+    assert live_manager.get_game_changes(0)[0] == 4
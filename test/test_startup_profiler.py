@@ -0,0 +1,112 @@
+"""
+Tests for the startup profiler and deferred plugin loading.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+from src.plugin_system.deferred_plugin import DeferredPlugin
+from src.startup_profiler import StartupProfiler, default_report_path
+
+
+def test_profiler_records_phases_plugins_and_marks(tmp_path):
+    profiler = StartupProfiler()
+    with profiler.phase('config'):
+        time.sleep(0.01)
+    with profiler.plugin_step('clock', 'import'):
+        time.sleep(0.01)
+    with profiler.plugin_step('clock', 'instantiate'):
+        pass
+    profiler.note_plugin('weather', deferred=True)
+    assert profiler.mark('first_frame') is True
+    assert profiler.mark('first_frame') is False
+
+    report_path = tmp_path / 'startup_report.json'
+    assert profiler.write_report(report_path)
+    report = json.loads(report_path.read_text())
+
+    assert report['phases'][0]['name'] == 'config'
+    assert report['phases'][0]['duration'] >= 0.01
+    assert report['plugins']['clock']['import'] >= 0.01
+    assert 'instantiate' in report['plugins']['clock']
+    assert report['plugins']['weather'] == {'deferred': True}
+    assert report['slowest_plugins'][0] == 'clock'
+    assert report['marks']['first_frame'] >= report['phases'][0]['duration']
+
+
+def test_report_path_prefers_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv('LEDMATRIX_STARTUP_REPORT', raising=False)
+    assert default_report_path(None) is None
+    assert default_report_path(str(tmp_path)) == tmp_path / 'startup_report.json'
+    monkeypatch.setenv('LEDMATRIX_STARTUP_REPORT', str(tmp_path / 'custom.json'))
+    assert default_report_path(str(tmp_path)) == tmp_path / 'custom.json'
+
+
+def test_deferred_plugin_shows_placeholder_until_loaded(mock_display_manager):
+    release = threading.Event()
+    loaded = threading.Event()
+    instance = MagicMock()
+    instance.display = MagicMock(return_value=True)
+    instance.enable_scrolling = True
+
+    def load(plugin_id):
+        release.wait(5)
+        return instance
+
+    placeholder = DeferredPlugin('clock', ['clock'], load=load, display_manager=mock_display_manager,
+                                 on_loaded=lambda plugin_id: loaded.set())
+    assert not hasattr(placeholder, 'enable_scrolling')
+
+    assert placeholder.display(display_mode='clock') is True
+    assert placeholder.loading
+    mock_display_manager.update_display.assert_called_once()
+    assert placeholder.display(display_mode='clock') is True
+    mock_display_manager.update_display.assert_called_once()  # Placeholder isn't redrawn
+
+    release.set()
+    assert loaded.wait(5)
+    assert placeholder.display(force_clear=True) is True
+    instance.display.assert_called_once_with(force_clear=True)
+    assert placeholder.enable_scrolling is True
+
+
+def test_failed_deferred_load_skips_mode(mock_display_manager):
+    placeholder = DeferredPlugin('broken', ['broken'], load=lambda plugin_id: None,
+                                 display_manager=mock_display_manager)
+    placeholder.display()
+    placeholder.wait(5)
+    assert placeholder.failed
+    assert placeholder.display() is False
+
+
+def test_controller_swaps_in_deferred_plugin(test_display_controller):
+    controller = test_display_controller
+    pm = controller.plugin_manager
+    pm.plugin_manifests = {
+        'clock': {'name': 'Clock', 'display_modes': ['clock']},
+        'sports': {'name': 'Sports', 'display_modes': ['sports_live', 'sports_recent']},
+    }
+    instance = MagicMock()
+    instance.modes = ['sports_recent', 'sports_upcoming']
+    pm.get_plugin.side_effect = lambda plugin_id: instance if plugin_id == 'sports' else None
+
+    controller._defer_plugin('clock')
+    controller._defer_plugin('sports')
+    assert controller.available_modes == ['clock', 'sports_live', 'sports_recent']
+    pm.load_plugin.assert_not_called()
+
+    controller.current_display_mode = 'sports_recent'
+    controller.current_mode_index = 2
+    placeholder = controller.plugin_modes['sports_recent']
+    placeholder.display(display_mode='sports_recent')
+    assert placeholder.wait(5) is instance
+    pm.load_plugin.assert_called_once_with('sports')
+
+    controller._process_display_events(timeout=1.0)
+    assert controller.available_modes == ['clock', 'sports_recent', 'sports_upcoming']
+    assert controller.plugin_modes['sports_upcoming'] is instance
+    assert 'sports_live' not in controller.plugin_modes
+    assert controller.current_mode_index == 1
+    assert isinstance(controller.plugin_modes['clock'], DeferredPlugin)
@@ -0,0 +1,144 @@
+"""
+Tests for running plugin updates in the update worker process.
+"""
+
+import json
+import time
+from multiprocessing import shared_memory
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.plugin_system.base_plugin import BasePlugin
+from src.plugin_system.plugin_manager import PluginManager
+from src.plugin_system.update_worker import UpdateWorker, WorkerUpdates, supports_update_snapshots
+
+PLUGIN_SOURCE = '''
+from src.plugin_system.base_plugin import BasePlugin
+
+
+class CounterPlugin(BasePlugin):
+    UPDATE_SNAPSHOT_ATTRIBUTES = ('count', 'label', 'blob')
+
+    def __init__(self, plugin_id, config, display_manager, cache_manager, plugin_manager):
+        super().__init__(plugin_id, config, display_manager, cache_manager, plugin_manager)
+        self.count = 0
+        self.label = config.get('label')
+        self.blob = b''
+
+    def update(self):
+        self.count += 1
+        self.label = self.config.get('label')
+        self.blob = b'x' * int(self.config.get('blob_size', 0))
+
+    def display(self, force_clear=False):
+        pass
+'''
+
+
+class ScoresPlugin(BasePlugin):
+    UPDATE_SNAPSHOT_ATTRIBUTES = ('scores',)
+
+    def __init__(self):
+        super().__init__('scores', {}, MagicMock(), MagicMock(), MagicMock())
+        self.scores = []
+        self.frame = 'drawn on the display process'
+
+    def update(self):
+        self.scores = [3, 1]
+
+    def display(self, force_clear=False):
+        pass
+
+
+@pytest.fixture
+def counter_plugin_paths(tmp_path):
+    plugin_dir = tmp_path / 'plugins' / 'counter'
+    plugin_dir.mkdir(parents=True)
+    (plugin_dir / 'manifest.json').write_text(json.dumps({
+        'id': 'counter', 'name': 'Counter', 'version': '1.0.0',
+        'entry_point': 'manager.py', 'class_name': 'CounterPlugin', 'display_modes': ['counter']
+    }))
+    (plugin_dir / 'manager.py').write_text(PLUGIN_SOURCE)
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({
+        'counter': {'enabled': True, 'update_interval': 0.05, 'label': 'first', 'blob_size': 16}
+    }))
+    secrets_path = tmp_path / 'config_secrets.json'
+    secrets_path.write_text('{}')
+    return str(tmp_path / 'plugins'), str(config_path), str(secrets_path)
+
+
+def _receive_until(worker, predicate, timeout=60.0):
+    """Collect worker messages until predicate(updates) holds."""
+    collected = WorkerUpdates()
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        updates = worker.receive()
+        if updates.ready is not None:
+            collected.ready = updates.ready
+        collected.snapshots.update(updates.snapshots)
+        collected.failures.extend(updates.failures)
+        if predicate(collected):
+            return collected
+        assert worker.alive, "update worker exited"
+        time.sleep(0.02)
+    pytest.fail("update worker did not deliver the expected messages in time")
+
+
+def test_snapshot_round_trip_applies_only_listed_attributes():
+    worker_side, display_side = ScoresPlugin(), ScoresPlugin()
+    worker_side.update()
+
+    snapshot = worker_side.get_update_snapshot()
+    assert snapshot == {'scores': [3, 1]}
+    display_side.apply_update_snapshot(dict(snapshot, frame='not listed'))
+    assert display_side.scores == [3, 1]
+    assert display_side.frame == 'drawn on the display process'
+    assert display_side.data_version == 1
+    assert supports_update_snapshots(display_side)
+
+
+def test_scheduled_updates_skip_delegated_plugins(tmp_path):
+    plugin_manager = PluginManager(plugins_dir=str(tmp_path))
+    plugin = ScoresPlugin()
+    plugin.update = MagicMock()
+    plugin_manager.plugins['scores'] = plugin
+    plugin_manager.plugin_manifests['scores'] = {'update_interval': 1}
+    plugin_manager.state_manager.can_execute = MagicMock(return_value=True)
+
+    plugin_manager.delegated_update_plugins = {'scores'}
+    plugin_manager.run_scheduled_updates()
+    plugin.update.assert_not_called()
+
+    plugin_manager.delegated_update_plugins = set()
+    plugin_manager.run_scheduled_updates()
+    plugin.update.assert_called_once()
+
+
+def test_worker_publishes_snapshots_and_follows_config(counter_plugin_paths):
+    plugins_dir, config_path, secrets_path = counter_plugin_paths
+    worker = UpdateWorker(['counter', 'missing'], plugins_dir, config_path, secrets_path,
+                          slot_size=64, slot_count=2)
+    worker.start()
+    try:
+        updates = _receive_until(worker, lambda u: u.ready is not None and 'counter' in u.snapshots)
+        assert updates.ready == ['counter']
+        updated_at, snapshot = updates.snapshots['counter']
+        assert snapshot['count'] >= 1
+        assert snapshot['label'] == 'first'
+        assert updated_at <= time.time()
+
+        # Larger than a slot: sent over the pipe instead
+        worker.send_config('counter', {'enabled': True, 'update_interval': 0.05,
+                                       'label': 'second', 'blob_size': 4096})
+        updates = _receive_until(worker, lambda u: u.snapshots.get('counter', (0, {}))[1].get('label') == 'second')
+        assert len(updates.snapshots['counter'][1]['blob']) == 4096
+        assert not updates.failures
+    finally:
+        shm_name = worker._shm.name
+        worker.stop()
+
+    assert not worker.alive
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shm_name)
@@ -0,0 +1,113 @@
+"""
+Tests for the shared journal follower behind the SSE log stream.
+"""
+
+import json
+import sys
+import time
+
+from web_interface.log_follower import LogEntry, LogFollower, matches, parse_journal_entry
+
+# Stand-in for journalctl: records its arguments, waits for the go file,
+# prints entries, then stays running (the first run exits early to exercise
+# cursor resume)
+FAKE_JOURNALCTL = r'''
+import json, os, sys, time
+log_path, go_path = sys.argv[1], sys.argv[2]
+with open(log_path, 'a') as f:
+    f.write(json.dumps(sys.argv[3:]) + '\n')
+runs = sum(1 for _ in open(log_path))
+while not os.path.exists(go_path):
+    time.sleep(0.01)
+messages = [
+    '2026-10-18 12:00:00.000 - INFO - plugin.weather - Fetched forecast',
+    '2026-10-18 12:00:01.000 - ERROR - plugin.stocks - Quote request failed',
+    '2026-10-18 12:00:02.000 - DEBUG - src.display_controller - Frame done',
+]
+for i, message in enumerate(messages):
+    cursor = f"s=run{runs};i={i}"
+    print(json.dumps({'__CURSOR': cursor, '__REALTIME_TIMESTAMP': '1792310400000000',
+                      '_HOSTNAME': 'pi', 'SYSLOG_IDENTIFIER': 'python3', '_PID': '42',
+                      'MESSAGE': message}), flush=True)
+if runs == 1:
+    sys.exit(1)
+time.sleep(30)
+'''
+
+
+def _entry(message, priority=6):
+    return parse_journal_entry({'MESSAGE': message, '__REALTIME_TIMESTAMP': '1792310400000000',
+                                '_HOSTNAME': 'pi', 'SYSLOG_IDENTIFIER': 'python3', '_PID': '7',
+                                '__CURSOR': 'c1', 'PRIORITY': str(priority)})
+
+
+def test_parse_readable_and_structured_lines():
+    parsed = _entry('2026-10-18 12:00:00.000 - WARNING - plugin.weather - API slow')
+    assert parsed['level'] == 'WARNING'
+    assert parsed['logger_name'] == 'plugin.weather'
+    assert parsed['cursor'] == 'c1'
+    assert ' pi python3[7]: 2026-10-18' in parsed['line']
+
+    structured = _entry(json.dumps({'level': 'error', 'logger': 'plugin.nhl', 'message': 'x'}))
+    assert (structured['level'], structured['logger_name']) == ('ERROR', 'plugin.nhl')
+
+    assert _entry('Traceback (most recent call last):', priority=3)['level'] == 'ERROR'
+    assert _entry([104, 105])['line'].endswith(': hi')
+
+
+def test_filters():
+    entry = LogEntry(1, 'line', 'WARNING', 'plugin.weather')
+    assert matches(entry)
+    assert matches(entry, min_level='warning', plugin='weather')
+    assert not matches(entry, min_level='ERROR')
+    assert not matches(entry, plugin='stocks')
+    assert matches(LogEntry(2, 'Loading weather plugin', 'INFO', None), plugin='weather')
+
+
+def _collect(stream, count, timeout=10):
+    lines = []
+    deadline = time.monotonic() + timeout
+    while len(lines) < count and time.monotonic() < deadline:
+        message = next(stream)
+        lines.extend(line for line in message['logs'].split('\n') if line)
+    return lines
+
+
+def test_one_follower_feeds_all_clients_and_resumes_from_cursor(tmp_path):
+    args_log = tmp_path / 'runs.jsonl'
+    go = tmp_path / 'go'
+    follower = LogFollower(command=[sys.executable, '-c', FAKE_JOURNALCTL, str(args_log), str(go)])
+    follower.RESTART_DELAY = 0.05
+
+    everything = follower.stream(heartbeat=0.2)
+    errors_only = follower.stream(min_level='ERROR', heartbeat=0.2)
+    weather = follower.stream(plugin='weather', heartbeat=0.2)
+    # Streams attach on first iteration; the first message is a heartbeat
+    for stream in (everything, errors_only, weather):
+        assert next(stream)['logs'] == ''
+    assert follower.client_count == 3
+    go.touch()
+
+    all_lines = _collect(everything, 7)
+    assert sum('Fetched forecast' in line for line in all_lines) == 2
+    assert any('exited with code 1' in line for line in all_lines)
+    error_lines = _collect(errors_only, 3)
+    assert len(error_lines) == 3
+    assert all('ERROR' in line or 'exited' in line for line in error_lines)
+    weather_lines = _collect(weather, 2)
+    assert len(weather_lines) == 2
+    assert all('plugin.weather' in line for line in weather_lines)
+
+    runs = [json.loads(line) for line in args_log.read_text().splitlines()]
+    assert runs[0] == ['--lines=0']
+    assert runs[1] == ['--after-cursor', 's=run1;i=2']
+    assert follower.cursor == 's=run2;i=2'
+
+    for stream in (everything, errors_only, weather):
+        stream.close()
+    assert follower.client_count == 0
+    deadline = time.monotonic() + 5
+    while follower._thread is not None and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert follower._thread is None
+    assert len(runs) == 2
@@ -0,0 +1,84 @@
+"""
+Tests for the shared system metrics sampler behind the SSE status stream.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from web_interface.system_metrics import ServiceStateProbe, SystemMetricsSampler
+
+
+def _counting_collector():
+    calls = []
+    lock = threading.Lock()
+
+    def collect():
+        with lock:
+            calls.append(time.monotonic())
+            return {'n': len(calls)}
+
+    return collect, calls
+
+
+def test_clients_share_one_sampler():
+    collect, calls = _counting_collector()
+    sampler = SystemMetricsSampler(interval=0.2, collect=collect, service_probe=MagicMock())
+    streams = [sampler.stream() for _ in range(4)]
+
+    first = [next(s) for s in streams]
+    second = [next(s) for s in streams]
+
+    assert sampler.client_count == 4
+    assert {sample['n'] for sample in first} == {1}
+    assert {sample['n'] for sample in second} == {2}
+    assert len(calls) == 2
+
+    for s in streams:
+        s.close()
+    assert sampler.client_count == 0
+    deadline = time.monotonic() + 2
+    while sampler._thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sampler._thread is None
+
+
+def test_new_client_gets_current_sample_immediately():
+    collect, calls = _counting_collector()
+    sampler = SystemMetricsSampler(interval=5, collect=collect, service_probe=MagicMock())
+    first = sampler.stream()
+    assert next(first)['n'] == 1
+    late = sampler.stream()
+    assert next(late)['n'] == 1
+    assert len(calls) == 1
+    assert sampler.latest() == {'n': 1}
+    first.close()
+    late.close()
+
+
+def test_sampling_errors_are_reported_as_samples():
+    def broken():
+        raise RuntimeError('sensor gone')
+
+    sampler = SystemMetricsSampler(interval=5, collect=broken, service_probe=MagicMock())
+    stream = sampler.stream()
+    assert next(stream) == {'error': 'sensor gone'}
+    stream.close()
+
+
+def test_service_state_from_cgroup(tmp_path):
+    unit = tmp_path / 'ledmatrix.service'
+    probe = ServiceStateProbe(cgroup_roots=(str(tmp_path),))
+    assert probe.is_active() is False
+    unit.mkdir()
+    (unit / 'cgroup.procs').write_text('1234\n')
+    assert probe.is_active() is True
+
+
+def test_systemctl_fallback_is_cached(tmp_path):
+    probe = ServiceStateProbe(ttl=60, cgroup_roots=(str(tmp_path / 'missing'),))
+    result = MagicMock(stdout='active\n')
+    with patch('web_interface.system_metrics.subprocess.run', return_value=result) as run:
+        assert probe.is_active() is True
+        assert probe.is_active() is True
+    assert run.call_count == 1
@@ -58,6 +58,8 @@ from web_interface.cache import get_cached, set_cached, invalidate_cache
 
 # Initialize plugin managers - read plugins directory from config
 config = config_manager.load_config()
+# Keep the shared config snapshot fresh so request handlers skip re-reading the files
+config_manager.start_watching()
 plugin_system_config = config.get('plugin_system', {})
 plugins_dir_name = plugin_system_config.get('plugins_directory', 'plugin-repos')
 
@@ -75,7 +77,10 @@ plugin_manager = PluginManager(
     display_manager=None,  # Not needed for web interface
     cache_manager=None     # Not needed for web interface
 )
-plugin_store_manager = PluginStoreManager(plugins_dir=str(plugins_dir))
+plugin_store_manager = PluginStoreManager(
+    plugins_dir=str(plugins_dir),
+    metadata_cache_file=str(project_root / "data" / "plugin_store_cache.json")
+)
 saved_repositories_manager = SavedRepositoriesManager()
 
 # Initialize schema manager
@@ -391,6 +396,7 @@ def captive_portal_redirect():
         '/connecttest.txt',  # Windows detection
         '/success.txt',  # Firefox detection
         '/favicon.ico',  # Favicon
+        '/metrics',  # Prometheus scrapes
     ]
 
     for allowed_path in allowed_paths:
@@ -438,51 +444,9 @@ def sse_response(generator_func):
 
 # System status generator for SSE
 def system_status_generator():
-    """Generate system status updates"""
-    while True:
-        try:
-            # Try to import psutil for system stats
-            try:
-                import psutil
-                cpu_percent = round(psutil.cpu_percent(interval=1), 1)
-                memory = psutil.virtual_memory()
-                memory_used_percent = round(memory.percent, 1)
-                
-                # Try to get CPU temperature (Raspberry Pi specific)
-                cpu_temp = 0
-                try:
-                    with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                        cpu_temp = round(float(f.read()) / 1000.0, 1)
-                except (OSError, ValueError):
-                    pass
-                    
-            except ImportError:
-                cpu_percent = 0
-                memory_used_percent = 0
-                cpu_temp = 0
-            
-            # Check if display service is running
-            service_active = False
-            try:
-                result = subprocess.run(['systemctl', 'is-active', 'ledmatrix'], 
-                                      capture_output=True, text=True, timeout=2)
-                service_active = result.stdout.strip() == 'active'
-            except (subprocess.SubprocessError, OSError):
-                pass
-            
-            status = {
-                'timestamp': time.time(),
-                'uptime': 'Running',
-                'service_active': service_active,
-                'cpu_percent': cpu_percent,
-                'memory_used_percent': memory_used_percent,
-                'cpu_temp': cpu_temp,
-                'disk_used_percent': 0
-            }
-            yield status
-        except Exception as e:
-            yield {'error': str(e)}
-        time.sleep(10)  # Update every 10 seconds (reduced frequency for better performance)
+    """Generate system status updates from the shared background sampler"""
+    from web_interface.system_metrics import get_system_metrics_sampler
+    yield from get_system_metrics_sampler().stream()
 
 # Display preview generator for SSE
 def display_preview_generator():
@@ -549,59 +513,10 @@ def display_preview_generator():
         time.sleep(0.5)  # Check 2 times per second (reduced frequency for better performance)
 
 # Logs generator for SSE
-def logs_generator():
-    """Generate log updates from journalctl"""
-    while True:
-        try:
-            # Get recent logs from journalctl (simplified version)
-            # Note: User should be in systemd-journal group to read logs without sudo
-            try:
-                result = subprocess.run(
-                    ['journalctl', '-u', 'ledmatrix.service', '-n', '50', '--no-pager'],
-                    capture_output=True, text=True, timeout=5
-                )
-
-                if result.returncode == 0:
-                    logs_text = result.stdout.strip()
-                    if logs_text:
-                        logs_data = {
-                            'timestamp': time.time(),
-                            'logs': logs_text
-                        }
-                        yield logs_data
-                    else:
-                        # No logs available
-                        logs_data = {
-                            'timestamp': time.time(),
-                            'logs': 'No logs available from ledmatrix service'
-                        }
-                        yield logs_data
-                else:
-                    # journalctl failed
-                    error_data = {
-                        'timestamp': time.time(),
-                        'logs': f'journalctl failed with return code {result.returncode}: {result.stderr.strip()}'
-                    }
-                    yield error_data
-
-            except subprocess.TimeoutExpired:
-                # Timeout - just skip this update
-                pass
-            except Exception as e:
-                error_data = {
-                    'timestamp': time.time(),
-                    'logs': f'Error running journalctl: {str(e)}'
-                }
-                yield error_data
-
-        except Exception as e:
-            error_data = {
-                'timestamp': time.time(),
-                'logs': f'Unexpected error in logs generator: {str(e)}'
-            }
-            yield error_data
-
-        time.sleep(5)  # Update every 5 seconds (reduced frequency for better performance)
+def logs_generator(level=None, plugin=None):
+    """Generate new log lines from the shared journal follower"""
+    from web_interface.log_follower import get_log_follower
+    yield from get_log_follower().stream(min_level=level, plugin=plugin)
 
 # SSE endpoints
 @app.route('/api/v3/stream/stats')
@@ -614,7 +529,10 @@ def stream_display():
 
 @app.route('/api/v3/stream/logs')
 def stream_logs():
-    return sse_response(logs_generator)
+    # Optional server-side filters: ?level=WARNING&plugin=<plugin_id>
+    level = request.args.get('level')
+    plugin = request.args.get('plugin')
+    return sse_response(lambda: logs_generator(level=level, plugin=plugin))
 
 # Exempt SSE streams from CSRF and add rate limiting
 if csrf:
@@ -628,6 +546,19 @@ if limiter:
     limiter.limit("20 per minute")(stream_display)
     limiter.limit("20 per minute")(stream_logs)
 
+# Prometheus scrape endpoint: the display service's published snapshot plus this process's metrics
+@app.route('/metrics')
+def metrics():
+    from src.metrics import get_metrics_registry, load_snapshot, render_prometheus
+    sources = [({'process': 'web'}, get_metrics_registry().snapshot())]
+    display_metrics = load_snapshot()
+    if display_metrics is not None:
+        sources.append(({'process': 'display'}, display_metrics))
+    return Response(render_prometheus(sources), mimetype='text/plain; version=0.0.4')
+
+if limiter:
+    limiter.exempt(metrics)
+
 # Main route - redirect to v3 interface as default
 @app.route('/')
 def index():
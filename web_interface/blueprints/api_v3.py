@@ -111,6 +111,16 @@ def _ensure_cache_manager():
         cache_manager = CacheManager()
     return cache_manager
 
+_installed_plugin_index = None
+
+def _get_installed_plugin_index():
+    """Get the installed plugin index for the current plugin manager."""
+    global _installed_plugin_index
+    if _installed_plugin_index is None or _installed_plugin_index.plugin_manager is not api_v3.plugin_manager:
+        from src.plugin_system.installed_plugin_index import InstalledPluginIndex
+        _installed_plugin_index = InstalledPluginIndex(api_v3.plugin_manager)
+    return _installed_plugin_index
+
 def _save_config_atomic(config_manager, config_data, create_backup=True):
     """
     Save configuration using atomic save if available, fallback to regular save.
@@ -671,7 +681,8 @@ def save_main_config():
         # Note: Checkboxes don't send data when unchecked, so we need to check if we're updating general settings
         # If any general setting is present, we're updating the general tab
         is_general_update = any(k in data for k in ['timezone', 'city', 'state', 'country', 'web_display_autostart',
-                                                     'auto_discover', 'auto_load_enabled', 'development_mode', 'plugins_directory'])
+                                                     'auto_discover', 'auto_load_enabled', 'lazy_load_plugins', 'separate_update_process',
+                                                     'development_mode', 'plugins_directory'])
 
         if is_general_update:
             # For checkbox: if not present in data during general update, it means unchecked
@@ -692,13 +703,15 @@ def save_main_config():
                 current_config['location']['country'] = data['country']
 
         # Handle plugin system settings
-        if 'auto_discover' in data or 'auto_load_enabled' in data or 'development_mode' in data or 'plugins_directory' in data:
+        if any(k in data for k in ['auto_discover', 'auto_load_enabled', 'lazy_load_plugins', 'separate_update_process',
+                                   'development_mode', 'plugins_directory']):
             if 'plugin_system' not in current_config:
                 current_config['plugin_system'] = {}
 
             # Handle plugin system checkboxes - always set to handle unchecked state
             # HTML checkboxes omit the key when unchecked, so missing key = unchecked = False
-            for checkbox in ['auto_discover', 'auto_load_enabled', 'development_mode']:
+            for checkbox in ['auto_discover', 'auto_load_enabled', 'lazy_load_plugins', 'separate_update_process',
+                             'development_mode']:
                 current_config['plugin_system'][checkbox] = _coerce_to_bool(data.get(checkbox))
 
             # Handle plugins_directory
@@ -1711,35 +1724,20 @@ def get_installed_plugins():
         if not api_v3.plugin_manager or not api_v3.plugin_store_manager:
             return jsonify({'status': 'error', 'message': 'Plugin managers not initialized'}), 500
 
-        import json
-        from pathlib import Path
-
-        # Re-discover plugins to ensure we have the latest list
-        # This handles cases where plugins are added/removed after app startup
-        api_v3.plugin_manager.discover_plugins()
-
-        # Get all installed plugin info from the plugin manager
-        all_plugin_info = api_v3.plugin_manager.get_all_plugin_info()
+        # Installed plugin manifests and git metadata come from an index that
+        # only re-scans the plugins directory, re-reads manifests or re-reads
+        # .git files when their mtimes change
+        plugin_index = _get_installed_plugin_index()
 
         # Load config once before the loop (not per-plugin)
         full_config = api_v3.config_manager.load_config() if api_v3.config_manager else {}
 
         # Format for the web interface
         plugins = []
-        for plugin_info in all_plugin_info:
-            plugin_id = plugin_info.get('id')
-
-            # Re-read manifest from disk to ensure we have the latest metadata
-            manifest_path = Path(api_v3.plugin_manager.plugins_dir) / plugin_id / "manifest.json"
-            if manifest_path.exists():
-                try:
-                    with open(manifest_path, 'r', encoding='utf-8') as f:
-                        fresh_manifest = json.load(f)
-                    # Update plugin_info with fresh manifest data
-                    plugin_info.update(fresh_manifest)
-                except Exception as e:
-                    # If we can't read the fresh manifest, use the cached one
-                    logger.warning("[PluginStore] Could not read fresh manifest for %s: %s", plugin_id, e)
+        for entry in plugin_index.get_entries():
+            plugin_id = entry['id']
+            plugin_info = dict(entry['manifest'])
+            plugin_info['loaded'] = api_v3.plugin_manager.get_plugin(plugin_id) is not None
 
             # Get enabled status from config (source of truth)
             # Read from config file first, fall back to plugin instance if config doesn't have the key
@@ -1763,9 +1761,8 @@ def get_installed_plugins():
             store_info = api_v3.plugin_store_manager.get_registry_info(plugin_id)
             verified = store_info.get('verified', False) if store_info else False
 
-            # Get local git info for installed plugin (actual installed commit)
-            plugin_path = Path(api_v3.plugin_manager.plugins_dir) / plugin_id
-            local_git_info = api_v3.plugin_store_manager._get_local_git_info(plugin_path) if plugin_path.exists() else None
+            # Local git info for installed plugin (actual installed commit)
+            local_git_info = entry['git_info']
 
             # Use local git info if available (actual installed commit), otherwise fall back to manifest/store info
             if local_git_info:
@@ -0,0 +1,281 @@
+"""
+Shared journald follower for the web log stream.
+
+A single ``journalctl --follow --output=json`` process tails the display
+service's journal for all SSE log clients. Entries go into a bounded
+backlog and are fanned out to each client, filtered server-side by minimum
+level and plugin. The journald cursor of the last entry is tracked, so if
+journalctl exits while clients are connected it is restarted with
+``--after-cursor`` and no lines are lost or repeated. The follower only
+runs while at least one client is streaming.
+"""
+import json
+import logging
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+logger = logging.getLogger('web_interface')
+
+LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40, 'CRITICAL': 50}
+_LEVEL_ALIASES = {'WARN': 'WARNING', 'FATAL': 'CRITICAL'}
+# syslog PRIORITY -> level, for lines without a recognizable level
+_PRIORITY_LEVELS = {0: 'CRITICAL', 1: 'CRITICAL', 2: 'CRITICAL', 3: 'ERROR', 4: 'WARNING',
+                    5: 'INFO', 6: 'INFO', 7: 'DEBUG'}
+# ContextualFormatter: "<asctime> - LEVEL - logger.name - message"
+_READABLE_RE = re.compile(r' - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - ([\w.\-]+) - ')
+_LEVEL_RE = re.compile(r'\b(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)\b')
+
+
+class LogEntry(NamedTuple):
+    """One journal line with the fields used for filtering."""
+    seq: int
+    line: str
+    level: str
+    logger_name: Optional[str]
+
+
+def _field_text(value: Any) -> str:
+    # journald exports non-UTF-8 fields as byte arrays
+    if isinstance(value, list):
+        return bytes(value).decode('utf-8', errors='replace')
+    return '' if value is None else str(value)
+
+
+def parse_journal_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn a ``journalctl -o json`` record into a display line plus level and logger.
+
+    The line follows journalctl's short format so the log viewer parses it
+    the same way as ``/api/v3/logs`` output.
+
+    Args:
+        entry: Decoded journal JSON record
+
+    Returns:
+        Dict with 'line', 'level', 'logger_name' and 'cursor'
+    """
+    message = _field_text(entry.get('MESSAGE'))
+    try:
+        when = datetime.fromtimestamp(int(entry['__REALTIME_TIMESTAMP']) / 1_000_000)
+    except (KeyError, TypeError, ValueError):
+        when = datetime.now()
+    identifier = _field_text(entry.get('SYSLOG_IDENTIFIER')) or 'ledmatrix'
+    pid = _field_text(entry.get('_PID'))
+    source = f"{identifier}[{pid}]" if pid else identifier
+    line = f"{when.strftime('%b %d %H:%M:%S')} {_field_text(entry.get('_HOSTNAME')) or 'localhost'} {source}: {message}"
+
+    level = None
+    logger_name = None
+    match = _READABLE_RE.search(message)
+    if match:
+        level, logger_name = match.group(1), match.group(2)
+    elif message.startswith('{'):
+        # StructuredFormatter output
+        try:
+            structured = json.loads(message)
+            level = str(structured.get('level', '')).upper() or None
+            logger_name = structured.get('logger')
+        except (ValueError, AttributeError):
+            pass
+    if level is None:
+        match = _LEVEL_RE.search(message)
+        if match:
+            level = _LEVEL_ALIASES.get(match.group(1), match.group(1))
+    if level not in LEVELS:
+        try:
+            level = _PRIORITY_LEVELS.get(int(entry.get('PRIORITY', 6)), 'INFO')
+        except (TypeError, ValueError):
+            level = 'INFO'
+    return {'line': line, 'level': level, 'logger_name': logger_name, 'cursor': entry.get('__CURSOR')}
+
+
+def matches(entry: LogEntry, min_level: Optional[str] = None, plugin: Optional[str] = None) -> bool:
+    """
+    Check a log entry against stream filters.
+
+    Args:
+        entry: Log entry
+        min_level: Minimum level name (e.g. 'WARNING')
+        plugin: Plugin ID; matches the plugin's logger (``plugin.<id>``), or
+            the ID in the line when the logger is unknown
+
+    Returns:
+        True if the entry passes all filters
+    """
+    if min_level and LEVELS.get(entry.level, 20) < LEVELS.get(min_level.upper(), 0):
+        return False
+    if plugin:
+        if entry.logger_name:
+            name = entry.logger_name
+            if name != f"plugin.{plugin}" and not name.startswith(f"plugin.{plugin}.") and name != plugin:
+                return False
+        elif plugin not in entry.line:
+            return False
+    return True
+
+
+class LogFollower:
+    """Single journal follower shared by all log stream clients."""
+
+    RESTART_DELAY = 5.0
+
+    def __init__(self, unit: str = 'ledmatrix.service', backlog: int = 500,
+                 command: Optional[List[str]] = None) -> None:
+        """
+        Initialize the follower.
+
+        Args:
+            unit: systemd unit whose journal is followed
+            backlog: Maximum number of entries kept for slow clients
+            command: Override for the journalctl command (before cursor arguments)
+        """
+        self.unit = unit
+        self.command = command or ['journalctl', '-u', unit, '--follow', '--output=json', '--no-pager']
+        self._entries: deque = deque(maxlen=backlog)
+        self._seq = 0
+        self._cursor: Optional[str] = None
+        self._clients = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """journald cursor of the last entry read."""
+        with self._cond:
+            return self._cursor
+
+    @property
+    def client_count(self) -> int:
+        with self._cond:
+            return self._clients
+
+    def _append(self, line: str, level: str = 'INFO', logger_name: Optional[str] = None,
+                cursor: Optional[str] = None) -> None:
+        with self._cond:
+            self._seq += 1
+            self._entries.append(LogEntry(self._seq, line, level, logger_name))
+            if cursor:
+                self._cursor = cursor
+            self._cond.notify_all()
+
+    def _follow_once(self, resume: bool) -> None:
+        """Run journalctl until it exits or the last client leaves."""
+        with self._cond:
+            cursor = self._cursor if resume else None
+        args = list(self.command)
+        args += ['--after-cursor', cursor] if cursor else ['--lines=0']
+        try:
+            process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                       text=True, bufsize=1)
+        except OSError as e:
+            logger.warning(f"Cannot start journalctl: {e}")
+            self._append(f"Cannot follow logs: {e}", level='ERROR')
+            return
+        with self._cond:
+            self._process = process
+            if self._clients == 0:
+                process.terminate()
+        try:
+            for raw in process.stdout:
+                raw = raw.strip()
+                if not raw:
+                    continue
+                try:
+                    parsed = parse_journal_entry(json.loads(raw))
+                except ValueError:
+                    parsed = {'line': raw, 'level': 'INFO', 'logger_name': None, 'cursor': None}
+                self._append(parsed['line'], parsed['level'], parsed['logger_name'], parsed['cursor'])
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+            with self._cond:
+                self._process = None
+                still_wanted = self._clients > 0
+            if still_wanted and returncode not in (0, -15):
+                error = (process.stderr.read() or '').strip()
+                self._append(f"journalctl exited with code {returncode}: {error}", level='ERROR')
+            process.stderr.close()
+
+    def _run(self) -> None:
+        resume = False
+        while True:
+            with self._cond:
+                if self._clients == 0:
+                    self._thread = None
+                    return
+            self._follow_once(resume)
+            # A restart while clients are connected continues after the last cursor
+            resume = True
+            with self._cond:
+                self._cond.wait_for(lambda: self._clients == 0, timeout=self.RESTART_DELAY)
+
+    def _attach(self) -> None:
+        with self._cond:
+            self._clients += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='LogFollower', daemon=True)
+                self._thread.start()
+
+    def _detach(self) -> None:
+        with self._cond:
+            self._clients -= 1
+            if self._clients == 0 and self._process is not None:
+                self._process.terminate()
+            self._cond.notify_all()
+
+    def stream(self, min_level: Optional[str] = None, plugin: Optional[str] = None,
+               heartbeat: float = 15.0) -> Iterator[Dict[str, Any]]:
+        """
+        Yield batches of new log lines for one client.
+
+        Each message is ``{'timestamp', 'logs'}`` with newline-joined lines
+        (and ``'dropped'`` when the client fell behind the backlog). An empty
+        batch is sent every ``heartbeat`` seconds so disconnects are noticed.
+
+        Args:
+            min_level: Only lines at or above this level
+            plugin: Only lines from this plugin
+            heartbeat: Seconds between keep-alive messages
+        """
+        self._attach()
+        try:
+            with self._cond:
+                last_seq = self._seq
+            last_sent = time.monotonic()
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._seq > last_seq, timeout=heartbeat)
+                    pending = [e for e in self._entries if e.seq > last_seq]
+                    oldest = self._entries[0].seq if self._entries else last_seq + 1
+                    current = self._seq
+                dropped = max(0, oldest - last_seq - 1)
+                last_seq = current
+                lines = [e.line for e in pending if matches(e, min_level, plugin)]
+                if not lines and not dropped and time.monotonic() - last_sent < heartbeat:
+                    continue
+                message: Dict[str, Any] = {'timestamp': time.time(), 'logs': '\n'.join(lines)}
+                if dropped:
+                    message['dropped'] = dropped
+                last_sent = time.monotonic()
+                yield message
+        finally:
+            self._detach()
+
+
+_follower: Optional[LogFollower] = None
+_follower_lock = threading.Lock()
+
+
+def get_log_follower() -> LogFollower:
+    """Get the process-wide journal follower."""
+    global _follower
+    with _follower_lock:
+        if _follower is None:
+            _follower = LogFollower()
+        return _follower
@@ -0,0 +1,227 @@
+"""
+Shared system metrics sampler for the web interface.
+
+One background thread samples CPU, memory, temperature and the display
+service state at a fixed cadence into a small ring of samples; every SSE
+status client is fed from that ring, so N open dashboards cost the same as
+one. The thread only runs while at least one client is streaming.
+
+CPU usage is measured non-blockingly over the sampling interval. The
+service state is read from the unit's systemd cgroup where available and
+otherwise probed with ``systemctl is-active`` at a much lower frequency
+than the samples.
+"""
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger('web_interface')
+
+THERMAL_ZONE = '/sys/class/thermal/thermal_zone0/temp'
+CGROUP_ROOTS = ('/sys/fs/cgroup/system.slice', '/sys/fs/cgroup/systemd/system.slice')
+
+
+def read_cpu_temp(path: str = THERMAL_ZONE) -> float:
+    """Read the CPU temperature in Celsius (0 if unavailable)."""
+    try:
+        with open(path, 'r') as f:
+            return round(float(f.read()) / 1000.0, 1)
+    except (OSError, ValueError):
+        return 0
+
+
+class ServiceStateProbe:
+    """Cached systemd service state."""
+
+    def __init__(self, service_name: str = 'ledmatrix', ttl: float = 30.0,
+                 cgroup_roots: Tuple[str, ...] = CGROUP_ROOTS) -> None:
+        """
+        Initialize the probe.
+
+        Args:
+            service_name: systemd unit name (without .service)
+            ttl: Seconds a ``systemctl`` result is reused
+            cgroup_roots: Directories holding the system.slice unit cgroups
+        """
+        self.service_name = service_name
+        self.ttl = ttl
+        self.cgroup_roots = cgroup_roots
+        self._cached: Optional[bool] = None
+        self._checked_at = 0.0
+
+    def _cgroup_state(self) -> Optional[bool]:
+        # systemd creates the unit's cgroup while it runs and removes it afterwards
+        have_hierarchy = False
+        for root in self.cgroup_roots:
+            if not os.path.isdir(root):
+                continue
+            have_hierarchy = True
+            procs = os.path.join(root, f'{self.service_name}.service', 'cgroup.procs')
+            try:
+                with open(procs, 'r') as f:
+                    return bool(f.read().strip())
+            except OSError:
+                continue
+        return False if have_hierarchy else None
+
+    def is_active(self) -> bool:
+        """Whether the service is running."""
+        state = self._cgroup_state()
+        if state is not None:
+            return state
+        now = time.monotonic()
+        if self._cached is None or now - self._checked_at >= self.ttl:
+            self._checked_at = now
+            try:
+                result = subprocess.run(['systemctl', 'is-active', self.service_name],
+                                        capture_output=True, text=True, timeout=2)
+                self._cached = result.stdout.strip() == 'active'
+            except (subprocess.SubprocessError, OSError):
+                self._cached = False
+        return self._cached
+
+
+class SystemMetricsSampler:
+    """Background sampler shared by all status stream clients."""
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        history: int = 60,
+        service_probe: Optional[ServiceStateProbe] = None,
+        collect: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+            history: Number of samples kept in the ring
+            service_probe: Service state probe (default: the ledmatrix unit)
+            collect: Override for the sample collector (used in tests)
+        """
+        self.interval = interval
+        self.service_probe = service_probe or ServiceStateProbe()
+        self._collect = collect or self._collect_sample
+        self._samples: deque = deque(maxlen=history)
+        self._seq = 0
+        self._clients = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._psutil = None
+        try:
+            import psutil
+            self._psutil = psutil
+            psutil.cpu_percent(interval=None)  # Prime the non-blocking measurement
+        except ImportError:
+            pass
+
+    def _collect_sample(self) -> Dict[str, Any]:
+        cpu_percent = 0
+        memory_used_percent = 0
+        cpu_temp = 0
+        if self._psutil is not None:
+            cpu_percent = round(self._psutil.cpu_percent(interval=None), 1)
+            memory_used_percent = round(self._psutil.virtual_memory().percent, 1)
+            cpu_temp = read_cpu_temp()
+        return {
+            'timestamp': time.time(),
+            'uptime': 'Running',
+            'service_active': self.service_probe.is_active(),
+            'cpu_percent': cpu_percent,
+            'memory_used_percent': memory_used_percent,
+            'cpu_temp': cpu_temp,
+            'disk_used_percent': 0
+        }
+
+    def sample_now(self) -> Tuple[int, Dict[str, Any]]:
+        """Take a sample, append it to the ring and wake waiting clients."""
+        try:
+            sample = self._collect()
+        except Exception as e:
+            logger.error(f"Error sampling system metrics: {e}")
+            sample = {'error': str(e)}
+        with self._cond:
+            self._seq += 1
+            self._samples.append((self._seq, time.monotonic(), sample))
+            self._cond.notify_all()
+            return self._seq, sample
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._clients == 0:
+                    self._thread = None
+                    return
+            self.sample_now()
+            with self._cond:
+                self._cond.wait_for(lambda: self._clients == 0, timeout=self.interval)
+
+    def _attach(self) -> None:
+        with self._cond:
+            self._clients += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='SystemMetricsSampler', daemon=True)
+                self._thread.start()
+
+    def _detach(self) -> None:
+        with self._cond:
+            self._clients -= 1
+            self._cond.notify_all()
+
+    @property
+    def client_count(self) -> int:
+        with self._cond:
+            return self._clients
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """The most recent sample, if any."""
+        with self._cond:
+            return self._samples[-1][2] if self._samples else None
+
+    def stream(self, poll_timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield samples for one client: the latest one right away if it is
+        current, then each new one.
+
+        The sampler runs while any stream is open; closing the generator
+        (e.g. on client disconnect) detaches it.
+
+        Args:
+            poll_timeout: Maximum seconds to wait for a sample (default: twice the interval)
+        """
+        timeout = poll_timeout if poll_timeout is not None else self.interval * 2
+        self._attach()
+        try:
+            with self._cond:
+                last_seq = self._seq
+                if self._samples and time.monotonic() - self._samples[-1][1] < self.interval:
+                    last_seq -= 1
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._seq > last_seq, timeout=timeout)
+                    pending = [(s, sample) for s, _, sample in self._samples if s > last_seq]
+                if not pending:
+                    continue
+                # A slow client skips to the newest sample rather than replaying a backlog
+                last_seq, sample = pending[-1]
+                yield sample
+        finally:
+            self._detach()
+
+
+_sampler: Optional[SystemMetricsSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_system_metrics_sampler() -> SystemMetricsSampler:
+    """Get the process-wide metrics sampler."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = SystemMetricsSampler()
+        return _sampler